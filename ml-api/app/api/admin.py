@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+관리 API (X-Admin-Token 헤더 필요, ADMIN_TOKEN 미설정이면 전부 403)
+
+- GET /api/admin/profile: 프로파일링 상태 + 최근 결과 목록
+- POST /api/admin/profile: 다음 N개 요청 샘플링 프로파일링
+- DELETE /api/admin/profile: 남은 프로파일링 취소
+- GET /api/admin/profile/{profile_id}: flamegraph용 folded 스택 다운로드
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from app.core.profiling import is_admin_token, profile_controller
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="관리자 토큰이 필요합니다")
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+class ProfileRequest(BaseModel):
+    """프로파일링 요청"""
+    requests: int = Field(10, ge=1, le=1000, description="프로파일링할 요청 수")
+    path_prefix: str = Field("", description="이 경로로 시작하는 요청만 (예: /api/predict)")
+    interval_ms: float = Field(5.0, ge=0.5, le=100, description="스택 샘플링 간격 (ms)")
+
+
+@router.get("/profile")
+async def get_profile_status():
+    """
+    프로파일링 상태 + 최근 결과 (스팬 요약 포함)
+    """
+    return profile_controller.status()
+
+
+@router.post("/profile")
+async def start_profiling(request: ProfileRequest):
+    """
+    다음 N개 요청을 샘플링 프로파일러로 감싸 logs/profiles/에 저장
+    """
+    profile_controller.arm(request.requests, request.path_prefix, request.interval_ms)
+    return {
+        "message": f"다음 {request.requests}개 요청을 프로파일링합니다",
+        **profile_controller.status(),
+    }
+
+
+@router.delete("/profile")
+async def stop_profiling():
+    """
+    남은 프로파일링 취소
+    """
+    profile_controller.disarm()
+    return {"message": "프로파일링을 중지했습니다"}
+
+
+@router.get("/profile/{profile_id}", response_class=PlainTextResponse)
+async def download_profile(profile_id: str):
+    """
+    folded 스택 (flamegraph.pl / speedscope 입력)
+    """
+    path = profile_controller.folded_path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다")
+    return PlainTextResponse(path.read_text(encoding="utf-8"))
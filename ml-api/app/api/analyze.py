@@ -11,6 +11,7 @@
 """
 from datetime import datetime
 from typing import List, Optional, Dict, Any
+import pyarrow.compute as pc
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from pydantic import BaseModel, Field
 
@@ -176,51 +177,55 @@ async def get_analysis_results(
 ):
     """
     분석 결과 조회
+
+    - 결과 파일(메모리맵)에서 필터/정렬 후 요청 페이지만 변환
     """
-    results = analyzer_service.get_results(job_id)
-    if results is None:
+    table = analyzer_service.get_results_table(job_id)
+    if table is None:
         raise HTTPException(status_code=404, detail="결과를 찾을 수 없습니다")
 
     # 필터링
-    filtered = results
-
-    if region_code:
-        filtered = [r for r in filtered if r.region_code == region_code]
-
-    if min_price:
-        filtered = [r for r in filtered if r.estimated_price >= min_price]
-
-    if max_price:
-        filtered = [r for r in filtered if r.estimated_price <= max_price]
-
-    # 정렬
-    reverse = sort_order == "desc"
-    if hasattr(filtered[0] if filtered else None, sort_by):
-        filtered = sorted(filtered, key=lambda x: getattr(x, sort_by, 0), reverse=reverse)
-
-    # 페이지네이션
-    total = len(filtered)
-    items = filtered[offset:offset + limit]
+    if table.num_rows:
+        mask = None
+        if region_code:
+            mask = pc.equal(table["region_code"], region_code)
+        if min_price:
+            cond = pc.greater_equal(table["estimated_price"], min_price)
+            mask = cond if mask is None else pc.and_(mask, cond)
+        if max_price:
+            cond = pc.less_equal(table["estimated_price"], max_price)
+            mask = cond if mask is None else pc.and_(mask, cond)
+        if mask is not None:
+            table = table.filter(mask)
+
+    # 정렬 + 페이지네이션 (정렬 인덱스 중 해당 페이지만 take)
+    total = table.num_rows
+    if total and sort_by in table.column_names and sort_by != "price_factors":
+        order = "descending" if sort_order == "desc" else "ascending"
+        indices = pc.sort_indices(table, sort_keys=[(sort_by, order)])
+        page = table.take(indices.slice(offset, limit))
+    else:
+        page = table.slice(offset, limit)
 
     # 응답 변환
     response_items = []
-    for item in items:
+    for item in page.to_pylist():
         response_items.append({
-            "apt_name": item.apt_name,
-            "region_code": item.region_code,
-            "area": item.area,
-            "base_price": item.base_price,
-            "estimated_price": item.estimated_price,
-            "estimated_price_billion": round(item.estimated_price / 10000, 2),
-            "min_price": item.min_price,
-            "max_price": item.max_price,
-            "price_range_text": f"{item.min_price / 10000:.2f}억 ~ {item.max_price / 10000:.2f}억",
-            "confidence": item.confidence,
-            "price_factors": item.price_factors,
-            "recent_trades": item.recent_trades,
-            "avg_trade_price": item.avg_trade_price,
-            "market_trend": item.market_trend,
-            "analyzed_at": item.analyzed_at,
+            "apt_name": item["apt_name"],
+            "region_code": item["region_code"],
+            "area": item["area"],
+            "base_price": item["base_price"],
+            "estimated_price": item["estimated_price"],
+            "estimated_price_billion": round(item["estimated_price"] / 10000, 2),
+            "min_price": item["min_price"],
+            "max_price": item["max_price"],
+            "price_range_text": f"{item['min_price'] / 10000:.2f}억 ~ {item['max_price'] / 10000:.2f}억",
+            "confidence": item["confidence"],
+            "price_factors": item["price_factors"],
+            "recent_trades": item["recent_trades"],
+            "avg_trade_price": item["avg_trade_price"],
+            "market_trend": item["market_trend"],
+            "analyzed_at": item["analyzed_at"],
         })
 
     return {
@@ -286,19 +291,25 @@ async def search_analysis(
     region_code: Optional[str] = Query(None, description="지역코드 필터"),
     min_price: Optional[int] = Query(None, description="최소 가격 (만원)"),
     max_price: Optional[int] = Query(None, description="최대 가격 (만원)"),
-    limit: int = Query(100, description="최대 반환 건수")
+    limit: int = Query(100, description="최대 반환 건수"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor)"),
 ):
     """
     분석 결과 검색
 
-    - 저장된 모든 분석 결과에서 검색
+    - 저장된 모든 분석 결과에서 검색 (추정가 오름차순)
+    - 다음 페이지는 next_cursor를 cursor로 전달
     """
-    results = analyzer_service.search_analysis(
+    if cursor is not None and not cursor.isdigit():
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+    results, next_cursor = analyzer_service.search_analysis(
         apt_name=apt_name,
         region_code=region_code,
         min_price=min_price,
         max_price=max_price,
-        limit=limit
+        limit=limit,
+        cursor=cursor,
     )
 
     return {
@@ -316,7 +327,8 @@ async def search_analysis(
             }
             for r in results
         ],
-        "total": len(results)
+        "total": len(results),
+        "next_cursor": next_cursor,
     }
 
 
@@ -19,6 +19,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from app.core.database import get_supabase_client
+from app.core.metrics import record_cache
 
 
 router = APIRouter(prefix="/api/chamgab", tags=["chamgab"])
@@ -29,21 +30,25 @@ router = APIRouter(prefix="/api/chamgab", tags=["chamgab"])
 # ============================================================================
 
 class SimpleCache:
-    """간단한 시간 기반 캐시"""
+    """간단한 시간 기반 캐시 (적중/미스는 키 접두사별로 /metrics에 집계)"""
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, name: str = "chamgab"):
         self.ttl_seconds = ttl_seconds
+        self.name = name
         self.cache = {}
 
     def get(self, key: str):
         """캐시에서 값 조회"""
+        label = f"{self.name}:{key.split(':', 1)[0]}"
         if key in self.cache:
             value, timestamp = self.cache[key]
             if datetime.now() - timestamp < timedelta(seconds=self.ttl_seconds):
+                record_cache(label, hit=True)
                 return value
             else:
                 # 만료된 캐시 삭제
                 del self.cache[key]
+        record_cache(label, hit=False)
         return None
 
     def set(self, key: str, value):
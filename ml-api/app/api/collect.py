@@ -60,6 +60,9 @@ class JobStatusResponse(BaseModel):
     completed_at: Optional[str]
     molit_count: int
     rone_count: int
+    cells_total: int = 0
+    cells_completed: int = 0
+    cells_skipped: int = 0
     error: Optional[str]
 
 
@@ -124,6 +127,9 @@ async def start_collection(
 async def get_collection_status(job_id: str):
     """
     수집 작업 상태 조회
+
+    - 영속 작업 저장소 기준 (서버 재시작 후에도 조회 가능)
+    - cells_*: (지역, 월, 소스) 셀 단위 진행률
     """
     job = collector_service.get_job(job_id)
     if not job:
@@ -139,6 +145,9 @@ async def get_collection_status(job_id: str):
         completed_at=job.completed_at,
         molit_count=job.molit_count,
         rone_count=job.rone_count,
+        cells_total=job.cells_total,
+        cells_completed=job.cells_completed,
+        cells_skipped=job.cells_skipped,
         error=job.error
     )
 
@@ -152,24 +161,23 @@ async def get_collected_data(
 ):
     """
     수집된 데이터 조회
+
+    - 작업 결과 파일에서 요청 범위만 잘라 반환 (전체 로드 없음)
     """
-    data = collector_service.get_collected_data(job_id)
-    if not data:
+    sources = collector_service.get_collected_sources(job_id)
+    if not sources:
         raise HTTPException(status_code=404, detail="데이터를 찾을 수 없습니다")
 
-    result = {}
-
     if source:
-        if source in data:
-            items = data[source]
-            result[source] = items[offset:offset + limit]
-            result[f"{source}_total"] = len(items)
-        else:
+        if source not in sources:
             raise HTTPException(status_code=400, detail=f"잘못된 소스: {source}")
-    else:
-        for src, items in data.items():
-            result[src] = items[offset:offset + limit]
-            result[f"{src}_total"] = len(items)
+        sources = [source]
+
+    result = {}
+    for src in sources:
+        items, total = collector_service.get_collected_page(job_id, src, offset, limit)
+        result[src] = items
+        result[f"{src}_total"] = total
 
     return result
 
@@ -193,13 +201,8 @@ async def list_jobs(
     """
     수집 작업 목록 조회
     """
-    jobs = list(collector_service.jobs.values())
-
-    if status:
-        jobs = [j for j in jobs if j.status.value == status]
-
-    # 최신순 정렬
-    jobs = sorted(jobs, key=lambda x: x.job_id, reverse=True)
+    # 최신순 정렬 (영속 저장소 기준)
+    jobs = collector_service.list_jobs(status=status)
 
     return {
         "jobs": [
@@ -211,6 +214,8 @@ async def list_jobs(
                 "months": j.months,
                 "molit_count": j.molit_count,
                 "rone_count": j.rone_count,
+                "cells_completed": j.cells_completed,
+                "cells_total": j.cells_total,
                 "started_at": j.started_at,
                 "completed_at": j.completed_at,
             }
@@ -225,11 +230,7 @@ async def delete_job(job_id: str):
     """
     수집 작업 삭제
     """
-    if job_id not in collector_service.jobs:
+    if not collector_service.delete_job(job_id):
         raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
 
-    del collector_service.jobs[job_id]
-    if job_id in collector_service.collected_data:
-        del collector_service.collected_data[job_id]
-
     return {"message": f"작업 {job_id}이(가) 삭제되었습니다"}
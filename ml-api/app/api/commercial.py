@@ -32,6 +32,9 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from app.core.database import get_supabase_client
+from app.core.region_gazetteer import region_gazetteer
+from app.core.metrics import record_cache
+from app.core.warmup import model_warmup
 from app.services.business_model_service import business_model_service
 
 
@@ -48,19 +51,23 @@ _DISCLAIMER = "본 분석은 AI 모델 기반 추정치이며, 실제 결과와
 # ============================================================================
 
 class SimpleCache:
-    """간단한 시간 기반 캐시"""
+    """간단한 시간 기반 캐시 (적중/미스는 키 접두사별로 /metrics에 집계)"""
 
-    def __init__(self, ttl_seconds: int = 3600):
+    def __init__(self, ttl_seconds: int = 3600, name: str = "commercial"):
         self.ttl_seconds = ttl_seconds
+        self.name = name
         self.cache = {}
 
     def get(self, key: str):
+        label = f"{self.name}:{key.split(':', 1)[0]}"
         if key in self.cache:
             value, timestamp = self.cache[key]
             if datetime.now() - timestamp < timedelta(seconds=self.ttl_seconds):
+                record_cache(label, hit=True)
                 return value
             else:
                 del self.cache[key]
+        record_cache(label, hit=False)
         return None
 
     def set(self, key: str, value):
@@ -219,7 +226,11 @@ def _try_get_supabase():
 
 
 def _get_district_name(client, sigungu_code: str) -> tuple:
-    """시군구 코드로 이름과 시도명 조회. (name, sido_name) 반환."""
+    """시군구 코드로 이름과 시도명 조회. (name, sido_name) 반환.
+    지역 코드 사전에 있으면 DB를 조회하지 않습니다."""
+    region = region_gazetteer.get(sigungu_code)
+    if region is not None and region.level == 2:
+        return region.name, region_gazetteer.sido_name(region.code)
     try:
         result = client.table('regions').select('name, parent_code') \
             .like('code', f'{sigungu_code}%').eq('level', 2).limit(1).execute()
@@ -520,6 +531,7 @@ async def predict_business_success(
     competition_ratio: Optional[float] = None,
 ):
     """창업 성공 확률 예측 - 실데이터 기반 피처 자동 조회"""
+    await model_warmup.wait()  # 워밍업 중이면 잠시 대기, 시간 초과면 규칙 기반 폴백
     client = _try_get_supabase()
     district_name = district_code
     industry_name = industry_code
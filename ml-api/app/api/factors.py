@@ -3,7 +3,6 @@ from pydantic import BaseModel
 from typing import List
 from uuid import UUID
 
-from app.services.shap_service import ShapService
 from app.core.database import get_supabase_client
 
 router = APIRouter()
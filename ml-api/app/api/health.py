@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Request
 from datetime import datetime
 
+from app.core.warmup import model_warmup
+
 router = APIRouter()
 
 
@@ -29,14 +31,18 @@ async def health_check(request: Request):
     except Exception as e:
         db_error = str(e)
 
-    # 종합 상태
+    # 종합 상태 (워밍업 중이면 모델 미로드가 정상 → warming)
     all_ok = model_loaded and artifacts_loaded and db_connected
-    status = "healthy" if all_ok else "degraded"
+    if model_warmup.status == "warming":
+        status = "warming"
+    else:
+        status = "healthy" if all_ok else "degraded"
 
     return {
         "status": status,
         "service": "chamgab-ml-api",
         "timestamp": datetime.now().isoformat(),
+        "warmup": model_warmup.describe(),
         "models": {
             "xgboost": model_loaded,
             "shap": shap_loaded,
@@ -0,0 +1,19 @@
+"""
+Prometheus 메트릭 API
+
+- GET /metrics: 요청 지연, Supabase 쿼리, 모델 추론/SHAP 지연, 캐시 적중 (텍스트 포맷)
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -5,7 +5,7 @@ from uuid import UUID
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from app.services.model_service import ModelService
+from app.core.warmup import model_warmup
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -34,7 +34,8 @@ async def predict_price(request_body: PredictRequest, request: Request):
     - 신뢰 구간 계산
     - 신뢰도 레벨 반환
     """
-    # 모델 확인
+    # 모델 확인 (워밍업 중이면 MODEL_WAIT_SECONDS까지 대기 후 폴백)
+    await model_warmup.wait()
     model = request.app.state.model
     artifacts = request.app.state.feature_artifacts
 
@@ -49,10 +50,14 @@ async def predict_price(request_body: PredictRequest, request: Request):
         )
 
     try:
+        # xgboost/pandas import는 첫 예측 시점으로 지연 (콜드 스타트 단축)
+        from app.services.model_service import ModelService
+
         # ModelService로 예측 (v2: residual_info + lgbm 지원)
         residual_info = getattr(request.app.state, "residual_info", None)
         lgbm_model = getattr(request.app.state, "lgbm_model", None)
-        model_service = ModelService(model, artifacts, residual_info, lgbm_model)
+        compiled_model = getattr(request.app.state, "compiled_model", None)
+        model_service = ModelService(model, artifacts, residual_info, lgbm_model, compiled_model)
         result = model_service.predict(request_body.property_id)
 
         return PredictResponse(
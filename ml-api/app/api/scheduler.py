@@ -7,9 +7,11 @@
 - POST /api/scheduler/start: 스케줄러 시작
 - POST /api/scheduler/stop: 스케줄러 중지
 - POST /api/scheduler/run: 즉시 실행 (수집/학습)
+- POST /api/scheduler/cancel: 실행 중 학습/수집 스크립트 취소
+- GET /api/scheduler/scripts/{run_id}/log: 스크립트 실행 로그
 """
 from typing import Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel, Field
 
 from app.core.scheduler import data_scheduler
@@ -17,23 +19,30 @@ from app.core.scheduler import data_scheduler
 
 router = APIRouter(prefix="/scheduler", tags=["Scheduler"])
 
-VALID_JOB_TYPES = ["daily", "weekly", "monthly", "collect_commercial", "train_business", "train_all"]
+VALID_JOB_TYPES = [
+    "daily", "weekly", "monthly", "collect_commercial", "train_business", "train_all", "train_all_force",
+]
 
 
 class SchedulerStatusResponse(BaseModel):
     """스케줄러 상태"""
     is_running: bool
+    role: str = Field("stopped", description="leader / follower / stopped")
+    leader: dict = Field(default_factory=dict, description="리더 락 백엔드/보유자")
+    model_bundle: Optional[str] = Field(None, description="마지막으로 로드한 모델 번들 버전")
     jobs: list
     last_collection_job: Optional[str]
     last_analysis_job: Optional[str]
     last_training_job: Optional[str]
+    scripts: dict = Field(default_factory=dict, description="실행 중/최근 스크립트 (진행률, ETA, 로그 끝부분)")
+    pipeline: dict = Field(default_factory=dict, description="파이프라인 단계별 마지막 성공/직전 결과")
 
 
 class RunNowRequest(BaseModel):
     """즉시 실행 요청"""
     job_type: str = Field(
         ...,
-        description="작업 유형 (daily/weekly/monthly/train_business/train_all)"
+        description="작업 유형 (daily/weekly/monthly/train_business/train_all/train_all_force)"
     )
 
 
@@ -44,10 +53,15 @@ async def get_scheduler_status():
     """
     return SchedulerStatusResponse(
         is_running=data_scheduler.is_running,
+        role=data_scheduler.role,
+        leader=data_scheduler.leader.describe(),
+        model_bundle=data_scheduler.bundle_version,
         jobs=data_scheduler.get_jobs(),
         last_collection_job=data_scheduler.last_collection_job,
         last_analysis_job=data_scheduler.last_analysis_job,
         last_training_job=data_scheduler.last_training_job,
+        scripts=data_scheduler.script_runner.status(),
+        pipeline=data_scheduler.pipeline.status(),
     )
 
 
@@ -90,13 +104,20 @@ async def run_job_now(
     - weekly: 주간 수집 (수도권) + 분석
     - monthly: 월간 수집 (전국)
     - train_business: 상권 모델 즉시 학습
-    - train_all: 전체 모델 즉시 학습 (아파트 + 상권)
+    - train_all: 전체 파이프라인 (아파트 + 상권 학습, 배치 스코어링, 입력이 바뀐 단계만)
+    - train_all_force: 전체 파이프라인 강제 재계산
     """
     if request.job_type not in VALID_JOB_TYPES:
         raise HTTPException(
             status_code=400,
             detail=f"job_type은 {', '.join(VALID_JOB_TYPES)} 중 하나여야 합니다"
         )
+    if data_scheduler.role == "follower":
+        # 팔로워가 수집/학습하면 리더와 모델 파일 쓰기가 겹침
+        raise HTTPException(
+            status_code=409,
+            detail=f"리더 인스턴스에서만 실행할 수 있습니다 (리더: {data_scheduler.leader.holder() or '알 수 없음'})"
+        )
 
     background_tasks.add_task(data_scheduler.run_now, request.job_type)
 
@@ -106,6 +127,30 @@ async def run_job_now(
     }
 
 
+@router.post("/cancel")
+async def cancel_running_scripts(job_id: Optional[str] = None):
+    """
+    실행 중인 학습/수집 스크립트 취소 (같은 작업의 남은 단계도 건너뜀)
+
+    job_id를 주면 해당 작업만 취소 (없으면 실행 중인 전체 작업)
+    """
+    cancelled = await data_scheduler.cancel_scripts(job_id)
+    if not cancelled:
+        return {"message": "실행 중인 스크립트가 없습니다", "cancelled": []}
+    return {"message": f"스크립트 {len(cancelled)}개를 취소했습니다", "cancelled": cancelled}
+
+
+@router.get("/scripts/{run_id}/log")
+async def get_script_log(run_id: str, lines: int = Query(200, ge=1, le=5000)):
+    """
+    스크립트 실행 로그 (링버퍼 끝부분)
+    """
+    run = data_scheduler.script_runner.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="실행 기록을 찾을 수 없습니다")
+    return run.to_dict(log_lines=lines)
+
+
 @router.get("/jobs")
 async def list_scheduled_jobs():
     """
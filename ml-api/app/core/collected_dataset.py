@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+수집 실거래 데이터셋 (Parquet, region_code/year_month 파티션)
+
+기존 data/latest_collected.csv (append-only, 중복 누적)를 대체
+- 파티션: data/collected/region_code=XXXXX/year_month=YYYYMM/part-0.parquet
+- upsert: Supabase transactions 유니크 제약과 같은 키로 중복 제거
+  (transaction_date, region_code, apt_name, area_exclusive, floor, price)
+- compact: 파티션 내 여러 파일/중복 행 병합
+- read: 파티션 프루닝 + 필터 푸시다운 (pyarrow.dataset)
+"""
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+COLLECTED_DATASET_DIR = DATA_DIR / "collected"
+
+# Supabase on_conflict="transaction_date,region_code,apt_name,area_exclusive,floor,price" 와 동일
+KEY_COLUMNS = ["deal_date", "region_code", "apt_name", "area", "floor", "price"]
+
+PARTITION_SCHEMA = pa.schema([
+    ("region_code", pa.string()),
+    ("year_month", pa.string()),
+])
+
+# 파티션 파일에 저장되는 컬럼 (파티션 컬럼 제외)
+FILE_SCHEMA = pa.schema([
+    ("apt_name", pa.string()),
+    ("area", pa.float64()),
+    ("floor", pa.int64()),
+    ("price", pa.int64()),  # 만원
+    ("deal_date", pa.string()),
+    ("built_year", pa.int64()),
+    ("dong", pa.string()),
+    ("jibun", pa.string()),
+    ("sigungu", pa.string()),
+    ("collected_at", pa.string()),
+])
+
+
+class CollectedDataset:
+    """파티션 Parquet 수집 데이터셋"""
+
+    def __init__(self, root: Path = COLLECTED_DATASET_DIR):
+        self.root = Path(root)
+
+    def exists(self) -> bool:
+        return self.root.exists() and any(self.root.glob("region_code=*/year_month=*/*.parquet"))
+
+    def _partition_dir(self, region_code: str, year_month: str) -> Path:
+        return self.root / f"region_code={region_code}" / f"year_month={year_month}"
+
+    # ─────────────────────────────────────────────
+    # 쓰기
+    # ─────────────────────────────────────────────
+
+    @staticmethod
+    def _to_frame(rows: List[dict]) -> pd.DataFrame:
+        raw = pd.DataFrame(rows)
+        for field in FILE_SCHEMA:
+            if field.name not in raw.columns:
+                raw[field.name] = None
+        # 파일 스키마로 타입 정규화 (CSV 이관 시 문자열/실수 혼입 방지)
+        df = pa.Table.from_pandas(
+            raw[FILE_SCHEMA.names], schema=FILE_SCHEMA, preserve_index=False
+        ).to_pandas()
+        df["region_code"] = raw["region_code"].astype(str).values
+        df["year_month"] = df["deal_date"].str[:7].str.replace("-", "", regex=False)
+        return df
+
+    @staticmethod
+    def _dedupe(df: pd.DataFrame) -> pd.DataFrame:
+        """키 기준 중복 제거 (나중에 수집된 행 우선)"""
+        if "collected_at" in df.columns:
+            df = df.sort_values("collected_at", kind="stable", na_position="first")
+        return df.drop_duplicates(subset=KEY_COLUMNS, keep="last")
+
+    def _read_partition(self, part_dir: Path) -> pd.DataFrame:
+        files = sorted(part_dir.glob("*.parquet"))
+        if not files:
+            return pd.DataFrame(columns=FILE_SCHEMA.names)
+        return pd.concat(
+            [pq.read_table(f, schema=FILE_SCHEMA).to_pandas() for f in files],
+            ignore_index=True,
+        )
+
+    def _write_partition(self, part_dir: Path, df: pd.DataFrame):
+        """파티션을 단일 파일로 원자적 교체"""
+        part_dir.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pandas(
+            df[FILE_SCHEMA.names], schema=FILE_SCHEMA, preserve_index=False
+        )
+        tmp_path = part_dir / f".tmp-{uuid.uuid4().hex}.parquet"
+        pq.write_table(table, tmp_path, compression="zstd")
+        target = part_dir / "part-0.parquet"
+        os.replace(tmp_path, target)
+        for stale in part_dir.glob("*.parquet"):
+            if stale != target:
+                stale.unlink()
+
+    def upsert(self, rows: List[dict]) -> int:
+        """
+        수집 행 upsert (파티션 단위 copy-on-write)
+
+        Returns:
+            신규 추가된 행 수 (기존 키와 겹치는 행은 갱신)
+        """
+        if not rows:
+            return 0
+
+        incoming = self._to_frame(rows)
+        added = 0
+        for (region_code, year_month), group in incoming.groupby(["region_code", "year_month"]):
+            part_dir = self._partition_dir(region_code, year_month)
+            existing = self._read_partition(part_dir)
+            if len(existing):
+                existing["region_code"] = region_code
+                before = len(self._dedupe(existing))
+                merged = self._dedupe(pd.concat([existing, group], ignore_index=True))
+            else:
+                before = 0
+                merged = self._dedupe(group)
+            added += len(merged) - before
+            self._write_partition(part_dir, merged)
+        return added
+
+    def compact(self, full: bool = False) -> Dict[str, int]:
+        """
+        파티션 정리
+
+        - 여러 파일로 나뉜 파티션 병합 + 키 중복 제거
+        - 중단된 쓰기로 남은 임시 파일 삭제
+        - full=True면 단일 파일 파티션도 다시 읽어 중복 검사
+        """
+        stats = {"partitions": 0, "compacted": 0, "rows_removed": 0}
+        if not self.root.exists():
+            return stats
+
+        for tmp in self.root.glob("region_code=*/year_month=*/.tmp-*"):
+            tmp.unlink()
+
+        for part_dir in sorted(self.root.glob("region_code=*/year_month=*")):
+            stats["partitions"] += 1
+            files = list(part_dir.glob("*.parquet"))
+            if not full and [f.name for f in files] == ["part-0.parquet"]:
+                continue  # upsert로만 쓰인 파티션은 이미 정리된 상태
+            df = self._read_partition(part_dir)
+            df["region_code"] = part_dir.parent.name.split("=", 1)[1]
+            deduped = self._dedupe(df)
+            if len(files) > 1 or len(deduped) < len(df):
+                self._write_partition(part_dir, deduped)
+                stats["compacted"] += 1
+                stats["rows_removed"] += len(df) - len(deduped)
+        return stats
+
+    def import_csv(self, csv_path: Path, chunksize: int = 100_000) -> int:
+        """기존 latest_collected.csv 이관 (청크 단위 upsert)"""
+        added = 0
+        str_columns = {"region_code": str}
+        str_columns.update({f.name: str for f in FILE_SCHEMA if pa.types.is_string(f.type)})
+        for chunk in pd.read_csv(csv_path, dtype=str_columns, chunksize=chunksize):
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            added += self.upsert(chunk.to_dict("records"))
+        return added
+
+    # ─────────────────────────────────────────────
+    # 읽기
+    # ─────────────────────────────────────────────
+
+    def partition_files(self) -> Dict[str, List[Path]]:
+        """시군구 코드별 파티션 파일 목록 (파이프라인 입력 해시용)"""
+        files: Dict[str, List[Path]] = {}
+        for path in sorted(self.root.glob("region_code=*/year_month=*/*.parquet")):
+            region_code = path.parent.parent.name.split("=", 1)[1]
+            files.setdefault(region_code, []).append(path)
+        return files
+
+    def dataset(self) -> ds.Dataset:
+        return ds.dataset(
+            str(self.root),
+            format="parquet",
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            exclude_invalid_files=True,
+        )
+
+    def read(
+        self,
+        region_codes: Optional[List[str]] = None,
+        start_month: Optional[str] = None,
+        end_month: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        필터 푸시다운 읽기
+
+        Args:
+            region_codes: 시군구 코드 목록 (파티션 프루닝)
+            start_month / end_month: YYYYMM 범위 (포함, 파티션 프루닝)
+            columns: 읽을 컬럼 (없으면 전체)
+        """
+        if not self.exists():
+            return pd.DataFrame(columns=PARTITION_SCHEMA.names + FILE_SCHEMA.names)
+
+        expr = None
+        if region_codes:
+            expr = ds.field("region_code").isin([str(c) for c in region_codes])
+        if start_month:
+            cond = ds.field("year_month") >= str(start_month)
+            expr = cond if expr is None else expr & cond
+        if end_month:
+            cond = ds.field("year_month") <= str(end_month)
+            expr = cond if expr is None else expr & cond
+
+        table = self.dataset().to_table(columns=columns, filter=expr)
+        return table.to_pandas()
+
+
+# 싱글톤 인스턴스
+collected_dataset = CollectedDataset()
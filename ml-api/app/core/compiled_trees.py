@@ -0,0 +1,263 @@
+"""
+컴파일된 트리 앙상블 추론 (CPU 서빙용 선택 백엔드)
+
+학습된 XGBoost / LightGBM 회귀 모델을 평탄화된 노드 배열로 export →
+numba JIT 커널로 트리 탐색 (numba 미설치 시 numpy 벡터 탐색).
+XGBoost 런타임/DMatrix 없이 배치 1~1024 행을 같은 경로로 예측.
+
+- train_model.py가 app/models/compiled_model.pkl로 저장
+- ModelService는 번들에 컴파일 모델이 있으면 사용, 없으면 XGBoost Booster
+- 분할 규칙: XGBoost x < threshold (float32 비교), LightGBM x <= threshold (float64),
+  결측은 노드별 default 방향 (LightGBM missing_type None/Zero/NaN 규칙 포함)
+"""
+import json
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# 노드별 결측 처리 (LightGBM missing_type)
+MISSING_NONE, MISSING_ZERO, MISSING_NAN = 0, 1, 2
+ZERO_THRESHOLD = 1e-35  # LightGBM kZeroThreshold
+SUPPORTED_XGB_OBJECTIVES = {"reg:squarederror", "reg:absoluteerror", "reg:pseudohubererror"}
+SUPPORTED_LGBM_OBJECTIVES = {"regression", "regression_l1", "huber", "fair", "quantile"}
+
+
+ROW_BLOCK = 64  # 트리당 동시에 탐색하는 행 수
+
+
+def _traverse(X, feature, threshold, left, default_left, missing, roots, inclusive, out):
+    """행 블록 × 트리 탐색 → 리프 값 합 (numba 컴파일 대상)
+
+    - 리프: left == -1, threshold 자리에 리프 값 / 오른쪽 자식 = left + 1
+    - 한 트리를 블록 내 행들이 깊이 단위로 함께 내려가 분기 지연을 겹침 (XGBoost CPU 예측기와 같은 방식)
+    """
+    out[:] = 0.0
+    nodes = np.empty(ROW_BLOCK, dtype=np.int32)
+    for start in range(0, X.shape[0], ROW_BLOCK):
+        size = min(ROW_BLOCK, X.shape[0] - start)
+        for t in range(roots.shape[0]):
+            nodes[:size] = roots[t]
+            active = True
+            while active:
+                active = False
+                for i in range(size):
+                    node = nodes[i]
+                    child = left[node]
+                    if child == -1:
+                        continue
+                    active = True
+                    x = X[start + i, feature[node]]
+                    mt = missing[node]
+                    if np.isnan(x):
+                        if mt == MISSING_NAN:
+                            nodes[i] = child + (not default_left[node])
+                            continue
+                        x = 0.0
+                    if mt == MISSING_ZERO and -ZERO_THRESHOLD < x <= ZERO_THRESHOLD:
+                        go_right = not default_left[node]
+                    elif inclusive:
+                        go_right = x > threshold[node]
+                    else:
+                        go_right = not x < threshold[node]
+                    nodes[i] = child + go_right
+            for i in range(size):
+                out[start + i] += threshold[nodes[i]]
+    return out
+
+
+if HAS_NUMBA:
+    _traverse_kernel = numba.njit(nogil=True, cache=False)(_traverse)
+
+
+def _traverse_numpy(X, feature, threshold, left, default_left, missing, roots, inclusive, out):
+    """numba 미설치 fallback: 모든 (행, 트리)를 깊이 단위로 동시에 한 단계씩 이동"""
+    nodes = np.broadcast_to(roots, (X.shape[0], roots.shape[0])).copy()
+    active = left[nodes] != -1
+    while active.any():
+        r, t = np.nonzero(active)
+        node = nodes[r, t]
+        x = X[r, feature[node]]
+        mt = missing[node]
+        x = np.where(np.isnan(x) & (mt != MISSING_NAN), 0.0, x)
+        use_default = ((mt == MISSING_NAN) & np.isnan(x)) | (
+            (mt == MISSING_ZERO) & (x > -ZERO_THRESHOLD) & (x <= ZERO_THRESHOLD))
+        with np.errstate(invalid="ignore"):
+            go_left = np.where(use_default, default_left[node],
+                               x <= threshold[node] if inclusive else x < threshold[node])
+        nodes[r, t] = left[node] + ~go_left
+        active = left[nodes] != -1
+    out[:] = threshold[nodes].sum(axis=1)
+    return out
+
+
+def _check_feature_count(num_features: int, feature_names: Sequence[str], source: str):
+    """split 인덱스가 feature_names 순서를 가리키므로 학습 피처 수가 다르면 컴파일하지 않음"""
+    if num_features != len(feature_names):
+        raise ValueError(
+            f"{source} 모델 피처 수({num_features})가 feature_names({len(feature_names)})와 다릅니다"
+        )
+
+
+@dataclass
+class CompiledTrees:
+    """평탄화된 트리 앙상블 (리프 노드는 threshold 자리에 리프 값 저장)"""
+    source: str  # "xgboost" | "lightgbm"
+    feature_names: List[str]
+    feature: np.ndarray       # int32, 분할 피처 인덱스
+    threshold: np.ndarray     # float64, 분할 임계값 / 리프 값
+    left: np.ndarray          # int32, -1이면 리프 (오른쪽 자식 = left + 1)
+    default_left: np.ndarray  # bool, 결측 시 왼쪽
+    missing: np.ndarray       # int8, MISSING_*
+    roots: np.ndarray         # int32, 트리별 루트 노드
+    base_score: float = 0.0
+
+    @property
+    def inclusive(self) -> bool:
+        return self.source == "lightgbm"
+
+    @classmethod
+    def from_xgboost(cls, model, feature_names: Sequence[str]) -> "CompiledTrees":
+        """XGBRegressor (gbtree, 수치 분할) → 노드 배열"""
+        booster = model.get_booster()
+        _check_feature_count(booster.num_features(), feature_names, "XGBoost")
+        learner = json.loads(booster.save_raw("json"))["learner"]
+        objective = learner["objective"]["name"]
+        if objective not in SUPPORTED_XGB_OBJECTIVES:
+            raise ValueError(f"지원하지 않는 XGBoost objective: {objective}")
+        gbm = learner["gradient_booster"]
+        if gbm["name"] != "gbtree":
+            raise ValueError(f"지원하지 않는 XGBoost booster: {gbm['name']}")
+
+        trees = gbm["model"]["trees"]
+        if not trees:
+            raise ValueError("트리가 없는 모델입니다")
+        try:  # sklearn 래퍼와 같은 규칙: early stopping이면 best_iteration까지
+            per_round = int(gbm["model"]["gbtree_model_param"]["num_parallel_tree"])
+            trees = trees[:(booster.best_iteration + 1) * per_round]
+        except AttributeError:
+            pass
+
+        arrays = {k: [] for k in ("feature", "threshold", "left", "default_left")}
+        roots, offset = [], 0
+        for tree in trees:
+            if any(tree["split_type"]):
+                raise ValueError("범주형 분할 트리는 컴파일하지 않습니다")
+            left = np.asarray(tree["left_children"], dtype=np.int32)
+            right = np.asarray(tree["right_children"], dtype=np.int32)
+            is_leaf = left == -1
+            if np.any(right[~is_leaf] != left[~is_leaf] + 1):
+                raise ValueError("자식 노드가 연속 배치되지 않은 트리입니다")
+            roots.append(offset)
+            arrays["feature"].append(np.asarray(tree["split_indices"], dtype=np.int32))
+            # XGBoost는 float32로 비교 → float32 값을 float64로 보존
+            arrays["threshold"].append(np.asarray(tree["split_conditions"], dtype=np.float32).astype(np.float64))
+            arrays["left"].append(np.where(is_leaf, -1, left + offset).astype(np.int32))
+            arrays["default_left"].append(np.asarray(tree["default_left"], dtype=bool))
+            offset += len(left)
+
+        base_score = float(np.float32(learner["learner_model_param"]["base_score"].strip("[]")))
+        return cls(
+            source="xgboost",
+            feature_names=list(feature_names),
+            **{k: np.concatenate(v) for k, v in arrays.items()},
+            missing=np.full(offset, MISSING_NAN, dtype=np.int8),  # XGBoost: NaN만 결측
+            roots=np.asarray(roots, dtype=np.int32),
+            base_score=base_score,
+        )
+
+    @classmethod
+    def from_lightgbm(cls, model, feature_names: Sequence[str]) -> "CompiledTrees":
+        """LGBMRegressor (수치 분할) → 노드 배열"""
+        booster = getattr(model, "booster_", model)
+        _check_feature_count(booster.num_feature(), feature_names, "LightGBM")
+        dump = booster.dump_model()  # early stopping이면 best_iteration까지 (래퍼 predict와 같음)
+        objective = dump["objective"].split()[0]
+        if objective not in SUPPORTED_LGBM_OBJECTIVES or dump.get("average_output"):
+            raise ValueError(f"지원하지 않는 LightGBM objective: {dump['objective']}")
+
+        feature, threshold, left, default_left, missing, roots = [], [], [], [], [], []
+        missing_codes = {"None": MISSING_NONE, "Zero": MISSING_ZERO, "NaN": MISSING_NAN}
+
+        for tree in dump["tree_info"]:
+            # 너비 우선 배치: 형제 노드를 연속으로 할당 (오른쪽 자식 = left + 1)
+            roots.append(len(feature))
+            queue = [tree["tree_structure"]]
+            while queue:
+                node = queue.pop(0)
+                if "leaf_value" in node:
+                    feature.append(0)
+                    threshold.append(float(node["leaf_value"]))
+                    left.append(-1)
+                    default_left.append(False)
+                    missing.append(MISSING_NONE)
+                    continue
+                if node.get("decision_type") != "<=":
+                    raise ValueError("범주형 분할 트리는 컴파일하지 않습니다")
+                feature.append(node["split_feature"])
+                threshold.append(float(node["threshold"]))
+                left.append(len(feature) + len(queue))
+                default_left.append(node["default_left"])
+                missing.append(missing_codes[node["missing_type"]])
+                queue.extend([node["left_child"], node["right_child"]])
+
+        return cls(
+            source="lightgbm",
+            feature_names=list(feature_names),
+            feature=np.asarray(feature, dtype=np.int32),
+            threshold=np.asarray(threshold, dtype=np.float64),
+            left=np.asarray(left, dtype=np.int32),
+            default_left=np.asarray(default_left, dtype=bool),
+            missing=np.asarray(missing, dtype=np.int8),
+            roots=np.asarray(roots, dtype=np.int32),
+        )
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """(n, n_features) → (n,) 예측값"""
+        X = np.asarray(X)
+        if self.source == "xgboost":
+            # XGBoost 입력은 float32로 변환 후 비교 (Booster와 같은 분할 결과)
+            X = X.astype(np.float32)
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        out = np.empty(X.shape[0], dtype=np.float64)
+        traverse = _traverse_kernel if HAS_NUMBA else _traverse_numpy
+        traverse(X, self.feature, self.threshold, self.left, self.default_left,
+                 self.missing, self.roots, self.inclusive, out)
+        return out + self.base_score
+
+
+@dataclass
+class CompiledPriceModel:
+    """가격 모델 번들 (XGBoost 단독 또는 XGBoost+LightGBM 0.5/0.5 앙상블)"""
+    feature_names: List[str]
+    xgb: CompiledTrees
+    lgbm: Optional[CompiledTrees] = None
+
+    @classmethod
+    def export(cls, model, feature_names: Sequence[str], lgbm_model=None) -> "CompiledPriceModel":
+        compiled = cls(
+            feature_names=list(feature_names),
+            xgb=CompiledTrees.from_xgboost(model, feature_names),
+            lgbm=CompiledTrees.from_lightgbm(lgbm_model, feature_names) if lgbm_model is not None else None,
+        )
+        compiled.warm_up()
+        return compiled
+
+    def warm_up(self):
+        """numba 커널 JIT 컴파일 (첫 요청 지연 방지)"""
+        if not HAS_NUMBA:
+            print("Warning: numba not installed, compiled model uses the numpy fallback "
+                  "(no faster than the XGBoost Booster). pip install numba")
+        self.predict(np.zeros((1, len(self.feature_names))))
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        prediction = self.xgb.predict(X)
+        if self.lgbm is not None:
+            prediction = 0.5 * prediction + 0.5 * self.lgbm.predict(X)
+        return prediction
@@ -21,11 +21,35 @@ class Settings(BaseSettings):
     SUPABASE_URL: Optional[str] = None
     SUPABASE_SERVICE_KEY: Optional[str] = None
 
+    # 관리 API (/api/admin/*, 요청별 프로파일링 헤더). 비어 있으면 비활성
+    ADMIN_TOKEN: str = ""
+
     # Redis
     REDIS_URL: str = ""
 
     # ML Model
     MODEL_PATH: str = "app/models/xgboost_model.pkl"
+    PRICE_MODEL_BACKEND: str = "auto"  # auto: 컴파일 모델 있으면 사용 / compiled / xgboost
+
+    # 시작 모드 (lazy: 모델 로드/마이그레이션을 백그라운드로, eager: 다 끝낸 뒤 트래픽 수신)
+    STARTUP_MODE: str = "lazy"
+    MODEL_WAIT_SECONDS: float = 3.0  # 워밍업 중 모델이 필요한 요청의 최대 대기 (초과 시 폴백)
+
+    # 작업 결과 저장소 (수집/분석 결과 디스크 보관)
+    RESULT_STORE_MEMORY_JOBS: int = 8  # 메모리맵 LRU로 유지할 최근 작업 수
+    RESULT_STORE_TTL_HOURS: float = 72.0  # 결과 보관 기간
+
+    # 스케줄러 학습/수집 스크립트 (서빙 경로와 CPU 분리)
+    SCRIPT_NICE: int = 10  # 자식 프로세스 nice 값 (POSIX)
+    SCRIPT_CPU_THREADS: int = 0  # OpenMP/BLAS 스레드 상한 (0: CPU 수 - 1)
+    SCRIPT_LOG_LINES: int = 1000  # 실행별 로그 링버퍼 줄 수
+
+    # 스케줄러 리더 선출 (워커/레플리카 중 하나만 수집·학습, 나머지는 모델 번들만 리로드)
+    SCHEDULER_LEADER_BACKEND: str = "auto"  # auto / postgres / redis / file / none
+    SCHEDULER_LEADER_KEY: str = "chamgab:scheduler-leader"
+    SCHEDULER_LEADER_TTL: int = 60  # Redis 락 TTL (초)
+    SCHEDULER_LEADER_CHECK_SECONDS: int = 20  # 리더 락 갱신 / 팔로워 인수 시도 주기
+    SCHEDULER_MODEL_POLL_SECONDS: int = 60  # 팔로워의 모델 번들 변경 확인 주기
 
     class Config:
         env_file = ".env"
@@ -2,24 +2,31 @@
 Supabase 데이터베이스 연결 헬퍼
 """
 import os
-from supabase import create_client, Client
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-_supabase_client: Optional[Client] = None
+from app.core.metrics import TimedSupabaseClient
 
+if TYPE_CHECKING:
+    from supabase import Client
 
-def get_supabase_client() -> Client:
-    """Supabase 클라이언트 싱글톤 반환"""
+_supabase_client: Optional["Client"] = None
+
+
+def get_supabase_client() -> "Client":
+    """Supabase 클라이언트 싱글톤 반환 (supabase import는 첫 호출 시점으로 지연)"""
     global _supabase_client
 
     if _supabase_client is None:
+        from supabase import create_client
+
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_SERVICE_KEY")
 
         if not url or not key:
             raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
 
-        _supabase_client = create_client(url, key)
+        # 쿼리 execute() 지연을 /metrics에 기록
+        _supabase_client = TimedSupabaseClient(create_client(url, key))
 
     return _supabase_client
 
@@ -0,0 +1,436 @@
+"""
+아파트 가격 모델 피처 스펙 (학습 아티팩트에서 컴파일, 모델 번들에 저장)
+
+온라인 예측(ModelService)과 배치 분석(batch_generate_analyses)이 같은 스펙 객체로
+피처를 계산 → 두 추론 경로 사이의 피처 로직 불일치 방지
+
+학습(FeatureEngineer.create_features)도 POI/시장/매물/유동인구 피처를 이 모듈의
+poi_features / market_features / property_features / footfall_features로 계산 →
+같은 행이면 학습 피처와 transform 결과가 같음 (lag/rolling, 건축물대장은 학습 시 실측 조회,
+추론 시 입력값 또는 학습 대체값)
+
+- 입력: 학습 원본과 같은 컬럼 스키마의 레코드 (prop_sido, complex_brand, area_exclusive, ...)
+- 출력: feature_names 순서의 피처 DataFrame (여러 행을 한 번에 계산)
+- 입력에 피처 컬럼(distance_to_subway, price_lag_1m 등)이 있으면 그 값을 우선 사용
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from app.core.region_gazetteer import SIDO_SHORT_NAMES, region_gazetteer
+
+# target encoder 키에 시도 약칭을 붙이는 시도 (광역시/세종, 서울은 plain name, 도는 접두어 없음)
+PREFIXED_SIDO_CODES = ("26", "27", "28", "29", "30", "31", "36")
+
+# 경기도 등 compound city (구 → 시)
+COMPOUND_CITIES = {
+    "수지구": "용인시", "기흥구": "용인시", "처인구": "용인시",
+    "영통구": "수원시", "장안구": "수원시", "권선구": "수원시", "팔달구": "수원시",
+    "단원구": "안산시", "상록구": "안산시",
+    "일산서구": "고양시", "일산동구": "고양시", "덕양구": "고양시",
+    "분당구": "성남시", "수정구": "성남시", "중원구": "성남시",
+    "만안구": "안양시", "동안구": "안양시",
+    "원미구": "부천시", "소사구": "부천시", "오정구": "부천시",
+    "상당구": "청주시", "서원구": "청주시", "청원구": "청주시", "흥덕구": "청주시",
+    "동남구": "천안시", "서북구": "천안시",
+}
+
+# 추론 시 POI 추정 (시군구 등급별)
+POI_PREMIUM_AREAS = {"강남구", "서초구", "송파구", "용산구", "마포구", "성동구"}
+POI_GOOD_AREAS = {"영등포구", "강동구", "광진구", "동작구", "양천구", "분당구", "수지구"}
+POI_TIERS = {
+    "premium": {
+        "distance_to_subway": 300, "subway_count_1km": 3,
+        "distance_to_school": 300, "school_count_1km": 5,
+        "distance_to_academy": 200, "academy_count_1km": 20,
+        "distance_to_hospital": 400, "hospital_count_1km": 3,
+        "distance_to_mart": 500, "convenience_count_500m": 10,
+        "distance_to_park": 400, "poi_score": 80,
+    },
+    "good": {
+        "distance_to_subway": 450, "subway_count_1km": 2,
+        "distance_to_school": 400, "school_count_1km": 4,
+        "distance_to_academy": 350, "academy_count_1km": 12,
+        "distance_to_hospital": 550, "hospital_count_1km": 2,
+        "distance_to_mart": 700, "convenience_count_500m": 7,
+        "distance_to_park": 500, "poi_score": 65,
+    },
+    "other": {
+        "distance_to_subway": 700, "subway_count_1km": 1,
+        "distance_to_school": 500, "school_count_1km": 3,
+        "distance_to_academy": 500, "academy_count_1km": 6,
+        "distance_to_hospital": 800, "hospital_count_1km": 1,
+        "distance_to_mart": 1000, "convenience_count_500m": 4,
+        "distance_to_park": 700, "poi_score": 50,
+    },
+}
+
+# 기준금리 이력 ((연, 월) 이후 적용)
+BASE_RATE_HISTORY = {
+    (2024, 1): 3.50, (2024, 6): 3.50, (2024, 10): 3.25, (2024, 12): 3.00,
+    (2025, 1): 3.00, (2025, 2): 2.75, (2025, 6): 2.50,
+    (2026, 1): 2.50, (2026, 2): 2.50,
+}
+JEONSE_RATIOS = {
+    "강남구": 52, "서초구": 54, "송파구": 58, "용산구": 55,
+    "마포구": 62, "성동구": 60, "영등포구": 65, "강동구": 63,
+}
+BUYING_POWER_BASE = {
+    "강남구": 85, "서초구": 88, "송파구": 92, "용산구": 90,
+    "마포구": 95, "성동구": 93, "영등포구": 100, "강동구": 98,
+}
+SEASONAL_VOLUME_FACTORS = {
+    1: 0.7, 2: 0.8, 3: 1.2, 4: 1.3, 5: 1.2, 6: 0.9,
+    7: 0.8, 8: 0.7, 9: 1.1, 10: 1.2, 11: 1.1, 12: 0.8,
+}
+SCHOOL_GRADES = {
+    "강남구": 5, "서초구": 5, "송파구": 4, "양천구": 4,
+    "노원구": 4, "광진구": 3, "마포구": 3, "성동구": 3,
+    "용산구": 3, "동작구": 3, "영등포구": 2, "강동구": 3,
+}
+
+TEMPORAL_COLUMNS = [
+    "price_lag_1m", "price_lag_3m", "price_rolling_6m_mean",
+    "price_rolling_6m_std", "price_yoy_change", "volume_lag_1m",
+]
+DEFAULT_PRICE_LEVEL = 500_000_000  # fill_values에 시군구 가격수준이 없을 때 lag 기본값
+
+
+SEOUL_SIDO = ("서울특별시", "서울시")
+ADMIN_SUFFIXES = ("시", "군", "구")
+
+
+def _as_object(values: pd.Series) -> pd.Series:
+    """category 등 → object (dict 조회 후 fillna가 가능하도록)"""
+    return values.astype(object) if isinstance(values.dtype, pd.CategoricalDtype) else values
+
+
+def poi_features(sigungu: pd.Series) -> Dict[str, pd.Series]:
+    """시군구 등급별 POI 추정 (학습/추론 공용)"""
+    sigungu = _as_object(sigungu)
+    tier = np.where(
+        sigungu.isin(POI_PREMIUM_AREAS), "premium",
+        np.where(sigungu.isin(POI_GOOD_AREAS), "good", "other"),
+    )
+    table = pd.DataFrame(POI_TIERS).T.astype(np.float64)
+    estimated = table.loc[tier].set_index(sigungu.index)
+    return {col: estimated[col] for col in table.columns}
+
+
+def market_features(year: pd.Series, month: pd.Series, sigungu: pd.Series) -> Dict[str, pd.Series]:
+    """기준금리 이력 / 시군구별 전세가율·매수우위 / 계절 거래량 (학습/추론 공용)"""
+    year = year.astype(np.int64)
+    month = month.astype(np.int64)
+    sigungu = _as_object(sigungu)
+    period = year * 12 + month
+    base_rate = pd.Series(2.50, index=year.index)
+    for (y, m), rate in sorted(BASE_RATE_HISTORY.items()):
+        base_rate = base_rate.where(period < y * 12 + m, rate)
+
+    return {
+        "base_rate": base_rate,
+        "mortgage_rate": (base_rate + 1.8).round(2),
+        "jeonse_ratio": sigungu.map(JEONSE_RATIOS).fillna(65).astype(np.float64),
+        "buying_power_index": (
+            sigungu.map(BUYING_POWER_BASE).fillna(100).astype(np.float64) + (3.0 - base_rate) * 5
+        ).round(1),
+        "transaction_volume": (500 * month.map(SEASONAL_VOLUME_FACTORS).fillna(1.0)).astype(np.int64),
+        "price_change_rate": pd.Series(0.3, index=year.index),
+        "reb_price_index": pd.Series(100.0, index=year.index),
+        "reb_rent_index": pd.Series(100.0, index=year.index),
+    }
+
+
+def property_features(building_age: pd.Series, sigungu: pd.Series) -> Dict[str, pd.Series]:
+    """재건축 / 학군 / 향·뷰·리모델링 중립값 (학습/추론 공용)"""
+    building_age = building_age.astype(np.float64)
+    sigungu = _as_object(sigungu)
+    reconstruction_premium = np.select(
+        [
+            (building_age >= 30) & (building_age <= 40),
+            (building_age >= 25) & (building_age < 30),
+            building_age > 40,
+        ],
+        [0.15, 0.05, 0.10],
+        default=0.0,
+    )
+    school_grade = sigungu.map(SCHOOL_GRADES).fillna(2).astype(np.int64)
+    index = building_age.index
+    return {
+        "is_old_building": (building_age >= 20).astype(np.int64),
+        "is_reconstruction_target": (building_age >= 30).astype(np.int64),
+        "reconstruction_premium": pd.Series(reconstruction_premium, index=index),
+        "school_district_grade": school_grade,
+        "is_premium_school_district": (school_grade >= 4).astype(np.int64),
+        "price_vs_previous": pd.Series(1.0, index=index),
+        "price_vs_complex_avg": pd.Series(1.0, index=index),
+        "price_vs_area_avg": pd.Series(1.0, index=index),
+        "direction_premium": pd.Series(1.0, index=index),
+        "view_premium": pd.Series(1.0, index=index),
+        "is_remodeled": pd.Series(0, index=index),
+        "remodel_premium": pd.Series(0.0, index=index),
+    }
+
+
+def footfall_features(index: pd.Index) -> Dict[str, pd.Series]:
+    """유동인구/상권 기본값 (학습/추론 공용)"""
+    return {
+        "footfall_score": pd.Series(60.0, index=index),
+        "commercial_density": pd.Series(100.0, index=index),
+        "store_diversity_index": pd.Series(0.6, index=index),
+    }
+
+
+def sido_prefix(sido: Optional[str]) -> str:
+    """시도 이름 → target encoder 키 접두어 ("부산광역시" → "부산", 서울/도 → "")"""
+    code = region_gazetteer.sido_code(sido) if sido else None
+    return SIDO_SHORT_NAMES[code] if code in PREFIXED_SIDO_CODES else ""
+
+
+class SigunguKeyResolver:
+    """(sido, sigungu) → target encoder 키 (아티팩트 로드 시 사전 컴파일)
+
+    학습 데이터의 target encoder는 중복 시군구명을 구분하기 위해
+    서울: plain name (강남구), 광역시: 접두어 (부산해운대구),
+    경기 compound: 시+구 (안산시단원구) 형식을 사용.
+
+    비서울 지역의 '중구', '서구' 등이 서울 것과 충돌하지 않도록
+    서울 이외는 접두어 버전을 먼저 시도.
+
+    suffix 매칭은 빌드 시 전체 키의 suffix 인덱스로 미리 계산하고
+    (단일 매칭만 사용), 해석 결과는 (sido, sigungu)별로 캐시 → 조회 1회
+    """
+
+    def __init__(self, mapping: dict):
+        self.keys = frozenset(mapping)
+        suffix_owners: Dict[str, set] = {}
+        for key in self.keys:
+            for i in range(len(key)):
+                suffix_owners.setdefault(key[i:], set()).add(key)
+
+        self.unique_suffix = {
+            suffix: next(iter(owners))
+            for suffix, owners in suffix_owners.items() if len(owners) == 1
+        }
+        self.ambiguous = sorted(
+            suffix for suffix, owners in suffix_owners.items()
+            if len(owners) > 1 and len(suffix) >= 2 and suffix.endswith(ADMIN_SUFFIXES)
+        )
+        self._resolved: Dict[tuple, str] = {}
+
+        if self.ambiguous:
+            sample = ", ".join(self.ambiguous[:5]) + (" ..." if len(self.ambiguous) > 5 else "")
+            print(f"[feature_spec] suffix 중복 시군구 {len(self.ambiguous)}개 ({sample}) "
+                  f"→ 접두어/compound 키 또는 global_mean fallback")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_resolved"] = {}
+        return state
+
+    def resolve(self, sido: str, sigungu: str) -> str:
+        pair = (sido, sigungu)
+        key = self._resolved.get(pair)
+        if key is None:
+            key = self._resolved[pair] = self._resolve(sido, sigungu)
+        return key
+
+    def _resolve(self, sido: str, sigungu: str) -> str:
+        # 서울은 plain name 직접 사용 (매핑에 없으면 global_mean)
+        if sido in SEOUL_SIDO:
+            return sigungu
+
+        # 광역시 접두어 (부산해운대구, 인천연수구)
+        sido_short = sido_prefix(sido)
+        if sido_short and sido_short + sigungu in self.keys:
+            return sido_short + sigungu
+
+        # Compound city (안산시단원구, 용인시수지구)
+        city = COMPOUND_CITIES.get(sigungu)
+        if city and city + sigungu in self.keys:
+            return city + sigungu
+
+        # Suffix match (단일 매칭만)
+        key = self.unique_suffix.get(sigungu)
+        if key is not None:
+            return key
+
+        # 비서울인데 plain name이 서울 것과 충돌할 수 있으므로
+        # 의도적으로 매핑에 없는 키 반환 → global_mean fallback
+        return sido_short + sigungu if sido_short else sigungu
+
+
+def _or_default(df: pd.DataFrame, column: str, default) -> pd.Series:
+    """`value or default`와 같은 규칙 (결측/0/빈 문자열 → default)"""
+    if column not in df.columns:
+        return pd.Series(default, index=df.index)
+    values = df[column]
+    missing = values.isna() | values.isin([0, ""])
+    if not missing.any():
+        return values
+    return values.astype(object).where(~missing, default).infer_objects()
+
+
+@dataclass
+class ApartmentFeatureSpec:
+    """컴파일된 피처 스펙 (인코더/대체값/피처 순서를 dict 조회 테이블로 보관)"""
+    feature_names: List[str]
+    label_codes: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    target_mappings: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    target_global_means: Dict[str, float] = field(default_factory=dict)
+    fill_values: Dict[str, float] = field(default_factory=dict)
+    brand_tiers: Dict[str, int] = field(default_factory=dict)
+    sigungu_resolver: SigunguKeyResolver = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.sigungu_resolver = SigunguKeyResolver(self.target_mappings.get("sigungu", {}))
+
+    @classmethod
+    def from_artifacts(cls, artifacts: dict) -> "ApartmentFeatureSpec":
+        """FeatureEngineer 아티팩트 (label_encoders, target_encoders, ...) → 스펙"""
+        label_codes = {
+            col: {value: code for code, value in enumerate(encoder.classes_)}
+            for col, encoder in (artifacts.get("label_encoders") or {}).items()
+        }
+        target_encoders = artifacts.get("target_encoders") or {}
+        return cls(
+            feature_names=list(artifacts.get("feature_names") or []),
+            label_codes=label_codes,
+            target_mappings={col: dict(enc.get("mapping", {})) for col, enc in target_encoders.items()},
+            target_global_means={col: enc.get("global_mean", 0) for col, enc in target_encoders.items()},
+            fill_values=dict(artifacts.get("fill_values") or {}),
+            brand_tiers=dict(artifacts.get("brand_tiers") or {}),
+        )
+
+    @classmethod
+    def from_bundle(cls, artifacts: dict) -> "ApartmentFeatureSpec":
+        """번들에 저장된 스펙 (이전 번들이면 컴파일 후 번들에 캐시)"""
+        spec = artifacts.get("feature_spec")
+        if spec is None:
+            spec = cls.from_artifacts(artifacts)
+            artifacts["feature_spec"] = spec
+        return spec
+
+    # ─────────────────────────────────────────────
+    # 인코딩
+    # ─────────────────────────────────────────────
+
+    def encode_label(self, column: str, values: pd.Series) -> np.ndarray:
+        """라벨 코드 (미등장 값 → 0)"""
+        codes = self.label_codes.get(column, {})
+        return values.map(codes).fillna(0).to_numpy(dtype=np.int64)
+
+    def target_encode(self, column: str, values: pd.Series) -> np.ndarray:
+        """target encoding (미등장 값 → global mean)"""
+        mapping = self.target_mappings.get(column, {})
+        global_mean = self.target_global_means.get(column, 0)
+        return values.map(mapping).fillna(global_mean).to_numpy(dtype=np.float64)
+
+    # ─────────────────────────────────────────────
+    # 피처 계산
+    # ─────────────────────────────────────────────
+
+    def transform(self, records: Union[pd.DataFrame, List[dict]],
+                  now: Optional[datetime] = None) -> pd.DataFrame:
+        """레코드 → feature_names 순서의 피처 행렬 (학습 원본 행이면 transaction_date로 연/월/분기)"""
+        df = records if isinstance(records, pd.DataFrame) else pd.DataFrame(records)
+        df = df.reset_index(drop=True)
+        if "transaction_date" in df.columns:
+            dates = pd.to_datetime(df["transaction_date"])
+            for column, values in (("transaction_year", dates.dt.year),
+                                   ("transaction_month", dates.dt.month),
+                                   ("transaction_quarter", dates.dt.quarter)):
+                if column not in df.columns:
+                    df[column] = values
+        now = now or datetime.now()
+        current_year = now.year
+        out: Dict[str, Union[pd.Series, np.ndarray, float]] = {}
+
+        # 기본 피처
+        built_year = _or_default(df, "complex_built_year", np.nan)
+        built_year = built_year.where(built_year.notna(), _or_default(df, "prop_built_year", current_year - 20))
+        built_year = built_year.astype(np.int64)
+        building_age = current_year - built_year
+        total_floors = _or_default(df, "prop_floors", 20).astype(np.float64)
+        floor = _or_default(df, "floor", 10).astype(np.float64)
+        year = _or_default(df, "transaction_year", current_year).astype(np.int64)
+        month = _or_default(df, "transaction_month", 1).astype(np.int64)
+
+        out["area_exclusive"] = _or_default(df, "area_exclusive", 84).astype(np.float64)
+        out["floor"] = floor
+        out["transaction_year"] = year
+        out["transaction_month"] = month
+        out["transaction_quarter"] = _or_default(df, "transaction_quarter", 1)
+        out["building_age"] = building_age
+        out["floor_ratio"] = (floor / total_floors).where(total_floors > 0, 0.5)
+        out["total_floors"] = total_floors
+        out["total_units"] = _or_default(df, "complex_total_units", 500)
+        out["parking_ratio"] = _or_default(df, "complex_parking_ratio", 1.0)
+        brand = _or_default(df, "complex_brand", "")
+        out["brand_tier"] = brand.map(self.brand_tiers).fillna(1).astype(np.int64)
+
+        # 지역 인코딩 (sido-prefixed 시군구 키로 중구/서구 등 충돌 방지)
+        # 학습과 같은 우선순위: 매물 시군구 → 거래 시군구, 거래 법정동 → 매물 읍면동
+        sido = _or_default(df, "prop_sido", "서울시")
+        sigungu = _or_default(df, "prop_sigungu", np.nan)
+        sigungu = sigungu.where(sigungu.notna(), _or_default(df, "sigungu", "강남구"))
+        dong = _or_default(df, "dong", np.nan)
+        dong = dong.where(dong.notna(), _or_default(df, "prop_eupmyeondong", "unknown"))
+        pairs = pd.MultiIndex.from_arrays([sido, sigungu])
+        unique_pairs = pairs.unique()
+        keys = pd.Series(
+            [self.sigungu_resolver.resolve(s, g) for s, g in unique_pairs], index=unique_pairs
+        )
+        sigungu_keys = pd.Series(keys.reindex(pairs).to_numpy(), index=df.index)
+
+        out["sido_encoded"] = self.encode_label("sido", sido)
+        out["sigungu_encoded"] = self.encode_label("sigungu", sigungu_keys)
+        out["sigungu_target_enc"] = self.target_encode("sigungu", sigungu_keys)
+        out["dong_target_enc"] = self.target_encode("dong", dong)
+
+        out.update(self._temporal_features(df))
+        out.update({
+            col: self._provided(df, col, estimated)  # 입력에 POI 값이 있으면 우선
+            for col, estimated in poi_features(sigungu).items()
+        })
+        out.update(market_features(year, month, sigungu))
+        out.update(property_features(building_age, sigungu))
+        out.update(footfall_features(df.index))
+
+        features = pd.DataFrame(
+            {col: out[col] if col in out else self.fill_values.get(col, 0) for col in self.feature_names},
+            index=df.index,
+        )
+        return features
+
+    @staticmethod
+    def _provided(df: pd.DataFrame, column: str, default: pd.Series) -> pd.Series:
+        """입력에 피처 값이 있으면 사용, 없으면 default"""
+        if column not in df.columns:
+            return default
+        return df[column].where(df[column].notna(), default).infer_objects()
+
+    def _temporal_features(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        lag/rolling 피처 (조회된 값이 없으면 학습 결측 대체값 = 이력 없는 학습 행과 같은 값,
+        대체값이 없는 이전 번들은 학습 가격수준 fallback, 0이 아님)
+        """
+        price_level = self.fill_values.get("sigungu_target_enc", DEFAULT_PRICE_LEVEL)
+        defaults = {
+            col: self.fill_values.get(col, default)
+            for col, default in (
+                ("price_lag_1m", price_level),
+                ("price_lag_3m", price_level),
+                ("price_rolling_6m_mean", price_level),
+                ("price_rolling_6m_std", 0.0),
+                ("price_yoy_change", 0.0),
+                ("volume_lag_1m", 0),
+            )
+        }
+        return {
+            col: self._provided(df, col, pd.Series(default, index=df.index, dtype=np.float64))
+            for col, default in defaults.items()
+        }
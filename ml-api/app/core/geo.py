@@ -0,0 +1,83 @@
+"""
+좌표 거리/반경 질의 (벡터화 Haversine + BallTree 색인)
+
+- haversine_m: 좌표 배열 간 거리 (미터, 브로드캐스팅)
+- GeoIndex: 시설 좌표 집합을 한 번 색인 → 여러 중심점의
+  최근접 거리 / 반경 내 개수를 한 번의 배치 질의로 계산
+"""
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+
+EARTH_RADIUS_M = 6371000  # 지구 반지름 (미터)
+
+
+def haversine_m(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """두 좌표 배열 간 거리 (미터, Haversine 공식 / numpy 브로드캐스팅)"""
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    delta_phi = phi2 - phi1
+    delta_lambda = np.radians(np.asarray(lon2) - np.asarray(lon1))
+
+    a = np.sin(delta_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+class GeoIndex:
+    """시설 좌표 색인 (BallTree, haversine 거리)"""
+
+    def __init__(self, lat, lon):
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+        valid = np.isfinite(lat) & np.isfinite(lon)
+        self.size = int(valid.sum())
+        self._tree = BallTree(np.radians(np.column_stack([lat[valid], lon[valid]])), metric="haversine") \
+            if self.size else None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, lat_col: str, lon_col: str) -> "GeoIndex":
+        """DataFrame 좌표 컬럼으로 색인 (숫자 변환 불가 값은 제외)"""
+        return cls(pd.to_numeric(df[lat_col], errors="coerce"),
+                   pd.to_numeric(df[lon_col], errors="coerce"))
+
+    def __len__(self) -> int:
+        return self.size
+
+    @staticmethod
+    def _points(lat, lon) -> np.ndarray:
+        return np.radians(np.column_stack([np.atleast_1d(lat), np.atleast_1d(lon)]).astype(np.float64))
+
+    def nearest(self, lat, lon) -> np.ndarray:
+        """중심점별 최근접 시설 거리 (미터, 시설이 없으면 NaN)"""
+        points = self._points(lat, lon)
+        if self._tree is None:
+            return np.full(len(points), np.nan)
+        distances, _ = self._tree.query(points, k=1)
+        return distances[:, 0] * EARTH_RADIUS_M
+
+    def count_within(self, lat, lon, radius_m: float) -> np.ndarray:
+        """중심점별 반경 내(경계 포함) 시설 수"""
+        points = self._points(lat, lon)
+        if self._tree is None:
+            return np.zeros(len(points), dtype=np.int64)
+        return self._tree.query_radius(points, r=radius_m / EARTH_RADIUS_M, count_only=True).astype(np.int64)
+
+    def query(self, lat, lon, radii: Iterable[float] = (500, 1000)) -> Dict[str, np.ndarray]:
+        """최근접 거리 + 반경별 개수 ({"nearest": ..., "count_500m": ..., "count_1km": ...})"""
+        result = {"nearest": self.nearest(lat, lon)}
+        for radius in radii:
+            result[f"count_{radius_label(radius)}"] = self.count_within(lat, lon, radius)
+        return result
+
+
+def radius_label(radius_m: float) -> str:
+    """500 → "500m", 1000 → "1km" (피처 컬럼명 규칙)"""
+    return f"{radius_m / 1000:g}km" if radius_m >= 1000 else f"{radius_m:g}m"
+
+
+def optional_index(df: Optional[pd.DataFrame], lat_col: str, lon_col: str) -> Optional[GeoIndex]:
+    """빈/없는 데이터면 None"""
+    if df is None or df.empty:
+        return None
+    return GeoIndex.from_frame(df, lat_col, lon_col)
@@ -0,0 +1,110 @@
+"""
+저지연 단건 추론 엔진 (sklearn 래퍼 / pandas 우회)
+
+XGBRegressor.predict / XGBClassifier.predict_proba는 1행 DataFrame에도
+DataFrame 검증 → DMatrix 생성 → 피처명 확인을 거쳐 트리 탐색보다 비용이 큼.
+
+- XGBoost: 원시 Booster.inplace_predict (피처 순서는 엔진 생성 시 1회 검증)
+- LightGBM: 원시 Booster.predict
+- 스레드별로 사전 할당한 (1, n_features) float32 행 버퍼 재사용
+"""
+import threading
+import weakref
+from typing import TYPE_CHECKING, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import xgboost as xgb  # 모델 unpickle 시 로드됨 (상권 서비스 import만으로 불러오지 않음)
+
+# 모델 객체별 엔진 캐시 (요청마다 서비스를 생성해도 Booster/버퍼 재사용)
+_ENGINES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _iteration_range(booster: "xgb.Booster") -> Tuple[int, int]:
+    """sklearn 래퍼와 같은 규칙 (early stopping이면 best_iteration까지)"""
+    try:
+        return 0, booster.best_iteration + 1
+    except AttributeError:
+        return 0, 0
+
+
+class BoosterInferenceEngine:
+    """원시 Booster + 고정 피처 순서 기반 단건 예측"""
+
+    def __init__(self, booster: "xgb.Booster", feature_names: Sequence[str], lgbm_booster=None):
+        self.feature_names = list(feature_names)
+        if booster.feature_names and list(booster.feature_names) != self.feature_names:
+            raise ValueError("Booster 피처 순서가 feature_names와 다릅니다")
+        if booster.num_features() != len(self.feature_names):
+            raise ValueError(
+                f"피처 수 불일치: booster {booster.num_features()}, feature_names {len(self.feature_names)}"
+            )
+
+        self.booster = booster
+        self.lgbm_booster = lgbm_booster
+        self.iteration_range = _iteration_range(booster)
+        self._local = threading.local()
+
+    @classmethod
+    def for_model(cls, model, feature_names: Sequence[str], lgbm_model=None) -> Optional["BoosterInferenceEngine"]:
+        """sklearn 래퍼 모델 → 엔진 (모델별 캐시, Booster가 없는 모델이면 None)"""
+        if model is None or not hasattr(model, "get_booster"):
+            return None
+
+        engine = _ENGINES.get(model)
+        lgbm_booster = getattr(lgbm_model, "booster_", None)
+        if (engine is None or engine.feature_names != list(feature_names)
+                or engine.lgbm_booster is not lgbm_booster):
+            engine = cls(model.get_booster(), feature_names, lgbm_booster)
+            _ENGINES[model] = engine
+        return engine
+
+    # ─────────────────────────────────────────────
+    # 행 버퍼
+    # ─────────────────────────────────────────────
+
+    def row_buffer(self) -> np.ndarray:
+        """현재 스레드의 (1, n_features) float32 버퍼"""
+        row = getattr(self._local, "row", None)
+        if row is None:
+            row = self._local.row = np.zeros((1, len(self.feature_names)), dtype=np.float32)
+        return row
+
+    def fill(self, values: Mapping[str, float], default: float = 0.0) -> np.ndarray:
+        """피처명 → 값 dict를 고정 순서로 버퍼에 기록"""
+        row = self.row_buffer()
+        for i, name in enumerate(self.feature_names):
+            row[0, i] = values.get(name, default)
+        return row
+
+    def load(self, features: pd.DataFrame) -> np.ndarray:
+        """feature_names 순서의 1행 피처 행렬을 버퍼에 복사"""
+        row = self.row_buffer()
+        np.copyto(row, features.to_numpy(dtype=np.float32, copy=False))
+        return row
+
+    # ─────────────────────────────────────────────
+    # 예측
+    # ─────────────────────────────────────────────
+
+    def predict(self, rows: np.ndarray) -> np.ndarray:
+        """XGBoost 예측값 (회귀: 값, 이진 분류: 클래스 1 확률)"""
+        return self.booster.inplace_predict(
+            rows, iteration_range=self.iteration_range, validate_features=False,
+        )
+
+    def predict_proba(self, rows: np.ndarray) -> np.ndarray:
+        """XGBClassifier.predict_proba와 같은 (n, n_classes) 확률"""
+        proba = self.predict(rows)
+        if proba.ndim == 1:
+            return np.column_stack([1 - proba, proba])
+        return proba
+
+    def predict_lgbm(self, rows: np.ndarray) -> np.ndarray:
+        """LightGBM 예측값 (원시 Booster, 단일 스레드)
+
+        LightGBM 분할 임계값은 float64 → float32 버퍼 대신 float64 행을 넘겨야 래퍼와 일치
+        """
+        return self.lgbm_booster.predict(rows, num_threads=1)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+수집 작업 영속 저장소 (SQLite)
+
+CollectorService 작업 상태와 (지역, 월, 소스) 단위 수집 체크포인트를 디스크에 기록
+- 서버 재시작 후에도 작업 상태 조회 가능 (/api/collect/status)
+- 완료된 셀(region_code, year_month, source)은 건수/체크섬과 함께 저장
+- 중단된 작업은 완료되지 않은 셀부터 재개
+"""
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 수집 작업 DB 경로 (data/는 .gitignore 대상)
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+JOB_DB_PATH = DATA_DIR / "collector_jobs.db"
+
+# 실거래 신고 기한 (계약 후 30일) - 이 기간이 지나기 전 수집된 월은 재수집 대상
+REPORTING_GRACE_DAYS = 30
+
+CellKey = Tuple[str, str, str]  # (region_code, year_month, source)
+
+
+def is_month_settled(year_month: str, completed_at: str) -> bool:
+    """
+    수집 시점에 해당 월의 신고 기한이 지났는지 여부
+
+    예: 202501 데이터는 2025-03-02 이후 수집분부터 확정 (1월 말 + 30일)
+    """
+    year, month = int(year_month[:4]), int(year_month[4:6])
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    month_end = datetime(next_year, next_month, 1)
+    try:
+        collected = datetime.fromisoformat(completed_at)
+    except (TypeError, ValueError):
+        return False
+    return (collected - month_end).days >= REPORTING_GRACE_DAYS
+
+
+class CollectionJobStore:
+    """수집 작업/체크포인트 SQLite 저장소"""
+
+    def __init__(self, db_path: Path = JOB_DB_PATH):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self):
+        """작업 단위 커넥션 (스레드/이벤트루프 공용)"""
+        with self._lock:
+            if not self._initialized:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), timeout=30)
+            conn.row_factory = sqlite3.Row
+            try:
+                if not self._initialized:
+                    self._create_tables(conn)
+                    self._initialized = True
+                yield conn
+                conn.commit()
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _create_tables(conn: sqlite3.Connection):
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS collection_jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                region_codes TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                months TEXT NOT NULL,
+                started_at TEXT,
+                completed_at TEXT,
+                molit_count INTEGER DEFAULT 0,
+                rone_count INTEGER DEFAULT 0,
+                cells_total INTEGER DEFAULT 0,
+                cells_completed INTEGER DEFAULT 0,
+                cells_skipped INTEGER DEFAULT 0,
+                error TEXT,
+                updated_at TEXT
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS collection_cells (
+                region_code TEXT NOT NULL,
+                year_month TEXT NOT NULL,
+                source TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                row_count INTEGER NOT NULL,
+                checksum TEXT NOT NULL,
+                completed_at TEXT NOT NULL,
+                PRIMARY KEY (region_code, year_month, source)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cells_job ON collection_cells(job_id)"
+        )
+
+    # ─────────────────────────────────────────────
+    # 작업
+    # ─────────────────────────────────────────────
+
+    def save_job(self, job: Dict) -> None:
+        """작업 상태 저장 (dataclass asdict 결과)"""
+        row = dict(job)
+        row["status"] = getattr(row["status"], "value", row["status"])
+        row["region_codes"] = json.dumps(row["region_codes"])
+        row["months"] = json.dumps(row["months"])
+        row["updated_at"] = datetime.now().isoformat()
+        columns = [
+            "job_id", "status", "region_codes", "year", "months",
+            "started_at", "completed_at", "molit_count", "rone_count",
+            "cells_total", "cells_completed", "cells_skipped", "error", "updated_at",
+        ]
+        values = [row.get(c) for c in columns]
+        placeholders = ", ".join("?" for _ in columns)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO collection_jobs ({', '.join(columns)}) "
+                f"VALUES ({placeholders})",
+                values,
+            )
+
+    def load_job(self, job_id: str) -> Optional[Dict]:
+        """작업 조회"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM collection_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None) -> List[Dict]:
+        """작업 목록 (최신순)"""
+        query = "SELECT * FROM collection_jobs"
+        params: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY job_id DESC"
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [self._row_to_job(r) for r in rows]
+
+    def delete_job(self, job_id: str) -> bool:
+        """작업 삭제 (체크포인트 셀은 유지 - 데이터는 이미 저장됨)"""
+        with self._connect() as conn:
+            cur = conn.execute(
+                "DELETE FROM collection_jobs WHERE job_id = ?", (job_id,)
+            )
+        return cur.rowcount > 0
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict:
+        job = dict(row)
+        job.pop("updated_at", None)
+        job["region_codes"] = json.loads(job["region_codes"])
+        job["months"] = json.loads(job["months"])
+        return job
+
+    # ─────────────────────────────────────────────
+    # 셀 체크포인트
+    # ─────────────────────────────────────────────
+
+    def mark_cells(self, cells: Iterable[Tuple[CellKey, int, str]], job_id: str) -> None:
+        """
+        셀 완료 기록
+
+        Args:
+            cells: ((region_code, year_month, source), row_count, checksum) 목록
+            job_id: 수집 작업 ID
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (key[0], key[1], key[2], job_id, row_count, checksum, now)
+            for key, row_count, checksum in cells
+        ]
+        if not rows:
+            return
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO collection_cells "
+                "(region_code, year_month, source, job_id, row_count, checksum, completed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def completed_cells(self, job_id: str, sources: Optional[List[str]] = None) -> Set[CellKey]:
+        """
+        건너뛸 수 있는 셀 집합
+
+        - 같은 작업에서 이미 완료한 셀 (재개)
+        - 신고 기한이 지난 뒤 수집되어 더 바뀌지 않는 셀
+        """
+        query = "SELECT region_code, year_month, source, job_id, completed_at FROM collection_cells"
+        params: list = []
+        if sources:
+            query += f" WHERE source IN ({', '.join('?' for _ in sources)})"
+            params.extend(sources)
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return {
+            (r["region_code"], r["year_month"], r["source"])
+            for r in rows
+            if r["job_id"] == job_id or is_month_settled(r["year_month"], r["completed_at"])
+        }
+
+    def get_cell(self, region_code: str, year_month: str, source: str) -> Optional[Dict]:
+        """단일 셀 조회"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM collection_cells "
+                "WHERE region_code = ? AND year_month = ? AND source = ?",
+                (region_code, year_month, source),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def has_cells(self, source: str = "molit") -> bool:
+        """체크포인트 기록 존재 여부"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM collection_cells WHERE source = ? LIMIT 1", (source,)
+            ).fetchone()
+        return row is not None
+
+    def pending_months(
+        self,
+        region_codes: List[str],
+        year_months: List[str],
+        source: str = "molit",
+    ) -> List[str]:
+        """확정(settled)되지 않은 셀이 하나라도 남은 월 목록"""
+        if not year_months:
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT region_code, year_month, completed_at FROM collection_cells "
+                f"WHERE source = ? AND year_month IN ({', '.join('?' for _ in year_months)})",
+                [source, *year_months],
+            ).fetchall()
+        settled = {
+            (r["region_code"], r["year_month"])
+            for r in rows
+            if is_month_settled(r["year_month"], r["completed_at"])
+        }
+        return [
+            ym for ym in year_months
+            if any((rc, ym) not in settled for rc in region_codes)
+        ]
+
+
+# 싱글톤 인스턴스
+job_store = CollectionJobStore()
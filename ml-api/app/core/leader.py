@@ -0,0 +1,288 @@
+"""
+스케줄러 리더 선출 (여러 uvicorn 워커/레플리카 중 하나만 수집·학습 실행)
+
+- postgres: pg_try_advisory_lock (전용 세션이 끊기면 락도 자동 해제)
+- redis: SET NX PX + 토큰 비교 갱신/해제 (TTL 안에 갱신 못 하면 다른 인스턴스가 인수)
+- file: fcntl.flock (같은 호스트의 워커끼리, 로컬 실행용)
+- none: 항상 리더 (단일 프로세스, 기존 동작)
+
+모든 메서드는 동기 호출 (스케줄러가 asyncio.to_thread로 실행)
+"""
+import hashlib
+import os
+import re
+import socket
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+try:
+    import psycopg2
+    HAS_PSYCOPG2 = True
+except ImportError:
+    HAS_PSYCOPG2 = False
+
+CONNECT_TIMEOUT = 5  # 락 백엔드 연결/응답 타임아웃 (초)
+
+# 내 토큰일 때만 TTL 연장 / 삭제 (다른 인스턴스가 인수한 락을 건드리지 않도록)
+_REDIS_RENEW = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+_REDIS_RELEASE = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+
+
+def instance_id() -> str:
+    """현재 프로세스 식별자 (호스트:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaderLock:
+    """리더 락 인터페이스"""
+
+    backend = "none"
+
+    def __init__(self, key: str = ""):
+        self.key = key
+        self.token = f"{instance_id()}:{uuid.uuid4().hex[:8]}"
+        self.held = False
+
+    def acquire(self) -> bool:
+        """락 획득 시도 (대기하지 않음). 이미 보유 중이면 True"""
+        self.held = True
+        return True
+
+    def renew(self) -> bool:
+        """보유 상태 확인/연장. 잃었으면 False"""
+        return self.held
+
+    def release(self):
+        self.held = False
+
+    def holder(self) -> Optional[str]:
+        """현재 락 보유자 (알 수 없으면 None)"""
+        return self.token if self.held else None
+
+    def describe(self) -> Dict:
+        return {"backend": self.backend, "key": self.key, "held": self.held, "holder": self.holder()}
+
+
+class FileLeaderLock(LeaderLock):
+    """fcntl.flock 파일 락 (프로세스가 죽으면 OS가 해제)"""
+
+    backend = "file"
+
+    def __init__(self, path: Path):
+        super().__init__(str(path))
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, self.token.encode("utf-8"))
+        self._fd = fd
+        self.held = True
+        return True
+
+    def renew(self) -> bool:
+        return self._fd is not None
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            os.ftruncate(self._fd, 0)
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self.held = False
+
+    def holder(self) -> Optional[str]:
+        try:
+            return self.path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+
+class RedisLeaderLock(LeaderLock):
+    """Redis SET NX PX 락 (renew 주기 < TTL 이어야 함)"""
+
+    backend = "redis"
+
+    def __init__(self, url: str, key: str, ttl_seconds: int = 60):
+        super().__init__(key)
+        self.url = url
+        self.ttl_ms = int(ttl_seconds * 1000)
+        self._client = None
+
+    def _redis(self):
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                self.url, socket_timeout=CONNECT_TIMEOUT, socket_connect_timeout=CONNECT_TIMEOUT,
+            )
+        return self._client
+
+    def acquire(self) -> bool:
+        if self.held:
+            return self.renew()
+        try:
+            self.held = bool(self._redis().set(self.key, self.token, nx=True, px=self.ttl_ms))
+        except (redis.RedisError, OSError) as e:
+            print(f"[리더] Redis 락 획득 실패: {e}")
+            self.held = False
+        return self.held
+
+    def renew(self) -> bool:
+        if not self.held:
+            return False
+        try:
+            self.held = bool(self._redis().eval(_REDIS_RENEW, 1, self.key, self.token, self.ttl_ms))
+        except (redis.RedisError, OSError) as e:
+            print(f"[리더] Redis 락 갱신 실패: {e}")
+            self.held = False  # TTL이 지나면 다른 인스턴스가 인수할 수 있으므로 보수적으로 포기
+        return self.held
+
+    def release(self):
+        if not self.held:
+            return
+        self.held = False
+        try:
+            self._redis().eval(_REDIS_RELEASE, 1, self.key, self.token)
+        except (redis.RedisError, OSError) as e:
+            print(f"[리더] Redis 락 해제 실패 (TTL 후 만료): {e}")
+
+    def holder(self) -> Optional[str]:
+        try:
+            value = self._redis().get(self.key)
+        except (redis.RedisError, OSError):
+            return None
+        return value.decode("utf-8") if value else None
+
+
+class PostgresLeaderLock(LeaderLock):
+    """세션 단위 advisory lock (락 보유 중에는 전용 연결 유지)"""
+
+    backend = "postgres"
+
+    def __init__(self, dsn: str, key: str):
+        super().__init__(key)
+        self.dsn = re.sub(r"^postgres(ql)?\+\w+://", "postgresql://", dsn)  # SQLAlchemy 드라이버 표기 제거
+        self.lock_id = advisory_lock_id(key)
+        self._conn = None
+
+    def _query(self, sql: str, params: tuple = ()):
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg2.connect(self.dsn, connect_timeout=CONNECT_TIMEOUT)
+            self._conn.autocommit = True
+        with self._conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchone()[0]
+
+    def _close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+            self._conn = None
+
+    def acquire(self) -> bool:
+        if self.held:
+            return self.renew()
+        try:
+            self.held = bool(self._query("SELECT pg_try_advisory_lock(%s)", (self.lock_id,)))
+        except (psycopg2.Error, OSError) as e:
+            print(f"[리더] Postgres 락 획득 실패: {e}")
+            self.held = False
+        if not self.held:
+            self._close()  # 팔로워는 연결을 잡고 있지 않음
+        return self.held
+
+    def renew(self) -> bool:
+        if not self.held:
+            return False
+        try:
+            self._query("SELECT 1")
+        except (psycopg2.Error, OSError) as e:
+            print(f"[리더] Postgres 락 세션 끊김: {e}")
+            self.held = False  # 세션이 끊기면 서버가 락을 해제함
+            self._close()
+        return self.held
+
+    def release(self):
+        if self.held:
+            try:
+                self._query("SELECT pg_advisory_unlock(%s)", (self.lock_id,))
+            except (psycopg2.Error, OSError) as e:
+                print(f"[리더] Postgres 락 해제 실패 (세션 종료로 해제): {e}")
+        self.held = False
+        self._close()
+
+    def holder(self) -> Optional[str]:
+        return self.token if self.held else None
+
+
+def advisory_lock_id(key: str) -> int:
+    """락 이름 → pg advisory lock용 signed 64bit 정수"""
+    return int.from_bytes(hashlib.sha1(key.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def create_leader_lock(
+    backend: str,
+    key: str,
+    file_path: Path,
+    database_url: str = "",
+    redis_url: str = "",
+    ttl_seconds: int = 60,
+) -> LeaderLock:
+    """
+    설정에 맞는 리더 락 생성.
+
+    Args:
+        backend: auto / postgres / redis / file / none
+            (auto: DATABASE_URL이 Postgres면 postgres → REDIS_URL 있으면 redis → file)
+    """
+    if backend == "auto":
+        if database_url.startswith("postgres") and HAS_PSYCOPG2:
+            backend = "postgres"
+        elif redis_url and HAS_REDIS:
+            backend = "redis"
+        else:
+            backend = "file"
+
+    if backend == "postgres":
+        if HAS_PSYCOPG2 and database_url:
+            return PostgresLeaderLock(database_url, key)
+        print("[리더] Warning: psycopg2/DATABASE_URL 없음, 파일 락 사용")
+    elif backend == "redis":
+        if HAS_REDIS and redis_url:
+            return RedisLeaderLock(redis_url, key, ttl_seconds)
+        print("[리더] Warning: redis/REDIS_URL 없음, 파일 락 사용")
+    elif backend == "none":
+        return LeaderLock(key)
+    elif backend != "file":
+        print(f"[리더] Warning: 알 수 없는 백엔드 {backend}, 파일 락 사용")
+
+    if not HAS_FCNTL:
+        print("[리더] Warning: fcntl 미지원 플랫폼, 리더 선출 없이 실행")
+        return LeaderLock(key)
+    return FileLeaderLock(file_path)
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+요청 지연/내부 구간 메트릭 (Prometheus 텍스트 포맷, GET /metrics)
+
+- chamgab_http_request_duration_seconds: 라우트 템플릿별 요청 지연 (미들웨어)
+- chamgab_supabase_query_duration_seconds: get_supabase_client() 쿼리 execute() 지연 (테이블/작업별)
+- chamgab_model_inference_duration_seconds: 가격/상권 모델 예측 지연 (백엔드별)
+- chamgab_shap_duration_seconds: SHAP 계산 지연
+- chamgab_cache_requests_total: 라우터 캐시 적중/미스 (적중률 = hit / (hit + miss))
+
+외부 의존성 없이 프로세스 메모리에 집계 → uvicorn 워커별 값 (Prometheus가 인스턴스별로 수집)
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 요청/쿼리 지연용 기본 버킷 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 쿼리 빌더에서 작업 이름으로 쓰는 메서드 (select/insert/... 중 처음 호출된 것)
+SUPABASE_OPERATIONS = {"select", "insert", "upsert", "update", "delete"}
+
+INF_BUCKET = 'le="+Inf"'
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 {sorted(labels)} != {sorted(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (+ _sum, _count)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List] = {}  # 레이블 → [버킷별 개수, 합계, 개수]
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 소요 시간 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, [list(s[0]), s[1], s[2]]) for key, s in self._series.items())
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, INF_BUCKET)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 + Prometheus 텍스트 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"중복 메트릭: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 싱글톤 레지스트리 + 메트릭
+registry = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "chamgab_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+SUPABASE_QUERY_SECONDS = registry.histogram(
+    "chamgab_supabase_query_duration_seconds",
+    "Supabase query execute() latency",
+    ["table", "operation", "status"],
+)
+MODEL_INFERENCE_SECONDS = registry.histogram(
+    "chamgab_model_inference_duration_seconds",
+    "Model prediction latency",
+    ["model", "backend"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+SHAP_SECONDS = registry.histogram(
+    "chamgab_shap_duration_seconds",
+    "SHAP explanation latency",
+    ["model"],
+)
+CACHE_REQUESTS = registry.counter(
+    "chamgab_cache_requests_total",
+    "Router cache lookups by result (hit/miss)",
+    ["cache", "result"],
+)
+
+
+# ─────────────────────────────────────────────
+# HTTP 미들웨어
+# ─────────────────────────────────────────────
+
+def _route_template(scope) -> str:
+    """매칭된 라우트 템플릿 (include_router 접두사 포함)
+
+    FastAPI 버전에 따라 route.path에 include_router(prefix=...) 접두사가 빠져 있음
+    → 요청 경로에서 라우트 정규식이 매칭되기 시작한 앞부분을 접두사로 붙임 (접두사는 고정 문자열)
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+    regex = getattr(route, "path_regex", None)
+    path = scope.get("path", "")
+    if regex is None or regex.match(path):
+        return template
+    for index, char in enumerate(path):
+        if char == "/" and index and regex.match(path[index:]):
+            return path[:index] + template
+    return template
+
+
+async def metrics_middleware(request, call_next):
+    """라우트 템플릿 기준 요청 지연 기록 (경로 파라미터별로 시계열이 늘지 않도록)"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=_route_template(request.scope),
+            status=str(status),
+        )
+
+
+# ─────────────────────────────────────────────
+# Supabase 쿼리 타이밍
+# ─────────────────────────────────────────────
+
+class TimedQuery:
+    """쿼리 빌더 프록시: 체인 메서드 결과를 계속 감싸고 execute()만 시간 측정"""
+
+    def __init__(self, builder, table: str, operation: Optional[str] = None):
+        self._builder = builder
+        self._table = table
+        self._operation = operation
+
+    def execute(self):
+        status = "error"
+        started = time.perf_counter()
+        try:
+            result = self._builder.execute()
+            status = "ok"
+            return result
+        finally:
+            SUPABASE_QUERY_SECONDS.observe(
+                time.perf_counter() - started,
+                table=self._table,
+                operation=self._operation or "other",
+                status=status,
+            )
+
+    def _wrap(self, value, name: str):
+        if hasattr(value, "execute"):
+            operation = self._operation or (name if name in SUPABASE_OPERATIONS else None)
+            return TimedQuery(value, self._table, operation)
+        return value
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if hasattr(attr, "execute"):  # .not_ 등 빌더를 돌려주는 속성
+            return self._wrap(attr, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            return self._wrap(attr(*args, **kwargs), name)
+        return call
+
+
+class TimedSupabaseClient:
+    """Supabase 클라이언트 프록시 (table/from_/rpc 쿼리만 측정, 나머지는 그대로 위임)"""
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name: str) -> TimedQuery:
+        return TimedQuery(self._client.table(name), name)
+
+    def from_(self, name: str) -> TimedQuery:
+        return TimedQuery(self._client.from_(name), name)
+
+    def rpc(self, fn: str, *args, **kwargs) -> TimedQuery:
+        return TimedQuery(self._client.rpc(fn, *args, **kwargs), f"rpc:{fn}", "rpc")
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+# ─────────────────────────────────────────────
+# 캐시 적중률
+# ─────────────────────────────────────────────
+
+def record_cache(cache: str, hit: bool):
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
@@ -0,0 +1,244 @@
+"""
+단지명 매칭 엔진 (건축물대장 / 실거래 / complexes 이름 대조)
+
+- 이름별 정규화 키(normalize_name / normalize_name_deep)를 한 번만 계산
+- 문자 2-gram (+ 한 글자 건너뛴 쌍) 역색인: (블록, gram) 특성의 희소 행렬 곱 한 번으로
+  같은 블록(예: 시군구+법정동) 안에서 gram을 공유하는 후보 쌍과 Dice 유사도를 함께 계산
+- 후보에만 names_match와 같은 단계 판정: exact → contains → partial → fuzzy
+  (fuzzy: SequenceMatcher ≥ 0.75, real_quick_ratio/quick_ratio 상한으로 조기 배제)
+- strict: normalize_name 결과가 같을 때만 (접미사 제거 없음).
+  "exact"는 접미사 제거 후 같아도 일치로 보므로 ("센트럴타워" = "센트럴파크")
+  단지 병합/삭제처럼 되돌리기 어려운 작업은 strict만 사용
+
+사용 예:
+    index = NameIndex(names, blocks=[(sigungu, dong), ...])
+    matches = index.match_many(queries, query_blocks, tiers=("strict",))
+"""
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+MATCH_PRIORITY = {"exact": 1, "contains": 2, "partial": 3, "fuzzy": 4}
+# match_many 전용 tier (names_match 판정에는 없음, 기본 tiers에도 미포함)
+STRICT = "strict"
+TIER_PRIORITY = {STRICT: 0, **MATCH_PRIORITY}
+FUZZY_THRESHOLD = 0.75
+
+# 아파트명에서 제거할 접미사 (긴 것부터)
+_SUFFIXES = [
+    "아파트", "주상복합", "타운하우스", "빌리지",
+    "타워", "팰리스", "파크", "맨션",
+    "빌라", "빌딩", "하우스", "단지",
+    "오피스텔", "레지던스",
+]
+
+
+def normalize_name(name: str) -> str:
+    """단지명 정규화 (공백/특수문자 제거, 소문자화)"""
+    name = re.sub(r"[^\w가-힣]", "", name)
+    return name.strip().lower()
+
+
+def normalize_name_deep(name: str) -> str:
+    """
+    단지명 심층 정규화:
+    1. 괄호 내용 제거: "이안용산1동(103동)" → "이안용산1동"
+    2. 특수문자/공백 제거
+    3. 접미사 제거: "래미안아파트" → "래미안"
+    4. 영문 소문자화
+    """
+    if not name:
+        return ""
+    # 괄호 내용 제거
+    name = re.sub(r"\([^)]*\)", "", name)
+    # 특수문자/공백 제거, 소문자화
+    name = re.sub(r"[^\w가-힣]", "", name).strip().lower()
+    # 접미사 제거 (긴 것부터)
+    for sfx in _SUFFIXES:
+        if name.endswith(sfx) and len(name) > len(sfx):
+            name = name[: -len(sfx)]
+            break
+    return name
+
+
+@dataclass(frozen=True)
+class NameKey:
+    """사전 계산된 정규화 키"""
+    norm: str
+    deep: str
+
+    @classmethod
+    def of(cls, name: Optional[str]) -> "NameKey":
+        name = name or ""
+        return cls(normalize_name(name), normalize_name_deep(name))
+
+    def grams(self) -> Set[str]:
+        """후보 추림용 문자 쌍 (인접 + 한 글자 건너뜀, norm/deep 모두)"""
+        grams: Set[str] = set()
+        for s in {self.norm, self.deep}:
+            grams.update(s[i:i + 2] for i in range(len(s) - 1))
+            grams.update(s[i] + s[i + 2] for i in range(len(s) - 2))
+        return grams
+
+
+def match_keys(api: NameKey, cx: NameKey) -> Optional[str]:
+    """
+    정규화 키 기준 names_match 판정.
+
+    Returns:
+        "exact" | "contains" | "partial" | "fuzzy" 또는 None
+    """
+    if not api.norm or not cx.norm:
+        return None
+
+    # 1) 정규화 후 완전 일치
+    if api.norm == cx.norm:
+        return "exact"
+    # 2) API 건물명이 단지명을 포함 / 3) 단지명이 API 건물명을 포함
+    if len(cx.norm) >= 2 and cx.norm in api.norm:
+        return "contains"
+    if len(api.norm) >= 2 and api.norm in cx.norm:
+        return "partial"
+
+    # 4) 접미사 제거 후 재비교 (deep normalize)
+    if api.deep and cx.deep:
+        if api.deep == cx.deep:
+            return "exact"
+        if len(cx.deep) >= 2 and cx.deep in api.deep:
+            return "contains"
+        if len(api.deep) >= 2 and api.deep in cx.deep:
+            return "partial"
+
+        # 5) SequenceMatcher 유사도 (상한이 임계값 미만이면 계산 생략)
+        if len(api.deep) >= 2 and len(cx.deep) >= 2:
+            matcher = SequenceMatcher(None, api.deep, cx.deep)
+            if (matcher.real_quick_ratio() >= FUZZY_THRESHOLD
+                    and matcher.quick_ratio() >= FUZZY_THRESHOLD
+                    and matcher.ratio() >= FUZZY_THRESHOLD):
+                return "fuzzy"
+
+    return None
+
+
+def names_match(api_name: str, complex_name: str) -> Tuple[bool, str]:
+    """
+    건물명과 단지명을 비교합니다.
+
+    Returns:
+        (매치 여부, 매치 유형)
+        매치 유형: "exact" | "contains" | "partial" | "fuzzy" | "none"
+    """
+    if not api_name or not complex_name:
+        return False, "none"
+    match_type = match_keys(NameKey.of(api_name), NameKey.of(complex_name))
+    return (True, match_type) if match_type else (False, "none")
+
+
+class NameIndex:
+    """
+    이름 목록 역색인 (블록 단위 후보 추림 + 단계 판정)
+
+    색인 이름이 names_match의 api_name, 조회 이름이 complex_name 자리입니다.
+    blocks를 주면 같은 블록 값끼리만 비교합니다 (None이면 전체 1블록).
+    """
+
+    def __init__(self, names: Sequence[str], blocks: Optional[Sequence[Hashable]] = None):
+        self.names = list(names)
+        self.keys = [NameKey.of(name) for name in self.names]
+        self.blocks = list(blocks) if blocks is not None else [None] * len(self.names)
+        if len(self.blocks) != len(self.names):
+            raise ValueError("names와 blocks 길이가 다릅니다")
+
+        self._vocab: Dict[Tuple[Hashable, str], int] = {}
+        grams = [key.grams() for key in self.keys]
+        for block, key_grams in zip(self.blocks, grams):
+            for gram in key_grams:
+                self._vocab.setdefault((block, gram), len(self._vocab))
+        self._matrix = self._encode(self.blocks, grams).T.tocsr()  # (V, n)
+        self._gram_counts = np.array([len(g) for g in grams], dtype=np.float64)
+
+        # gram이 없는 1글자 이름은 정규화 키 완전 일치로만 후보
+        self._exact: Dict[Tuple[Hashable, str], List[int]] = {}
+        for i, (block, key) in enumerate(zip(self.blocks, self.keys)):
+            for s in {key.norm, key.deep}:
+                if s:
+                    self._exact.setdefault((block, s), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _encode(self, blocks: Sequence[Hashable], grams: Sequence[Set[str]]) -> sparse.csr_matrix:
+        """(블록, gram) 이진 특성 행렬 (색인에 없는 gram은 제외)"""
+        rows, cols = [], []
+        for r, (block, key_grams) in enumerate(zip(blocks, grams)):
+            for gram in key_grams:
+                col = self._vocab.get((block, gram))
+                if col is not None:
+                    rows.append(r)
+                    cols.append(col)
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(grams), len(self._vocab)),
+        )
+
+    def match_many(
+        self,
+        names: Sequence[str],
+        blocks: Optional[Sequence[Hashable]] = None,
+        tiers: Iterable[str] = MATCH_PRIORITY,
+    ) -> List[List[Tuple[int, str, float]]]:
+        """
+        조회 이름별 매칭 색인 항목.
+
+        Args:
+            names: 조회 이름 (complex_name 자리)
+            blocks: 조회 이름별 블록 값 (None이면 전체 1블록)
+            tiers: 허용 매치 유형 (예: ("strict",) → 정규화 이름 완전 일치만,
+                ("exact",) → 접미사 제거 후 일치까지)
+
+        Returns:
+            조회별 [(색인 위치, 매치 유형, gram Dice 유사도)] — 유형 우선순위, 유사도 순
+            (strict를 허용하면 정규화 이름이 같은 항목은 "strict"로 표시)
+        """
+        allowed = set(tiers)
+        blocks = list(blocks) if blocks is not None else [None] * len(names)
+        keys = [NameKey.of(name) for name in names]
+        grams = [key.grams() for key in keys]
+
+        # 공유 gram 수 (조회 × 색인) → Dice = 2·공유 / (조회 gram + 색인 gram)
+        shared = (self._encode(blocks, grams) @ self._matrix).tocsr()
+        query_counts = np.repeat([len(g) for g in grams], np.diff(shared.indptr))
+        dice = 2.0 * shared.data / (query_counts + self._gram_counts[shared.indices])
+
+        results: List[List[Tuple[int, str, float]]] = []
+        for q, (block, key) in enumerate(zip(blocks, keys)):
+            start, end = shared.indptr[q], shared.indptr[q + 1]
+            scores = dict(zip(shared.indices[start:end].tolist(), dice[start:end].tolist()))
+            for s in {key.norm, key.deep}:
+                for i in self._exact.get((block, s), ()):
+                    scores.setdefault(i, 1.0)
+
+            matches = []
+            for i, score in scores.items():
+                if STRICT in allowed and key.norm and self.keys[i].norm == key.norm:
+                    matches.append((i, STRICT, score))
+                    continue
+                match_type = match_keys(self.keys[i], key)
+                if match_type in allowed:
+                    matches.append((i, match_type, score))
+            matches.sort(key=lambda m: (TIER_PRIORITY[m[1]], -m[2], m[0]))
+            results.append(matches)
+        return results
+
+    def match(
+        self,
+        name: str,
+        block: Hashable = None,
+        tiers: Iterable[str] = MATCH_PRIORITY,
+    ) -> List[Tuple[int, str, float]]:
+        """단일 조회 (match_many 참고)"""
+        return self.match_many([name], [block], tiers)[0]
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+증분 파이프라인 실행기 (수집 데이터 → 피처 → 학습 → 배치 스코어링)
+
+- 단계(Stage)마다 입력 콘텐츠 해시(키별)와 출력 파일 해시를 logs/pipeline_state.json에 기록
+- 입력 해시와 출력 파일이 직전 성공 실행과 같으면 건너뜀
+- 의존 단계의 출력 해시는 "@단계명" 입력 키로 전파 → 출력이 그대로면 하위 단계도 건너뜀
+- 의존 관계가 없는 단계(아파트 모델 / 상권 모델)는 asyncio로 동시 실행
+- 단계는 바뀐 입력 키 집합을 받아 부분 재계산 (예: 바뀐 지역만 재스코어링)
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+HASH_CHUNK_SIZE = 1 << 20
+
+# 단계 실행 함수: 바뀐 입력 키 집합(None: 이전 기록 없음 → 전체 계산) → 성공 여부
+StageFn = Callable[[Optional[Set[str]]], Awaitable[bool]]
+
+
+@dataclass
+class Stage:
+    """파이프라인 단계"""
+    name: str
+    run: StageFn
+    inputs: Optional[Callable[[], Optional[Dict[str, str]]]] = None  # 입력 키 → 콘텐츠 해시 (None: 해시 불가, 항상 실행)
+    outputs: List[Path] = field(default_factory=list)
+    deps: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StageResult:
+    """단계 1회 실행 결과"""
+    name: str
+    status: str  # ran / skipped / failed / blocked
+    changed: Optional[List[str]] = None  # 실행 사유가 된 입력 키 (None: 전체)
+    output_changed: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("ran", "skipped")
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "changed": self.changed,
+            "output_changed": self.output_changed,
+            "elapsed_seconds": round(self.elapsed, 1),
+        }
+
+
+class FileHasher:
+    """파일 콘텐츠 해시 (크기/mtime이 같으면 이전 해시 재사용)"""
+
+    def __init__(self, cache: Optional[Dict[str, List]] = None):
+        self.cache = cache if cache is not None else {}  # 경로 → [size, mtime_ns, sha1]
+        self.lock = threading.Lock()  # 병렬 단계의 해시 스레드 ↔ 상태 저장
+
+    def hash_file(self, path: Path) -> Optional[str]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = str(path)
+        cached = self.cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        with self.lock:
+            self.cache[key] = [stat.st_size, stat.st_mtime_ns, value]
+        return value
+
+    def hash_files(self, paths: Iterable[Path], root: Optional[Path] = None) -> str:
+        """여러 파일 → 하나의 해시 (없는 파일은 "missing", root 기준 상대 경로 포함)"""
+        digest = hashlib.sha1()
+        for path in sorted(Path(p) for p in paths):
+            name = str(path.relative_to(root)) if root else str(path)
+            digest.update(f"{name}={self.hash_file(path) or 'missing'}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+
+class PipelineRunner:
+    """단계 DAG 실행기"""
+
+    def __init__(self, state_path: Path):
+        self.state_path = Path(state_path)
+        self.stages: Dict[str, Stage] = {}
+        self.state = self._load_state()
+        self.hasher = FileHasher(self.state.setdefault("file_hashes", {}))
+        self.last_results: Dict[str, StageResult] = {}
+
+    def _load_state(self) -> Dict:
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.hasher.lock:
+                text = json.dumps(self.state, ensure_ascii=False, indent=2)
+            tmp_path = self.state_path.with_suffix(".json.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            print(f"[파이프라인] 상태 저장 실패: {e}")
+
+    def add(self, stage: Stage):
+        """단계 등록 (의존 단계가 먼저 등록되어 있어야 함 → 순환 불가)"""
+        if stage.name in self.stages:
+            raise ValueError(f"중복 단계: {stage.name}")
+        missing = [dep for dep in stage.deps if dep not in self.stages]
+        if missing:
+            raise ValueError(f"{stage.name}: 등록되지 않은 의존 단계 {missing}")
+        self.stages[stage.name] = stage
+
+    def _closure(self, targets: Optional[Iterable[str]]) -> List[str]:
+        """대상 단계 + 모든 상위 단계 (등록 순서 = 위상 순서)"""
+        if targets is None:
+            return list(self.stages)
+        needed: Set[str] = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"알 수 없는 단계: {name}")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].deps)
+        return [name for name in self.stages if name in needed]
+
+    def _stage_state(self, name: str) -> Dict:
+        return self.state.setdefault("stages", {}).get(name, {})
+
+    def fingerprint(self, stage: Stage) -> Optional[Dict[str, str]]:
+        """단계 입력 해시 (자체 입력 + 의존 단계 출력). 해시 불가 단계는 None"""
+        inputs = stage.inputs() if stage.inputs is not None else None
+        if inputs is None:
+            return None
+        inputs = dict(inputs)
+        for dep in stage.deps:
+            inputs[f"@{dep}"] = self._stage_state(dep).get("output_hash", "")
+        return inputs
+
+    def output_hash(self, stage: Stage) -> Optional[str]:
+        if not stage.outputs:
+            return None
+        return self.hasher.hash_files(stage.outputs)
+
+    def plan(self, stage: Stage, inputs: Optional[Dict[str, str]], force: bool = False) -> Optional[Set[str]]:
+        """
+        실행 필요 여부.
+
+        Args:
+            inputs: fingerprint() 결과
+
+        Returns:
+            바뀐 입력 키 집합 (빈 집합: 건너뜀), None: 이전 기록 없음/강제 → 전체 계산
+        """
+        previous = self._stage_state(stage.name)
+        if force or inputs is None or "inputs" not in previous:
+            return None
+        if stage.outputs and not all(Path(p).exists() for p in stage.outputs):
+            return None
+        before = previous["inputs"]
+        return {key for key in set(inputs) | set(before) if inputs.get(key) != before.get(key)}
+
+    async def _run_stage(self, stage: Stage, upstream: List["asyncio.Task"], force: bool) -> StageResult:
+        dep_results = await asyncio.gather(*upstream)
+        if not all(result.ok for result in dep_results):
+            print(f"[파이프라인] {stage.name}: 상위 단계 실패로 건너뜀")
+            return StageResult(stage.name, "blocked")
+
+        inputs = await asyncio.to_thread(self.fingerprint, stage)
+        changed = self.plan(stage, inputs, force)
+        if changed is not None and not changed:
+            print(f"[파이프라인] {stage.name}: 입력 변경 없음, 건너뜀")
+            return StageResult(stage.name, "skipped", changed=[])
+
+        reason = "전체" if changed is None else f"{len(changed)}개 입력 변경"
+        print(f"[파이프라인] {stage.name}: 실행 ({reason})")
+        started = time.time()
+        try:
+            ok = await stage.run(changed)
+        except Exception as e:
+            print(f"[파이프라인] {stage.name}: 실패 ({e})")
+            ok = False
+        elapsed = time.time() - started
+        changed_keys = sorted(changed) if changed is not None else None
+        if not ok:
+            return StageResult(stage.name, "failed", changed=changed_keys, elapsed=elapsed)
+
+        # 실행 전 입력 해시를 기록 (실행 중 바뀐 입력은 다음 실행에서 다시 처리)
+        output_hash = await asyncio.to_thread(self.output_hash, stage)
+        previous = self._stage_state(stage.name)
+        output_changed = output_hash is None or output_hash != previous.get("output_hash")
+        self.state["stages"][stage.name] = {
+            "inputs": inputs,
+            # 출력 파일이 없는 단계는 실행 시각을 출력 해시로 사용 (하위 단계 항상 갱신)
+            "output_hash": output_hash or f"run:{started}",
+            "finished_at": datetime.now().isoformat(),
+            "elapsed_seconds": round(elapsed, 1),
+        }
+        self._save_state()
+        return StageResult(
+            stage.name, "ran", changed=changed_keys, output_changed=output_changed, elapsed=elapsed,
+        )
+
+    async def run(self, targets: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, StageResult]:
+        """
+        대상 단계(및 상위 단계) 실행.
+
+        Args:
+            targets: 실행할 단계 이름 (None: 전체)
+            force: 입력 해시와 관계없이 전체 재계산
+
+        Returns:
+            단계 이름 → StageResult
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in self._closure(targets):
+            stage = self.stages[name]
+            upstream = [tasks[dep] for dep in stage.deps]
+            tasks[name] = asyncio.create_task(self._run_stage(stage, upstream, force))
+        results = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+        self.last_results = results
+        return results
+
+    def status(self) -> Dict:
+        """단계별 마지막 성공 기록 + 직전 실행 결과"""
+        stages = {}
+        for name, stage in self.stages.items():
+            previous = self._stage_state(name)
+            result = self.last_results.get(name)
+            stages[name] = {
+                "deps": stage.deps,
+                "last_success": previous.get("finished_at"),
+                "last_result": result.to_dict() if result else None,
+            }
+        return stages
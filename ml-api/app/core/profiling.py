@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+핫패스 프로파일링 (재배포 없이 운영 중 켜고 끄는 샘플링 프로파일러 + 타이밍 스팬)
+
+- 요청별 opt-in: X-Profile: 1 + X-Admin-Token 헤더
+- 일괄: POST /api/admin/profile 로 다음 N개 요청(경로 접두사 필터) 프로파일링
+- 프로파일링 중인 요청은 처리 스레드(이벤트 루프)의 스택을 주기적으로 샘플링해
+  logs/profiles/<id>.folded 에 "frame;frame;frame count" 형식으로 저장
+  (flamegraph.pl, speedscope, inferno 등에 그대로 입력)
+- span(): 핫패스 구간 타이밍 → chamgab_span_duration_seconds 히스토그램 +
+  프로파일링 중인 요청은 Server-Timing 헤더와 .folded 옆 .json 요약에 기록
+
+비동기 핸들러는 이벤트 루프 스레드를 샘플링하므로 같은 시각 다른 요청의 코루틴도 섞일 수 있음
+"""
+import contextvars
+import hmac
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import Counter as StackCounter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+PROFILES_DIR = PROJECT_ROOT / "logs" / "profiles"
+
+MAX_STACK_DEPTH = 128
+
+SPAN_SECONDS = registry.histogram(
+    "chamgab_span_duration_seconds",
+    "Hot-path span latency (ModelService.predict, business features)",
+    ["span"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# 프로파일링 중인 요청의 스팬 기록 (그 외 요청은 None → 히스토그램만)
+_request_spans: contextvars.ContextVar[Optional[List[Tuple[str, float]]]] = contextvars.ContextVar(
+    "request_spans", default=None
+)
+
+
+@contextmanager
+def span(name: str):
+    """핫패스 구간 타이밍 (예: with span("predict.fetch"): ...)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        SPAN_SECONDS.observe(elapsed, span=name)
+        spans = _request_spans.get()
+        if spans is not None:
+            spans.append((name, elapsed))
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    try:
+        filename = str(Path(filename).relative_to(PROJECT_ROOT))
+    except ValueError:
+        filename = Path(filename).name
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+class SamplingProfiler:
+    """대상 스레드의 스택을 interval마다 샘플링 (sys._current_frames, 순수 파이썬)"""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: StackCounter = StackCounter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        if frame is None:
+            return
+        labels = []
+        while frame is not None and len(labels) < MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def folded(self) -> str:
+        """flamegraph 입력 형식 (스택 한 줄 + 샘플 수)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class ProfileController:
+    """프로파일링 대상 요청 선택 + 결과 파일 관리"""
+
+    def __init__(self, output_dir: Path = PROFILES_DIR, keep: int = 50):
+        self.output_dir = Path(output_dir)
+        self.keep = keep
+        self.remaining = 0
+        self.path_prefix = ""
+        self.interval = 0.005
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # 설정
+    # ------------------------------------------------------------------ #
+    def arm(self, requests: int, path_prefix: str = "", interval_ms: float = 5.0):
+        """다음 requests개 요청(path_prefix로 시작) 프로파일링"""
+        with self._lock:
+            self.remaining = max(int(requests), 0)
+            self.path_prefix = path_prefix
+            self.interval = max(interval_ms, 0.5) / 1000
+
+    def disarm(self):
+        with self._lock:
+            self.remaining = 0
+
+    def should_profile(self, path: str, headers) -> bool:
+        """요청별 opt-in 헤더(관리자 토큰 필요) 또는 남은 일괄 횟수"""
+        if headers.get("x-profile") == "1" and is_admin_token(headers.get("x-admin-token")):
+            return True
+        with self._lock:
+            if self.remaining > 0 and path.startswith(self.path_prefix):
+                self.remaining -= 1
+                return True
+        return False
+
+    def status(self) -> Dict:
+        return {
+            "remaining": self.remaining,
+            "path_prefix": self.path_prefix,
+            "interval_ms": round(self.interval * 1000, 2),
+            "profiles": self.list_profiles(),
+        }
+
+    # ------------------------------------------------------------------ #
+    # 결과
+    # ------------------------------------------------------------------ #
+    def save(self, profiler: SamplingProfiler, meta: Dict) -> str:
+        """.folded(스택) + .json(요청/스팬 요약) 저장, 오래된 결과 정리. 프로파일 id 반환"""
+        profile_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{uuid.uuid4().hex[:4]}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        (self.output_dir / f"{profile_id}.folded").write_text(profiler.folded(), encoding="utf-8")
+        meta = {**meta, "id": profile_id, "samples": profiler.samples, "interval_ms": profiler.interval * 1000}
+        (self.output_dir / f"{profile_id}.json").write_text(
+            json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        for old in sorted(self.output_dir.glob("*.json"))[:-self.keep]:
+            old.unlink(missing_ok=True)
+            old.with_suffix(".folded").unlink(missing_ok=True)
+        return profile_id
+
+    def list_profiles(self) -> List[Dict]:
+        profiles = []
+        for path in sorted(self.output_dir.glob("*.json"), reverse=True):
+            try:
+                profiles.append(json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+        return profiles
+
+    def folded_path(self, profile_id: str) -> Optional[Path]:
+        path = self.output_dir / f"{Path(profile_id).name}.folded"
+        return path if path.exists() else None
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """ADMIN_TOKEN이 설정되어 있고 일치할 때만 True (미설정이면 관리 기능 비활성)"""
+    if not settings.ADMIN_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode("utf-8"), settings.ADMIN_TOKEN.encode("utf-8"))
+
+
+def server_timing(spans: List[Tuple[str, float]]) -> str:
+    """Server-Timing 헤더 값 (같은 이름 스팬은 합산)"""
+    totals: Dict[str, float] = {}
+    for name, elapsed in spans:
+        totals[name] = totals.get(name, 0.0) + elapsed
+    return ", ".join(f"{name};dur={elapsed * 1000:.2f}" for name, elapsed in totals.items())
+
+
+async def profiling_middleware(request, call_next):
+    """선택된 요청만 샘플링 프로파일러로 감싸고 결과 id/스팬을 응답 헤더에 추가"""
+    if not profile_controller.should_profile(request.url.path, request.headers):
+        return await call_next(request)
+
+    spans: List[Tuple[str, float]] = []
+    token = _request_spans.set(spans)  # call_next 태스크가 컨텍스트를 복사해도 같은 리스트 공유
+    profiler = SamplingProfiler(threading.get_ident(), profile_controller.interval)
+    started = time.perf_counter()
+    profiler.start()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        profiler.stop()
+        _request_spans.reset(token)
+        elapsed = time.perf_counter() - started
+        route = request.scope.get("route")
+        profile_id = profile_controller.save(profiler, {
+            "method": request.method,
+            "path": request.url.path,
+            "route": getattr(route, "path", None),
+            "status": status,
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "spans": [{"name": name, "ms": round(sec * 1000, 3)} for name, sec in spans],
+            "created_at": datetime.now().isoformat(),
+        })
+    response.headers["X-Profile-Id"] = profile_id
+    if spans:
+        response.headers["Server-Timing"] = server_timing(spans)
+    return response
+
+
+# 싱글톤 인스턴스
+profile_controller = ProfileController()
@@ -0,0 +1,240 @@
+"""
+지역 코드 사전 (시도 / 시군구 / 법정동 코드 ↔ 이름 ↔ 시도 ↔ 상위 지역)
+
+- 스냅샷(app/models/region_gazetteer.json)을 한 번 읽어 dict 색인만 구성 → 조회 O(1)
+- 시군구 이름은 표기 변형을 모두 색인 (공백 무시):
+  "안산시 단원구" / "안산시단원구" / "단원구", 시도 접두 "부산 중구" / "부산광역시 중구"
+- 여러 시도에 같은 이름이 있으면("중구", "고성군") sido를 함께 줘야 코드가 결정됩니다
+- 폐지 코드(28170 인천 남구 → 28177 미추홀구)는 현재 코드로 정규화
+- 특별자치도 신코드(51 강원 / 52 전북)는 레포 테이블과 맞추기 위해 구코드(42 / 45)로 정규화
+- 스냅샷 갱신: scripts/build_region_gazetteer.py
+
+사용 예:
+    from app.core.region_gazetteer import region_gazetteer
+    region_gazetteer.sigungu_code("단원구")                   # "41273"
+    region_gazetteer.sigungu_code("중구", sido="부산광역시")   # "26110"
+    region_gazetteer.name("41273")                           # "안산시 단원구"
+    region_gazetteer.bjdong_code("41273", "고잔동")           # "10100"
+"""
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SNAPSHOT_PATH = Path(__file__).parent.parent / "models" / "region_gazetteer.json"
+
+# 시도 약칭 (시군구 이름 접두 / 약칭 조회용)
+SIDO_SHORT_NAMES: Dict[str, str] = {
+    "11": "서울", "26": "부산", "27": "대구", "28": "인천", "29": "광주",
+    "30": "대전", "31": "울산", "36": "세종", "41": "경기", "42": "강원",
+    "43": "충북", "44": "충남", "45": "전북", "46": "전남", "47": "경북",
+    "48": "경남", "50": "제주",
+}
+
+# 시도 통칭 / 옛 명칭
+SIDO_NAME_ALIASES: Dict[str, str] = {
+    "서울시": "11", "부산시": "26", "대구시": "27", "인천시": "28", "광주시": "29",
+    "대전시": "30", "울산시": "31", "세종시": "36",
+    "강원도": "42", "전라북도": "45", "제주도": "50",
+}
+
+
+def _compact(name: Optional[str]) -> str:
+    """조회 키 (공백 제거)"""
+    return re.sub(r"\s+", "", name or "")
+
+
+@dataclass(frozen=True)
+class Region:
+    """시도(level 1) / 시군구(level 2) / 법정동(level 3)"""
+    code: str                   # 2자리 / 5자리 / 10자리
+    name: str                   # "경기도", "안산시 단원구", "고잔동"
+    level: int
+    sido_code: str
+    parent_code: Optional[str]  # 시군구: 구가 있는 시 또는 시도, 법정동: 시군구
+
+
+class RegionGazetteer:
+    """지역 코드 사전 (스냅샷 dict → 코드/이름 색인)"""
+
+    def __init__(self, snapshot: Dict):
+        self.built_at: str = snapshot.get("built_at", "")
+        self._code_aliases: Dict[str, str] = dict(snapshot.get("code_aliases", {}))
+        self._bjdong: Dict[str, Dict[str, str]] = snapshot.get("bjdong", {})
+        self._dong_names: Dict[str, Dict[str, str]] = {}
+        self._regions: Dict[str, Region] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._sido_index: Dict[str, str] = {}
+        self._sigungu_index: Dict[str, Tuple[str, ...]] = {}
+
+        for code, name in snapshot.get("sido", {}).items():
+            self._regions[code] = Region(code, name, 1, code, None)
+            for alias in (name, SIDO_SHORT_NAMES.get(code)):
+                if alias:
+                    self._sido_index[_compact(alias)] = code
+        for alias, code in SIDO_NAME_ALIASES.items():
+            if code in self._regions:
+                self._sido_index.setdefault(_compact(alias), code)
+
+        sigungu = snapshot.get("sigungu", {})
+        city_codes = {
+            (code[:2], name): code for code, name in sigungu.items() if " " not in name
+        }
+        name_aliases = snapshot.get("name_aliases", {})
+        index: Dict[str, List[str]] = {}
+        for code, name in sorted(sigungu.items()):
+            sido_code = code[:2]
+            city = name.split(" ")[0] if " " in name else None
+            parent = city_codes.get((sido_code, city), sido_code) if city else sido_code
+            self._regions[code] = Region(code, name, 2, sido_code, parent)
+            self._children.setdefault(parent, []).append(code)
+
+            forms = {name, *name_aliases.get(code, ())}
+            if city:
+                forms.add(name.split(" ", 1)[1])  # "안산시 단원구" → "단원구"
+            prefixes = [""]
+            if sido_code in self._regions:
+                prefixes += [self._regions[sido_code].name, SIDO_SHORT_NAMES.get(sido_code, "")]
+            for form in forms:
+                for prefix in prefixes:
+                    codes = index.setdefault(_compact(prefix + form), [])
+                    if code not in codes:
+                        codes.append(code)
+        self._sigungu_index = {key: tuple(codes) for key, codes in index.items()}
+
+    @classmethod
+    def load(cls, path: Path = SNAPSHOT_PATH) -> "RegionGazetteer":
+        """스냅샷 파일 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    # ------------------------------------------------------------------ #
+    # 코드 → 지역
+    # ------------------------------------------------------------------ #
+    def canonical_code(self, code: Optional[str]) -> str:
+        """폐지/별칭 코드 → 사전 기준 코드 (시도 코드는 앞 2자리만 치환)"""
+        code = (code or "").strip()
+        if code in self._code_aliases:
+            return self._code_aliases[code]
+        if len(code) == 10:
+            sigungu = self._code_aliases.get(code[:5])
+            if sigungu:
+                return sigungu + code[5:]
+        sido = self._code_aliases.get(code[:2])
+        if sido and len(code) > 2:
+            return self.canonical_code(sido + code[2:])
+        return code
+
+    def get(self, code: Optional[str]) -> Optional[Region]:
+        """
+        시도(2자리) / 시군구(5자리) / 법정동(10자리) 코드 조회.
+        10자리 코드의 뒤 5자리가 00000이면 시군구, 앞 2자리 뒤가 모두 0이면 시도입니다.
+        """
+        code = self.canonical_code(code)
+        if len(code) == 10:
+            if code[2:] == "00000000":
+                code = code[:2]
+            elif code[5:] == "00000":
+                code = code[:5]
+            else:
+                return self._dong(code[:5], code[5:])
+        return self._regions.get(code)
+
+    def _dong(self, sigungu_code: str, bjdong_code: str) -> Optional[Region]:
+        names = self._dong_names.get(sigungu_code)
+        if names is None:  # 법정동 역색인은 시군구별로 처음 조회할 때 구성
+            names = {code: name for name, code in self._bjdong.get(sigungu_code, {}).items()}
+            self._dong_names[sigungu_code] = names
+        name = names.get(bjdong_code)
+        if name is None:
+            return None
+        return Region(sigungu_code + bjdong_code, name, 3, sigungu_code[:2], sigungu_code)
+
+    def name(self, code: Optional[str], default: Optional[str] = None) -> Optional[str]:
+        """코드 → 이름 ("41273" → "안산시 단원구")"""
+        region = self.get(code)
+        return region.name if region else default
+
+    def sido_name(self, code: Optional[str]) -> str:
+        """아무 수준의 코드 → 시도 전체 이름 ("41273" → "경기도")"""
+        region = self._regions.get(self.canonical_code(code)[:2])
+        return region.name if region else ""
+
+    def full_name(self, code: Optional[str]) -> str:
+        """시도부터 이어 붙인 이름 ("4127310100" → "경기도 안산시 단원구 고잔동")"""
+        region = self.get(code)
+        if region is None:
+            return ""
+        parts = [region.name]
+        if region.level == 3:
+            parts.insert(0, self.name(region.parent_code, ""))
+        if region.level > 1:
+            parts.insert(0, self.sido_name(region.sido_code))
+        return " ".join(parts)
+
+    def parent(self, code: Optional[str]) -> Optional[Region]:
+        """상위 지역 (단원구 → 안산시, 안산시 → 경기도)"""
+        region = self.get(code)
+        return self.get(region.parent_code) if region and region.parent_code else None
+
+    def children(self, code: Optional[str]) -> List[str]:
+        """하위 시군구 코드 (시도 → 시군구, 구가 있는 시 → 구)"""
+        return list(self._children.get(self.canonical_code(code), ()))
+
+    def sigungu_codes(self, sido: Optional[str] = None) -> List[str]:
+        """시군구 코드 목록 (sido: 시도 코드 또는 이름, 없으면 전국)"""
+        sido_code = self.sido_code(sido) if sido else None
+        if sido and not sido_code:
+            return []
+        return [
+            code for code, region in self._regions.items()
+            if region.level == 2 and (sido_code is None or region.sido_code == sido_code)
+        ]
+
+    # ------------------------------------------------------------------ #
+    # 이름 → 코드
+    # ------------------------------------------------------------------ #
+    def sido_code(self, sido: Optional[str]) -> Optional[str]:
+        """시도 이름/약칭/코드 → 2자리 코드 ("부산광역시" / "부산" / "26" → "26")"""
+        key = _compact(sido)
+        if key.isdigit():
+            key = self.canonical_code(key)[:2]
+            return key if key in self._regions else None
+        return self._sido_index.get(key)
+
+    def sigungu_candidates(self, name: Optional[str], sido: Optional[str] = None) -> Tuple[str, ...]:
+        """이름 표기에 해당하는 시군구 코드 후보 (sido를 알면 그 시도로 한정)"""
+        codes = self._sigungu_index.get(_compact(name), ())
+        sido_code = self.sido_code(sido) if sido else None
+        if sido_code:
+            codes = tuple(code for code in codes if code.startswith(sido_code))
+        return codes
+
+    def sigungu_code(self, name: Optional[str], sido: Optional[str] = None) -> Optional[str]:
+        """
+        시군구 이름 → 5자리 코드.
+
+        Args:
+            name: "강남구", "안산시단원구", "안산시 단원구", "단원구", "부산 중구" 등
+            sido: 시도 이름/약칭/코드 (같은 이름이 여러 시도에 있을 때 필요)
+
+        Returns:
+            코드, 없거나 모호하면 None
+        """
+        codes = self.sigungu_candidates(name, sido)
+        return codes[0] if len(codes) == 1 else None
+
+    def bjdong_code(self, sigungu_code: Optional[str], dong: Optional[str]) -> Optional[str]:
+        """법정동 이름 → 5자리 법정동 코드 (10자리 코드의 뒤 5자리)"""
+        return self._bjdong.get(self.canonical_code(sigungu_code), {}).get((dong or "").strip())
+
+    def bjdong_codes(self) -> Dict[str, Dict[str, str]]:
+        """{시군구코드: {법정동명: 법정동코드}} (읽기 전용으로 사용)"""
+        return self._bjdong
+
+
+region_gazetteer = RegionGazetteer.load()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+작업 결과 디스크 저장소 (Arrow IPC, 메모리맵)
+
+수집/분석 작업 결과를 프로세스 메모리에 무기한 보관하던 방식을 대체
+- 작업별 파일: data/results/{job_id}/{name}.arrow
+- 최근 작업 N개만 메모리맵 테이블 LRU로 유지
+- TTL이 지난 작업 디렉터리는 자동 삭제
+- 페이지 조회는 Table.slice (zero-copy) 후 해당 범위만 파이썬 객체로 변환
+"""
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow as pa
+
+from app.core.config import settings
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+RESULTS_DIR = DATA_DIR / "results"
+
+# TTL 정리 최소 간격 (초)
+CLEANUP_INTERVAL = 3600
+
+
+class JobResultStore:
+    """작업 결과 Arrow 저장소 (LRU + TTL)"""
+
+    def __init__(
+        self,
+        root: Path = RESULTS_DIR,
+        max_memory_jobs: int = settings.RESULT_STORE_MEMORY_JOBS,
+        ttl_hours: float = settings.RESULT_STORE_TTL_HOURS,
+    ):
+        self.root = Path(root)
+        self.max_memory_jobs = max_memory_jobs
+        self.ttl_seconds = ttl_hours * 3600
+        self._cache: "OrderedDict[str, Dict[str, pa.Table]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_cleanup = 0.0
+
+    def _path(self, job_id: str, name: str) -> Path:
+        return self.root / job_id / f"{name}.arrow"
+
+    # ─────────────────────────────────────────────
+    # 쓰기
+    # ─────────────────────────────────────────────
+
+    def put(self, job_id: str, name: str, data) -> int:
+        """
+        결과 저장 (dict 목록 또는 pa.Table)
+
+        Returns:
+            저장된 행 수
+        """
+        table = data if isinstance(data, pa.Table) else self._to_table(list(data))
+        path = self._path(job_id, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        tmp_path.replace(path)
+
+        with self._lock:
+            self._cache.pop(job_id, None)  # 다음 조회 시 새 파일로 메모리맵
+        self.cleanup_expired()
+        return table.num_rows
+
+    @staticmethod
+    def _to_table(rows: List[dict]) -> pa.Table:
+        """dict 목록 → Table (타입이 섞인 컬럼은 문자열로 통일)"""
+        try:
+            return pa.Table.from_pylist(rows)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            columns = {key for row in rows for key in row}
+            mixed = {
+                key for key in columns
+                if len({type(row.get(key)) for row in rows if row.get(key) is not None}) > 1
+            }
+            normalized = [
+                {k: (str(v) if k in mixed and v is not None else v) for k, v in row.items()}
+                for row in rows
+            ]
+            return pa.Table.from_pylist(normalized)
+
+    # ─────────────────────────────────────────────
+    # 읽기
+    # ─────────────────────────────────────────────
+
+    def has(self, job_id: str) -> bool:
+        return (self.root / job_id).is_dir()
+
+    def names(self, job_id: str) -> List[str]:
+        """작업에 저장된 결과 이름 목록"""
+        job_dir = self.root / job_id
+        if not job_dir.is_dir():
+            return []
+        return sorted(p.stem for p in job_dir.glob("*.arrow"))
+
+    def job_ids(self) -> List[str]:
+        """저장된 작업 ID 목록"""
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def get_table(self, job_id: str, name: str) -> Optional[pa.Table]:
+        """메모리맵 테이블 조회 (최근 작업은 LRU 캐시)"""
+        with self._lock:
+            tables = self._cache.get(job_id)
+            if tables is not None and name in tables:
+                self._cache.move_to_end(job_id)
+                return tables[name]
+
+        path = self._path(job_id, name)
+        if not path.exists():
+            return None
+        table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+        with self._lock:
+            self._cache.setdefault(job_id, {})[name] = table
+            self._cache.move_to_end(job_id)
+            while len(self._cache) > self.max_memory_jobs:
+                self._cache.popitem(last=False)
+        return table
+
+    def slice(self, job_id: str, name: str, offset: int, limit: int) -> Tuple[List[dict], int]:
+        """
+        페이지 조회 (zero-copy slice)
+
+        Returns:
+            (행 목록, 전체 건수)
+        """
+        table = self.get_table(job_id, name)
+        if table is None:
+            return [], 0
+        return table.slice(offset, limit).to_pylist(), table.num_rows
+
+    # ─────────────────────────────────────────────
+    # 삭제 / TTL 정리
+    # ─────────────────────────────────────────────
+
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            self._cache.pop(job_id, None)
+        job_dir = self.root / job_id
+        if not job_dir.is_dir():
+            return False
+        shutil.rmtree(job_dir, ignore_errors=True)
+        return True
+
+    def cleanup_expired(self, force: bool = False) -> int:
+        """TTL이 지난 작업 삭제 (최소 CLEANUP_INTERVAL 간격)"""
+        now = time.time()
+        if not force and now - self._last_cleanup < CLEANUP_INTERVAL:
+            return 0
+        self._last_cleanup = now
+        if not self.root.exists():
+            return 0
+
+        removed = 0
+        for job_dir in self.root.iterdir():
+            if job_dir.is_dir() and now - job_dir.stat().st_mtime > self.ttl_seconds:
+                self.delete(job_dir.name)
+                removed += 1
+        if removed:
+            print(f"[결과 저장소] 만료 작업 {removed}개 삭제")
+        return removed
+
+
+# 싱글톤 인스턴스
+result_store = JobResultStore()
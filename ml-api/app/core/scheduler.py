@@ -8,28 +8,84 @@ APScheduler를 사용한 정기 데이터 수집 및 모델 학습 자동화
 - 매주 월요일 오전 7시: 주간 시세 지수 수집
 - 매주 화요일 오전 3시: 상권 모델 재학습
 - 매월 1일 오전 8시: 월간 전국 데이터 수집
-- 매월 2일 오전 3시: 전체 모델 재학습
+- 매월 2일 오전 3시: 전체 모델 재학습 + 배치 스코어링
+
+재학습은 PipelineRunner(app/core/pipeline.py) 단계 DAG로 실행 → 입력 해시가 그대로인 단계는
+건너뛰고, 아파트/상권 모델은 동시에 학습하며, 배치 스코어링은 데이터가 바뀐 지역만 다시 계산
+
+학습/수집 스크립트는 ScriptRunner(asyncio subprocess)로 실행 → 학습 중에도 API 응답,
+로그/진행률/ETA는 /api/scheduler/status, 취소는 /api/scheduler/cancel
+
+여러 워커/레플리카에서 start()가 호출되어도 리더 락(app/core/leader.py)을 잡은
+인스턴스만 위 작업을 예약합니다. 나머지(팔로워)는 리더가 학습 후 게시한
+모델 번들 매니페스트(app/models/bundle_manifest.json)를 주기적으로 확인해 리로드만 하고,
+리더 락이 풀리면 인수합니다. (레플리카 간에는 app/models를 공유 볼륨으로 마운트)
 """
 import asyncio
-import pickle
-import subprocess
-import sys
+import contextvars
+import json
+import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
+from app.core.config import settings
+from app.core.leader import create_leader_lock, instance_id
+from app.core.pipeline import PipelineRunner, Stage
+from app.core.script_runner import ScriptRunner
+from app.core.warmup import load_models
 from app.services.collector_service import collector_service
 from app.services.analyzer_service import analyzer_service
-from app.services.business_model_service import business_model_service
 
 # 프로젝트 루트 (ml-api/)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 MODELS_DIR = PROJECT_ROOT / "app" / "models"
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+SCRIPT_HISTORY_PATH = PROJECT_ROOT / "logs" / "script_durations.json"
+LEADER_LOCK_PATH = PROJECT_ROOT / "logs" / "scheduler.lock"
+BUNDLE_MANIFEST_PATH = MODELS_DIR / "bundle_manifest.json"
+PIPELINE_STATE_PATH = PROJECT_ROOT / "logs" / "pipeline_state.json"
+BUSINESS_TRAINING_CSV = SCRIPTS_DIR / "business_training_data.csv"
+
+# 실행되면 모델 핫리로드가 필요한 파이프라인 단계
+MODEL_STAGES = ("apartment_model", "business_model")
+
+# 리더/팔로워 공통 작업 (나머지 작업은 리더만 예약)
+LEADERSHIP_JOB_ID = "leader_check"
+MODEL_WATCH_JOB_ID = "model_bundle_watch"
+
+# 현재 코루틴이 속한 스케줄러 작업 id (파이프라인 단계처럼 태스크로 갈라져도 전파)
+_current_job: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("scheduler_job", default=None)
+
+
+def transactions_fingerprint(client) -> Optional[str]:
+    """
+    train_model이 읽는 Supabase transactions 테이블 지문 (행 수 + 최근 created_at)
+
+    전체 행을 읽지 않는 head/limit 쿼리 2개. 행 추가/삭제는 감지하지만
+    기존 행의 제자리 수정(upsert로 값만 바뀜)은 감지하지 못함 → 그 경우 force 재학습.
+    조회 실패 시 None
+    """
+    try:
+        count = client.table("transactions").select("id", count="exact", head=True).execute().count
+        latest = (
+            client.table("transactions")
+            .select("created_at")
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+    except Exception as e:
+        print(f"[스케줄러] transactions 지문 조회 실패: {e}")
+        return None
+    created_at = latest.data[0].get("created_at") if latest.data else ""
+    return f"{count}:{created_at}"
 
 
 class DataScheduler:
@@ -42,6 +98,27 @@ class DataScheduler:
         self.last_analysis_job: Optional[str] = None
         self.last_training_job: Optional[str] = None
         self._app = None  # FastAPI app 참조 (핫리로드용)
+        self.script_runner = ScriptRunner(
+            cwd=PROJECT_ROOT,
+            log_lines=settings.SCRIPT_LOG_LINES,
+            nice=settings.SCRIPT_NICE,
+            cpu_threads=settings.SCRIPT_CPU_THREADS,
+            history_path=SCRIPT_HISTORY_PATH,
+        )
+        # 실행 중 작업 id → 취소 요청 (취소 후 같은 작업의 남은 스크립트는 건너뜀, 다른 작업과 독립)
+        self._job_cancels: Dict[str, asyncio.Event] = {}
+        self.leader = create_leader_lock(
+            settings.SCHEDULER_LEADER_BACKEND,
+            key=settings.SCHEDULER_LEADER_KEY,
+            file_path=LEADER_LOCK_PATH,
+            database_url=settings.DATABASE_URL,
+            redis_url=settings.REDIS_URL,
+            ttl_seconds=settings.SCHEDULER_LEADER_TTL,
+        )
+        self.role = "stopped"  # leader / follower / stopped
+        self.bundle_manifest_path = BUNDLE_MANIFEST_PATH
+        self.bundle_version: Optional[str] = None  # 마지막으로 로드한 모델 번들
+        self.pipeline = self._build_pipeline()
 
     def set_app(self, app):
         """FastAPI app 참조 설정 (모델 핫리로드에 필요)"""
@@ -182,6 +259,9 @@ class DataScheduler:
             self.last_collection_job = job.job_id
             print(f"[스케줄러] 월간 수집 완료 (months={months}): {job.job_id}")
 
+            stats = collector_service.dataset.compact()
+            print(f"[스케줄러] 수집 데이터셋 정리: {stats}")
+
         except Exception as e:
             print(f"[스케줄러] 월간 수집 실패: {e}")
 
@@ -199,34 +279,46 @@ class DataScheduler:
         job_id = f"commercial_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         print(f"[스케줄러] 주간 상권 데이터 수집 시작: {job_id}")
 
-        # Step 1: API 수집 + 데이터 생성 + Supabase 저장 (한 번에)
-        ok = self._run_script(
-            "scripts.collect_business_statistics",
-            args=["--months", "24"],
-            timeout=3600  # 1시간 (API 호출 130개 지역 × 7개 업종)
-        )
-
-        if ok:
-            print(f"[스케줄러] 상권 데이터 수집 완료: {job_id}")
-        else:
-            print(f"[스케줄러] 상권 데이터 수집 실패: {job_id}")
-            # 캐시가 있으면 fallback으로 재시도
-            print("[스케줄러] 캐시 데이터로 재시도...")
-            ok = self._run_script(
+        with self._job(job_id):
+            # Step 1: API 수집 + 데이터 생성 + Supabase 저장 (한 번에)
+            ok = await self._run_script(
                 "scripts.collect_business_statistics",
-                args=["--skip-api", "--months", "24"],
-                timeout=300
+                args=["--months", "24"],
+                timeout=3600  # 1시간 (API 호출 130개 지역 × 7개 업종)
             )
+
             if ok:
-                print(f"[스케줄러] 캐시 기반 상권 데이터 생성 완료")
+                print(f"[스케줄러] 상권 데이터 수집 완료: {job_id}")
+            else:
+                print(f"[스케줄러] 상권 데이터 수집 실패: {job_id}")
+                # 캐시가 있으면 fallback으로 재시도
+                print("[스케줄러] 캐시 데이터로 재시도...")
+                ok = await self._run_script(
+                    "scripts.collect_business_statistics",
+                    args=["--skip-api", "--months", "24"],
+                    timeout=300
+                )
+                if ok:
+                    print(f"[스케줄러] 캐시 기반 상권 데이터 생성 완료")
 
     # ─────────────────────────────────────────────
     # 학습 작업 (신규)
     # ─────────────────────────────────────────────
 
-    def _run_script(self, module: str, args: list = None, timeout: int = 600) -> bool:
+    @contextmanager
+    def _job(self, job_id: str):
+        """작업 등록: 블록 안에서 실행되는 스크립트는 이 작업의 취소 요청(Event)만 따름"""
+        cancel = self._job_cancels[job_id] = asyncio.Event()
+        token = _current_job.set(job_id)
+        try:
+            yield cancel
+        finally:
+            _current_job.reset(token)
+            self._job_cancels.pop(job_id, None)
+
+    async def _run_script(self, module: str, args: list = None, timeout: int = 600) -> bool:
         """
-        학습 스크립트를 subprocess로 실행 (메모리 격리)
+        학습 스크립트를 별도 프로세스로 실행 (메모리 격리, 이벤트 루프 비차단)
 
         Args:
             module: 실행할 모듈 (예: "scripts.train_business_model")
@@ -236,168 +328,238 @@ class DataScheduler:
         Returns:
             성공 여부
         """
-        cmd = [sys.executable, "-m", module]
-        if args:
-            cmd.extend(args)
+        job_id = _current_job.get()
+        cancel = self._job_cancels.get(job_id)
+        if cancel is not None and cancel.is_set():
+            print(f"[스케줄러] 취소 요청으로 건너뜀: {module} ({job_id})")
+            return False
 
-        print(f"[스케줄러] 스크립트 실행: {' '.join(cmd)}")
+        print(f"[스케줄러] 스크립트 실행: {module} {' '.join(args or [])}")
+        run = await self.script_runner.run(module, args, timeout=timeout, job_id=job_id)
 
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=str(PROJECT_ROOT),
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+        if run.succeeded:
+            print(f"[스케줄러] 스크립트 성공: {module} ({run.elapsed:.0f}s)")
+            # 마지막 몇 줄만 출력
+            for line in run.tail(5):
+                print(f"  > {line}")
+        elif run.status == "timeout":
+            print(f"[스케줄러] 스크립트 타임아웃 ({timeout}s): {module}")
+        elif run.status == "cancelled":
+            print(f"[스케줄러] 스크립트 취소: {module}")
+        else:
+            print(f"[스케줄러] 스크립트 실패 (exit {run.returncode}): {module}")
+            for line in [line for line in run.log if line.startswith("! ")][-5:]:
+                print(f"  {line}")
+        return run.succeeded
 
-            if result.returncode == 0:
-                print(f"[스케줄러] 스크립트 성공: {module}")
-                # 마지막 몇 줄만 출력
-                lines = result.stdout.strip().split("\n")
-                for line in lines[-5:]:
-                    print(f"  > {line}")
-                return True
-            else:
-                print(f"[스케줄러] 스크립트 실패 (exit {result.returncode}): {module}")
-                if result.stderr:
-                    for line in result.stderr.strip().split("\n")[-5:]:
-                        print(f"  ! {line}")
-                return False
+    async def cancel_scripts(self, job_id: Optional[str] = None) -> list:
+        """
+        실행 중 스크립트 취소 + 해당 작업의 남은 스크립트 건너뛰기
 
-        except subprocess.TimeoutExpired:
-            print(f"[스케줄러] 스크립트 타임아웃 ({timeout}s): {module}")
-            return False
-        except Exception as e:
-            print(f"[스케줄러] 스크립트 실행 오류: {e}")
-            return False
+        job_id가 없으면 실행 중인 모든 작업. 취소한 run_id 목록 반환
+        """
+        jobs = list(self._job_cancels) if job_id is None else [job_id]
+        for name in jobs:
+            if name in self._job_cancels:
+                self._job_cancels[name].set()  # 종료 대기 중 작업이 다음 단계로 넘어가지 않도록 먼저 설정
+        runs = [
+            run for run in self.script_runner.active.values()
+            if job_id is None or run.job_id == job_id
+        ]
+        cancelled = []
+        for run in runs:
+            cancelled += await self.script_runner.cancel(run.run_id)
+        return cancelled
 
     async def _reload_models(self):
-        """학습 완료 후 모델 핫리로드"""
+        """학습 완료 후 모델 핫리로드 (unpickle은 워커 스레드에서, 이벤트 루프 비차단)"""
         print("[스케줄러] 모델 핫리로드 시작...")
 
         try:
-            # 상권 모델 리로드
-            biz_model_path = MODELS_DIR / "business_model.pkl"
-            if biz_model_path.exists():
-                business_model_service.load(str(biz_model_path))
-                print("[스케줄러] 상권 모델 리로드 완료")
-
-            # 아파트 모델 리로드 (app.state 직접 접근)
-            if self._app:
-                model_path = MODELS_DIR / "xgboost_model.pkl"
-                shap_path = MODELS_DIR / "shap_explainer.pkl"
-                artifacts_path = MODELS_DIR / "feature_artifacts.pkl"
-
-                if model_path.exists():
-                    with open(model_path, "rb") as f:
-                        self._app.state.model = pickle.load(f)
-                    print("[스케줄러] 아파트 가격 모델 리로드 완료")
-
-                if shap_path.exists():
-                    with open(shap_path, "rb") as f:
-                        self._app.state.shap_explainer = pickle.load(f)
-                    print("[스케줄러] SHAP Explainer 리로드 완료")
-
-                if artifacts_path.exists():
-                    with open(artifacts_path, "rb") as f:
-                        self._app.state.feature_artifacts = pickle.load(f)
-                    print("[스케줄러] Feature Artifacts 리로드 완료")
-
-                # v2: 잔차 정보 + LightGBM 리로드
-                residual_path = MODELS_DIR / "residual_info.pkl"
-                if residual_path.exists():
-                    with open(residual_path, "rb") as f:
-                        self._app.state.residual_info = pickle.load(f)
-                    print("[스케줄러] Residual Info 리로드 완료")
-
-                lgbm_path = MODELS_DIR / "lgbm_model.pkl"
-                if lgbm_path.exists():
-                    with open(lgbm_path, "rb") as f:
-                        self._app.state.lgbm_model = pickle.load(f)
-                    print("[스케줄러] LightGBM 모델 리로드 완료")
-
+            await asyncio.to_thread(load_models, self._app.state if self._app else None)
             print("[스케줄러] 모델 핫리로드 완료")
 
         except Exception as e:
             print(f"[스케줄러] 모델 핫리로드 실패: {e}")
 
-    async def weekly_business_training(self):
+    def _read_bundle_version(self) -> Optional[str]:
+        try:
+            with open(self.bundle_manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("version")
+        except (OSError, ValueError):
+            return None
+
+    def _publish_model_bundle(self):
+        """학습 결과 모델 파일 목록을 매니페스트로 게시 (팔로워가 버전 변경을 보고 리로드)"""
+        files = {
+            path.name: {"size": path.stat().st_size, "mtime": path.stat().st_mtime}
+            for path in sorted(MODELS_DIR.glob("*.pkl"))
+        }
+        version = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        manifest = {
+            "version": version,
+            "published_at": datetime.now().isoformat(),
+            "published_by": instance_id(),
+            "files": files,
+        }
+        try:
+            self.bundle_manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.bundle_manifest_path.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.bundle_manifest_path)  # 팔로워가 쓰다 만 파일을 읽지 않도록
+            self.bundle_version = version
+            print(f"[스케줄러] 모델 번들 게시: {version} ({len(files)}개 파일)")
+        except OSError as e:
+            print(f"[스케줄러] 모델 번들 게시 실패: {e}")
+
+    async def watch_model_bundle(self) -> bool:
+        """팔로워: 게시된 모델 번들 버전이 바뀌었으면 리로드. 리로드했으면 True"""
+        version = self._read_bundle_version()
+        if version is None or version == self.bundle_version:
+            return False
+        print(f"[스케줄러] 새 모델 번들 감지: {version}")
+        self.bundle_version = version
+        await self._reload_models()
+        return True
+
+    # ─────────────────────────────────────────────
+    # 학습 파이프라인 (피처 → 학습 → 배치 스코어링)
+    # ─────────────────────────────────────────────
+
+    def _build_pipeline(self) -> PipelineRunner:
         """
-        주간 상권 모델 재학습
-        - 매주 화요일 오전 3시 실행 (월요일 수집 후)
+        단계 DAG
+
+            apartment_model ──→ analyses (바뀐 지역만 재스코어링)
+            business_features ──→ business_model
+
+        아파트 모델 / 상권 모델 계열은 서로 독립 → 동시 실행
         """
-        job_id = f"train_biz_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        pipeline = PipelineRunner(PIPELINE_STATE_PATH)
+        hasher = pipeline.hasher
+
+        def code_hash(*relative_paths: str) -> str:
+            return hasher.hash_files([PROJECT_ROOT / p for p in relative_paths], root=PROJECT_ROOT)
+
+        def region_hashes() -> Optional[dict]:
+            # Supabase transactions와 같은 행이 쌓이는 수집 데이터셋을 변경 감지에 사용
+            dataset = collector_service.dataset
+            if not dataset.exists():
+                return None
+            return {
+                f"region:{code}": hasher.hash_files(files, root=dataset.root)
+                for code, files in dataset.partition_files().items()
+            }
+
+        def apartment_inputs() -> Optional[dict]:
+            # train_model은 Supabase transactions를 우선 읽음 → 테이블 지문이 학습 입력 키.
+            # 수집 데이터셋 파티션 해시는 Supabase 조회 실패 시 train_model이 읽는 폴백 데이터
+            regions = region_hashes()
+            if regions is None:
+                return None
+            from app.core.database import get_supabase_client
+            try:
+                supabase_key = transactions_fingerprint(get_supabase_client())
+            except ValueError:  # Supabase 미설정
+                supabase_key = None
+            if supabase_key is not None:
+                regions["supabase:transactions"] = supabase_key
+            regions["code"] = code_hash(
+                "scripts/train_model.py", "scripts/feature_engineering.py", "app/core/feature_spec.py",
+            )
+            return regions
+
+        async def train_apartment(changed) -> bool:
+            return await self._run_script("scripts.train_model", args=[], timeout=900)
+
+        async def prepare_business(changed) -> bool:
+            return await self._run_script("scripts.prepare_business_training_data", timeout=120)
+
+        async def train_business(changed) -> bool:
+            return await self._run_script(
+                "scripts.train_business_model",
+                args=["--data", str(BUSINESS_TRAINING_CSV)],
+                timeout=300,
+            )
+
+        async def score_analyses(changed) -> bool:
+            args = ["--skip-sync"]
+            if changed is None:
+                pass  # 이전 기록 없음: 분석이 없는 properties만 생성
+            elif "@apartment_model" in changed or "code" in changed:
+                args.append("--regenerate")  # 모델이 바뀌면 전체 재스코어링
+            else:
+                codes = sorted(key.split(":", 1)[1] for key in changed if key.startswith("region:"))
+                args += ["--region-codes", ",".join(codes)]
+            return await self._run_script("scripts.batch_generate_analyses", args=args, timeout=3600)
+
+        def analyses_inputs() -> Optional[dict]:
+            regions = region_hashes() or {}
+            regions["code"] = code_hash("scripts/batch_generate_analyses.py")
+            return regions
+
+        pipeline.add(Stage(
+            "apartment_model", train_apartment,
+            inputs=apartment_inputs,
+            outputs=[MODELS_DIR / "xgboost_model.pkl", MODELS_DIR / "feature_artifacts.pkl"],
+        ))
+        pipeline.add(Stage(
+            "business_features", prepare_business,
+            outputs=[BUSINESS_TRAINING_CSV],  # 입력은 Supabase 통계 테이블 → 항상 실행, 출력이 같으면 학습 건너뜀
+        ))
+        pipeline.add(Stage(
+            "business_model", train_business,
+            inputs=lambda: {"code": code_hash("scripts/train_business_model.py")},
+            outputs=[MODELS_DIR / "business_model.pkl"],
+            deps=["business_features"],
+        ))
+        pipeline.add(Stage(
+            "analyses", score_analyses,
+            inputs=analyses_inputs,
+            deps=["apartment_model"],
+        ))
+        return pipeline
+
+    async def _run_pipeline(self, job_id: str, targets: Optional[list] = None, force: bool = False):
+        """파이프라인 실행 후 새로 학습된 모델이 있으면 핫리로드 + 번들 게시"""
         self.last_training_job = job_id
-        print(f"[스케줄러] 주간 상권 모델 학습 시작: {job_id}")
 
-        # Step 1: 학습 데이터 준비
-        ok = self._run_script(
-            "scripts.prepare_business_training_data",
-            timeout=120
-        )
-        if not ok:
-            print("[스케줄러] 상권 학습 데이터 준비 실패, 학습 건너뜀")
-            return
+        with self._job(job_id) as cancel:
+            results = await self.pipeline.run(targets, force=force)
+        summary = ", ".join(f"{name}={result.status}" for name, result in results.items())
+        print(f"[스케줄러] 파이프라인 결과: {summary}")
 
-        # Step 2: 모델 학습
-        csv_path = str(SCRIPTS_DIR / "business_training_data.csv")
-        ok = self._run_script(
-            "scripts.train_business_model",
-            args=["--data", csv_path],
-            timeout=300
-        )
-        if not ok:
-            print("[스케줄러] 상권 모델 학습 실패")
+        if cancel.is_set():
+            print(f"[스케줄러] 파이프라인 취소됨: {job_id}")
             return
+        retrained = [
+            name for name in MODEL_STAGES
+            if name in results and results[name].status == "ran" and results[name].output_changed
+        ]
+        if retrained:
+            await self._reload_models()
+            self._publish_model_bundle()
 
-        # Step 3: 핫리로드
-        await self._reload_models()
+    async def weekly_business_training(self):
+        """
+        주간 상권 모델 재학습
+        - 매주 화요일 오전 3시 실행 (월요일 수집 후)
+        - 학습 데이터가 지난 학습과 같으면 학습 건너뜀
+        """
+        job_id = f"train_biz_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        print(f"[스케줄러] 주간 상권 모델 학습 시작: {job_id}")
+        await self._run_pipeline(job_id, targets=["business_model"])
         print(f"[스케줄러] 주간 상권 모델 학습 완료: {job_id}")
 
-    async def monthly_full_training(self):
+    async def monthly_full_training(self, force: bool = False):
         """
-        월간 전체 모델 재학습
+        월간 전체 모델 재학습 + 배치 스코어링
         - 매월 2일 오전 3시 실행 (1일 전국 수집 후)
+        - 입력이 바뀐 단계만 실행 (force: 전체 재계산)
         """
         job_id = f"train_all_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.last_training_job = job_id
         print(f"[스케줄러] 월간 전체 모델 학습 시작: {job_id}")
-
-        # Step 1: 아파트 모델 학습 (v2 - Supabase에서 직접 읽기, CSV 불필요)
-        ok_apt = self._run_script(
-            "scripts.train_model",
-            args=[],
-            timeout=900
-        )
-        if ok_apt:
-            print("[스케줄러] 아파트 모델 학습 완료")
-        else:
-            print("[스케줄러] 아파트 모델 학습 실패")
-
-        # Step 3: 상권 학습 데이터 준비
-        ok = self._run_script(
-            "scripts.prepare_business_training_data",
-            timeout=120
-        )
-
-        # Step 4: 상권 모델 학습
-        if ok:
-            biz_csv = str(SCRIPTS_DIR / "business_training_data.csv")
-            ok_biz = self._run_script(
-                "scripts.train_business_model",
-                args=["--data", biz_csv],
-                timeout=300
-            )
-            if ok_biz:
-                print("[스케줄러] 상권 모델 학습 완료")
-            else:
-                print("[스케줄러] 상권 모델 학습 실패")
-        else:
-            print("[스케줄러] 상권 학습 데이터 준비 실패, 상권 모델 건너뜀")
-
-        # Step 5: 전체 모델 핫리로드
-        await self._reload_models()
+        await self._run_pipeline(job_id, force=force)
         print(f"[스케줄러] 월간 전체 모델 학습 완료: {job_id}")
 
     # ─────────────────────────────────────────────
@@ -408,12 +570,40 @@ class DataScheduler:
         """
         서버 시작 시 놓친 데이터를 자동 수집 + 학습
 
-        Supabase에서 가장 최근 거래일을 조회하여,
-        그 이후 누락된 월들을 전국 수집 → 모델 재학습
+        1. 이전 프로세스에서 중단된 수집 작업을 체크포인트부터 재개
+        2. 작업 저장소에 체크포인트가 있으면 확정되지 않은 월만 전국 수집
+           (없으면 Supabase 최근 거래일 기준으로 누락 월 계산)
+        3. 신규 데이터가 있으면 모델 재학습
         """
         print(f"[캐치업] 누락 데이터 캐치업 시작: {datetime.now()}")
 
         try:
+            resumed = await collector_service.resume_interrupted_jobs()
+            resumed_count = sum(
+                collector_service.get_job(job_id).molit_count for job_id in resumed
+            )
+            if resumed:
+                print(f"[캐치업] 중단 작업 {len(resumed)}개 재개 완료")
+
+            now = datetime.now()
+            job_store = collector_service.job_store
+
+            if job_store.has_cells("molit"):
+                # 체크포인트 기준: 최근 6개월 중 확정되지 않은 셀이 남은 월
+                candidates = []
+                cursor = now.replace(day=1)
+                for _ in range(6):
+                    candidates.append(cursor.strftime("%Y%m"))
+                    cursor = (cursor - timedelta(days=1)).replace(day=1)
+                candidates.reverse()
+                pending = job_store.pending_months(
+                    collector_service.get_all_region_codes(), candidates
+                )
+                missing_months = [(int(ym[:4]), int(ym[4:])) for ym in pending]
+                print(f"[캐치업] 체크포인트 기준 수집 대상: {missing_months}")
+                await self._catchup_collect(missing_months, resumed_count)
+                return
+
             # Supabase에서 최근 거래일 조회
             from app.core.database import get_supabase_client
             client = get_supabase_client()
@@ -426,8 +616,6 @@ class DataScheduler:
                 .execute()
             )
 
-            now = datetime.now()
-
             if result.data and result.data[0].get("transaction_date"):
                 last_date_str = result.data[0]["transaction_date"]
                 last_date = datetime.strptime(last_date_str[:10], "%Y-%m-%d")
@@ -463,17 +651,26 @@ class DataScheduler:
                     missing_months.append((d.year, d.month))
                 missing_months.reverse()
 
-            if not missing_months:
-                print("[캐치업] 수집 대상 없음")
-                return
+            await self._catchup_collect(missing_months, resumed_count)
+
+        except Exception as e:
+            print(f"[캐치업] 캐치업 실패: {e}")
+            import traceback
+            traceback.print_exc()
+
+    async def _catchup_collect(self, missing_months: list, already_collected: int = 0):
+        """누락 월 전국 수집 후 신규 데이터가 있으면 재학습"""
+        total_collected = already_collected
 
+        if not missing_months:
+            print("[캐치업] 수집 대상 없음")
+        else:
             # 연도별로 그룹화하여 수집
             from collections import defaultdict
             by_year = defaultdict(list)
             for y, m in missing_months:
                 by_year[y].append(m)
 
-            total_collected = 0
             for year, months in by_year.items():
                 print(f"[캐치업] {year}년 {months}월 전국 수집 시작...")
                 try:
@@ -493,29 +690,49 @@ class DataScheduler:
                 except Exception as e:
                     print(f"[캐치업] {year}년 수집 실패: {e}")
 
-            print(f"[캐치업] 전체 수집 완료: {total_collected}건")
-
-            # 수집 후 모델 재학습
-            if total_collected > 0:
-                print("[캐치업] 신규 데이터 수집됨, 모델 재학습 시작...")
-                await self.monthly_full_training()
-            else:
-                print("[캐치업] 신규 데이터 없음, 학습 건너뜀")
+        print(f"[캐치업] 전체 수집 완료: {total_collected}건")
 
-        except Exception as e:
-            print(f"[캐치업] 캐치업 실패: {e}")
-            import traceback
-            traceback.print_exc()
+        # 수집 후 모델 재학습
+        if total_collected > 0:
+            print("[캐치업] 신규 데이터 수집됨, 모델 재학습 시작...")
+            await self.monthly_full_training()
+        else:
+            print("[캐치업] 신규 데이터 없음, 학습 건너뜀")
 
     # ─────────────────────────────────────────────
     # 스케줄러 제어
     # ─────────────────────────────────────────────
 
     def start(self):
-        """스케줄러 시작"""
+        """스케줄러 시작 (리더 락을 잡으면 수집/학습 예약, 못 잡으면 팔로워)"""
         if self.is_running:
             return
 
+        # 리더 락 갱신 / 팔로워의 리더 인수 시도
+        self.scheduler.add_job(
+            self.check_leadership,
+            IntervalTrigger(seconds=settings.SCHEDULER_LEADER_CHECK_SECONDS),
+            id=LEADERSHIP_JOB_ID,
+            name="리더 락 갱신/인수",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+
+        self.bundle_version = self._read_bundle_version()  # 시작 시 로드한 모델 기준
+        self.scheduler.start()
+        self.is_running = True
+
+        if self.leader.acquire():
+            self._become_leader()
+        else:
+            self._become_follower()
+        print(f"[스케줄러] 수집-학습 통합 스케줄러 시작 ({self.role}, {self.leader.backend} 락)")
+        for job in self.scheduler.get_jobs():
+            print(f"  - {job.name}: 다음 실행 {job.next_run_time}")
+
+    def _schedule_leader_jobs(self):
+        """수집/학습 작업 예약 (리더 전용)"""
         # 일간 수집: 매일 오전 6시
         self.scheduler.add_job(
             self.daily_collection,
@@ -570,7 +787,7 @@ class DataScheduler:
             replace_existing=True,
         )
 
-        # 시작 90초 후 캐치업 (놓친 데이터 자동 수집)
+        # 리더가 된 지 90초 후 캐치업 (놓친 데이터 자동 수집, 인수한 리더는 중단 작업 재개)
         catchup_time = datetime.now() + timedelta(seconds=90)
         self.scheduler.add_job(
             self.startup_catchup,
@@ -580,19 +797,54 @@ class DataScheduler:
             replace_existing=True,
         )
 
-        self.scheduler.start()
-        self.is_running = True
-        print("[스케줄러] 수집-학습 통합 스케줄러 시작")
+    def _unschedule_leader_jobs(self):
         for job in self.scheduler.get_jobs():
-            print(f"  - {job.name}: 다음 실행 {job.next_run_time}")
+            if job.id not in (LEADERSHIP_JOB_ID, MODEL_WATCH_JOB_ID):
+                job.remove()
+
+    def _become_leader(self):
+        self.role = "leader"
+        if self.scheduler.get_job(MODEL_WATCH_JOB_ID):
+            self.scheduler.remove_job(MODEL_WATCH_JOB_ID)
+        self._schedule_leader_jobs()
+        print(f"[스케줄러] 리더로 전환: {instance_id()}")
+
+    def _become_follower(self):
+        self.role = "follower"
+        self._unschedule_leader_jobs()
+        self.scheduler.add_job(
+            self.watch_model_bundle,
+            IntervalTrigger(seconds=settings.SCHEDULER_MODEL_POLL_SECONDS),
+            id=MODEL_WATCH_JOB_ID,
+            name="모델 번들 변경 확인",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+        print(f"[스케줄러] 팔로워로 대기 (리더: {self.leader.holder() or '알 수 없음'})")
+
+    async def check_leadership(self):
+        """리더: 락 갱신 (잃으면 실행 중 스크립트 취소 후 팔로워로) / 팔로워: 락 인수 시도"""
+        if self.role == "leader":
+            if await asyncio.to_thread(self.leader.renew):
+                return
+            print("[스케줄러] 리더 락 상실, 실행 중 스크립트 취소")
+            self._become_follower()
+            await self.cancel_scripts()  # 새 리더와 모델 파일 쓰기가 겹치지 않도록
+        elif self.role == "follower":
+            if await asyncio.to_thread(self.leader.acquire):
+                self._become_leader()
 
     def stop(self):
-        """스케줄러 중지"""
+        """스케줄러 중지 (리더 락 해제 → 다른 인스턴스가 인수)"""
         if not self.is_running:
             return
 
+        self.scheduler.remove_all_jobs()  # 재시작 시 역할에 맞게 다시 예약
         self.scheduler.shutdown(wait=False)
+        self.leader.release()
         self.is_running = False
+        self.role = "stopped"
         print("[스케줄러] 스케줄러 중지")
 
     def get_jobs(self):
@@ -619,6 +871,8 @@ class DataScheduler:
             await self.weekly_business_training()
         elif job_type == "train_all":
             await self.monthly_full_training()
+        elif job_type == "train_all_force":
+            await self.monthly_full_training(force=True)
         elif job_type == "collect_commercial":
             await self.weekly_commercial_collection()
         elif job_type == "catchup":
@@ -0,0 +1,287 @@
+"""
+학습/수집 스크립트 비동기 실행기 (스케줄러용)
+
+- asyncio subprocess로 실행 → 학습 중에도 이벤트 루프(API 요청 처리)가 멈추지 않음
+- stdout/stderr를 줄 단위로 읽어 실행별 링버퍼 로그에 저장 (PYTHONUNBUFFERED)
+- 진행률: 출력의 "[3/5]" / tqdm "45%|" 표기, 없으면 같은 모듈의 직전 성공 소요 시간으로 ETA 추정
+- 취소: terminate → 유예 후 kill
+- CPU 예산: nice 값 + OpenMP/BLAS 스레드 수 제한 (XGBoost/LightGBM이 서빙 코어를 다 쓰지 않도록)
+"""
+import asyncio
+import json
+import os
+import re
+import sys
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+# 학습 라이브러리 스레드 수를 제한하는 환경변수
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS",
+)
+KILL_GRACE_SECONDS = 10
+STREAM_LIMIT = 1 << 20  # 한 줄 최대 1MB
+
+_STEP_PATTERN = re.compile(r"\[(\d+)\s*/\s*(\d+)\]")
+_PERCENT_PATTERN = re.compile(r"(\d{1,3})%\|")  # tqdm 막대 ("MAPE: 4.5%" 같은 지표는 제외)
+
+
+def parse_progress(line: str) -> Optional[float]:
+    """출력 한 줄에서 진행률(0~1) 추출 ("[3/5]" → 0.6, tqdm "45%|" → 0.45)"""
+    match = _STEP_PATTERN.search(line)
+    if match and int(match.group(2)) > 0:
+        return min(int(match.group(1)) / int(match.group(2)), 1.0)
+    match = _PERCENT_PATTERN.search(line)
+    if match and int(match.group(1)) <= 100:
+        return int(match.group(1)) / 100
+    return None
+
+
+@dataclass
+class ScriptRun:
+    """스크립트 1회 실행 상태"""
+    run_id: str
+    module: str
+    args: List[str]
+    timeout: int
+    job_id: Optional[str] = None  # 실행을 요청한 스케줄러 작업
+    status: str = "running"  # running / succeeded / failed / timeout / cancelled
+    started_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    returncode: Optional[int] = None
+    pid: Optional[int] = None
+    progress: Optional[float] = None
+    expected_seconds: Optional[float] = None  # 직전 성공 소요 시간
+    log: Deque[str] = field(default_factory=deque)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "succeeded"
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.time()) - self.started_at
+
+    def eta_seconds(self) -> Optional[float]:
+        """남은 시간 추정 (진행률 우선, 없으면 직전 소요 시간)"""
+        if self.status != "running":
+            return 0.0
+        if self.progress:
+            return round(self.elapsed * (1 - self.progress) / self.progress, 1)
+        if self.expected_seconds:
+            return round(max(self.expected_seconds - self.elapsed, 0.0), 1)
+        return None
+
+    def tail(self, lines: int) -> List[str]:
+        return list(self.log)[-lines:] if lines > 0 else []
+
+    def to_dict(self, log_lines: int = 20) -> Dict:
+        return {
+            "run_id": self.run_id,
+            "module": self.module,
+            "args": self.args,
+            "job_id": self.job_id,
+            "status": self.status,
+            "pid": self.pid,
+            "returncode": self.returncode,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "finished_at": datetime.fromtimestamp(self.finished_at).isoformat() if self.finished_at else None,
+            "elapsed_seconds": round(self.elapsed, 1),
+            "progress": round(self.progress, 3) if self.progress is not None else None,
+            "eta_seconds": self.eta_seconds(),
+            "log_tail": self.tail(log_lines),
+        }
+
+
+class ScriptRunner:
+    """
+    `python -m <module>` 비동기 실행 + 로그/진행률/취소 관리
+
+    실행 이력(모듈별 직전 성공 소요 시간)은 history_path에 저장되어 재시작 후에도 ETA에 쓰입니다.
+    """
+
+    def __init__(
+        self,
+        cwd: Path,
+        log_lines: int = 1000,
+        nice: int = 10,
+        cpu_threads: int = 0,
+        history_path: Optional[Path] = None,
+        keep_runs: int = 20,
+    ):
+        self.cwd = Path(cwd)
+        self.log_lines = log_lines
+        self.nice = nice
+        self.cpu_threads = cpu_threads or max((os.cpu_count() or 2) - 1, 1)
+        self.history_path = history_path
+        self.active: Dict[str, ScriptRun] = {}
+        self.recent: Deque[ScriptRun] = deque(maxlen=keep_runs)
+        self._processes: Dict[str, asyncio.subprocess.Process] = {}
+        self._cancelled: set = set()
+        self._durations: Dict[str, float] = self._load_history()
+
+    # ------------------------------------------------------------------ #
+    # 실행
+    # ------------------------------------------------------------------ #
+    def _env(self) -> Dict[str, str]:
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        for name in THREAD_ENV_VARS:
+            env.setdefault(name, str(self.cpu_threads))
+        return env
+
+    def _lower_priority(self, pid: int):
+        """자식 프로세스 nice 값 적용 (POSIX만, 실패해도 실행은 계속)"""
+        if self.nice and hasattr(os, "setpriority"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, pid, self.nice)
+            except OSError as e:
+                print(f"[스크립트] nice 적용 실패 (pid {pid}): {e}")
+
+    async def _pump(self, run: ScriptRun, stream: asyncio.StreamReader, prefix: str):
+        """스트림을 줄 단위로 링버퍼에 기록 (tqdm의 \\r 갱신은 마지막 상태만)"""
+        while True:
+            try:
+                raw = await stream.readline()
+            except ValueError:  # 한도를 넘는 줄 (버퍼는 asyncio가 비움)
+                run.log.append(prefix + "(긴 줄 생략)")
+                continue
+            if not raw:
+                break
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n").split("\r")[-1]
+            if not line:
+                continue
+            run.log.append(prefix + line)
+            progress = parse_progress(line)
+            if progress is not None:
+                run.progress = progress
+
+    async def run(
+        self, module: str, args: Optional[List[str]] = None, timeout: int = 600, job_id: Optional[str] = None,
+    ) -> ScriptRun:
+        """
+        스크립트 실행 후 완료까지 대기 (이벤트 루프는 막지 않음).
+        job_id: 실행을 요청한 작업 (작업 단위 취소용)
+
+        Returns:
+            ScriptRun (status: succeeded / failed / timeout / cancelled)
+        """
+        run = ScriptRun(
+            run_id=uuid.uuid4().hex[:12], module=module, args=list(args or []), timeout=timeout, job_id=job_id,
+            expected_seconds=self._durations.get(module), log=deque(maxlen=self.log_lines),
+        )
+        self.active[run.run_id] = run
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", module, *run.args,
+                cwd=str(self.cwd), env=self._env(),
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LIMIT,
+            )
+        except Exception as e:
+            run.log.append(f"! 실행 실패: {e}")
+            return self._finish(run, "failed")
+
+        run.pid = process.pid
+        self._processes[run.run_id] = process
+        self._lower_priority(process.pid)
+        pumps = asyncio.gather(
+            self._pump(run, process.stdout, ""), self._pump(run, process.stderr, "! "),
+        )
+
+        status = None
+        try:
+            await asyncio.wait_for(process.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+            await self._stop(process)
+        except asyncio.CancelledError:  # 호출 측 작업이 취소되면 자식도 정리
+            await self._stop(process)
+            pumps.cancel()
+            self._finish(run, "cancelled")
+            raise
+        await pumps
+
+        run.returncode = process.returncode
+        if run.run_id in self._cancelled:
+            status = "cancelled"
+        return self._finish(run, status or ("succeeded" if process.returncode == 0 else "failed"))
+
+    def _finish(self, run: ScriptRun, status: str) -> ScriptRun:
+        run.status = status
+        run.finished_at = time.time()
+        if run.succeeded:
+            run.progress = 1.0
+            self._durations[run.module] = round(run.elapsed, 1)
+            self._save_history()
+        self.active.pop(run.run_id, None)
+        self._processes.pop(run.run_id, None)
+        self._cancelled.discard(run.run_id)
+        self.recent.append(run)
+        return run
+
+    async def _stop(self, process: asyncio.subprocess.Process):
+        """terminate → KILL_GRACE_SECONDS 후에도 남아 있으면 kill"""
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=KILL_GRACE_SECONDS)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        except ProcessLookupError:
+            pass
+
+    # ------------------------------------------------------------------ #
+    # 제어 / 조회
+    # ------------------------------------------------------------------ #
+    async def cancel(self, run_id: Optional[str] = None) -> List[str]:
+        """실행 중 스크립트 취소 (run_id 없으면 전체). 취소한 run_id 목록 반환"""
+        targets = [run_id] if run_id else list(self._processes)
+        cancelled = []
+        for target in targets:
+            process = self._processes.get(target)
+            if process is None:
+                continue
+            self._cancelled.add(target)
+            await self._stop(process)
+            cancelled.append(target)
+        return cancelled
+
+    def get(self, run_id: str) -> Optional[ScriptRun]:
+        if run_id in self.active:
+            return self.active[run_id]
+        return next((run for run in self.recent if run.run_id == run_id), None)
+
+    def status(self, log_lines: int = 20) -> Dict:
+        return {
+            "active": [run.to_dict(log_lines) for run in self.active.values()],
+            "recent": [run.to_dict(0) for run in reversed(self.recent)],
+            "nice": self.nice,
+            "cpu_threads": self.cpu_threads,
+        }
+
+    # ------------------------------------------------------------------ #
+    # 소요 시간 이력
+    # ------------------------------------------------------------------ #
+    def _load_history(self) -> Dict[str, float]:
+        if not self.history_path or not self.history_path.exists():
+            return {}
+        try:
+            return json.loads(self.history_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_history(self):
+        if not self.history_path:
+            return
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            self.history_path.write_text(json.dumps(self._durations, indent=2), encoding="utf-8")
+        except OSError as e:
+            print(f"[스크립트] 실행 이력 저장 실패: {e}")
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 모델 워밍업 (빠른 콜드 스타트)
+
+STARTUP_MODE=lazy이면 lifespan은 워밍업 태스크만 띄우고 바로 트래픽을 받음
+- 워커 스레드에서 auto_migrate → 모델 unpickle (xgboost/lightgbm/shap import 포함)
+- 완료 후 이벤트 루프에서 스케줄러 시작
+- /health는 완료 전까지 status="warming"
+- 모델이 필요한 요청은 wait()로 최대 MODEL_WAIT_SECONDS 기다린 뒤 폴백 응답
+
+STARTUP_MODE=eager이면 기존처럼 lifespan 안에서 모두 끝낸 뒤 트래픽을 받음
+"""
+import asyncio
+import pickle
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.core.config import settings
+
+MODELS_DIR = Path(__file__).parent.parent / "models"
+MODEL_PATH = MODELS_DIR / "xgboost_model.pkl"
+SHAP_PATH = MODELS_DIR / "shap_explainer.pkl"
+ARTIFACTS_PATH = MODELS_DIR / "feature_artifacts.pkl"
+BUSINESS_MODEL_PATH = MODELS_DIR / "business_model.pkl"
+RESIDUAL_PATH = MODELS_DIR / "residual_info.pkl"
+LGBM_PATH = MODELS_DIR / "lgbm_model.pkl"
+COMPILED_MODEL_PATH = MODELS_DIR / "compiled_model.pkl"
+
+# app.state 속성 → 모델 파일 (없으면 None 유지)
+STATE_MODELS = {
+    "model": MODEL_PATH,
+    "shap_explainer": SHAP_PATH,
+    "feature_artifacts": ARTIFACTS_PATH,
+    "residual_info": RESIDUAL_PATH,
+    "lgbm_model": LGBM_PATH,
+}
+
+
+def init_model_state(state):
+    """모델 속성 초기화 (워밍업 중 요청이 AttributeError 없이 폴백하도록)"""
+    for name in STATE_MODELS:
+        setattr(state, name, None)
+    state.compiled_model = None
+
+
+def load_models(state=None):
+    """
+    모델 파일 → app.state + 상권 모델 서비스 (동기, 워커 스레드에서 호출)
+
+    모두 읽은 뒤 한 번에 app.state에 반영 → 서빙 중인 요청이 새/옛 모델을 섞어 쓰지 않음
+    """
+    print("Loading ML models...")
+
+    loaded = {name: None for name in STATE_MODELS}
+    for name, path in STATE_MODELS.items():
+        if path.exists():
+            with open(path, "rb") as f:
+                loaded[name] = pickle.load(f)
+            print(f"{name} loaded: {path}")
+
+    # 컴파일된 트리 앙상블 (PRICE_MODEL_BACKEND=auto|compiled, 없으면 XGBoost Booster)
+    loaded["compiled_model"] = None
+    if settings.PRICE_MODEL_BACKEND != "xgboost" and COMPILED_MODEL_PATH.exists():
+        with open(COMPILED_MODEL_PATH, "rb") as f:
+            loaded["compiled_model"] = pickle.load(f)
+        loaded["compiled_model"].warm_up()
+        print(f"Compiled model loaded: {COMPILED_MODEL_PATH}")
+    elif settings.PRICE_MODEL_BACKEND == "compiled":
+        print(f"Warning: compiled backend requested but {COMPILED_MODEL_PATH} not found, using XGBoost")
+
+    if state is not None:
+        for name, value in loaded.items():
+            setattr(state, name, value)
+
+    # 상권 성공 예측 모델 로드
+    from app.services.business_model_service import business_model_service
+    if BUSINESS_MODEL_PATH.exists():
+        business_model_service.load(str(BUSINESS_MODEL_PATH))
+    else:
+        print("Warning: No business model found. Run train_business_model.py first.")
+
+    if loaded["model"] is not None:
+        print("ML models loaded successfully!")
+    else:
+        print("Warning: No trained model found. Run train_model.py first.")
+
+
+class ModelWarmup:
+    """워밍업 상태 (cold → warming → ready / failed)"""
+
+    def __init__(self):
+        self.status = "cold"
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._done: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_ready(self) -> bool:
+        return self.status in ("ready", "failed")
+
+    async def run(self, steps: Callable[[], None], on_ready: Optional[Callable[[], None]] = None):
+        """
+        워밍업 실행 (steps는 워커 스레드, on_ready는 이벤트 루프에서 호출)
+
+        모델 로드가 실패해도 폴백으로 서빙할 수 있도록 on_ready는 항상 호출
+        """
+        self.status = "warming"
+        self.error = None
+        self.started_at = time.time()
+        self.finished_at = None
+        self._done = asyncio.Event()
+        try:
+            await asyncio.to_thread(steps)
+            self.status = "ready"
+        except Exception as e:
+            print(f"Error loading models: {e}")
+            self.status = "failed"
+            self.error = str(e)
+        finally:
+            self.finished_at = time.time()
+            self._done.set()
+        print(f"[워밍업] {self.status} ({self.finished_at - self.started_at:.1f}s)")
+        if on_ready is not None:
+            on_ready()
+
+    def start(self, steps: Callable[[], None], on_ready: Optional[Callable[[], None]] = None):
+        """백그라운드 워밍업 시작 (lifespan은 기다리지 않음)"""
+        self._task = asyncio.create_task(self.run(steps, on_ready))
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        워밍업 완료 대기.
+
+        Args:
+            timeout: 최대 대기 시간 (초, None: 설정값 MODEL_WAIT_SECONDS)
+
+        Returns:
+            완료 여부 (시간 초과면 False → 호출자는 폴백 응답)
+        """
+        if self._done is None:
+            return True  # 워밍업을 쓰지 않는 실행 (테스트 등)
+        if self.is_ready:
+            return True
+        timeout = settings.MODEL_WAIT_SECONDS if timeout is None else timeout
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def cancel(self):
+        """종료 시 진행 중 워밍업 태스크 정리 (워커 스레드는 끝까지 실행됨)"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def describe(self) -> Dict:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.time()) - self.started_at, 2)
+        return {"status": self.status, "elapsed_seconds": elapsed, "error": self.error}
+
+
+# 싱글톤 인스턴스
+model_warmup = ModelWarmup()
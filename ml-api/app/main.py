@@ -6,7 +6,6 @@
 - 전국 아파트 데이터 자동 수집 및 분석
 """
 import os
-import pickle
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -24,85 +23,37 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from app.api import predict, factors, similar, health, commercial, chamgab, integrated, reports
-from app.api import collect, analyze, scheduler
+from app.api import collect, analyze, scheduler, metrics, admin
 from app.core.config import settings
 from app.core.scheduler import data_scheduler
+from app.core.metrics import metrics_middleware
 from app.core.migrate import auto_migrate
-from app.services.business_model_service import business_model_service
-
-
-# 모델 경로
-MODELS_DIR = Path(__file__).parent / "models"
-MODEL_PATH = MODELS_DIR / "xgboost_model.pkl"
-SHAP_PATH = MODELS_DIR / "shap_explainer.pkl"
-ARTIFACTS_PATH = MODELS_DIR / "feature_artifacts.pkl"
-BUSINESS_MODEL_PATH = MODELS_DIR / "business_model.pkl"
-RESIDUAL_PATH = MODELS_DIR / "residual_info.pkl"
-LGBM_PATH = MODELS_DIR / "lgbm_model.pkl"
+from app.core.profiling import profiling_middleware
+from app.core.warmup import init_model_state, load_models, model_warmup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: 자동 마이그레이션 (transactions 컬럼 추가)
-    auto_migrate()
-
-    # Load ML models
-    print("Loading ML models...")
-
-    app.state.model = None
-    app.state.shap_explainer = None
-    app.state.feature_artifacts = None
-    app.state.residual_info = None
-    app.state.lgbm_model = None
-
-    try:
-        if MODEL_PATH.exists():
-            with open(MODEL_PATH, "rb") as f:
-                app.state.model = pickle.load(f)
-            print(f"Model loaded: {MODEL_PATH}")
-
-        if SHAP_PATH.exists():
-            with open(SHAP_PATH, "rb") as f:
-                app.state.shap_explainer = pickle.load(f)
-            print(f"SHAP Explainer loaded: {SHAP_PATH}")
-
-        if ARTIFACTS_PATH.exists():
-            with open(ARTIFACTS_PATH, "rb") as f:
-                app.state.feature_artifacts = pickle.load(f)
-            print(f"Feature artifacts loaded: {ARTIFACTS_PATH}")
-
-        if RESIDUAL_PATH.exists():
-            with open(RESIDUAL_PATH, "rb") as f:
-                app.state.residual_info = pickle.load(f)
-            print(f"Residual info loaded: {RESIDUAL_PATH}")
-
-        if LGBM_PATH.exists():
-            with open(LGBM_PATH, "rb") as f:
-                app.state.lgbm_model = pickle.load(f)
-            print(f"LightGBM model loaded: {LGBM_PATH}")
-
-        # 상권 성공 예측 모델 로드
-        if BUSINESS_MODEL_PATH.exists():
-            business_model_service.load(str(BUSINESS_MODEL_PATH))
-        else:
-            print("Warning: No business model found. Run train_business_model.py first.")
-
-        if app.state.model:
-            print("ML models loaded successfully!")
-        else:
-            print("Warning: No trained model found. Run train_model.py first.")
-
-    except Exception as e:
-        print(f"Error loading models: {e}")
-
-    # 스케줄러 자동 시작 (수집 + 학습 통합)
+    init_model_state(app.state)
     data_scheduler.set_app(app)
-    data_scheduler.start()
+
+    def warm_up():
+        # 자동 마이그레이션 (transactions 컬럼 추가) → ML 모델 로드
+        auto_migrate()
+        load_models(app.state)
+
+    # 스케줄러 자동 시작 (수집 + 학습 통합) — 모델 로드 후 (캐치업 학습과 로드가 겹치지 않도록)
+    if settings.STARTUP_MODE == "eager":
+        await model_warmup.run(warm_up, on_ready=data_scheduler.start)
+    else:
+        model_warmup.start(warm_up, on_ready=data_scheduler.start)
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    await model_warmup.cancel()
+    await data_scheduler.cancel_scripts()  # 학습 자식 프로세스가 남지 않도록
     if data_scheduler.is_running:
         data_scheduler.stop()
 
@@ -135,8 +86,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연 (GET /metrics), 관리자 opt-in 샘플링 프로파일링 (/api/admin/profile)
+app.middleware("http")(profiling_middleware)
+app.middleware("http")(metrics_middleware)
+
 # Routes
 app.include_router(health.router, tags=["Health"])
+app.include_router(metrics.router, tags=["Metrics"])
 app.include_router(predict.router, prefix="/api", tags=["Prediction"])
 app.include_router(factors.router, prefix="/api", tags=["Factors"])
 app.include_router(similar.router, prefix="/api", tags=["Similar"])
@@ -145,6 +101,7 @@ app.include_router(similar.router, prefix="/api", tags=["Similar"])
 app.include_router(collect.router, prefix="/api", tags=["Collection"])
 app.include_router(analyze.router, prefix="/api", tags=["Analysis"])
 app.include_router(scheduler.router, prefix="/api", tags=["Scheduler"])
+app.include_router(admin.router, prefix="/api", tags=["Admin"])
 
 # 상권분석 라우터
 app.include_router(commercial.router, tags=["Commercial"])
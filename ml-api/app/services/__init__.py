@@ -1,5 +1,16 @@
-from .model_service import ModelService
-from .shap_service import ShapService
-from .business_model_service import BusinessModelService
+# 서비스 모듈은 필요할 때 import (app.services.X를 import해도 xgboost/shap은 첫 사용 시 로드)
+from importlib import import_module
 
-__all__ = ["ModelService", "ShapService", "BusinessModelService"]
+_EXPORTS = {
+    "ModelService": ".model_service",
+    "ShapService": ".shap_service",
+    "BusinessModelService": ".business_model_service",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+분석 결과 검색 인덱스
+
+저장된 모든 분석 결과(PriceAnalysis)를 대상으로 하는 /api/analyze/search용 인덱스
+- 정렬 키: (estimated_price, doc_id)를 하나의 int64로 합성 → 가격 범위/커서가 이진 탐색 한 번
+  doc_id는 작업 등록 시 단조 증가로 부여 (작업 시작 id + 행 번호) → 작업 만료/삭제로
+  재구성되어도 남은 결과의 정렬 키가 그대로라 이전 커서가 같은 위치에서 이어짐
+- 지역 인덱스: region_code → 정렬 키 배열 + 문서 배열
+- 단지명 인덱스: 1·2글자 n-gram → 단지명 ID 목록 (부분 문자열 후보 → 원문 검증)
+- 결과는 가격 오름차순, 커서는 마지막 항목의 정렬 키
+"""
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# 정렬 키 = estimated_price << DOC_BITS | doc_id (프로세스 수명 동안 2^32 행까지)
+DOC_BITS = 32
+DOC_MASK = (1 << DOC_BITS) - 1
+
+# (job_id, row) 목록
+DocRefs = List[Tuple[str, int]]
+
+
+def _grams(text: str) -> set:
+    """1·2글자 n-gram"""
+    return set(text) | {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+class AnalysisIndex:
+    """분석 결과 검색 인덱스 (작업 추가/삭제 시 다음 검색에서 재구성)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, dict] = {}
+        self._job_base: Dict[str, int] = {}  # 작업 → 첫 행의 doc_id (등록 순서대로 증가)
+        self._next_doc = 0
+        self._lock = threading.Lock()
+        self._dirty = True
+
+        self._doc_job: np.ndarray = np.empty(0, dtype=np.int32)
+        self._doc_row: np.ndarray = np.empty(0, dtype=np.int64)
+        self._job_ids: List[str] = []
+        self._bases: np.ndarray = np.empty(0, dtype=np.int64)
+        self._doc_key: np.ndarray = np.empty(0, dtype=np.int64)
+        self._doc_region: np.ndarray = np.empty(0, dtype=np.int32)
+        self._sorted_keys: np.ndarray = np.empty(0, dtype=np.int64)
+        self._sorted_docs: np.ndarray = np.empty(0, dtype=np.int64)
+        self._regions: Dict[str, int] = {}
+        self._region_postings: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._names: List[str] = []
+        self._name_docs: List[np.ndarray] = []
+        self._grams: Dict[str, np.ndarray] = {}
+
+    # ─────────────────────────────────────────────
+    # 작업 등록
+    # ─────────────────────────────────────────────
+
+    def add_job(self, job_id: str, table: pa.Table):
+        """분석 결과 테이블 등록 (apt_name, region_code, estimated_price 컬럼만 사용)"""
+        if table.num_rows:
+            columns = table.select(["apt_name", "region_code", "estimated_price"]).to_pydict()
+        else:
+            columns = {"apt_name": [], "region_code": [], "estimated_price": []}
+        with self._lock:
+            # 재등록이면 새 doc_id 구간 (dict 순서 = doc_id 순서 유지)
+            self._jobs.pop(job_id, None)
+            self._jobs[job_id] = columns
+            self._job_base[job_id] = self._next_doc
+            self._next_doc += len(columns["apt_name"])
+            self._dirty = True
+
+    def remove_job(self, job_id: str):
+        with self._lock:
+            if self._jobs.pop(job_id, None) is not None:
+                self._job_base.pop(job_id, None)
+                self._dirty = True
+
+    def job_ids(self) -> List[str]:
+        return list(self._jobs)
+
+    def __len__(self) -> int:
+        return sum(len(c["apt_name"]) for c in self._jobs.values())
+
+    # ─────────────────────────────────────────────
+    # 재구성
+    # ─────────────────────────────────────────────
+
+    def _rebuild(self):
+        job_ids = list(self._jobs)
+        columns = [self._jobs[j] for j in job_ids]
+        sizes = [len(c["apt_name"]) for c in columns]
+        n = sum(sizes)
+
+        self._job_ids = job_ids
+        self._bases = np.array([self._job_base[j] for j in job_ids], dtype=np.int64)
+        self._doc_job = np.repeat(np.arange(len(job_ids), dtype=np.int32), sizes)
+        self._doc_row = np.concatenate(
+            [np.arange(size, dtype=np.int64) for size in sizes]
+        ) if n else np.empty(0, dtype=np.int64)
+
+        names = [name for c in columns for name in c["apt_name"]]
+        regions = [code for c in columns for code in c["region_code"]]
+        prices = np.array(
+            [p for c in columns for p in c["estimated_price"]], dtype=np.int64
+        ).clip(0, (1 << 31) - 1)
+
+        # 정렬 키는 안정 doc_id, 내부 색인(지역/단지명)은 이번 재구성의 위치(doc_ids) 기준
+        doc_ids = np.arange(n, dtype=np.int64)
+        stable_ids = self._bases[self._doc_job] + self._doc_row if n else doc_ids
+        self._doc_key = (prices << DOC_BITS) | stable_ids
+        order = np.argsort(self._doc_key, kind="stable")
+        self._sorted_docs = doc_ids[order]
+        self._sorted_keys = self._doc_key[order]
+
+        # 지역별 정렬 키 (전역 정렬 순서를 지역으로 안정 분할)
+        region_codes, uniq_regions = pd.factorize(pd.Series(regions, dtype=object))
+        self._doc_region = region_codes.astype(np.int32)
+        self._regions = {code: i for i, code in enumerate(uniq_regions)}
+        by_region = np.argsort(self._doc_region[self._sorted_docs], kind="stable")
+        bounds = np.cumsum(np.bincount(self._doc_region, minlength=len(uniq_regions)))
+        self._region_postings = {}
+        start = 0
+        for rid, end in enumerate(bounds):
+            idx = by_region[start:end]
+            self._region_postings[rid] = (self._sorted_keys[idx], self._sorted_docs[idx])
+            start = end
+
+        # 단지명 → 문서, n-gram → 단지명
+        name_codes, uniq_names = pd.factorize(pd.Series(names, dtype=object))
+        self._names = [str(name) for name in uniq_names]
+        by_name = np.argsort(name_codes, kind="stable")
+        splits = np.cumsum(np.bincount(name_codes, minlength=len(uniq_names)))[:-1]
+        self._name_docs = np.split(doc_ids[by_name], splits) if n else []
+        grams: Dict[str, List[int]] = {}
+        for name_id, name in enumerate(self._names):
+            for gram in _grams(name):
+                grams.setdefault(gram, []).append(name_id)
+        self._grams = {g: np.array(ids, dtype=np.int64) for g, ids in grams.items()}
+
+        self._dirty = False
+
+    def _ensure_built(self):
+        if self._dirty:
+            with self._lock:
+                if self._dirty:
+                    self._rebuild()
+
+    # ─────────────────────────────────────────────
+    # 검색
+    # ─────────────────────────────────────────────
+
+    def _match_names(self, query: str) -> List[int]:
+        """부분 문자열 매칭 단지명 ID"""
+        grams = [query] if len(query) == 1 else [query[i:i + 2] for i in range(len(query) - 1)]
+        postings = []
+        for gram in set(grams):
+            posting = self._grams.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if not len(candidates):
+                return []
+        return [int(i) for i in candidates if query in self._names[i]]
+
+    def search(
+        self,
+        apt_name: Optional[str] = None,
+        region_code: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[DocRefs, Optional[str]]:
+        """
+        분석 결과 검색 (가격 오름차순)
+
+        Returns:
+            ((job_id, row) 목록, 다음 페이지 커서 또는 None)
+        """
+        self._ensure_built()
+
+        lo_key = int(cursor) + 1 if cursor else 0
+        if min_price:
+            lo_key = max(lo_key, int(min_price) << DOC_BITS)
+        hi_key = (int(max_price) + 1) << DOC_BITS if max_price else np.iinfo(np.int64).max
+
+        region_id = None
+        if region_code:
+            region_id = self._regions.get(region_code)
+            if region_id is None:
+                return [], None
+
+        if apt_name:
+            name_ids = self._match_names(apt_name)
+            if not name_ids:
+                return [], None
+            docs = np.concatenate([self._name_docs[i] for i in name_ids])
+            if region_id is not None:
+                docs = docs[self._doc_region[docs] == region_id]
+            keys = self._doc_key[docs]
+            mask = (keys >= lo_key) & (keys < hi_key)
+            keys = keys[mask]
+            if len(keys) > limit:
+                keys = np.partition(keys, limit)[:limit + 1]
+            keys = np.sort(keys)
+        else:
+            if region_id is not None:
+                all_keys, _ = self._region_postings[region_id]
+            else:
+                all_keys = self._sorted_keys
+            start = np.searchsorted(all_keys, lo_key, side="left")
+            end = np.searchsorted(all_keys, hi_key, side="left")
+            keys = all_keys[start:min(end, start + limit + 1)]
+
+        has_more = len(keys) > limit
+        keys = keys[:limit]
+        stable_ids = keys & DOC_MASK
+        jobs = np.searchsorted(self._bases, stable_ids, side="right") - 1
+        refs = [
+            (self._job_ids[j], int(sid - self._bases[j]))
+            for j, sid in zip(jobs, stable_ids)
+        ]
+        next_cursor = str(int(keys[-1])) if has_more and len(keys) else None
+        return refs, next_cursor
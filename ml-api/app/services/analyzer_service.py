@@ -7,12 +7,38 @@
 - 층수/면적/연식 보정
 - 지역 시장 동향 반영
 """
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import pandas as pd
+import pyarrow as pa
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from app.core.result_store import JobResultStore, result_store as default_result_store
+from app.services.analysis_index import AnalysisIndex
+
+# 결과 저장소 내 분석 결과 이름
+RESULTS_NAME = "analyses"
+
+# 검색 인덱스 ↔ 결과 저장소 동기화 최소 간격 (초)
+INDEX_SYNC_INTERVAL = 60
+
+# 지역 분석에 사용하는 거래 컬럼
+TRADE_COLUMNS = ["region_code", "apt_name", "area", "floor", "price", "deal_date", "built_year"]
+
+# 기준가 산출에 쓰는 최근 거래 수
+RECENT_TRADES = 10
+
+# 이 건수 이상이면 지역별 분석을 프로세스 풀로 분산 (spawn 비용이 초 단위라 대량일 때만)
+PROCESS_POOL_MIN_TRADES = 500_000
+
 
 class AnalysisStatus(str, Enum):
     PENDING = "pending"
@@ -74,9 +100,11 @@ class AnalyzerService:
         "재건축대상": -0.10,  # 30년 이상: -10%
     }
 
-    def __init__(self):
+    def __init__(self, results: Optional[JobResultStore] = None):
         self.jobs: Dict[str, AnalysisJob] = {}
-        self.analysis_results: Dict[str, List[PriceAnalysis]] = {}
+        self.results = results or default_result_store  # 작업별 분석 결과 (디스크 + LRU)
+        self.index = AnalysisIndex()  # 전체 분석 결과 검색 인덱스
+        self._index_synced_at = 0.0
 
     def get_floor_category(self, floor: int, total_floors: int = 20) -> str:
         """층수 카테고리 분류"""
@@ -163,67 +191,31 @@ class AnalyzerService:
         total_floors: int = 20,
         **kwargs
     ) -> PriceAnalysis:
-        """단일 아파트 분석"""
-
-        # 동일 단지, 유사 면적 거래 필터링
-        area_range = (area * 0.9, area * 1.1)
-        similar_trades = [
-            t for t in trade_data
-            if t.get("apt_name") == apt_name
-            and area_range[0] <= t.get("area", 0) <= area_range[1]
-        ]
-
-        # 최근 6개월 거래
-        recent_trades = similar_trades[-10:] if similar_trades else []
-
-        # 기준가 계산 (최근 거래 평균)
-        if recent_trades:
-            prices = [t.get("price", 0) for t in recent_trades if t.get("price")]
-            base_price = int(np.mean(prices)) if prices else 0
-            avg_trade_price = base_price
-        else:
-            # 거래 없으면 지역 평균 기반 추정
-            base_price = self._estimate_from_region(region_code, area, trade_data)
-            avg_trade_price = base_price
-
-        # 가격 보정 요인 계산
-        price_factors = self.calculate_price_adjustment(
-            floor=floor,
-            total_floors=total_floors,
-            built_year=built_year,
-            **kwargs
+        """
+        단일 아파트 분석
+
+        analyze_region과 같은 규칙 (같은 지역·같은 단지 내 면적 ±10%, 거래일 기준 최근 10건)으로
+        계산하고, 층/연식/부가 보정은 요청 값을 사용. 유사 거래가 없으면 지역 평균 기반 추정.
+        """
+        trades = _trades_frame(trade_data)
+        trades = trades[(trades["region_code"] == region_code) & (trades["apt_name"] == apt_name)]
+        targets = pd.DataFrame({"apt_name": [apt_name], "area": [float(area)], "target": [0]})
+        extra = self.calculate_price_adjustment(
+            floor=floor, total_floors=total_floors, built_year=built_year, **kwargs
         )
 
-        # 총 보정률
-        total_adjustment = sum(price_factors.values())
-
-        # 적정가격 계산
-        estimated_price = int(base_price * (1 + total_adjustment))
-
-        # 신뢰구간 (±5~10%)
-        confidence = min(0.9, 0.5 + len(recent_trades) * 0.05)  # 거래 많을수록 신뢰도 높음
-        margin = 0.05 if confidence > 0.7 else 0.10
-        min_price = int(estimated_price * (1 - margin))
-        max_price = int(estimated_price * (1 + margin))
-
-        # 시장 동향 판단
-        market_trend = self._calculate_market_trend(recent_trades)
-
-        return PriceAnalysis(
-            apt_name=apt_name,
+        row = _score_targets(
+            targets,
+            _target_pairs(targets, trades),
+            floors=np.array([floor], dtype=np.float64),
+            built_years=np.array([built_year], dtype=np.float64),
             region_code=region_code,
-            area=area,
-            base_price=base_price,
-            estimated_price=estimated_price,
-            min_price=min_price,
-            max_price=max_price,
-            confidence=confidence,
-            price_factors=price_factors,
-            recent_trades=len(recent_trades),
-            avg_trade_price=avg_trade_price,
-            market_trend=market_trend,
             analyzed_at=datetime.now().isoformat(),
-        )
+            total_floors=total_floors,
+            extra_factors={k: extra[k] for k in ("view", "subway", "school", "brand")},
+            fallback_base=lambda: self._estimate_from_region(region_code, area, trade_data),
+        )[0]
+        return PriceAnalysis(**row)
 
     def _estimate_from_region(
         self,
@@ -248,84 +240,25 @@ class AnalyzerService:
         pyung = area / 3.3
         return int(pyung * 2000)
 
-    def _calculate_market_trend(self, trades: List[dict]) -> str:
-        """시장 동향 계산"""
-        if len(trades) < 3:
-            return "보합"
-
-        # 시간순 정렬
-        sorted_trades = sorted(trades, key=lambda x: x.get("deal_date", ""))
-
-        # 전반부 vs 후반부 가격 비교
-        mid = len(sorted_trades) // 2
-        early_prices = [t.get("price", 0) for t in sorted_trades[:mid] if t.get("price")]
-        late_prices = [t.get("price", 0) for t in sorted_trades[mid:] if t.get("price")]
-
-        if not early_prices or not late_prices:
-            return "보합"
-
-        early_avg = np.mean(early_prices)
-        late_avg = np.mean(late_prices)
-
-        change_rate = (late_avg - early_avg) / early_avg
-
-        if change_rate > 0.03:
-            return "상승"
-        elif change_rate < -0.03:
-            return "하락"
-        else:
-            return "보합"
-
     async def analyze_region(
         self,
         region_code: str,
         trade_data: List[dict],
         job_id: str
     ) -> List[PriceAnalysis]:
-        """지역 전체 아파트 분석"""
-
-        # 지역 거래 필터링
-        region_trades = [t for t in trade_data if t.get("region_code") == region_code]
-
-        # 단지별 그룹핑
-        apt_groups = {}
-        for trade in region_trades:
-            apt_name = trade.get("apt_name", "")
-            if apt_name not in apt_groups:
-                apt_groups[apt_name] = []
-            apt_groups[apt_name].append(trade)
-
-        results = []
-
-        for apt_name, trades in apt_groups.items():
-            if not trades:
-                continue
-
-            # 대표 면적별 분석
-            areas = set(t.get("area", 0) for t in trades if t.get("area"))
-            for area in areas:
-                if area <= 0:
-                    continue
-
-                # 해당 면적 거래
-                area_trades = [t for t in trades if abs(t.get("area", 0) - area) < 5]
-                if not area_trades:
-                    continue
-
-                # 최근 거래 기준 정보 추출
-                latest = max(area_trades, key=lambda x: x.get("deal_date", ""))
-
-                analysis = self.analyze_apartment(
-                    apt_name=apt_name,
-                    region_code=region_code,
-                    area=area,
-                    floor=latest.get("floor", 10),
-                    built_year=latest.get("built_year", 2010),
-                    trade_data=trade_data,
-                )
-                results.append(analysis)
-
-        return results
+        """
+        지역 전체 아파트 분석
+
+        지역 거래를 (단지, 면적) 단위로 한 번에 그룹 연산
+        (유사 거래는 같은 지역·같은 단지 내 면적 ±10%, 거래일 기준 최근 10건)
+        """
+        trades = _trades_frame(trade_data)
+        rows = _analyze_region_frame(
+            trades[trades["region_code"] == region_code],
+            region_code,
+            datetime.now().isoformat(),
+        )
+        return [PriceAnalysis(**row) for row in rows]
 
     async def analyze_all_regions(
         self,
@@ -333,18 +266,48 @@ class AnalyzerService:
         trade_data: List[dict],
         job_id: str
     ) -> Dict[str, Any]:
-        """다중 지역 분석"""
+        """
+        다중 지역 분석
+
+        거래 DataFrame을 한 번 만들어 지역별로 나눈 뒤,
+        대량(PROCESS_POOL_MIN_TRADES 이상)이면 프로세스 풀, 아니면 워커 스레드에서 실행
+        """
         job = self.jobs.get(job_id)
         if job:
             job.status = AnalysisStatus.RUNNING
             job.started_at = datetime.now().isoformat()
 
-        all_results = []
+        trades = _trades_frame(trade_data)
+        by_region = dict(tuple(trades.groupby("region_code", sort=False)))
+        empty = trades.iloc[0:0]
+        analyzed_at = datetime.now().isoformat()
+        loop = asyncio.get_running_loop()
 
-        for i, region_code in enumerate(region_codes):
-            print(f"[분석] {i + 1}/{len(region_codes)}: {region_code}")
-            results = await self.analyze_region(region_code, trade_data, job_id)
-            all_results.extend(results)
+        all_results = []
+        workers = min(len(region_codes), os.cpu_count() or 1)
+        if len(trades) >= PROCESS_POOL_MIN_TRADES and workers > 1:
+            # 서버 프로세스 fork 시 스레드 락 상속을 피하기 위해 spawn 사용
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                futures = [
+                    loop.run_in_executor(
+                        pool, _analyze_region_frame,
+                        by_region.get(code, empty), code, analyzed_at
+                    )
+                    for code in region_codes
+                ]
+                for i, rows in enumerate(await asyncio.gather(*futures)):
+                    print(f"[분석] {i + 1}/{len(region_codes)}: {region_codes[i]}")
+                    all_results.extend(PriceAnalysis(**row) for row in rows)
+        else:
+            for i, region_code in enumerate(region_codes):
+                print(f"[분석] {i + 1}/{len(region_codes)}: {region_code}")
+                rows = await loop.run_in_executor(
+                    None, _analyze_region_frame,
+                    by_region.get(region_code, empty), region_code, analyzed_at
+                )
+                all_results.extend(PriceAnalysis(**row) for row in rows)
 
         # 작업 상태 업데이트
         if job:
@@ -352,8 +315,9 @@ class AnalyzerService:
             job.completed_at = datetime.now().isoformat()
             job.total_analyzed = len(all_results)
 
-        # 결과 저장
-        self.analysis_results[job_id] = all_results
+        # 결과 저장 (디스크, TTL 후 삭제)
+        self.results.put(job_id, RESULTS_NAME, [asdict(r) for r in all_results])
+        self.index.add_job(job_id, self.get_results_table(job_id))
 
         print(f"[분석 완료] 총 {len(all_results)}개 매물 분석")
 
@@ -378,9 +342,39 @@ class AnalyzerService:
         """작업 조회"""
         return self.jobs.get(job_id)
 
+    def get_results_table(self, job_id: str) -> Optional[pa.Table]:
+        """분석 결과 테이블 조회 (메모리맵, 페이지 조회용)"""
+        return self.results.get_table(job_id, RESULTS_NAME)
+
     def get_results(self, job_id: str) -> Optional[List[PriceAnalysis]]:
         """분석 결과 조회"""
-        return self.analysis_results.get(job_id)
+        table = self.get_results_table(job_id)
+        if table is None:
+            return None
+        return [PriceAnalysis(**row) for row in table.to_pylist()]
+
+    def result_job_ids(self) -> List[str]:
+        """분석 결과가 저장된 작업 ID 목록"""
+        return [
+            job_id for job_id in self.results.job_ids()
+            if RESULTS_NAME in self.results.names(job_id)
+        ]
+
+    def _sync_index(self, force: bool = False):
+        """검색 인덱스를 결과 저장소와 동기화 (재시작 후 복원, TTL 삭제 반영)"""
+        now = time.time()
+        if not force and now - self._index_synced_at < INDEX_SYNC_INTERVAL:
+            return
+        self._index_synced_at = now
+
+        stored = set(self.result_job_ids())
+        indexed = set(self.index.job_ids())
+        for job_id in indexed - stored:
+            self.index.remove_job(job_id)
+        for job_id in sorted(stored - indexed):
+            table = self.get_results_table(job_id)
+            if table is not None:
+                self.index.add_job(job_id, table)
 
     def search_analysis(
         self,
@@ -388,28 +382,207 @@ class AnalyzerService:
         region_code: Optional[str] = None,
         min_price: Optional[int] = None,
         max_price: Optional[int] = None,
-        limit: int = 100
-    ) -> List[PriceAnalysis]:
-        """분석 결과 검색"""
-        all_results = []
-        for results in self.analysis_results.values():
-            all_results.extend(results)
-
-        filtered = all_results
-
-        if apt_name:
-            filtered = [r for r in filtered if apt_name in r.apt_name]
-
-        if region_code:
-            filtered = [r for r in filtered if r.region_code == region_code]
-
-        if min_price:
-            filtered = [r for r in filtered if r.estimated_price >= min_price]
-
-        if max_price:
-            filtered = [r for r in filtered if r.estimated_price <= max_price]
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[PriceAnalysis], Optional[str]]:
+        """
+        분석 결과 검색 (추정가 오름차순, 커서 페이지)
+
+        Returns:
+            (분석 결과 목록, 다음 페이지 커서 또는 None)
+        """
+        self._sync_index()
+        refs, next_cursor = self.index.search(
+            apt_name=apt_name,
+            region_code=region_code,
+            min_price=min_price,
+            max_price=max_price,
+            limit=limit,
+            cursor=cursor,
+        )
 
-        return filtered[:limit]
+        # 작업별로 묶어서 해당 행만 변환
+        rows_by_job: Dict[str, List[int]] = {}
+        for job_id, row in refs:
+            rows_by_job.setdefault(job_id, []).append(row)
+        fetched: Dict[Tuple[str, int], dict] = {}
+        for job_id, rows in rows_by_job.items():
+            table = self.get_results_table(job_id)
+            if table is None:  # TTL로 삭제됨 → 다음 동기화 때 인덱스에서 제거
+                continue
+            for row, data in zip(rows, table.take(rows).to_pylist()):
+                fetched[(job_id, row)] = data
+
+        results = [PriceAnalysis(**fetched[ref]) for ref in refs if ref in fetched]
+        return results, next_cursor
+
+
+def _trades_frame(trade_data: List[dict]) -> pd.DataFrame:
+    """거래 dict 목록 → 분석용 DataFrame (원본 순서는 seq로 보존)"""
+    df = pd.DataFrame.from_records(trade_data, columns=TRADE_COLUMNS)
+    df["region_code"] = df["region_code"].fillna("").astype(str)
+    df["apt_name"] = df["apt_name"].fillna("").astype(str)
+    df["area"] = pd.to_numeric(df["area"], errors="coerce").fillna(0.0)
+    df["price"] = pd.to_numeric(df["price"], errors="coerce").fillna(0)
+    df["deal_date"] = df["deal_date"].fillna("").astype(str)
+    df["seq"] = np.arange(len(df))
+    return df
+
+
+def _analyze_region_frame(
+    trades: pd.DataFrame,
+    region_code: str,
+    analyzed_at: str,
+) -> List[dict]:
+    """
+    지역 전체 (단지, 면적) 조합을 한 번에 분석
+
+    단지별로 (분석 면적 × 거래) 쌍을 만든 뒤 그룹 연산으로
+    기준가/보정/신뢰도/동향을 계산. 프로세스 풀에서 실행되도록 모듈 함수로 둠.
+    """
+    if trades.empty:
+        return []
+
+    # 분석 대상: 단지별 고유 면적 (등장 순서 유지)
+    targets = (
+        trades.loc[trades["area"] > 0, ["apt_name", "area"]]
+        .drop_duplicates()
+        .reset_index(drop=True)
+    )
+    if targets.empty:
+        return []
+    targets["target"] = np.arange(len(targets))
+    pairs = _target_pairs(targets, trades)
+
+    # 대표 거래: 면적 ±5㎡ 내 최근 거래 (동일 거래일은 먼저 수집된 거래)
+    near = pairs[(pairs["area_t"] - pairs["area"]).abs() < 5]
+    latest = (
+        near.sort_values(["target", "deal_date", "seq"], ascending=[True, False, True])
+        .drop_duplicates("target")
+        .set_index("target")
+        .reindex(targets["target"])
+    )
+    floors = pd.to_numeric(latest["floor"], errors="coerce").fillna(10).to_numpy()
+    built_years = pd.to_numeric(latest["built_year"], errors="coerce").fillna(2010).to_numpy()
+
+    return _score_targets(targets, pairs, floors, built_years, region_code, analyzed_at)
+
+
+def _target_pairs(targets: pd.DataFrame, trades: pd.DataFrame) -> pd.DataFrame:
+    """(분석 대상 × 같은 단지 거래) 쌍 (거래 면적은 area_t)"""
+    return targets.merge(
+        trades[["apt_name", "area", "floor", "price", "deal_date", "built_year", "seq"]],
+        on="apt_name",
+        suffixes=("", "_t"),
+    )
+
+
+def _score_targets(
+    targets: pd.DataFrame,
+    pairs: pd.DataFrame,
+    floors: np.ndarray,
+    built_years: np.ndarray,
+    region_code: str,
+    analyzed_at: str,
+    total_floors: int = 20,
+    extra_factors: Optional[Dict[str, float]] = None,
+    fallback_base: Optional[Callable[[], int]] = None,
+) -> List[dict]:
+    """
+    분석 대상별 기준가/보정/신뢰도/동향 (analyze_region, analyze_apartment 공용)
+
+    Args:
+        floors / built_years: 대상별 층, 준공연도 (보정 기준)
+        extra_factors: 조망/역세권/학군/브랜드 보정 (없으면 0)
+        fallback_base: 유사 거래가 없는 대상의 기준가 (없으면 0)
+    """
+    # 유사 거래: 면적 ±10% 내 최근 RECENT_TRADES건
+    similar = pairs[
+        (pairs["area_t"] >= pairs["area"] * 0.9) & (pairs["area_t"] <= pairs["area"] * 1.1)
+    ].sort_values(["target", "deal_date", "seq"], ascending=[True, False, False])
+    similar = similar.assign(rank=similar.groupby("target").cumcount())
+    similar = similar[similar["rank"] < RECENT_TRADES]
+
+    counts = similar.groupby("target").size().reindex(targets["target"], fill_value=0)
+    n = counts.to_numpy()
+
+    priced = similar[similar["price"] > 0]
+    base = (
+        priced.groupby("target")["price"].mean()
+        .reindex(targets["target"], fill_value=0)
+        .to_numpy()
+    )
+    base_price = np.trunc(base).astype(np.int64)
+    if fallback_base is not None and (n == 0).any():
+        base_price[n == 0] = fallback_base()
+
+    # 시장 동향: 시간순 전반부 vs 후반부 평균
+    n_per_row = similar["target"].map(counts).to_numpy()
+    early = (n_per_row - 1 - similar["rank"].to_numpy()) < (n_per_row // 2)
+    halves = (
+        similar.assign(early=early)[similar["price"] > 0]
+        .groupby(["target", "early"])["price"].mean()
+        .unstack()
+        .reindex(targets["target"])
+    )
+    early_avg = halves[True].to_numpy() if True in halves.columns else np.full(len(targets), np.nan)
+    late_avg = halves[False].to_numpy() if False in halves.columns else np.full(len(targets), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change_rate = (late_avg - early_avg) / early_avg
+    trend = np.select([change_rate > 0.03, change_rate < -0.03], ["상승", "하락"], "보합")
+    trend = np.where((n < 3) | np.isnan(early_avg) | np.isnan(late_avg), "보합", trend)
+
+    # 층수 보정
+    ratio = floors / total_floors
+    floor_cat = np.select(
+        [floors == total_floors, ratio <= 0.15, ratio <= 0.35, ratio <= 0.60, ratio <= 0.85],
+        ["최고층", "저층", "중저층", "중층", "중고층"],
+        "고층",
+    )
+    floor_adj = pd.Series(floor_cat).map(AnalyzerService.FLOOR_ADJUSTMENTS).fillna(0.0).to_numpy()
+
+    # 연식 보정
+    age = datetime.now().year - built_years
+    age_cat = np.select(
+        [age <= 5, age <= 10, age <= 15, age <= 20, age <= 25, age <= 30],
+        ["신축", "준신축", "일반", "중구축", "구축", "노후"],
+        "재건축대상",
+    )
+    age_adj = pd.Series(age_cat).map(AnalyzerService.AGE_ADJUSTMENTS).fillna(0.0).to_numpy()
+
+    # 총 보정률 (price_factors 순서대로 합산)
+    extra = {"view": 0.0, "subway": 0.0, "school": 0.0, "brand": 0.0, **(extra_factors or {})}
+    total_adj = floor_adj + age_adj
+    for value in extra.values():
+        total_adj = total_adj + value
+
+    estimated = np.trunc(base_price * (1 + total_adj)).astype(np.int64)
+    confidence = np.minimum(0.9, 0.5 + n * 0.05)
+    margin = np.where(confidence > 0.7, 0.05, 0.10)
+    min_price = np.trunc(estimated * (1 - margin)).astype(np.int64)
+    max_price = np.trunc(estimated * (1 + margin)).astype(np.int64)
+
+    results = []
+    for i, (apt_name, area) in enumerate(zip(targets["apt_name"].tolist(), targets["area"].tolist())):
+        results.append({
+            "apt_name": apt_name,
+            "region_code": region_code,
+            "area": area,
+            "base_price": int(base_price[i]),
+            "estimated_price": int(estimated[i]),
+            "min_price": int(min_price[i]),
+            "max_price": int(max_price[i]),
+            "confidence": float(confidence[i]),
+            "price_factors": {
+                "floor": float(floor_adj[i]), "age": float(age_adj[i]),
+                **{name: float(value) for name, value in extra.items()},
+            },
+            "recent_trades": int(n[i]),
+            "avg_trade_price": int(base_price[i]),
+            "market_trend": str(trend[i]),
+            "analyzed_at": analyzed_at,
+        })
+    return results
 
 
 # 싱글톤 인스턴스
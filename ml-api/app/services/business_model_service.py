@@ -14,6 +14,9 @@ import numpy as np
 import pandas as pd
 
 from app.core.database import get_supabase_client
+from app.core.inference_engine import BoosterInferenceEngine
+from app.core.metrics import MODEL_INFERENCE_SECONDS, SHAP_SECONDS
+from app.core.profiling import span
 
 
 # train_business_model.py / BusinessFeatureEngineer.FEATURE_COLUMNS와 동기화 (v2 - 32개)
@@ -48,6 +51,7 @@ class BusinessModelService:
         self.model = None
         self.shap_explainer = None
         self.feature_names: Optional[list] = None
+        self.engine: Optional[BoosterInferenceEngine] = None
         self._loaded = False
 
     def load(self, model_path: str) -> bool:
@@ -64,6 +68,7 @@ class BusinessModelService:
             self.model = model_data["model"]
             self.shap_explainer = model_data.get("shap_explainer")
             self.feature_names = model_data.get("feature_names", FEATURE_COLUMNS)
+            self.engine = self._build_engine()
             self._loaded = True
             print(f"[BusinessModelService] 모델 로드 완료: {model_path}")
             return True
@@ -71,6 +76,14 @@ class BusinessModelService:
             print(f"[BusinessModelService] 모델 로드 실패: {e}")
             return False
 
+    def _build_engine(self) -> Optional[BoosterInferenceEngine]:
+        """원시 Booster 단건 추론 엔진 (구성 불가 시 sklearn 래퍼 사용)"""
+        try:
+            return BoosterInferenceEngine.for_model(self.model, self.feature_names)
+        except ValueError as e:
+            print(f"[BusinessModelService] Booster 엔진 비활성화: {e}")
+            return None
+
     @property
     def is_loaded(self) -> bool:
         return self._loaded and self.model is not None
@@ -108,24 +121,32 @@ class BusinessModelService:
             )
 
         # 피처 엔지니어링 (train_business_model.py와 동일하게)
-        features = self._prepare_features(
-            survival_rate=survival_rate,
-            monthly_avg_sales=monthly_avg_sales,
-            sales_growth_rate=sales_growth_rate,
-            store_count=store_count,
-            franchise_ratio=franchise_ratio,
-            competition_ratio=competition_ratio,
-            foot_traffic_score=foot_traffic_score,
-            peak_hour_ratio=peak_hour_ratio,
-            weekend_ratio=weekend_ratio,
-            evening_traffic=evening_traffic,
-            morning_traffic=morning_traffic,
-            sigungu_code=sigungu_code,
-            industry_code=industry_code,
-        )
+        with span("business.prepare_features"):
+            values = self._feature_values(
+                survival_rate=survival_rate,
+                monthly_avg_sales=monthly_avg_sales,
+                sales_growth_rate=sales_growth_rate,
+                store_count=store_count,
+                franchise_ratio=franchise_ratio,
+                competition_ratio=competition_ratio,
+                foot_traffic_score=foot_traffic_score,
+                peak_hour_ratio=peak_hour_ratio,
+                weekend_ratio=weekend_ratio,
+                evening_traffic=evening_traffic,
+                morning_traffic=morning_traffic,
+                sigungu_code=sigungu_code,
+                industry_code=industry_code,
+            )
 
-        # 예측
-        proba = self.model.predict_proba(features)[0]
+        # 예측 (원시 Booster 엔진 우선: 사전 할당 float32 행, DataFrame 생성 없음)
+        if self.engine is not None:
+            features = self.engine.fill(values)
+            with MODEL_INFERENCE_SECONDS.time(model="business", backend="booster"):
+                proba = self.engine.predict_proba(features)[0]
+        else:
+            features = self._to_frame(values)
+            with MODEL_INFERENCE_SECONDS.time(model="business", backend="sklearn"):
+                proba = self.model.predict_proba(features)[0]
         success_probability = float(proba[1]) * 100  # 클래스 1 확률
 
         # 신뢰도 (예측 확률의 확실성에 기반)
@@ -173,6 +194,16 @@ class BusinessModelService:
 
     def _prepare_features(self, **kwargs) -> pd.DataFrame:
         """학습 시와 동일한 피처 엔지니어링 (BusinessFeatureEngineer.create_features 일치, v2 - 32개)"""
+        with span("business.prepare_features"):
+            return self._to_frame(self._feature_values(**kwargs))
+
+    def _to_frame(self, values: dict) -> pd.DataFrame:
+        """피처 dict → feature_names 순서의 1행 DataFrame (누락 피처 0)"""
+        names = self.feature_names or FEATURE_COLUMNS
+        return pd.DataFrame([[values.get(col, 0) for col in names]], columns=names)
+
+    def _feature_values(self, **kwargs) -> dict:
+        """피처명 → 값 (32개)"""
         survival_rate = kwargs["survival_rate"]
         monthly_avg_sales = kwargs["monthly_avg_sales"]
         sales_growth_rate = kwargs["sales_growth_rate"]
@@ -226,7 +257,8 @@ class BusinessModelService:
         # ── 시간 lag 피처 (6개) - 실제 이력 데이터 우선, fallback으로 현재값 ──
         lag_data = None
         if sigungu_code and industry_code:
-            lag_data = self._fetch_lag_data(sigungu_code, industry_code)
+            with span("business.lag_fetch"):
+                lag_data = self._fetch_lag_data(sigungu_code, industry_code)
 
         if lag_data:
             sales_lag_1m = lag_data["sales_lag_1m"]
@@ -297,16 +329,9 @@ class BusinessModelService:
             "age_concentration_index": age_concentration_index,
         }
 
-        df = pd.DataFrame([row])
-
-        # feature_names 순서에 맞게 정렬
-        for col in (self.feature_names or FEATURE_COLUMNS):
-            if col not in df.columns:
-                df[col] = 0
-
-        return df[self.feature_names or FEATURE_COLUMNS]
+        return row
 
-    def _get_feature_contributions(self, features: pd.DataFrame) -> list:
+    def _get_feature_contributions(self, features) -> list:
         """SHAP 기반 피처 기여도 분석"""
         if self.shap_explainer is None:
             # SHAP가 없으면 feature_importances 사용
@@ -328,7 +353,8 @@ class BusinessModelService:
             return []
 
         try:
-            shap_values = self.shap_explainer.shap_values(features)
+            with SHAP_SECONDS.time(model="business"):
+                shap_values = self.shap_explainer.shap_values(features)
             if isinstance(shap_values, list):
                 shap_values = shap_values[1]  # 클래스 1의 SHAP 값
 
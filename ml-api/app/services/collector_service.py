@@ -8,22 +8,21 @@
 - 백그라운드 작업으로 비동기 수집
 """
 import os
-import csv
 import asyncio
+import hashlib
 import aiohttp
 import xml.etree.ElementTree as ET
 import json
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 from app.core.config import settings
-
-# 수집 데이터 CSV 저장 경로
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-LATEST_CSV_PATH = DATA_DIR / "latest_collected.csv"
+from app.core.job_store import CollectionJobStore, job_store as default_job_store
+from app.core.collected_dataset import CollectedDataset, collected_dataset as default_dataset
+from app.core.result_store import JobResultStore, result_store as default_result_store
+from app.core.region_gazetteer import region_gazetteer
 
 
 class CollectionStatus(str, Enum):
@@ -44,6 +43,9 @@ class CollectionJob:
     completed_at: Optional[str] = None
     molit_count: int = 0
     rone_count: int = 0
+    cells_total: int = 0
+    cells_completed: int = 0
+    cells_skipped: int = 0
     error: Optional[str] = None
 
 
@@ -90,6 +92,7 @@ class CollectorService:
         # 세종
         "세종시": "36110",
     }
+    REGION_NAMES = {code: name for name, code in REGION_CODES.items()}  # 코드 → 수집 지역명
 
     # R-ONE 통계표 ID
     RONE_STATS = {
@@ -99,30 +102,40 @@ class CollectorService:
         "apt_trade_median": "A_2024_00189",     # 아파트 매매 중위가격
     }
 
-    def __init__(self):
+    def __init__(
+        self,
+        job_store: Optional[CollectionJobStore] = None,
+        dataset: Optional[CollectedDataset] = None,
+        results: Optional[JobResultStore] = None
+    ):
         self.molit_api_key = os.getenv("MOLIT_API_KEY", "")
         self.reb_api_key = os.getenv("REB_API_KEY", "")
-        self.jobs: Dict[str, CollectionJob] = {}
-        self.collected_data: Dict[str, List[dict]] = {}
+        self.job_store = job_store or default_job_store
+        self.dataset = dataset or default_dataset
+        self.results = results or default_result_store  # 작업별 수집 결과 (디스크 + LRU)
+        self.jobs: Dict[str, CollectionJob] = {}  # 실행 중 작업 캐시 (원본은 job_store)
 
     def get_all_region_codes(self) -> List[str]:
         """전국 시군구 코드 목록"""
         return list(self.REGION_CODES.values())
 
     def get_region_name(self, code: str) -> str:
-        """코드로 지역명 조회"""
-        for name, c in self.REGION_CODES.items():
-            if c == code:
-                return name
-        return code
+        """코드로 지역명 조회 (수집 대상 외 코드는 지역 코드 사전)"""
+        return self.REGION_NAMES.get(code) or region_gazetteer.name(code) or code
 
     async def fetch_molit_trade(
         self,
         session: aiohttp.ClientSession,
         region_code: str,
-        year_month: str
+        year_month: str,
+        raise_errors: bool = False
     ) -> List[dict]:
-        """국토교통부 실거래가 API 호출"""
+        """
+        국토교통부 실거래가 API 호출
+
+        raise_errors=True면 실패를 빈 결과와 구분하기 위해 예외를 그대로 전달
+        (체크포인트 수집에서 실패 셀을 완료로 기록하지 않도록)
+        """
         url = "https://apis.data.go.kr/1613000/RTMSDataSvcAptTrade/getRTMSDataSvcAptTrade"
         params = {
             "serviceKey": self.molit_api_key,
@@ -137,13 +150,25 @@ class CollectorService:
                 if resp.status == 200:
                     # raw bytes로 읽어서 XML 파서가 인코딩을 직접 처리하도록 함
                     raw_bytes = await resp.read()
-                    return self._parse_molit_xml(raw_bytes, year_month, region_code)
+                    return self._parse_molit_xml(
+                        raw_bytes, year_month, region_code, strict=raise_errors
+                    )
+                if raise_errors:
+                    raise RuntimeError(f"HTTP {resp.status}")
                 return []
         except Exception as e:
             print(f"[MOLIT] {region_code}/{year_month}: {e}")
+            if raise_errors:
+                raise
             return []
 
-    def _parse_molit_xml(self, xml_data, year_month: str, region_code: str) -> List[dict]:
+    def _parse_molit_xml(
+        self,
+        xml_data,
+        year_month: str,
+        region_code: str,
+        strict: bool = False
+    ) -> List[dict]:
         """국토부 XML 파싱 (bytes → ET가 인코딩 자동 감지)"""
         data = []
         try:
@@ -153,6 +178,8 @@ class CollectorService:
             root = ET.fromstring(xml_data)
             result_code = root.find(".//resultCode")
             if result_code is not None and result_code.text not in ("00", "000"):
+                if strict:
+                    raise ValueError(f"resultCode {result_code.text}")
                 return []
 
             items = root.findall(".//item")
@@ -187,7 +214,8 @@ class CollectorService:
                 except:
                     continue
         except ET.ParseError:
-            pass
+            if strict:
+                raise
         return data
 
     async def fetch_rone_stats(
@@ -195,7 +223,8 @@ class CollectorService:
         session: aiohttp.ClientSession,
         stat_id: str,
         year_month: str,
-        delay: float = 0.0
+        delay: float = 0.0,
+        raise_errors: bool = False
     ) -> List[dict]:
         """한국부동산원 R-ONE API 호출"""
         if delay > 0:
@@ -218,11 +247,17 @@ class CollectorService:
                     raw_bytes = await resp.read()
                     text = raw_bytes.decode("utf-8", errors="replace")
                     if text.strip().startswith("<"):
+                        if raise_errors:
+                            raise ValueError("XML 오류 응답")
                         return []
                     json_data = json.loads(text)
                     return self._parse_rone_json(json_data, stat_id, year_month)
+                if raise_errors:
+                    raise RuntimeError(f"HTTP {resp.status}")
                 return []
         except Exception as e:
+            if raise_errors:
+                raise
             return []
 
     def _parse_rone_json(self, json_data: dict, stat_id: str, year_month: str) -> List[dict]:
@@ -271,6 +306,26 @@ class CollectorService:
         except:
             return default
 
+    @staticmethod
+    def _cell_checksum(rows: List[dict]) -> str:
+        """셀 데이터 체크섬 (수집 시각 제외, 순서 무관)"""
+        digest = hashlib.sha256()
+        canonical = sorted(
+            json.dumps({k: v for k, v in r.items() if k != "collected_at"},
+                       sort_keys=True, ensure_ascii=False)
+            for r in rows
+        )
+        for line in canonical:
+            digest.update(line.encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def _save_job(self, job: CollectionJob):
+        """작업 상태를 영속 저장소에 기록"""
+        try:
+            self.job_store.save_job(asdict(job))
+        except Exception as e:
+            print(f"[작업 저장소] {job.job_id} 저장 실패: {e}")
+
     async def collect_regions(
         self,
         region_codes: List[str],
@@ -278,69 +333,139 @@ class CollectorService:
         months: List[int],
         job_id: str
     ) -> Dict[str, Any]:
-        """여러 지역 병렬 수집"""
-        job = self.jobs.get(job_id)
+        """
+        여러 지역 병렬 수집 (셀 단위 체크포인트)
+
+        (지역, 월, 소스) 셀마다 저장이 끝나면 job_store에 완료 기록.
+        같은 job_id로 다시 호출하면 완료된 셀은 건너뛰고 남은 셀부터 재개.
+        """
+        job = self.get_job(job_id)
         if job:
             job.status = CollectionStatus.RUNNING
-            job.started_at = datetime.now().isoformat()
+            job.started_at = job.started_at or datetime.now().isoformat()
+            job.error = None
+            self.jobs[job_id] = job
 
         year_months = [f"{year}{m:02d}" for m in months]
         molit_results = []
         rone_results = []
 
-        print(f"[수집 시작] {len(region_codes)}개 지역, {len(months)}개월")
+        done = self.job_store.completed_cells(job_id)
+        molit_cells = [
+            (region_code, ym)
+            for region_code in region_codes
+            for ym in year_months
+            if (region_code, ym, "molit") not in done
+        ]
+        rone_cells = [
+            (stat_id, ym)
+            for stat_id in self.RONE_STATS.values()
+            for ym in year_months
+            if (stat_id, ym, "rone") not in done
+        ]
+        cells_total = (len(region_codes) + len(self.RONE_STATS)) * len(year_months)
+        skipped = cells_total - len(molit_cells) - len(rone_cells)
+        failed_cells = 0
 
-        async with aiohttp.ClientSession() as session:
-            # 국토부 API (지역 x 월)
-            molit_tasks = []
-            for region_code in region_codes:
-                for ym in year_months:
-                    molit_tasks.append(self.fetch_molit_trade(session, region_code, ym))
+        if job:
+            job.cells_total = cells_total
+            job.cells_skipped = skipped
+            job.cells_completed = skipped
+            self._save_job(job)
+
+        print(f"[수집 시작] {len(region_codes)}개 지역, {len(months)}개월 "
+              f"(완료 셀 {skipped}/{cells_total} 건너뜀)")
 
-            # 배치 처리 (50개씩)
+        async with aiohttp.ClientSession() as session:
+            # 국토부 API (지역 x 월) - 배치 처리 (50개씩), 배치마다 저장 후 체크포인트
             batch_size = 50
-            for i in range(0, len(molit_tasks), batch_size):
-                batch = molit_tasks[i:i + batch_size]
-                results = await asyncio.gather(*batch, return_exceptions=True)
-                for result in results:
-                    if isinstance(result, list):
-                        molit_results.extend(result)
-                print(f"[MOLIT] {min(i + batch_size, len(molit_tasks))}/{len(molit_tasks)} 완료")
+            for i in range(0, len(molit_cells), batch_size):
+                batch = molit_cells[i:i + batch_size]
+                results = await asyncio.gather(
+                    *[self.fetch_molit_trade(session, rc, ym, raise_errors=True) for rc, ym in batch],
+                    return_exceptions=True
+                )
+
+                batch_rows = []
+                completed = []
+                spans = []  # completed[k] 셀의 batch_rows 구간
+                for (region_code, ym), result in zip(batch, results):
+                    if not isinstance(result, list):
+                        failed_cells += 1
+                        continue
+                    spans.append(range(len(batch_rows), len(batch_rows) + len(result)))
+                    batch_rows.extend(result)
+                    completed.append(
+                        ((region_code, ym, "molit"), len(result), self._cell_checksum(result))
+                    )
+
+                if batch_rows:
+                    saved, failed_rows = await self._persist_to_supabase(batch_rows)
+                    if failed_rows:
+                        # Supabase 저장 실패 행이 있는 셀은 완료 기록하지 않음 (재개 시 재수집)
+                        failed_rows = set(failed_rows)
+                        kept = [cell for cell, span in zip(completed, spans) if failed_rows.isdisjoint(span)]
+                        failed_cells += len(completed) - len(kept)
+                        completed = kept
+                    try:
+                        added = self._save_to_dataset(batch_rows)
+                        print(f"[영구 저장] Supabase: {saved}건, Parquet: 신규 {added}건")
+                    except Exception as e:
+                        # 로컬 저장 실패 셀은 완료 기록하지 않음 (재개 시 재수집)
+                        print(f"[Parquet] 저장 실패: {e}")
+                        failed_cells += len(completed)
+                        batch_rows, completed = [], []
+                self.job_store.mark_cells(completed, job_id)
+                molit_results.extend(batch_rows)
+
+                if job:
+                    job.molit_count += len(batch_rows)
+                    job.cells_completed += len(completed)
+                    self._save_job(job)
+                print(f"[MOLIT] {min(i + batch_size, len(molit_cells))}/{len(molit_cells)} 완료")
 
             # R-ONE API (통계표 x 월, 속도 제한)
             delay = 0.0
-            for stat_name, stat_id in self.RONE_STATS.items():
-                for ym in year_months:
-                    result = await self.fetch_rone_stats(session, stat_id, ym, delay)
-                    rone_results.extend(result)
+            for stat_id, ym in rone_cells:
+                try:
+                    result = await self.fetch_rone_stats(session, stat_id, ym, delay, raise_errors=True)
+                except Exception:
+                    failed_cells += 1
+                    continue
+                finally:
                     delay = 0.1  # 100ms 간격
-
-        # 작업 상태 업데이트
+                rone_results.extend(result)
+                self.job_store.mark_cells(
+                    [((stat_id, ym, "rone"), len(result), self._cell_checksum(result))], job_id
+                )
+                if job:
+                    job.rone_count += len(result)
+                    job.cells_completed += 1
+            if job and rone_cells:
+                self._save_job(job)
+
+        # 작업 상태 업데이트 (실패 셀이 남으면 같은 job_id로 재개 가능)
         if job:
-            job.status = CollectionStatus.COMPLETED
             job.completed_at = datetime.now().isoformat()
-            job.molit_count = len(molit_results)
-            job.rone_count = len(rone_results)
-
-        # 인메모리 저장
-        self.collected_data[job_id] = {
-            "molit": molit_results,
-            "rone": rone_results,
-        }
+            if failed_cells:
+                job.status = CollectionStatus.FAILED
+                job.error = f"{failed_cells}개 셀 수집 실패 (재실행 시 해당 셀부터 재개)"
+            else:
+                job.status = CollectionStatus.COMPLETED
+            self._save_job(job)
 
-        # Supabase + CSV 영구 저장
-        if molit_results:
-            saved = await self._persist_to_supabase(molit_results)
-            csv_path = self._save_to_csv(molit_results)
-            print(f"[영구 저장] Supabase: {saved}건, CSV: {csv_path}")
+        # 결과 저장소에 보관 (이번 실행에서 수집한 데이터, TTL 후 삭제)
+        self.results.put(job_id, "molit", molit_results)
+        self.results.put(job_id, "rone", rone_results)
 
-        print(f"[수집 완료] MOLIT: {len(molit_results)}건, R-ONE: {len(rone_results)}건")
+        print(f"[수집 완료] MOLIT: {len(molit_results)}건, R-ONE: {len(rone_results)}건, "
+              f"실패 셀: {failed_cells}")
 
         return {
             "job_id": job_id,
             "molit_count": len(molit_results),
             "rone_count": len(rone_results),
-            "status": "completed",
+            "status": job.status.value if job else "completed",
         }
 
     async def collect_nationwide(
@@ -353,6 +478,23 @@ class CollectorService:
         all_codes = self.get_all_region_codes()
         return await self.collect_regions(all_codes, year, months, job_id)
 
+    async def resume_interrupted_jobs(self) -> List[str]:
+        """
+        이전 프로세스에서 중단된 작업 재개
+
+        job_store에 pending/running으로 남은 작업을 완료되지 않은 셀부터 다시 수집
+        """
+        resumed = []
+        for status in (CollectionStatus.RUNNING, CollectionStatus.PENDING):
+            for row in self.job_store.list_jobs(status=status.value):
+                job_id = row["job_id"]
+                if job_id in self.jobs:
+                    continue  # 현재 프로세스에서 실행 중
+                print(f"[수집 재개] {job_id} ({row['cells_completed']}/{row['cells_total']} 셀 완료)")
+                await self.collect_regions(row["region_codes"], row["year"], row["months"], job_id)
+                resumed.append(job_id)
+        return resumed
+
     def create_job(
         self,
         region_codes: List[str],
@@ -361,6 +503,11 @@ class CollectorService:
     ) -> CollectionJob:
         """수집 작업 생성"""
         job_id = f"collect_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # 같은 초에 생성된 작업과 체크포인트가 섞이지 않도록 접미사 부여
+        base_id, seq = job_id, 1
+        while job_id in self.jobs or self.job_store.load_job(job_id):
+            seq += 1
+            job_id = f"{base_id}_{seq}"
         job = CollectionJob(
             job_id=job_id,
             status=CollectionStatus.PENDING,
@@ -369,25 +516,73 @@ class CollectorService:
             months=months,
         )
         self.jobs[job_id] = job
+        self._save_job(job)
         return job
 
     def get_job(self, job_id: str) -> Optional[CollectionJob]:
-        """작업 조회"""
-        return self.jobs.get(job_id)
+        """작업 조회 (메모리 캐시 → 영속 저장소)"""
+        job = self.jobs.get(job_id)
+        if job:
+            return job
+        row = self.job_store.load_job(job_id)
+        if not row:
+            return None
+        row["status"] = CollectionStatus(row["status"])
+        return CollectionJob(**row)
+
+    def list_jobs(self, status: Optional[str] = None) -> List[CollectionJob]:
+        """작업 목록 (최신순, 영속 저장소 기준)"""
+        jobs = []
+        for row in self.job_store.list_jobs(status=status):
+            cached = self.jobs.get(row["job_id"])
+            if cached:
+                jobs.append(cached)
+                continue
+            row["status"] = CollectionStatus(row["status"])
+            jobs.append(CollectionJob(**row))
+        return jobs
+
+    def delete_job(self, job_id: str) -> bool:
+        """작업 삭제"""
+        existed = self.job_store.delete_job(job_id)
+        existed = self.jobs.pop(job_id, None) is not None or existed
+        self.results.delete(job_id)
+        return existed
 
     def get_collected_data(self, job_id: str) -> Optional[Dict[str, List[dict]]]:
-        """수집된 데이터 조회"""
-        return self.collected_data.get(job_id)
+        """수집된 데이터 전체 조회 (분석 입력용)"""
+        if not self.results.has(job_id):
+            return None
+        return {
+            source: self.results.get_table(job_id, source).to_pylist()
+            for source in self.results.names(job_id)
+        }
 
-    async def _persist_to_supabase(self, molit_results: List[dict]) -> int:
-        """수집 데이터를 Supabase transactions 테이블에 영구 저장 (전체 필드)"""
+    def get_collected_page(
+        self,
+        job_id: str,
+        source: str,
+        offset: int,
+        limit: int
+    ) -> Tuple[List[dict], int]:
+        """수집 데이터 페이지 조회 (디스크 파일 zero-copy slice)"""
+        return self.results.slice(job_id, source, offset, limit)
+
+    def get_collected_sources(self, job_id: str) -> List[str]:
+        """작업에 저장된 데이터 소스 목록"""
+        return self.results.names(job_id)
+
+    async def _persist_to_supabase(self, molit_results: List[dict]) -> Tuple[int, List[int]]:
+        """
+        수집 데이터를 Supabase transactions 테이블에 영구 저장 (전체 필드)
+
+        Returns:
+            (저장 건수, 저장 실패한 molit_results 인덱스)
+        """
         try:
             from app.core.database import get_supabase_client
             client = get_supabase_client()
 
-            # region_code → sigungu 매핑
-            code_to_name = {v: k for k, v in self.REGION_CODES.items()}
-
             # 전체 필드 변환 (018 마이그레이션 적용 후 모든 컬럼 사용)
             rows = []
             for item in molit_results:
@@ -401,11 +596,12 @@ class CollectorService:
                     "apt_name": item.get("apt_name", ""),
                     "built_year": item.get("built_year"),
                     "jibun": item.get("jibun", ""),
-                    "sigungu": code_to_name.get(item.get("region_code", ""), ""),
+                    "sigungu": self.REGION_NAMES.get(item.get("region_code", ""), ""),
                 })
 
             # 배치 upsert (500개씩, 중복은 무시)
             inserted = 0
+            failed: List[int] = []
             batch_size = 500
             for i in range(0, len(rows), batch_size):
                 batch = rows[i:i + batch_size]
@@ -423,43 +619,25 @@ class CollectorService:
                         inserted += len(result.data) if result.data else 0
                     except Exception as e2:
                         print(f"[Supabase] 배치 {i//batch_size} 저장 실패: {e2}")
+                        failed.extend(range(i, i + len(batch)))
 
-            return inserted
+            return inserted, failed
         except Exception as e:
             print(f"[Supabase] 저장 실패: {e}")
-            return 0
-
-    def _save_to_csv(self, molit_results: List[dict]) -> str:
-        """수집 데이터를 CSV 파일로 저장 (학습용, 모든 필드 포함)"""
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
+            return 0, list(range(len(molit_results)))
 
-        # 기존 CSV가 있으면 append, 없으면 새로 생성
-        file_exists = LATEST_CSV_PATH.exists()
-        fieldnames = [
-            "region_code", "apt_name", "area", "floor", "price",
-            "deal_date", "built_year", "dong", "jibun", "collected_at"
+    def _save_to_dataset(self, molit_results: List[dict]) -> int:
+        """수집 데이터를 Parquet 데이터셋에 upsert (학습용, region_code/year_month 파티션)"""
+        rows = [
+            {**item, "sigungu": self.REGION_NAMES.get(item.get("region_code", ""), "")}
+            for item in molit_results
         ]
+        return self.dataset.upsert(rows)
 
-        # region_code → sigungu 매핑 추가
-        code_to_name = {v: k for k, v in self.REGION_CODES.items()}
-
-        with open(LATEST_CSV_PATH, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames + ["sigungu"])
-            if not file_exists:
-                writer.writeheader()
-
-            for item in molit_results:
-                row = {k: item.get(k, "") for k in fieldnames}
-                row["sigungu"] = code_to_name.get(item.get("region_code", ""), "")
-                writer.writerow(row)
-
-        return str(LATEST_CSV_PATH)
-
-    @staticmethod
-    def get_latest_csv_path() -> Optional[str]:
-        """최신 수집 CSV 경로 반환 (학습 스크립트용)"""
-        if LATEST_CSV_PATH.exists():
-            return str(LATEST_CSV_PATH)
+    def get_dataset_path(self) -> Optional[str]:
+        """수집 Parquet 데이터셋 경로 반환 (학습 스크립트용)"""
+        if self.dataset.exists():
+            return str(self.dataset.root)
         return None
 
 
@@ -10,6 +10,7 @@ import pandas as pd
 import shap
 
 from app.core.database import get_supabase_client
+from app.core.metrics import SHAP_SECONDS
 
 
 # 피처 한글 매핑
@@ -176,7 +177,8 @@ class ShapService:
 
     def explain(self, features: pd.DataFrame) -> np.ndarray:
         """SHAP 값 계산"""
-        shap_values = self.explainer.shap_values(features)
+        with SHAP_SECONDS.time(model="apartment"):
+            shap_values = self.explainer.shap_values(features)
         return shap_values
 
     def get_factors(
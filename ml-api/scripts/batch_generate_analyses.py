@@ -33,10 +33,12 @@ sys.path.insert(0, ml_api_dir)
 from collections import defaultdict
 
 import numpy as np
-import pandas as pd
 
 from supabase import create_client
 
+from app.core.feature_spec import ApartmentFeatureSpec
+from app.core.region_gazetteer import region_gazetteer
+
 SUPABASE_URL = os.environ.get("SUPABASE_URL") or os.environ.get("NEXT_PUBLIC_SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_KEY") or os.environ.get("NEXT_PUBLIC_SUPABASE_ANON_KEY", "")
 
@@ -47,76 +49,15 @@ FEATURE_ARTIFACTS_PATH = os.path.join(MODELS_DIR, "feature_artifacts.pkl")
 SHAP_EXPLAINER_PATH = os.path.join(MODELS_DIR, "shap_explainer.pkl")
 RESIDUAL_INFO_PATH = os.path.join(MODELS_DIR, "residual_info.pkl")
 
+# 피처/예측/SHAP 일괄 계산 단위
+BATCH_CHUNK_SIZE = 500
+
 
 def load_pkl(path):
     with open(path, "rb") as f:
         return pickle.load(f)
 
 
-# ─────────────────────────────────────────────
-# Fix #1: 시군구 target encoding 키 매핑
-# ─────────────────────────────────────────────
-
-# 광역시 약칭 매핑 (서울은 plain name 사용)
-_SIDO_SHORT = {
-    "부산광역시": "부산", "대구광역시": "대구",
-    "인천광역시": "인천", "광주광역시": "광주",
-    "대전광역시": "대전", "울산광역시": "울산",
-    "세종특별자치시": "세종",
-}
-
-# 경기도 등 compound city 매핑 (구 → 시)
-_COMPOUND_CITIES = {
-    "수지구": "용인시", "기흥구": "용인시", "처인구": "용인시",
-    "영통구": "수원시", "장안구": "수원시", "권선구": "수원시", "팔달구": "수원시",
-    "단원구": "안산시", "상록구": "안산시",
-    "일산서구": "고양시", "일산동구": "고양시", "덕양구": "고양시",
-    "분당구": "성남시", "수정구": "성남시", "중원구": "성남시",
-    "만안구": "안양시", "동안구": "안양시",
-    "원미구": "부천시", "소사구": "부천시", "오정구": "부천시",
-    "상당구": "청주시", "서원구": "청주시", "청원구": "청주시", "흥덕구": "청주시",
-    "동남구": "천안시", "서북구": "천안시",
-}
-
-
-def get_sigungu_key(sido, sigungu, target_mapping):
-    """(sido, sigungu) → target encoder 키 변환
-
-    학습 데이터의 target encoder는 중복 시군구명을 구분하기 위해
-    서울: plain name (강남구), 광역시: 접두어 (부산해운대구),
-    경기 compound: 시+구 (안산시단원구) 형식을 사용.
-
-    중요: 비서울 지역의 '중구', '서구' 등이 서울 것과 충돌하지 않도록
-    서울 이외는 반드시 접두어 버전을 먼저 시도.
-    """
-    # 서울은 plain name 직접 사용
-    if sido in ("서울특별시", "서울시"):
-        return sigungu  # 매핑에 없으면 자동으로 global_mean
-
-    # 비서울: 접두어 버전 우선
-    # 2. 광역시 접두어 (부산해운대구, 인천연수구)
-    sido_short = _SIDO_SHORT.get(sido, "")
-    if sido_short:
-        key = sido_short + sigungu
-        if key in target_mapping:
-            return key
-
-    # 3. Compound city (안산시단원구, 용인시수지구)
-    if sigungu in _COMPOUND_CITIES:
-        key = _COMPOUND_CITIES[sigungu] + sigungu
-        if key in target_mapping:
-            return key
-
-    # 4. Suffix match (단일 매칭만)
-    matches = [k for k in target_mapping if k.endswith(sigungu)]
-    if len(matches) == 1:
-        return matches[0]
-
-    # 5. 비서울인데 plain name이 서울 것과 충돌할 수 있으므로
-    #    의도적으로 매핑에 없는 키 반환 → global_mean fallback
-    return sido_short + sigungu if sido_short else sigungu
-
-
 # ─────────────────────────────────────────────
 # Fix #2: 실제 거래 데이터 기반 시세 lag 피처
 # ─────────────────────────────────────────────
@@ -354,19 +295,33 @@ def sync_complexes_to_properties(sb, area_map=None):
 # Step 2 + 3: chamgab_analyses + price_factors 생성
 # ─────────────────────────────────────────────
 
+def filter_by_region_codes(properties, region_codes):
+    """시군구 코드에 속한 properties만 (sido/sigungu 이름 → 지역 코드 사전으로 코드 변환)"""
+    wanted = {region_gazetteer.canonical_code(code) for code in region_codes}
+    return [
+        p for p in properties
+        if region_gazetteer.canonical_code(
+            region_gazetteer.sigungu_code(p.get("sigungu"), p.get("sido"))
+        ) in wanted
+    ]
+
+
 def generate_analyses(sb, model, artifacts, shap_explainer, residual_info, skip_existing=True, limit=0,
-                       complex_price_stats=None, sigungu_price_stats=None, area_map=None):
-    """모든 properties에 대해 chamgab_analyses + price_factors 생성"""
+                       complex_price_stats=None, sigungu_price_stats=None, area_map=None,
+                       region_codes=None):
+    """모든 properties에 대해 chamgab_analyses + price_factors 생성
+
+    region_codes가 있으면 해당 시군구 properties만 재스코어링.
+    새 분석을 먼저 저장하고, 새 분석이 저장된 property의 이전 분석만 마지막에 삭제
+    (스코어링이 실패한 property는 기존 분석 유지)
+    """
     print("\n[Step 2+3] Chamgab Analyses + Price Factors 생성")
     complex_price_stats = complex_price_stats or {}
     sigungu_price_stats = sigungu_price_stats or {}
     area_map = area_map or {}
 
-    label_encoders = artifacts.get("label_encoders", {})
-    target_encoders = artifacts.get("target_encoders", {})
-    fill_values = artifacts.get("fill_values", {})
-    feature_names = artifacts.get("feature_names", [])
-    brand_tiers = artifacts.get("brand_tiers", {})
+    spec = ApartmentFeatureSpec.from_bundle(artifacts)
+    feature_names = spec.feature_names
     residual_percentiles = (residual_info or {}).get("residual_percentiles", {})
 
     # 기존 분석이 있는 property_id 조회
@@ -402,6 +357,12 @@ def generate_analyses(sb, model, artifacts, shap_explainer, residual_info, skip_
 
     print(f"  총 properties: {len(all_properties)}건")
 
+    stale_analyses = {}  # property_id → 교체될 이전 분석 id
+    if region_codes:
+        all_properties = filter_by_region_codes(all_properties, region_codes)
+        print(f"  대상 지역 {len(region_codes)}개: {len(all_properties)}건 재스코어링")
+        stale_analyses = find_analyses_for_properties(sb, [p["id"] for p in all_properties])
+
     # 기존 분석 제외
     if skip_existing:
         all_properties = [p for p in all_properties if p["id"] not in existing_analysis_ids]
@@ -415,183 +376,38 @@ def generate_analyses(sb, model, artifacts, shap_explainer, residual_info, skip_
         print("  → 생성할 분석 없음")
         return 0, 0
 
-    # 헬퍼 함수들
-    def encode_label(column, value):
-        encoder = label_encoders.get(column)
-        if encoder is None:
-            return 0
-        if value in encoder.classes_:
-            return encoder.transform([value])[0]
-        return 0
-
-    def target_encode(column, value):
-        enc = target_encoders.get(column, {})
-        mapping = enc.get("mapping", {})
-        global_mean = enc.get("global_mean", 0)
-        return mapping.get(value, global_mean)
-
-    def get_poi_features(sigungu):
-        premium = ["강남구", "서초구", "송파구", "용산구", "마포구", "성동구"]
-        good = ["영등포구", "강동구", "광진구", "동작구", "양천구", "분당구", "수지구"]
-        if sigungu in premium:
-            return {"distance_to_subway": 300, "subway_count_1km": 3,
-                    "distance_to_school": 300, "school_count_1km": 5,
-                    "distance_to_academy": 200, "academy_count_1km": 20,
-                    "distance_to_hospital": 400, "hospital_count_1km": 3,
-                    "distance_to_mart": 500, "convenience_count_500m": 10,
-                    "distance_to_park": 400, "poi_score": 80}
-        elif sigungu in good:
-            return {"distance_to_subway": 450, "subway_count_1km": 2,
-                    "distance_to_school": 400, "school_count_1km": 4,
-                    "distance_to_academy": 350, "academy_count_1km": 12,
-                    "distance_to_hospital": 550, "hospital_count_1km": 2,
-                    "distance_to_mart": 700, "convenience_count_500m": 7,
-                    "distance_to_park": 500, "poi_score": 65}
-        else:
-            return {"distance_to_subway": 700, "subway_count_1km": 1,
-                    "distance_to_school": 500, "school_count_1km": 3,
-                    "distance_to_academy": 500, "academy_count_1km": 6,
-                    "distance_to_hospital": 800, "hospital_count_1km": 1,
-                    "distance_to_mart": 1000, "convenience_count_500m": 4,
-                    "distance_to_park": 700, "poi_score": 50}
-
-    def get_market_features(sigungu):
-        base_rate = 2.50
-        mortgage_rate = round(base_rate + 1.8, 2)
-        jeonse_ratios = {"강남구": 52, "서초구": 54, "송파구": 58, "용산구": 55,
-                         "마포구": 62, "성동구": 60, "영등포구": 65, "강동구": 63}
-        jeonse_ratio = jeonse_ratios.get(sigungu, 65)
-        buying_power_base = {"강남구": 85, "서초구": 88, "송파구": 92, "용산구": 90,
-                             "마포구": 95, "성동구": 93, "영등포구": 100, "강동구": 98}
-        buying_power = buying_power_base.get(sigungu, 100) + (3.0 - base_rate) * 5
-        return {
-            "base_rate": base_rate, "mortgage_rate": mortgage_rate,
-            "jeonse_ratio": float(jeonse_ratio),
-            "buying_power_index": round(buying_power, 1),
-            "transaction_volume": 500, "price_change_rate": 0.3,
-            "reb_price_index": 100.0, "reb_rent_index": 100.0,
-        }
-
-    def get_property_extra(built_year, sigungu):
-        current_year = datetime.now().year
-        building_age = current_year - built_year
-        is_old = 1 if building_age >= 20 else 0
-        is_recon = 1 if building_age >= 30 else 0
-        if 30 <= building_age <= 40:
-            recon_prem = 0.15
-        elif 25 <= building_age < 30:
-            recon_prem = 0.05
-        elif building_age > 40:
-            recon_prem = 0.10
-        else:
-            recon_prem = 0.0
-        school_grades = {"강남구": 5, "서초구": 5, "송파구": 4, "양천구": 4,
-                         "노원구": 4, "광진구": 3, "마포구": 3, "성동구": 3,
-                         "용산구": 3, "동작구": 3, "영등포구": 2, "강동구": 3}
-        sg = school_grades.get(sigungu, 2)
-        return {
-            "is_old_building": is_old, "is_reconstruction_target": is_recon,
-            "reconstruction_premium": recon_prem,
-            "school_district_grade": sg, "is_premium_school_district": 1 if sg >= 4 else 0,
-            "price_vs_previous": 1.0, "price_vs_complex_avg": 1.0,
-            "price_vs_area_avg": 1.0, "direction_premium": 1.0,
-            "view_premium": 1.0, "is_remodeled": 0, "remodel_premium": 0.0,
-        }
-
-    # target encoder에서 sigungu 매핑 키 목록 추출 (get_sigungu_key용)
-    sigungu_target_mapping = (target_encoders.get("sigungu") or {}).get("mapping", {})
-
-    def prepare_features(prop):
+    def to_record(prop):
+        """properties 행 → 피처 스펙 입력 레코드 (학습 원본 컬럼 스키마)"""
         complex_data = prop.get("complexes") or {}
-        current_year = datetime.now().year
-
-        built_year = complex_data.get("built_year") or prop.get("built_year") or (current_year - 20)
-        building_age = current_year - built_year
-        total_floors = prop.get("floors") or 20
-        floor = 10
-        floor_ratio = floor / total_floors if total_floors > 0 else 0.5
-
-        brand = complex_data.get("brand")
-        brand_tier = brand_tiers.get(brand, 1) if brand else 1
-
-        sido = prop.get("sido") or "서울특별시"
+        now = datetime.now()
         sigungu = prop.get("sigungu") or "강남구"
-        dong = prop.get("eupmyeondong") or "unknown"
         # 면적: area_map(거래 중앙값) > property > 84m² fallback
-        complex_id_for_area = (complex_data.get("id") if complex_data else None) or prop.get("complex_id")
-        area = (
-            area_map.get(complex_id_for_area)
-            or prop.get("area_exclusive")
-            or 84
-        )
-
-        # Fix #1: sido-prefixed 시군구 키로 인코딩 (중구/서구 등 충돌 방지)
-        sigungu_key = get_sigungu_key(sido, sigungu, sigungu_target_mapping)
-        sido_enc = encode_label("sido", sido)
-        sigungu_enc = encode_label("sigungu", sigungu_key)
-        sigungu_target = target_encode("sigungu", sigungu_key)
-        dong_target = target_encode("dong", dong)
-
-        poi = get_poi_features(sigungu)
-        market = get_market_features(sigungu)
-        extra = get_property_extra(built_year, sigungu)
-
-        # Fix #2: 실제 거래 데이터 기반 lag 피처
-        complex_id = prop.get("complex_id") or (complex_data.get("id") if complex_data else None)
-        lag = None
-        if complex_id and complex_id in complex_price_stats:
-            lag = complex_price_stats[complex_id]
-        elif sigungu and sigungu in sigungu_price_stats:
-            lag = sigungu_price_stats[sigungu]
-
-        if lag:
-            price_lag_1m = lag["price_lag_1m"]
-            price_lag_3m = lag["price_lag_3m"]
-            price_rolling_6m_mean = lag["price_rolling_6m_mean"]
-            price_rolling_6m_std = lag["price_rolling_6m_std"]
-            price_yoy_change = lag["price_yoy_change"]
-        else:
-            # 글로벌 중앙값 fallback (0 대신)
-            global_mean = fill_values.get("sigungu_target_enc", 500000000)
-            price_lag_1m = global_mean
-            price_lag_3m = global_mean
-            price_rolling_6m_mean = global_mean
-            price_rolling_6m_std = 0
-            price_yoy_change = 0
-
-        features = {
-            "area_exclusive": area,
-            "floor": floor,
-            "transaction_year": current_year,
-            "transaction_month": datetime.now().month,
-            "transaction_quarter": (datetime.now().month - 1) // 3 + 1,
-            "building_age": building_age,
-            "floor_ratio": floor_ratio,
-            "total_floors": total_floors,
-            "total_units": complex_data.get("total_units") or 500,
-            "parking_ratio": complex_data.get("parking_ratio") or 1.0,
-            "brand_tier": brand_tier,
-            "sido_encoded": sido_enc,
-            "sigungu_encoded": sigungu_enc,
-            "sigungu_target_enc": sigungu_target,
-            "dong_target_enc": dong_target,
-            "price_lag_1m": price_lag_1m,
-            "price_lag_3m": price_lag_3m,
-            "price_rolling_6m_mean": price_rolling_6m_mean,
-            "price_rolling_6m_std": price_rolling_6m_std,
-            "price_yoy_change": price_yoy_change,
-            "volume_lag_1m": fill_values.get("volume_lag_1m", 0),
-            **poi, **market, **extra,
-            "footfall_score": 60.0,
-            "commercial_density": 100.0,
-            "store_diversity_index": 0.6,
+        complex_id = prop.get("complex_id") or complex_data.get("id")
+        record = {
+            "area_exclusive": area_map.get(complex_id) or prop.get("area_exclusive") or 84,
+            "floor": 10,
+            "transaction_year": now.year,
+            "transaction_month": now.month,
+            "transaction_quarter": (now.month - 1) // 3 + 1,
+            "prop_sido": prop.get("sido") or "서울특별시",
+            "prop_sigungu": sigungu,
+            "prop_eupmyeondong": prop.get("eupmyeondong"),
+            "prop_built_year": prop.get("built_year"),
+            "prop_floors": prop.get("floors"),
+            "complex_name": complex_data.get("name"),
+            "complex_total_units": complex_data.get("total_units"),
+            "complex_built_year": complex_data.get("built_year"),
+            "complex_parking_ratio": complex_data.get("parking_ratio"),
+            "complex_brand": complex_data.get("brand"),
         }
 
-        df = pd.DataFrame([features])
-        for col in feature_names:
-            if col not in df.columns:
-                df[col] = fill_values.get(col, 0)
-        return df[feature_names]
+        # Fix #2: 실제 거래 데이터 기반 lag 피처 (없으면 스펙의 학습 대체값 fallback)
+        lag = complex_price_stats.get(complex_id) if complex_id else None
+        if lag is None:
+            lag = sigungu_price_stats.get(sigungu)
+        if lag:
+            record.update(lag)
+        return record
 
     def calculate_confidence(prop):
         complex_data = prop.get("complexes") or {}
@@ -629,103 +445,115 @@ def generate_analyses(sb, model, artifacts, shap_explainer, residual_info, skip_
         "price_rolling_6m_mean": "6개월평균", "price_yoy_change": "전년대비변동",
     }
 
-    # 배치 처리
+    # 배치 처리 (청크 단위로 피처/예측/SHAP 일괄 계산 → 행 단위 저장)
     total_analyses = 0
     total_factors = 0
     errors = 0
+    rescored = []  # 새 분석이 저장된 property_id
 
-    for idx, prop in enumerate(all_properties):
+    for start in range(0, len(all_properties), BATCH_CHUNK_SIZE):
+        chunk = all_properties[start:start + BATCH_CHUNK_SIZE]
         try:
-            # 피처 준비
-            features = prepare_features(prop)
-
-            # XGBoost 예측
-            prediction = model.predict(features)[0]
-            prediction = max(0, int(prediction))
-
-            # 신뢰 구간
-            if residual_percentiles:
-                p10 = residual_percentiles.get(10, 0)
-                p90 = residual_percentiles.get(90, 0)
-                min_price = max(0, int(prediction + p10))
-                max_price = max(0, int(prediction + p90))
-                if min_price > max_price:
-                    min_price, max_price = max_price, min_price
-            else:
-                margin = int(prediction * 0.1)
-                min_price = max(0, prediction - margin)
-                max_price = prediction + margin
-
-            confidence = calculate_confidence(prop)
-
-            # chamgab_analyses 저장
-            analysis_record = {
-                "property_id": prop["id"],
-                "chamgab_price": prediction,
-                "min_price": min_price,
-                "max_price": max_price,
-                "confidence": round(confidence, 2),
-                "expires_at": (datetime.now() + timedelta(days=30)).isoformat(),
-            }
-
-            result = sb.table("chamgab_analyses").insert(analysis_record).execute()
-
-            if result.data:
-                analysis_id = result.data[0]["id"]
-                total_analyses += 1
+            features = spec.transform([to_record(prop) for prop in chunk])
+            predictions = np.maximum(model.predict(features), 0).astype(np.int64)
+        except Exception as e:
+            errors += len(chunk)
+            print(f"  청크 예측 오류 ({start}~{start + len(chunk)}): {e}")
+            continue
 
-                # SHAP 분석
-                if shap_explainer is not None:
-                    try:
-                        shap_values = shap_explainer.shap_values(features)
-                        if len(shap_values.shape) == 2:
-                            shap_values = shap_values[0]
+        shap_matrix = None
+        if shap_explainer is not None:
+            try:
+                shap_matrix = np.asarray(shap_explainer.shap_values(features)).reshape(len(chunk), -1)
+            except Exception as e:
+                print(f"  SHAP 오류 ({start}~{start + len(chunk)}): {e}")
 
-                        # Top 10 요인
-                        contributions = []
-                        for i, (name, val) in enumerate(zip(feature_names, shap_values)):
-                            contributions.append((name, float(val), abs(float(val))))
-                        contributions.sort(key=lambda x: x[2], reverse=True)
+        for offset, prop in enumerate(chunk):
+            idx = start + offset
+            try:
+                prediction = int(predictions[offset])
+
+                # 신뢰 구간
+                if residual_percentiles:
+                    p10 = residual_percentiles.get(10, 0)
+                    p90 = residual_percentiles.get(90, 0)
+                    min_price = max(0, int(prediction + p10))
+                    max_price = max(0, int(prediction + p90))
+                    if min_price > max_price:
+                        min_price, max_price = max_price, min_price
+                else:
+                    margin = int(prediction * 0.1)
+                    min_price = max(0, prediction - margin)
+                    max_price = prediction + margin
+
+                confidence = calculate_confidence(prop)
+
+                # chamgab_analyses 저장
+                analysis_record = {
+                    "property_id": prop["id"],
+                    "chamgab_price": prediction,
+                    "min_price": min_price,
+                    "max_price": max_price,
+                    "confidence": round(confidence, 2),
+                    "expires_at": (datetime.now() + timedelta(days=30)).isoformat(),
+                }
+
+                result = sb.table("chamgab_analyses").insert(analysis_record).execute()
+
+                if result.data:
+                    analysis_id = result.data[0]["id"]
+                    total_analyses += 1
+                    rescored.append(prop["id"])
+
+                    # SHAP Top 10 요인
+                    if shap_matrix is not None:
+                        shap_values = shap_matrix[offset]
+                        top = np.argsort(-np.abs(shap_values), kind="stable")[:10]
 
                         factor_records = []
-                        for rank, (name, val, _) in enumerate(contributions[:10], 1):
-                            name_ko = FEATURE_NAME_KO.get(name, name)
-                            direction = "positive" if val > 0 else "negative"
+                        for rank, i in enumerate(top, 1):
+                            name = feature_names[i]
+                            val = float(shap_values[i])
                             factor_records.append({
                                 "analysis_id": analysis_id,
                                 "rank": rank,
                                 "factor_name": name,
-                                "factor_name_ko": name_ko,
+                                "factor_name_ko": FEATURE_NAME_KO.get(name, name),
                                 "contribution": int(val),
-                                "direction": direction,
+                                "direction": "positive" if val > 0 else "negative",
                             })
 
                         if factor_records:
                             sb.table("price_factors").insert(factor_records).execute()
                             total_factors += len(factor_records)
 
-                    except Exception as e:
-                        print(f"  SHAP 오류 ({prop['name']}): {e}")
-
-        except Exception as e:
-            errors += 1
-            if errors <= 5:
-                print(f"  오류 ({prop.get('name', '?')}): {e}")
-            elif errors == 6:
-                print(f"  ... 이후 오류 생략")
+            except Exception as e:
+                errors += 1
+                if errors <= 5:
+                    print(f"  오류 ({prop.get('name', '?')}): {e}")
+                elif errors == 6:
+                    print(f"  ... 이후 오류 생략")
 
-        # 진행 표시
-        if (idx + 1) % 100 == 0:
-            print(f"  진행: {idx + 1}/{len(all_properties)} (분석: {total_analyses}, 요인: {total_factors}, 오류: {errors})")
+            # 진행 표시
+            if (idx + 1) % 100 == 0:
+                print(f"  진행: {idx + 1}/{len(all_properties)} (분석: {total_analyses}, 요인: {total_factors}, 오류: {errors})")
 
-        # API 속도 제한
-        if (idx + 1) % 50 == 0:
-            time.sleep(0.5)
+            # API 속도 제한
+            if (idx + 1) % 50 == 0:
+                time.sleep(0.5)
 
     print(f"\n  → chamgab_analyses: {total_analyses}건 생성")
     print(f"  → price_factors: {total_factors}건 생성")
     print(f"  → 오류: {errors}건")
 
+    # 재스코어링된 property의 이전 분석 정리 (새 분석 저장 후)
+    if stale_analyses:
+        stale_ids = [aid for pid in rescored for aid in stale_analyses.get(pid, [])]
+        kept = sum(len(ids) for ids in stale_analyses.values()) - len(stale_ids)
+        delete_analyses(sb, stale_ids)
+        if kept:
+            print(f"  → 재스코어링 실패로 이전 분석 {kept}건 유지")
+
     return total_analyses, total_factors
 
 
@@ -766,6 +594,28 @@ def delete_existing_analyses(sb):
     return deleted_analyses, deleted_factors
 
 
+def find_analyses_for_properties(sb, property_ids):
+    """지정 properties의 기존 chamgab_analyses id (지역 재스코어링 전 스냅샷)"""
+    analyses = {}
+    for i in range(0, len(property_ids), 100):
+        batch_ids = property_ids[i:i + 100]
+        result = sb.table("chamgab_analyses").select("id, property_id").in_("property_id", batch_ids).execute()
+        for row in result.data or []:
+            analyses.setdefault(row["property_id"], []).append(row["id"])
+    print(f"  → 교체 대상 기존 분석 {sum(len(ids) for ids in analyses.values())}건")
+    return analyses
+
+
+def delete_analyses(sb, analysis_ids):
+    """chamgab_analyses + price_factors 삭제 (FK 참조 순서)"""
+    for i in range(0, len(analysis_ids), 100):
+        batch_ids = analysis_ids[i:i + 100]
+        sb.table("price_factors").delete().in_("analysis_id", batch_ids).execute()
+        sb.table("chamgab_analyses").delete().in_("id", batch_ids).execute()
+    print(f"  → 이전 분석 {len(analysis_ids)}건 삭제")
+    return len(analysis_ids)
+
+
 def backfill_property_areas(sb, area_map):
     """기존 properties 중 area_exclusive가 0 또는 NULL인 것을 거래 데이터에서 보정"""
     print("\n[Step 1.1] 기존 properties 면적 보정")
@@ -825,9 +675,12 @@ def main():
                         help="기존 분석 전체 삭제 후 재생성 (Fix #1/#2 적용)")
     parser.add_argument("--limit", type=int, default=0, help="분석할 최대 properties 수 (0=무제한)")
     parser.add_argument("--no-shap", action="store_true", help="SHAP 분석 스킵")
+    parser.add_argument("--region-codes", type=str, default="",
+                        help="재스코어링할 시군구 코드 (쉼표 구분, 해당 지역 기존 분석 교체)")
     args = parser.parse_args()
 
-    if args.no_skip_existing or args.regenerate:
+    region_codes = [code.strip() for code in args.region_codes.split(",") if code.strip()]
+    if args.no_skip_existing or args.regenerate or region_codes:
         args.skip_existing = False
 
     print("=" * 60)
@@ -891,6 +744,7 @@ def main():
         complex_price_stats=complex_price_stats,
         sigungu_price_stats=sigungu_price_stats,
         area_map=area_map,
+        region_codes=region_codes,
     )
 
     print("\n" + "=" * 60)
@@ -0,0 +1,104 @@
+"""
+가격 모델 추론 백엔드 벤치마크 (배치 크기별 처리량)
+
+비교 대상:
+- wrapper : XGBRegressor.predict (DataFrame)
+- booster : 원시 Booster.inplace_predict (float32 ndarray)
+- compiled: 컴파일된 트리 앙상블 (numba 커널, 없으면 numpy)
+
+사용법:
+  python scripts/benchmark_inference.py               # app/models 번들 (없으면 합성 모델)
+  python scripts/benchmark_inference.py --synthetic --trees 600 --depth 7
+"""
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import compiled_trees
+from app.core.compiled_trees import CompiledPriceModel
+from app.core.inference_engine import BoosterInferenceEngine
+
+MODELS_DIR = Path(__file__).parent.parent / "app" / "models"
+BATCH_SIZES = (1, 32, 1024)
+
+
+def load_bundle():
+    """학습된 모델 + 피처 순서 (app/models)"""
+    with open(MODELS_DIR / "xgboost_model.pkl", "rb") as f:
+        model = pickle.load(f)
+    with open(MODELS_DIR / "feature_artifacts.pkl", "rb") as f:
+        feature_names = pickle.load(f)["feature_names"]
+    return model, feature_names
+
+
+def synthetic_bundle(n_features: int, trees: int, depth: int):
+    """학습 기본값과 비슷한 규모의 합성 회귀 모델"""
+    rng = np.random.default_rng(42)
+    feature_names = [f"f{i}" for i in range(n_features)]
+    X = pd.DataFrame(rng.normal(size=(20_000, n_features)), columns=feature_names)
+    y = 5e8 + X.to_numpy() @ rng.normal(1e7, 5e6, n_features) + 3e7 * np.sin(X["f0"] * X["f1"])
+    model = xgb.XGBRegressor(n_estimators=trees, max_depth=depth, learning_rate=0.03, n_jobs=1)
+    model.fit(X, y)
+    return model, feature_names
+
+
+def throughput(fn, rows: int, min_seconds: float = 1.0) -> float:
+    """행/초 (최소 min_seconds 동안 반복)"""
+    fn()  # warm-up
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return calls * rows / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가격 모델 추론 백엔드 벤치마크")
+    parser.add_argument("--synthetic", action="store_true", help="합성 모델 사용")
+    parser.add_argument("--features", type=int, default=69)
+    parser.add_argument("--trees", type=int, default=600)
+    parser.add_argument("--depth", type=int, default=7)
+    parser.add_argument("--seconds", type=float, default=1.0, help="측정 구간별 최소 시간")
+    args = parser.parse_args()
+
+    if not args.synthetic and (MODELS_DIR / "xgboost_model.pkl").exists():
+        model, feature_names = load_bundle()
+        print(f"모델: {MODELS_DIR / 'xgboost_model.pkl'}")
+    else:
+        model, feature_names = synthetic_bundle(args.features, args.trees, args.depth)
+        print(f"합성 모델: {args.features}개 피처, {args.trees}개 트리, depth {args.depth}")
+
+    engine = BoosterInferenceEngine.for_model(model, feature_names)
+    compiled = CompiledPriceModel.export(model, feature_names)
+    print(f"컴파일 커널: {'numba' if compiled_trees.HAS_NUMBA else 'numpy'}")
+
+    rng = np.random.default_rng(0)
+    X_all = pd.DataFrame(rng.normal(size=(max(BATCH_SIZES), len(feature_names))), columns=feature_names)
+
+    print(f"\n{'batch':>6} {'wrapper':>12} {'booster':>12} {'compiled':>12}  (rows/s)")
+    for batch in BATCH_SIZES:
+        frame = X_all.iloc[:batch]
+        rows32 = np.ascontiguousarray(frame.to_numpy(np.float32))
+        rows64 = np.ascontiguousarray(frame.to_numpy(np.float64))
+        np.testing.assert_allclose(compiled.predict(rows64), model.predict(frame), rtol=1e-5)
+
+        results = [
+            throughput(lambda: model.predict(frame), batch, args.seconds),
+            throughput(lambda: engine.predict(rows32), batch, args.seconds),
+            throughput(lambda: compiled.predict(rows64), batch, args.seconds),
+        ]
+        print(f"{batch:>6} " + " ".join(f"{r:>12,.0f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+지역 코드 사전 스냅샷 생성 (app/models/region_gazetteer.json)
+
+원천:
+1. 행정표준코드 법정동코드 전체 목록 (PublicDataReader.code_bdong, 현존 코드만)
+2. scripts/bjdong_codes.json (법정동코드 보강)
+3. 기존 스냅샷 (원천에 없는 시군구 / code_aliases / name_aliases 유지)
+
+--offline이면 1을 건너뛰고 기존 스냅샷 + bjdong_codes.json으로만 다시 씁니다.
+
+사용법:
+    python scripts/build_region_gazetteer.py
+    python scripts/build_region_gazetteer.py --offline
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.region_gazetteer import SNAPSHOT_PATH, RegionGazetteer
+
+BJDONG_JSON_PATH = Path(__file__).parent / "bjdong_codes.json"
+
+try:
+    import PublicDataReader as pdr
+    HAS_PDR = True
+except ImportError:
+    HAS_PDR = False
+
+
+def empty_snapshot() -> Dict:
+    return {"sido": {}, "sigungu": {}, "code_aliases": {}, "name_aliases": {}, "bjdong": {}}
+
+
+def snapshot_from_code_table(df: pd.DataFrame) -> Dict:
+    """
+    법정동코드 목록 → 스냅샷.
+
+    Args:
+        df: 법정동코드(10자리), 시도명, 시군구명, 읍면동명, 동리명, 말소일자 컬럼
+    """
+    snapshot = empty_snapshot()
+    if "말소일자" in df.columns:
+        df = df[df["말소일자"].isna() | (df["말소일자"].astype(str).str.strip() == "")]
+
+    for row in df.itertuples(index=False):
+        code = str(row.법정동코드).zfill(10)
+        sido_name = str(row.시도명 or "").strip()
+        sigungu_name = str(row.시군구명 or "").strip() if pd.notna(row.시군구명) else ""
+        if code[2:] == "00000000":
+            snapshot["sido"][code[:2]] = sido_name
+        elif code[5:] == "00000":
+            snapshot["sigungu"][code[:5]] = sigungu_name or sido_name  # 세종: 시군구명 없음
+        else:
+            dong = row.동리명 if pd.notna(row.동리명) and str(row.동리명).strip() else row.읍면동명
+            snapshot["bjdong"].setdefault(code[:5], {})[str(dong).strip()] = code[5:]
+    return snapshot
+
+
+def merge_snapshot(base: Dict, extra: Dict) -> Dict:
+    """extra에 없는 항목만 base에서 보충 (extra 우선)"""
+    merged = empty_snapshot()
+    for key in ("sido", "sigungu", "code_aliases", "name_aliases"):
+        merged[key] = {**base.get(key, {}), **extra.get(key, {})}
+    for sigungu_code in set(base.get("bjdong", {})) | set(extra.get("bjdong", {})):
+        merged["bjdong"][sigungu_code] = {
+            **base.get("bjdong", {}).get(sigungu_code, {}),
+            **extra.get("bjdong", {}).get(sigungu_code, {}),
+        }
+    return merged
+
+
+def merge_bjdong_json(snapshot: Dict, path: Path = BJDONG_JSON_PATH) -> int:
+    """bjdong_codes.json의 법정동 중 스냅샷에 없는 것 추가 (폐지 시군구 코드는 현재 코드로)"""
+    if not path.exists():
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    aliases = snapshot.get("code_aliases", {})
+    added = 0
+    for sigungu_code, dongs in data.items():
+        target = snapshot["bjdong"].setdefault(aliases.get(sigungu_code, sigungu_code), {})
+        for name, code in dongs.items():
+            if name not in target:
+                target[name] = code
+                added += 1
+    return added
+
+
+def write_snapshot(snapshot: Dict, path: Path = SNAPSHOT_PATH):
+    """한 줄에 시군구 하나씩 쓰는 압축 JSON (공백 없는 구분자)"""
+    def dump(value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+    lines = ["{"]
+    lines.append(f'"built_at":{dump(snapshot.get("built_at", ""))},')
+    for key in ("sido", "sigungu", "code_aliases", "name_aliases"):
+        lines.append(f'"{key}":{dump(snapshot.get(key, {}))},')
+    lines.append('"bjdong":{')
+    entries = sorted(snapshot.get("bjdong", {}).items())
+    for i, (sigungu_code, dongs) in enumerate(entries):
+        comma = "," if i < len(entries) - 1 else ""
+        lines.append(f'"{sigungu_code}":{json.dumps(dongs, ensure_ascii=False, separators=(",", ":"))}{comma}')
+    lines.append("}}")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지역 코드 사전 스냅샷 생성")
+    parser.add_argument("--offline", action="store_true",
+                        help="법정동코드 목록을 내려받지 않고 기존 스냅샷 + bjdong_codes.json만 사용")
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    base = empty_snapshot()
+    if args.output.exists():
+        with open(args.output, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        print(f"기존 스냅샷: 시군구 {len(base.get('sigungu', {}))}개")
+
+    snapshot = base
+    if not args.offline:
+        if not HAS_PDR:
+            print("ERROR: PublicDataReader 미설치 (--offline 사용 가능)")
+            sys.exit(1)
+        df = pdr.code_bdong()
+        fresh = snapshot_from_code_table(df)
+        print(f"법정동코드 목록: 시도 {len(fresh['sido'])}개, 시군구 {len(fresh['sigungu'])}개, "
+              f"법정동 {sum(len(v) for v in fresh['bjdong'].values())}건")
+        snapshot = merge_snapshot(base, fresh)
+
+    added = merge_bjdong_json(snapshot)
+    print(f"bjdong_codes.json 보강: {added}건")
+
+    snapshot["built_at"] = date.today().isoformat()
+    write_snapshot(snapshot, args.output)
+
+    start = time.perf_counter()
+    gazetteer = RegionGazetteer.load(args.output)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"저장: {args.output} ({args.output.stat().st_size / 1024:.0f}KB, "
+          f"지역 {len(gazetteer)}개, 법정동 {sum(len(v) for v in snapshot['bjdong'].values())}건, "
+          f"로드 {elapsed:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
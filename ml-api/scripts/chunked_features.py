@@ -0,0 +1,417 @@
+"""
+전국 거래 이력 청크 단위 피처 생성 + XGBoost 외부 메모리 학습 입력
+
+전체 이력을 하나의 DataFrame으로 올리지 않고 수집 Parquet 데이터셋(data/collected)을
+(시도, 연도) 파티션 단위로 처리. 메모리 사용량 ≈ 가장 큰 파티션 + 집계 상태.
+
+1) 분포 스캔: 가격 분포 (1~99% 이상치 경계)
+2) 통계 스캔: 월간 가격 집계(temporal 상태), target encoding 폴드 통계, 라벨 인코더 범주, 거래일 분포
+3) 피처 기록: 파티션별 피처 생성 → features/{year}_{sido}.parquet, 결측치 대체값 분포 누적
+
+학습은 FeaturePartitionIter(xgb.DataIter)로 파티션 파일을 차례로 공급 (ExtMemQuantileDMatrix).
+데이터 규모는 RAM이 아니라 디스크에 의해 제한됨.
+
+인메모리 경로(prepare_training_data)와의 차이:
+- 층/면적 결측치는 파티션 median으로 채움
+- K-fold target encoding 폴드는 행 키 해시로 배정 (전체 행 순서 없이 결정적)
+- 시간 분할은 위치가 아니라 거래일 경계 (train < 70% 지점 ≤ val < 85% 지점 ≤ test)
+"""
+import json
+import shutil
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.preprocessing import LabelEncoder
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.collected_dataset import CollectedDataset, COLLECTED_DATASET_DIR
+from scripts.feature_engineering import FeatureEngineer, TARGET_COLUMN
+
+CHUNKED_FEATURE_DIR = Path(__file__).parent.parent / "data" / "chunked_features"
+SPLIT_FRACTIONS = (0.70, 0.85)  # train / val 경계 (거래일 분포 기준)
+N_FOLDS = 5
+# target encoding 폴드 배정용 행 키 (수집 데이터셋 중복 제거 키와 동일)
+FOLD_KEY_COLUMNS = ["transaction_date", "apt_name", "area_exclusive", "floor", "price"]
+TARGET_ENCODED_COLUMNS = ["sigungu", "dong"]
+LABEL_ENCODED_COLUMNS = ["sido", "sigungu"]
+
+
+def quantile_from_counts(counts: pd.Series, q: float) -> float:
+    """값별 건수(index=값) → 선형 보간 분위수 (pandas quantile과 같은 정의)"""
+    counts = counts[counts > 0].sort_index()
+    cumulative = counts.to_numpy().cumsum()
+    values = counts.index.to_numpy(dtype=np.float64)
+    h = (cumulative[-1] - 1) * q
+    lo, hi = int(np.floor(h)), int(np.ceil(h))
+    v_lo = values[np.searchsorted(cumulative, lo, side="right")]
+    v_hi = values[np.searchsorted(cumulative, hi, side="right")]
+    return float(v_lo + (h - lo) * (v_hi - v_lo))
+
+
+def _add_counts(total: Optional[pd.Series], values: pd.Series) -> pd.Series:
+    """값별 건수 누적"""
+    counts = values.value_counts()
+    return counts if total is None else total.add(counts, fill_value=0)
+
+
+@dataclass
+class FeaturePartition:
+    """기록된 피처 파티션"""
+    sido: str
+    year: str
+    path: str
+    rows: int
+
+
+@dataclass
+class ChunkedFeatureSet:
+    """파티션별 피처 파일 + 시간 분할 경계"""
+    root: Path
+    partitions: List[FeaturePartition]
+    split_dates: Dict[str, str] = field(default_factory=dict)  # {"val_start", "test_start"}
+    rows: int = 0
+
+    def date_range(self, split: str) -> Tuple[Optional[str], Optional[str]]:
+        """split → [start, end) 거래일 범위"""
+        val_start, test_start = self.split_dates["val_start"], self.split_dates["test_start"]
+        return {
+            "train": (None, val_start),
+            "val": (val_start, test_start),
+            "test": (test_start, None),
+            "all": (None, None),
+        }[split]
+
+    def iterator(self, fe: FeatureEngineer, split: str = "all") -> "FeaturePartitionIter":
+        start, end = self.date_range(split)
+        cache_dir = self.root / "xgb_cache"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FeaturePartitionIter(
+            fe, [p.path for p in self.partitions], start=start, end=end,
+            cache_prefix=str(cache_dir / split),
+        )
+
+    @classmethod
+    def load(cls, root: Path) -> "ChunkedFeatureSet":
+        with open(Path(root) / "manifest.json", encoding="utf-8") as f:
+            manifest = json.load(f)
+        return cls(
+            root=Path(root),
+            partitions=[FeaturePartition(**p) for p in manifest["partitions"]],
+            split_dates=manifest["split_dates"],
+            rows=manifest["rows"],
+        )
+
+
+class FeaturePartitionIter(xgb.DataIter):
+    """
+    피처 파티션 파일 → XGBoost 외부 메모리 배치
+
+    파일 하나 = 배치 하나, 거래일 [start, end) 필터 후 fit된 대체값으로 결측치 처리
+    """
+
+    def __init__(self, fe: FeatureEngineer, paths: List[str], start: Optional[str] = None,
+                 end: Optional[str] = None, cache_prefix: Optional[str] = None):
+        self.fe = fe
+        self.paths = list(paths)
+        self.start = pd.Timestamp(start) if start else None
+        self.end = pd.Timestamp(end) if end else None
+        self._it = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def _read(self, path: str) -> Optional[Tuple[pd.DataFrame, pd.Series]]:
+        df = pd.read_parquet(path)
+        dates = df.pop("transaction_date")
+        mask = np.ones(len(df), dtype=bool)
+        if self.start is not None:
+            mask &= (dates >= self.start).to_numpy()
+        if self.end is not None:
+            mask &= (dates < self.end).to_numpy()
+        if not mask.any():
+            return None
+        y = df.pop(TARGET_COLUMN)[mask]
+        X = self.fe._smart_fill_missing(df.loc[mask, self.fe.feature_names].copy(), fit=False)
+        return X, y
+
+    def batches(self) -> Iterator[Tuple[pd.DataFrame, pd.Series]]:
+        """(X, y) 배치 순회 (평가/예측용)"""
+        for path in self.paths:
+            batch = self._read(path)
+            if batch is not None:
+                yield batch
+
+    def next(self, input_data) -> bool:
+        while self._it < len(self.paths):
+            batch = self._read(self.paths[self._it])
+            self._it += 1
+            if batch is not None:
+                X, y = batch
+                input_data(data=X.to_numpy(dtype=np.float32), label=y.to_numpy(dtype=np.float64))
+                return True
+        return False
+
+    def reset(self):
+        self._it = 0
+
+
+class ChunkedFeatureBuilder:
+    """(시도, 연도) 파티션 단위 학습 피처 생성"""
+
+    def __init__(self, fe: FeatureEngineer, dataset_dir: Path = COLLECTED_DATASET_DIR,
+                 output_dir: Path = CHUNKED_FEATURE_DIR):
+        self.fe = fe
+        self.dataset = CollectedDataset(Path(dataset_dir))
+        self.output_dir = Path(output_dir)
+        self._oof_tables: Dict[str, Tuple[pd.Index, np.ndarray]] = {}  # 범주 → (폴드, 범주) 인코딩 값
+        self._temporal: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None  # temporal 조회 테이블
+
+    # ─────────────────────────────────────────────
+    # 파티션 읽기
+    # ─────────────────────────────────────────────
+
+    def partitions(self) -> List[Tuple[str, str, List[str]]]:
+        """(시도 코드, 연도, 지역코드 목록) — 연도 → 시도 순"""
+        groups: Dict[Tuple[str, str], set] = {}
+        for part_dir in self.dataset.root.glob("region_code=*/year_month=*"):
+            region_code = part_dir.parent.name.split("=", 1)[1]
+            year_month = part_dir.name.split("=", 1)[1]
+            groups.setdefault((year_month[:4], region_code[:2]), set()).add(region_code)
+        return [(sido, year, sorted(codes)) for (year, sido), codes in sorted(groups.items())]
+
+    def _load_partition(self, region_codes: List[str], year: str) -> pd.DataFrame:
+        """파티션 원본 → 기본 피처 + 유효 행 (가격/면적 결측·0 제외)"""
+        df = self.dataset.read(
+            region_codes=region_codes, start_month=f"{year}01", end_month=f"{year}12"
+        )
+        df = self.fe._add_basic_features(self.fe._normalize_collected(df))
+        valid = (
+            df["price"].notna() & df["area_exclusive"].notna()
+            & (df["price"] > 0) & (df["area_exclusive"] > 0)
+        )
+        return df[valid].reset_index(drop=True)
+
+    @staticmethod
+    def _row_folds(df: pd.DataFrame) -> np.ndarray:
+        """행 키 해시 → K-fold 번호 (파티션 순서와 무관하게 결정적)"""
+        keys = [c for c in FOLD_KEY_COLUMNS if c in df.columns]
+        hashes = pd.util.hash_pandas_object(df[keys], index=False).to_numpy()
+        return (hashes % N_FOLDS).astype(np.int64)
+
+    # ─────────────────────────────────────────────
+    # 실행
+    # ─────────────────────────────────────────────
+
+    def build(self) -> ChunkedFeatureSet:
+        """3단계 스캔으로 피처 파티션 생성 + 인코더/대체값 fit"""
+        partitions = self.partitions()
+        if not partitions:
+            raise ValueError(f"수집 데이터셋이 없습니다: {self.dataset.root}")
+        print(f"청크 피처 생성: 파티션 {len(partitions)}개 (시도 × 연도)")
+
+        low, high = self._scan_price_bounds(partitions)
+        print(f"가격 이상치 경계 (1%~99%): {low:,.0f} ~ {high:,.0f}")
+        stats = self._scan_statistics(partitions, low, high)
+        print(f"전처리 후 데이터: {stats['rows']}건")
+        self._fit_encoders(stats)
+
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        (self.output_dir / "features").mkdir(parents=True)
+        written, fill_counts = self._write_features(partitions, low, high, stats)
+        self._fit_fill_values(fill_counts)
+
+        feature_set = ChunkedFeatureSet(
+            root=self.output_dir,
+            partitions=written,
+            split_dates=stats["split_dates"],
+            rows=sum(p.rows for p in written),
+        )
+        with open(self.output_dir / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "partitions": [asdict(p) for p in written],
+                "split_dates": feature_set.split_dates,
+                "rows": feature_set.rows,
+                "price_bounds": [low, high],
+            }, f, indent=2, ensure_ascii=False)
+        self.fe.save(str(self.output_dir / "artifacts.pkl"))
+        self.fe.is_fitted = True
+        return feature_set
+
+    def _scan_price_bounds(self, partitions: list) -> Tuple[float, float]:
+        """1단계: 가격 분포 → 1% / 99% 분위수"""
+        price_counts = None
+        for sido, year, codes in partitions:
+            df = self._load_partition(codes, year)
+            if len(df):
+                price_counts = _add_counts(price_counts, df["price"])
+        if price_counts is None:
+            raise ValueError("학습 데이터가 없습니다")
+        return quantile_from_counts(price_counts, 0.01), quantile_from_counts(price_counts, 0.99)
+
+    def _scan_statistics(self, partitions: list, low: float, high: float) -> dict:
+        """2단계: 월간 집계 / target encoding 폴드 통계 / 라벨 범주 / 거래일 분포"""
+        sg_monthly = apt_monthly = None
+        target_stats: Dict[str, Optional[pd.DataFrame]] = {col: None for col in TARGET_ENCODED_COLUMNS}
+        fold_totals = np.zeros((N_FOLDS, 2))  # 폴드별 (가격 합계, 건수)
+        labels: Dict[str, set] = {col: set() for col in LABEL_ENCODED_COLUMNS}
+        date_counts = None
+        rows = 0
+
+        for sido, year, codes in partitions:
+            df = self._load_partition(codes, year)
+            df = df[(df["price"] >= low) & (df["price"] <= high)]
+            if df.empty:
+                continue
+            rows += len(df)
+
+            sg, apt = self.fe._monthly_aggregates(df)
+            sg_monthly = sg if sg_monthly is None else self.fe._combine_monthly([sg_monthly, sg])
+            apt_monthly = apt if apt_monthly is None else self.fe._combine_monthly([apt_monthly, apt])
+
+            folds = self._row_folds(df)
+            price = df["price"].to_numpy(dtype=np.float64)
+            fold_totals[:, 0] += np.bincount(folds, weights=price, minlength=N_FOLDS)
+            fold_totals[:, 1] += np.bincount(folds, minlength=N_FOLDS)
+            for col in TARGET_ENCODED_COLUMNS:
+                part = (
+                    pd.DataFrame({"value": df[col].to_numpy(), "fold": folds, "sum": price, "count": 1})
+                    .groupby(["value", "fold"])[["sum", "count"]].sum()
+                )
+                prev = target_stats[col]
+                target_stats[col] = part if prev is None else prev.add(part, fill_value=0)
+
+            for col in LABEL_ENCODED_COLUMNS:
+                labels[col].update(self.fe._fill_category(df[col], "unknown").unique())
+            date_counts = _add_counts(date_counts, df["transaction_date"])
+
+        if rows == 0:
+            raise ValueError("학습 데이터가 없습니다")
+
+        # 시간 분할 경계 (거래일 분포의 70% / 85% 지점)
+        date_counts = date_counts.sort_index()
+        cumulative = date_counts.to_numpy().cumsum()
+        val_start, test_start = (
+            date_counts.index[np.searchsorted(cumulative, int(rows * frac), side="right")]
+            for frac in SPLIT_FRACTIONS
+        )
+        return {
+            "rows": rows,
+            "sg_monthly": sg_monthly,
+            "apt_monthly": apt_monthly,
+            "target_stats": target_stats,
+            "fold_totals": fold_totals,
+            "labels": labels,
+            "split_dates": {"val_start": str(val_start.date()), "test_start": str(test_start.date())},
+        }
+
+    def _fit_encoders(self, stats: dict):
+        """누적 통계 → 라벨 인코더 / target encoding 매핑 / 폴드별 out-of-fold 테이블 / temporal 조회 테이블"""
+        fe = self.fe
+        for col, values in stats["labels"].items():
+            encoder = LabelEncoder()
+            encoder.classes_ = np.array(sorted(values), dtype=object)
+            fe.label_encoders[col] = encoder
+
+        fold_sums, fold_counts = stats["fold_totals"][:, 0], stats["fold_totals"][:, 1]
+        global_mean = fold_sums.sum() / fold_counts.sum()
+        # 폴드 k 행은 나머지 폴드 통계로 인코딩
+        fold_globals = (fold_sums.sum() - fold_sums) / (fold_counts.sum() - fold_counts)
+
+        self._oof_tables = {}
+        for col, table in stats["target_stats"].items():
+            sums = table["sum"].unstack("fold", fill_value=0).reindex(columns=range(N_FOLDS), fill_value=0)
+            counts = table["count"].unstack("fold", fill_value=0).reindex(columns=range(N_FOLDS), fill_value=0)
+            total_sums = sums.sum(axis=1).to_numpy()
+            total_counts = counts.sum(axis=1).to_numpy(dtype=np.float64)
+            smooth = fe._smooth_means(total_sums, total_counts, global_mean, smoothing=20)
+            fe.target_encoders[col] = {
+                "mapping": dict(zip(sums.index, smooth.tolist())),
+                "global_mean": global_mean,
+            }
+
+            n_cats = len(sums)
+            oof = np.empty((N_FOLDS, n_cats + 1), dtype=np.float64)
+            for k in range(N_FOLDS):
+                oof[k, :n_cats] = fe._smooth_means(
+                    total_sums - sums[k].to_numpy(),
+                    total_counts - counts[k].to_numpy(dtype=np.float64),
+                    fold_globals[k], smoothing=20,
+                )
+                oof[k, n_cats] = fold_globals[k]  # 미등장 범주 → 폴드 평균
+            self._oof_tables[col] = (pd.Index(sums.index), oof)
+
+        self._temporal = None
+        if stats["rows"] >= 50:
+            self._temporal = fe._temporal_history(stats["sg_monthly"], stats["apt_monthly"])
+
+    def _encode(self, df: pd.DataFrame):
+        """fit된 인코더로 라벨/target encoding 컬럼 추가 (in-place, 학습 행은 out-of-fold)"""
+        for col in LABEL_ENCODED_COLUMNS:
+            values = self.fe._fill_category(df[col], "unknown").astype(object)
+            classes = self.fe.label_encoders[col].classes_
+            df[f"{col}_encoded"] = pd.Categorical(values, categories=classes).codes.astype(np.int64)
+
+        folds = self._row_folds(df)
+        for col in TARGET_ENCODED_COLUMNS:
+            categories, oof = self._oof_tables[col]
+            codes = categories.get_indexer(df[col].astype(object))
+            codes = np.where(codes >= 0, codes, len(categories))
+            df[f"{col}_target_enc"] = oof[folds, codes]
+
+    def _write_features(self, partitions: list, low: float, high: float,
+                        stats: dict) -> Tuple[List[FeaturePartition], Dict[str, pd.Series]]:
+        """3단계: 파티션별 전체 피처 → Parquet (결측치 대체값 분포 누적)"""
+        fe = self.fe
+        feature_cols = fe.get_feature_columns()
+        fe.feature_names = feature_cols
+        median_cols = [c for c in feature_cols if fe._median_fill_default(c) is not None]
+        fill_counts: Dict[str, Optional[pd.Series]] = {col: None for col in median_cols}
+        written = []
+
+        for sido, year, codes in partitions:
+            df = self._load_partition(codes, year)
+            df = df[(df["price"] >= low) & (df["price"] <= high)]
+            if df.empty:
+                continue
+            df = fe._add_service_features(df.sort_values("transaction_date").reset_index(drop=True))
+
+            if self._temporal is not None:
+                fe._apply_temporal_features(df, *self._temporal)
+            else:
+                for col in fe._TEMPORAL_COLUMNS:
+                    df[col] = np.nan
+            self._encode(df)
+
+            for col in feature_cols:
+                if col not in df.columns:
+                    df[col] = np.nan
+            out = df[feature_cols]
+            if fe.memory_optimized:
+                out = fe._optimize_dtypes(out.copy())
+            for col in median_cols:
+                values = out[col].dropna()
+                if len(values):
+                    fill_counts[col] = _add_counts(fill_counts[col], values)
+
+            path = self.output_dir / "features" / f"{year}_{sido}.parquet"
+            out.assign(**{
+                TARGET_COLUMN: df["price"].to_numpy(dtype=np.float64),
+                "transaction_date": df["transaction_date"].to_numpy(),
+            }).to_parquet(path, index=False)
+            written.append(FeaturePartition(sido=sido, year=year, path=str(path), rows=len(out)))
+            print(f"  {year} / 시도 {sido}: {len(out)}건 → {path.name}")
+            fe._report_memory(f"파티션 {year}_{sido}", df)
+
+        return written, fill_counts
+
+    def _fit_fill_values(self, fill_counts: Dict[str, Optional[pd.Series]]):
+        """누적 분포 → median 결측치 대체값 (전부 결측이면 기본값)"""
+        self.fe.fill_values = {
+            col: quantile_from_counts(counts, 0.5) if counts is not None
+            else self.fe._median_fill_default(col)
+            for col, counts in fill_counts.items()
+        }
@@ -3,24 +3,37 @@
 건축물대장 API를 이용한 단지 건물 정보 수집 스크립트
 
 - complexes 테이블에서 total_units가 NULL인 단지를 조회
+- 시군구/법정동 코드는 app.core.region_gazetteer 우선 (regions 테이블은 보조)
 - 건축물대장 표제부 API (getBrRecapTitleInfo)로 건물 상세 정보 조회
-- 건물명(bldNm) 매칭으로 해당 단지 식별
+- 건물명(bldNm) 매칭으로 해당 단지 식별 (app.core.name_matcher 색인, 조합별 1회 구축)
 - building_info 테이블에 전체 API 응답 저장 (UPSERT)
 - complexes 테이블에 확장 필드 업데이트:
     total_units, total_buildings, parking_ratio, total_floors,
     dong_count, floor_area_ratio, building_coverage_ratio,
     main_use, structure, use_approval_date, building_info_id
+
+동시 수집 (기본):
+- 단지를 (시군구코드, 법정동코드)로 묶어 각 조합의 대장 페이지를 1회만 조회
+  (aiohttp, 동시 요청 수 --concurrency)
+- 그룹 내 단지는 메모리에서 매칭 → building_info / complexes 일괄 UPSERT
+- --sequential: 단지별 순차 처리 (기존 방식)
+
+사용법:
+  python scripts/collect_building_info.py [--concurrency 8] [--sequential]
 """
 
-import json
+import argparse
+import asyncio
+import math
 import os
 import re
 import sys
 import time
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import aiohttp
 import requests
 
 # ------------------------------------------------------------------ #
@@ -38,6 +51,16 @@ if os.path.exists(env_path):
 
 from supabase import create_client  # noqa: E402
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.name_matcher import (  # noqa: E402, F401 (names_match 등 기존 import 경로 유지)
+    MATCH_PRIORITY,
+    NameIndex,
+    names_match,
+    normalize_name,
+    normalize_name_deep,
+)
+from app.core.region_gazetteer import region_gazetteer  # noqa: E402
+
 # ------------------------------------------------------------------ #
 # 환경변수
 # ------------------------------------------------------------------ #
@@ -72,97 +95,19 @@ RETRY_DELAY = 2.0
 MAX_CONSECUTIVE_SAME_ERROR = 3
 MAX_TOTAL_RETRIES = 10
 
+# 동시 수집 설정
+CONCURRENCY = 8  # 동시 API 요청 수 (슬롯마다 REQUEST_DELAY 간격 유지)
+ROWS_PER_PAGE = 100
+MAX_PAGES = 10  # (시군구, 법정동)당 최대 페이지 (안전 장치)
+UPSERT_BATCH_SIZE = 200  # 일괄 UPSERT 행 수
+BUILDING_INFO_CONFLICT = "sigungu_cd,bjdong_cd,bun,ji,mgm_bld_rgst_pk"
+# complexes 일괄 UPSERT 시 INSERT 제약(NOT NULL) 충족용 기존 컬럼
+COMPLEX_REQUIRED_COLUMNS = ("name", "address", "sido", "sigungu")
+
 
 # ------------------------------------------------------------------ #
 # 헬퍼 함수
 # ------------------------------------------------------------------ #
-def normalize_name(name: str) -> str:
-    """단지명 정규화 (공백/특수문자 제거, 소문자화)"""
-    name = re.sub(r"[^\w가-힣]", "", name)
-    return name.strip().lower()
-
-
-# 아파트명에서 제거할 접미사 (긴 것부터)
-_SUFFIXES = [
-    "아파트", "주상복합", "타운하우스", "빌리지",
-    "타워", "팰리스", "파크", "맨션",
-    "빌라", "빌딩", "하우스", "단지",
-    "오피스텔", "레지던스",
-]
-
-
-def normalize_name_deep(name: str) -> str:
-    """
-    단지명 심층 정규화:
-    1. 괄호 내용 제거: "이안용산1동(103동)" → "이안용산1동"
-    2. 특수문자/공백 제거
-    3. 접미사 제거: "래미안아파트" → "래미안"
-    4. 영문 소문자화
-    """
-    if not name:
-        return ""
-    # 괄호 내용 제거
-    name = re.sub(r"\([^)]*\)", "", name)
-    # 특수문자/공백 제거, 소문자화
-    name = re.sub(r"[^\w가-힣]", "", name).strip().lower()
-    # 접미사 제거 (긴 것부터)
-    for sfx in _SUFFIXES:
-        if name.endswith(sfx) and len(name) > len(sfx):
-            name = name[: -len(sfx)]
-            break
-    return name
-
-
-def names_match(api_name: str, complex_name: str) -> Tuple[bool, str]:
-    """
-    건물명과 단지명을 비교합니다.
-
-    Returns:
-        (매치 여부, 매치 유형)
-        매치 유형: "exact" | "contains" | "partial" | "fuzzy" | "none"
-    """
-    if not api_name or not complex_name:
-        return False, "none"
-
-    norm_api = normalize_name(api_name)
-    norm_cx = normalize_name(complex_name)
-
-    # 1) 정규화 후 완전 일치
-    if norm_api == norm_cx:
-        return True, "exact"
-
-    # 2) API 건물명이 단지명을 포함 (예: "래미안강남아파트" contains "래미안강남")
-    if len(norm_cx) >= 2 and norm_cx in norm_api:
-        return True, "contains"
-
-    # 3) 단지명이 API 건물명을 포함 (예: "래미안강남퍼스트하임" contains "래미안강남")
-    if len(norm_api) >= 2 and norm_api in norm_cx:
-        return True, "partial"
-
-    # 4) 접미사 제거 후 재비교 (deep normalize)
-    deep_api = normalize_name_deep(api_name)
-    deep_cx = normalize_name_deep(complex_name)
-
-    if deep_api and deep_cx:
-        if deep_api == deep_cx:
-            return True, "exact"
-        if len(deep_cx) >= 2 and deep_cx in deep_api:
-            return True, "contains"
-        if len(deep_api) >= 2 and deep_api in deep_cx:
-            return True, "partial"
-
-    # 5) SequenceMatcher 유사도 매칭 (0.75 이상)
-    from difflib import SequenceMatcher
-
-    # deep normalized 이름 기준으로 비교
-    if deep_api and deep_cx and len(deep_api) >= 2 and len(deep_cx) >= 2:
-        ratio = SequenceMatcher(None, deep_api, deep_cx).ratio()
-        if ratio >= 0.75:
-            return True, "fuzzy"
-
-    return False, "none"
-
-
 def fetch_building_info(
     sigungu_cd: str,
     bjdong_cd: str,
@@ -181,15 +126,7 @@ def fetch_building_info(
     Returns:
         JSON 응답 dict 또는 None
     """
-    params = {
-        "serviceKey": API_KEY,
-        "sigunguCd": sigungu_cd,
-        "bjdongCd": bjdong_cd,
-        "platGbCd": "0",  # 대지
-        "numOfRows": str(num_of_rows),
-        "pageNo": str(page_no),
-        "_type": "json",
-    }
+    params = _build_params(sigungu_cd, bjdong_cd, page_no, num_of_rows)
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
@@ -251,6 +188,92 @@ def fetch_building_info(
     return None
 
 
+def _build_params(
+    sigungu_cd: str, bjdong_cd: str, page_no: int, num_of_rows: int
+) -> Dict[str, str]:
+    """표제부 API 요청 파라미터"""
+    return {
+        "serviceKey": API_KEY,
+        "sigunguCd": sigungu_cd,
+        "bjdongCd": bjdong_cd,
+        "platGbCd": "0",  # 대지
+        "numOfRows": str(num_of_rows),
+        "pageNo": str(page_no),
+        "_type": "json",
+    }
+
+
+async def fetch_building_info_async(
+    session: aiohttp.ClientSession,
+    sigungu_cd: str,
+    bjdong_cd: str,
+    page_no: int = 1,
+    num_of_rows: int = ROWS_PER_PAGE,
+) -> Optional[Dict]:
+    """
+    건축물대장 표제부 API 비동기 호출 (fetch_building_info와 같은 재시도 규칙)
+
+    Returns:
+        JSON 응답 dict 또는 None
+    """
+    params = _build_params(sigungu_cd, bjdong_cd, page_no, num_of_rows)
+
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            async with session.get(
+                BLD_API_URL,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=15),
+            ) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+
+            header = data.get("response", {}).get("header", {})
+            result_code = header.get("resultCode", "")
+
+            if result_code == "00":  # 정상
+                return data
+            elif result_code == "99":  # 데이터 없음
+                return None
+            else:
+                result_msg = header.get("resultMsg", "")
+                print(
+                    f"    API 오류 (code={result_code}): {result_msg}"
+                )
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(RETRY_DELAY * attempt)
+                    continue
+                return None
+
+        except asyncio.TimeoutError:
+            print(
+                f"    타임아웃 (시도 {attempt}/{MAX_RETRIES}): "
+                f"sigungu={sigungu_cd}, bjdong={bjdong_cd}"
+            )
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(RETRY_DELAY * attempt)
+        except aiohttp.ClientResponseError as e:
+            print(
+                f"    HTTP 오류 {e.status} (시도 {attempt}/{MAX_RETRIES})"
+            )
+            if e.status == 429:
+                await asyncio.sleep(RETRY_DELAY * attempt * 2)
+            elif attempt < MAX_RETRIES:
+                await asyncio.sleep(RETRY_DELAY * attempt)
+            else:
+                return None
+        except (aiohttp.ClientError, ValueError) as e:
+            print(
+                f"    요청 오류 (시도 {attempt}/{MAX_RETRIES}): {e}"
+            )
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(RETRY_DELAY * attempt)
+            else:
+                return None
+
+    return None
+
+
 def extract_items_from_response(data: Dict) -> List[Dict]:
     """API 응답에서 항목 리스트 추출"""
     try:
@@ -277,6 +300,7 @@ def extract_items_from_response(data: Dict) -> List[Dict]:
 def find_matching_building(
     items: List[Dict],
     complex_name: str,
+    index: Optional[NameIndex] = None,
 ) -> Optional[Dict]:
     """
     API 응답 항목에서 단지명과 매칭되는 건물을 찾습니다.
@@ -288,21 +312,20 @@ def find_matching_building(
     4. 유사도 75% 이상 (fuzzy)
 
     동일 우선순위 내에서는 세대수(hhldCnt)가 큰 것을 우선합니다.
+
+    Args:
+        index: items의 건물명 색인 (같은 items로 여러 단지를 매칭할 때 재사용)
     """
+    if index is None:
+        index = NameIndex([item.get("bldNm", "") or "" for item in items])
+
     best_match = None
     best_priority = 99  # 낮을수록 우선
     best_units = 0
 
-    priority_map = {"exact": 1, "contains": 2, "partial": 3, "fuzzy": 4}
-
-    for item in items:
-        bld_nm = item.get("bldNm", "") or ""
-        matched, match_type = names_match(bld_nm, complex_name)
-
-        if not matched:
-            continue
-
-        priority = priority_map.get(match_type, 99)
+    for pos, match_type, _ in index.match(complex_name):
+        item = items[pos]
+        priority = MATCH_PRIORITY[match_type]
         hhld_cnt = _safe_int(item.get("hhldCnt"))
 
         # 더 높은 우선순위이거나, 같은 우선순위에서 세대수가 더 큰 경우
@@ -427,93 +450,6 @@ def build_code_mappings(
     return sigungu_map, bjdong_map
 
 
-# ------------------------------------------------------------------ #
-# 하드코딩 시군구 코드 (regions 테이블 보완용)
-# ------------------------------------------------------------------ #
-FALLBACK_SIGUNGU_CODES: Dict[str, str] = {
-    # 서울 (prefixed - ambiguous names)
-    "서울 중구": "11140", "서울 강서구": "11500",
-    # 서울
-    "종로구": "11110", "중구": "11140", "용산구": "11170", "성동구": "11200",
-    "광진구": "11215", "동대문구": "11230", "중랑구": "11260", "성북구": "11290",
-    "강북구": "11305", "도봉구": "11320", "노원구": "11350", "은평구": "11380",
-    "서대문구": "11410", "마포구": "11440", "양천구": "11470", "강서구": "11500",
-    "구로구": "11530", "금천구": "11545", "영등포구": "11560", "동작구": "11590",
-    "관악구": "11620", "서초구": "11650", "강남구": "11680", "송파구": "11710",
-    "강동구": "11740",
-    # 경기
-    "수원시 장안구": "41111", "수원시 권선구": "41113",
-    "수원시 팔달구": "41115", "수원시 영통구": "41117",
-    "성남시 수정구": "41131", "성남시 중원구": "41133",
-    "성남시 분당구": "41135", "의정부시": "41150",
-    "안양시 만안구": "41170", "안양시 동안구": "41173",
-    "부천시": "41190", "광명시": "41210", "평택시": "41220",
-    "동두천시": "41250", "안산시 상록구": "41270",
-    "안산시 단원구": "41273", "고양시 덕양구": "41280",
-    "고양시 일산동구": "41281", "고양시 일산서구": "41285",
-    "과천시": "41290", "구리시": "41310", "남양주시": "41360",
-    "오산시": "41370", "시흥시": "41390", "군포시": "41410",
-    "의왕시": "41430", "하남시": "41450", "용인시 처인구": "41460",
-    "용인시 기흥구": "41461", "용인시 수지구": "41463",
-    "파주시": "41480", "이천시": "41500", "안성시": "41550",
-    "김포시": "41570", "화성시": "41590", "광주시": "41610",
-    "양주시": "41630", "포천시": "41650", "여주시": "41670",
-    "연천군": "41800", "가평군": "41820", "양평군": "41830",
-    # 인천
-    "인천 중구": "28110", "인천 동구": "28140", "인천 미추홀구": "28177",
-    "인천 연수구": "28185", "인천 남동구": "28200", "인천 부평구": "28237",
-    "인천 계양구": "28245", "인천 서구": "28260",
-    # 대전
-    "대전 동구": "30110", "대전 중구": "30140", "대전 서구": "30170",
-    "대전 유성구": "30200", "대전 대덕구": "30230",
-    # 세종
-    "세종시": "36110",
-    # 충청
-    "청주시 상당구": "43110", "청주시 서원구": "43111",
-    "청주시 흥덕구": "43112", "청주시 청원구": "43113",
-    "충주시": "43130", "제천시": "43150",
-    "천안시 동남구": "44130", "천안시 서북구": "44131",
-    "공주시": "44150", "보령시": "44180", "아산시": "44200", "서산시": "44210",
-    # 부산
-    "부산 중구": "26110", "부산 서구": "26140", "부산 동구": "26170",
-    "부산 영도구": "26200", "부산 부산진구": "26230", "부산 동래구": "26260",
-    "부산 남구": "26290", "부산 북구": "26320", "부산 해운대구": "26350",
-    "부산 사하구": "26380", "부산 금정구": "26410", "부산 강서구": "26440",
-    "부산 연제구": "26470", "부산 수영구": "26500", "부산 사상구": "26530",
-    # 대구
-    "대구 중구": "27110", "대구 동구": "27140", "대구 서구": "27170",
-    "대구 남구": "27200", "대구 북구": "27230", "대구 수성구": "27260",
-    "대구 달서구": "27290",
-    # 광주
-    "광주 동구": "29110", "광주 서구": "29140", "광주 남구": "29155",
-    "광주 북구": "29170", "광주 광산구": "29200",
-    # 울산
-    "울산 중구": "31110", "울산 남구": "31140", "울산 동구": "31170",
-    "울산 북구": "31200", "울산 울주군": "31710",
-    # 제주
-    "제주시": "50110", "서귀포시": "50130",
-    # 경기 (약식 구명 - complexes에 "수지구" 등으로 저장된 경우)
-    "수지구": "41463", "기흥구": "41461", "처인구": "41460",
-    "권선구": "41113", "장안구": "41111", "팔달구": "41115",
-    "영통구": "41117",
-    "일산동구": "41281", "일산서구": "41285", "덕양구": "41280",
-    "단원구": "41273", "상록구": "41270",
-    "수정구": "41131", "중원구": "41133", "분당구": "41135",
-    "만안구": "41170", "동안구": "41173",
-    # 충북 (약식 구명)
-    "서원구": "43111", "상당구": "43110", "흥덕구": "43112",
-    "청원구": "43113",
-    # 충남 (약식 구명)
-    "동남구": "44130", "서북구": "44131",
-}
-
-# 시도 약칭 매핑 (ambiguous 시군구명 해결용)
-SIDO_SHORT: Dict[str, str] = {
-    "서울특별시": "서울", "부산광역시": "부산", "대구광역시": "대구",
-    "인천광역시": "인천", "광주광역시": "광주", "대전광역시": "대전",
-    "울산광역시": "울산",
-}
-
 # ------------------------------------------------------------------ #
 # 행정동 → 법정동 매핑 (신도시 등 행정동≠법정동인 경우)
 # ------------------------------------------------------------------ #
@@ -530,7 +466,7 @@ ADMIN_TO_LEGAL_DONG: Dict[str, Dict[str, List[str]]] = {
 
 # ------------------------------------------------------------------ #
 # 신도시 행정동 → 법정동코드 직접 매핑
-# (bjdong_codes.json에 누락된 신규 법정동 코드)
+# (지역 코드 사전에 누락된 신규 법정동 코드)
 # ------------------------------------------------------------------ #
 NEWTOWN_BJDONG: Dict[str, Dict[str, str]] = {
     "41360": {  # 남양주시 - 다산신도시
@@ -558,32 +494,6 @@ NEWTOWN_BJDONG: Dict[str, Dict[str, str]] = {
 AMBIGUOUS_SIGUNGU = {"동구", "서구", "남구", "북구", "중구"}
 
 
-# ------------------------------------------------------------------ #
-# 법정동코드 JSON 로더
-# ------------------------------------------------------------------ #
-def load_bjdong_codes_json() -> Dict[str, Dict[str, str]]:
-    """
-    bjdong_codes.json 파일에서 법정동코드 매핑을 로드합니다.
-
-    Returns:
-        {"11680": {"역삼동": "10100", "대치동": "10600", ...}, ...}
-    """
-    json_path = Path(__file__).parent / "bjdong_codes.json"
-    if not json_path.exists():
-        print(f"  WARNING: {json_path} 파일이 없습니다.")
-        return {}
-
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    total_entries = sum(len(v) for v in data.values())
-    print(
-        f"  bjdong_codes.json 로드: "
-        f"{total_entries}건 ({len(data)}개 시군구)"
-    )
-    return data
-
-
 def parse_address_bun_ji(
     address: str,
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -644,6 +554,8 @@ class BuildingInfoCollector:
 
         # API 호출 캐시: (sigungu_cd, bjdong_cd) -> items
         self._api_cache: Dict[Tuple[str, str], List[Dict]] = {}
+        # 건물명 색인 캐시: (sigungu_cd, bjdong_cd) -> NameIndex (그룹 내 단지가 공유)
+        self._index_cache: Dict[Tuple[str, str], NameIndex] = {}
 
         # building_info 테이블 미존재 경고 플래그 (1회만 출력)
         self._building_info_warned: bool = False
@@ -691,21 +603,13 @@ class BuildingInfoCollector:
         emd_name = (complex_row.get("eupmyeondong") or "").strip()
         sido_name = (complex_row.get("sido") or "").strip()
 
-        # 1) regions 테이블 매핑에서 시군구코드 조회
-        sigungu_cd = sigungu_map.get(sigungu_name)
+        # 1) 지역 코드 사전 조회 (표기 변형 "안산시 단원구"/"단원구" 등,
+        #    "중구", "강서구"처럼 여러 시도에 있는 이름은 sido로 구별)
+        sigungu_cd = region_gazetteer.sigungu_code(sigungu_name, sido_name)
 
-        # 2) 없으면 fallback 딕셔너리에서 조회
+        # 2) 없으면 regions 테이블 매핑에서 조회
         if not sigungu_cd:
-            sigungu_cd = FALLBACK_SIGUNGU_CODES.get(sigungu_name)
-
-        # 3) sido-prefixed lookup으로 ambiguous 시군구 해결
-        #    "중구", "강서구" 등이 여러 시도에 존재 → sido로 구별
-        sido_short = SIDO_SHORT.get(sido_name, "")
-        if sido_short:
-            prefixed = f"{sido_short} {sigungu_name}"
-            resolved = FALLBACK_SIGUNGU_CODES.get(prefixed)
-            if resolved:
-                sigungu_cd = resolved
+            sigungu_cd = sigungu_map.get(sigungu_name)
 
         if not sigungu_cd:
             return None, None
@@ -744,7 +648,7 @@ class BuildingInfoCollector:
                             bjdong_cd = code
                             break
 
-        # 5) 신도시 직접 코드 매핑 (bjdong_codes.json에 없는 코드)
+        # 5) 신도시 직접 코드 매핑 (지역 코드 사전에 없는 코드)
         if bjdong_cd == "00000" and emd_name and sigungu_cd:
             newtown_map = NEWTOWN_BJDONG.get(sigungu_cd, {})
             newtown_code = newtown_map.get(emd_name)
@@ -802,16 +706,15 @@ class BuildingInfoCollector:
 
         all_items: List[Dict] = []
         page_no = 1
-        max_pages = 10  # 안전 장치
 
-        while page_no <= max_pages:
+        while page_no <= MAX_PAGES:
             time.sleep(REQUEST_DELAY)
 
             data = fetch_building_info(
                 sigungu_cd=sigungu_cd,
                 bjdong_cd=bjdong_cd,
                 page_no=page_no,
-                num_of_rows=100,
+                num_of_rows=ROWS_PER_PAGE,
             )
 
             if data is None:
@@ -834,6 +737,97 @@ class BuildingInfoCollector:
         self._api_cache[cache_key] = all_items
         return all_items
 
+    def match_in_group(
+        self, sigungu_cd: str, bjdong_cd: str, complex_name: str
+    ) -> Optional[Dict]:
+        """(sigungu_cd, bjdong_cd) 대장 항목에서 단지명 매칭 (건물명 색인 재사용)"""
+        items = self.get_building_items(sigungu_cd, bjdong_cd)
+        key = (sigungu_cd, bjdong_cd)
+        if key not in self._index_cache:
+            self._index_cache[key] = NameIndex(
+                [item.get("bldNm", "") or "" for item in items]
+            )
+        return find_matching_building(
+            items, complex_name, self._index_cache[key]
+        )
+
+    async def _fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        sigungu_cd: str,
+        bjdong_cd: str,
+        page_no: int,
+    ) -> Optional[Dict]:
+        """동시 요청 슬롯 1개를 잡고 페이지 1건 조회"""
+        async with semaphore:
+            await asyncio.sleep(REQUEST_DELAY)
+            return await fetch_building_info_async(
+                session, sigungu_cd, bjdong_cd, page_no
+            )
+
+    async def _fetch_all_pages(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        sigungu_cd: str,
+        bjdong_cd: str,
+    ) -> List[Dict]:
+        """첫 페이지의 totalCount로 나머지 페이지를 동시에 조회"""
+        data = await self._fetch_page(
+            session, semaphore, sigungu_cd, bjdong_cd, 1
+        )
+        if data is None:
+            return []
+        all_items = extract_items_from_response(data)
+        if not all_items:
+            return []
+
+        body = data.get("response", {}).get("body", {})
+        total_count = _safe_int(body.get("totalCount"))
+        n_pages = min(MAX_PAGES, math.ceil(total_count / ROWS_PER_PAGE))
+        pages = await asyncio.gather(*(
+            self._fetch_page(session, semaphore, sigungu_cd, bjdong_cd, p)
+            for p in range(2, n_pages + 1)
+        ))
+        # 순차 조회와 같이 첫 실패/빈 페이지에서 중단
+        for page in pages:
+            items = extract_items_from_response(page) if page else []
+            if not items:
+                break
+            all_items.extend(items)
+        return all_items
+
+    async def prefetch_building_items(
+        self,
+        keys: Iterable[Tuple[str, str]],
+        concurrency: int = CONCURRENCY,
+    ) -> int:
+        """
+        (sigungu_cd, bjdong_cd) 조합별 대장 항목을 동시에 조회해 캐시에 채웁니다.
+        이후 get_building_items는 API 호출 없이 캐시를 반환합니다.
+
+        Returns:
+            새로 조회한 조합 수
+        """
+        pending = [k for k in dict.fromkeys(keys) if k not in self._api_cache]
+        if not pending:
+            return 0
+
+        semaphore = asyncio.Semaphore(concurrency)
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *(self._fetch_all_pages(session, semaphore, *k) for k in pending),
+                return_exceptions=True,
+            )
+
+        for key, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                print(f"    조회 실패 {key[0]}/{key[1]}: {result}")
+                result = []
+            self._api_cache[key] = result
+        return len(pending)
+
     def _parse_use_approval_date(self, use_apr_day: Optional[str]) -> Optional[str]:
         """사용승인일 문자열(YYYYMMDD)을 ISO date 문자열로 변환"""
         if not use_apr_day or len(use_apr_day) < 8:
@@ -936,43 +930,78 @@ class BuildingInfoCollector:
                 return result.data[0].get("id")
             return None
         except Exception as e:
-            err_msg = str(e)
-            # building_info 테이블이 아직 없는 경우 (migration 020 미적용)
-            if "building_info" in err_msg and (
-                "does not exist" in err_msg
-                or "relation" in err_msg
-                or "404" in err_msg
-                or "Not Found" in err_msg
-            ):
-                if not self._building_info_warned:
-                    print(
-                        "    WARNING: building_info 테이블이 존재하지 않습니다. "
-                        "migration 020을 먼저 적용하세요. "
-                        "(complexes 업데이트만 진행합니다)"
-                    )
-                    self._building_info_warned = True
+            if self._warn_if_building_info_missing(e):
                 return None
             print(f"    building_info UPSERT 오류: {e}")
             return None
 
-    def update_complex(
+    def _warn_if_building_info_missing(self, error: Exception) -> bool:
+        """building_info 테이블이 아직 없는 오류인지 (migration 020 미적용, 경고 1회)"""
+        err_msg = str(error)
+        if "building_info" in err_msg and (
+            "does not exist" in err_msg
+            or "relation" in err_msg
+            or "404" in err_msg
+            or "Not Found" in err_msg
+        ):
+            if not self._building_info_warned:
+                print(
+                    "    WARNING: building_info 테이블이 존재하지 않습니다. "
+                    "migration 020을 먼저 적용하세요. "
+                    "(complexes 업데이트만 진행합니다)"
+                )
+                self._building_info_warned = True
+            return True
+        return False
+
+    @staticmethod
+    def _building_info_key(row: Dict[str, Any]) -> Tuple:
+        """building_info UPSERT 충돌 키"""
+        return tuple(row.get(col) for col in BUILDING_INFO_CONFLICT.split(","))
+
+    def bulk_upsert_building_info(
+        self,
+        rows: List[Dict[str, Any]],
+    ) -> Dict[Tuple, Optional[str]]:
+        """
+        building_info 일괄 UPSERT.
+
+        같은 건물에 여러 단지가 매칭되면 마지막 단지 행만 남깁니다
+        (순차 처리에서 마지막 UPSERT가 남는 것과 동일, 한 문장 내 중복 충돌 방지).
+
+        Returns:
+            {충돌 키: building_info.id}
+        """
+        deduped = {self._building_info_key(r): r for r in rows}
+        unique_rows = list(deduped.values())
+        ids: Dict[Tuple, Optional[str]] = {}
+
+        for start in range(0, len(unique_rows), UPSERT_BATCH_SIZE):
+            batch = unique_rows[start:start + UPSERT_BATCH_SIZE]
+            try:
+                result = (
+                    self.client.table("building_info")
+                    .upsert(batch, on_conflict=BUILDING_INFO_CONFLICT)
+                    .execute()
+                )
+                for saved in result.data or []:
+                    ids[self._building_info_key(saved)] = saved.get("id")
+            except Exception as e:
+                if self._warn_if_building_info_missing(e):
+                    return ids
+                print(f"    building_info 일괄 UPSERT 오류, 단건 재시도: {e}")
+                for row in batch:
+                    ids[self._building_info_key(row)] = self.insert_building_info(row)
+        return ids
+
+    def _complex_update_data(
         self,
-        complex_id: str,
         total_units: int,
         parking_ratio: Optional[float],
         matched: Dict[str, Any],
         building_info_id: Optional[str] = None,
-    ) -> bool:
-        """
-        complexes 테이블 업데이트 (확장 필드 포함)
-
-        Args:
-            complex_id: complexes.id
-            total_units: 세대수
-            parking_ratio: 주차대수비율
-            matched: API 응답 매칭 항목 (확장 필드 추출용)
-            building_info_id: building_info.id (FK 링크)
-        """
+    ) -> Dict[str, Any]:
+        """complexes 업데이트 필드 (기본 + 확장 필드)"""
         update_data: Dict[str, Any] = {"total_units": total_units}
 
         if parking_ratio is not None:
@@ -1023,6 +1052,30 @@ class BuildingInfoCollector:
         if building_info_id:
             update_data["building_info_id"] = building_info_id
 
+        return update_data
+
+    def update_complex(
+        self,
+        complex_id: str,
+        total_units: int,
+        parking_ratio: Optional[float],
+        matched: Dict[str, Any],
+        building_info_id: Optional[str] = None,
+    ) -> bool:
+        """
+        complexes 테이블 업데이트 (확장 필드 포함)
+
+        Args:
+            complex_id: complexes.id
+            total_units: 세대수
+            parking_ratio: 주차대수비율
+            matched: API 응답 매칭 항목 (확장 필드 추출용)
+            building_info_id: building_info.id (FK 링크)
+        """
+        update_data = self._complex_update_data(
+            total_units, parking_ratio, matched, building_info_id
+        )
+
         try:
             self.client.table("complexes").update(update_data).eq(
                 "id", complex_id
@@ -1053,25 +1106,28 @@ class BuildingInfoCollector:
             print(f"    DB 업데이트 오류: {e}")
             return False
 
-    def process_complex(
+    def match_complex(
         self,
         cx: Dict,
         sigungu_map: Dict[str, str],
         bjdong_map: Dict[str, Dict[str, str]],
-    ) -> bool:
+        codes: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        단일 단지에 대해 건축물대장 조회 + 매칭 + 업데이트를 수행합니다.
+        단일 단지의 코드 결정 + 건축물대장 조회(캐시) + 건물명 매칭.
+
+        Args:
+            codes: 미리 결정한 (sigungu_cd, bjdong_cd) (없으면 resolve_codes)
 
         Returns:
-            True if updated successfully, False otherwise
+            매칭 결과 dict (cx, sigungu_cd, bjdong_cd, matched,
+            total_units, parking_ratio) 또는 None (stats 반영)
         """
         cx_name = cx.get("name", "")
-        cx_id = cx["id"]
         sigungu = cx.get("sigungu", "")
-        emd = cx.get("eupmyeondong", "")
 
         # 1) 코드 결정
-        sigungu_cd, bjdong_cd = self.resolve_codes(
+        sigungu_cd, bjdong_cd = codes or self.resolve_codes(
             cx, sigungu_map, bjdong_map
         )
 
@@ -1081,15 +1137,17 @@ class BuildingInfoCollector:
                 f"시군구코드 매핑 실패: sigungu={sigungu}"
             )
             self.stats["no_code"] += 1
-            return False
+            return None
 
         # 2) API 호출 (캐시 활용)
-        items = self.get_building_items(sigungu_cd, bjdong_cd)
+        items_key = (sigungu_cd, bjdong_cd)
+        items = self.get_building_items(*items_key)
 
         if not items:
             # bjdong_cd가 00000이 아닌 경우 시군구 전체로 재시도
             if bjdong_cd != "00000":
-                items = self.get_building_items(sigungu_cd, "00000")
+                items_key = (sigungu_cd, "00000")
+                items = self.get_building_items(*items_key)
 
             if not items:
                 print(
@@ -1097,29 +1155,22 @@ class BuildingInfoCollector:
                     f"API 응답 없음: {sigungu_cd}/{bjdong_cd}"
                 )
                 self.stats["api_error"] += 1
-                return False
+                return None
 
         # 3) 건물명 매칭
-        matched = find_matching_building(items, cx_name)
+        matched = self.match_in_group(*items_key, cx_name)
 
         # 3b) 매칭 실패 시 행정동→법정동 대체 후보로 재시도
-        if matched is None and sigungu_cd in ADMIN_TO_LEGAL_DONG:
-            admin_map = ADMIN_TO_LEGAL_DONG[sigungu_cd]
-            alt_dongs = admin_map.get(emd, [])
-            emd_codes = bjdong_map.get(sigungu_cd, {})
-
-            for alt_dong in alt_dongs:
-                alt_code = emd_codes.get(alt_dong)
-                if alt_code and alt_code != bjdong_cd:
-                    alt_items = self.get_building_items(
-                        sigungu_cd, alt_code
+        if matched is None:
+            for alt_code in self._alternate_bjdong_codes(
+                cx, sigungu_cd, bjdong_cd, bjdong_map
+            ):
+                if self.get_building_items(sigungu_cd, alt_code):
+                    matched = self.match_in_group(
+                        sigungu_cd, alt_code, cx_name
                     )
-                    if alt_items:
-                        matched = find_matching_building(
-                            alt_items, cx_name
-                        )
-                        if matched:
-                            break
+                    if matched:
+                        break
 
         if not matched:
             print(
@@ -1128,13 +1179,12 @@ class BuildingInfoCollector:
                 f"sigungu={sigungu_cd}, bjdong={bjdong_cd}"
             )
             self.stats["not_found"] += 1
-            return False
+            return None
 
         # 4) 데이터 추출
         hhld_cnt = _safe_int(matched.get("hhldCnt"))
         tot_pkng = _safe_int(matched.get("totPkngCnt"))
         ho_cnt = _safe_int(matched.get("hoCnt"))
-        matched_bld_nm = matched.get("bldNm", "")
 
         # 세대수가 0이면 호수(hoCnt)로 대체
         total_units = hhld_cnt if hhld_cnt > 0 else ho_cnt
@@ -1142,67 +1192,250 @@ class BuildingInfoCollector:
         if total_units <= 0:
             print(
                 f"  SKIP [{cx_name}] "
-                f"세대수/호수 모두 0: bldNm={matched_bld_nm}"
+                f"세대수/호수 모두 0: bldNm={matched.get('bldNm', '')}"
             )
             self.stats["not_found"] += 1
-            return False
+            return None
 
         # 주차대수비율 계산 (주차대수 / 세대수)
         parking_ratio = None
         if tot_pkng > 0 and total_units > 0:
             parking_ratio = tot_pkng / total_units
 
-        # 5) building_info 테이블에 UPSERT (전체 API 응답 저장)
-        building_info_id = None
-        bi_row = self._extract_building_info_row(
-            matched, cx_id, sigungu_cd, bjdong_cd
-        )
-        building_info_id = self.insert_building_info(bi_row)
+        return {
+            "cx": cx,
+            "sigungu_cd": sigungu_cd,
+            "bjdong_cd": bjdong_cd,
+            "matched": matched,
+            "total_units": total_units,
+            "parking_ratio": parking_ratio,
+        }
 
-        # 6) complexes 테이블 업데이트 (확장 필드 포함)
-        success = self.update_complex(
-            cx_id, total_units, parking_ratio, matched, building_info_id
+    def _alternate_bjdong_codes(
+        self,
+        cx: Dict,
+        sigungu_cd: str,
+        bjdong_cd: str,
+        bjdong_map: Dict[str, Dict[str, str]],
+    ) -> List[str]:
+        """행정동→법정동 대체 후보 법정동코드 (ADMIN_TO_LEGAL_DONG)"""
+        alt_dongs = ADMIN_TO_LEGAL_DONG.get(sigungu_cd, {}).get(
+            cx.get("eupmyeondong", ""), []
+        )
+        emd_codes = bjdong_map.get(sigungu_cd, {})
+        codes = []
+        for alt_dong in alt_dongs:
+            alt_code = emd_codes.get(alt_dong)
+            if alt_code and alt_code != bjdong_cd:
+                codes.append(alt_code)
+        return codes
+
+    def _building_info_row(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        return self._extract_building_info_row(
+            plan["matched"], plan["cx"]["id"],
+            plan["sigungu_cd"], plan["bjdong_cd"],
         )
 
-        if success:
-            pr_str = (
-                f", parking_ratio={parking_ratio:.2f}"
-                if parking_ratio is not None
-                else ""
-            )
-            bi_str = (
-                f", building_info_id={building_info_id[:8]}..."
-                if building_info_id
-                else ""
+    def _report_updated(
+        self, plan: Dict[str, Any], building_info_id: Optional[str]
+    ):
+        """업데이트 성공 로그 + 통계"""
+        matched = plan["matched"]
+        parking_ratio = plan["parking_ratio"]
+        pr_str = (
+            f", parking_ratio={parking_ratio:.2f}"
+            if parking_ratio is not None
+            else ""
+        )
+        bi_str = (
+            f", building_info_id={building_info_id[:8]}..."
+            if building_info_id
+            else ""
+        )
+        extra_fields = []
+        if _safe_int(matched.get("grndFlrCnt")) > 0:
+            extra_fields.append(
+                f"floors={matched.get('grndFlrCnt')}"
             )
-            extra_fields = []
-            if _safe_int(matched.get("grndFlrCnt")) > 0:
-                extra_fields.append(
-                    f"floors={matched.get('grndFlrCnt')}"
-                )
-            if _safe_int(matched.get("totDongTotCnt")) > 0:
-                extra_fields.append(
-                    f"dongs={matched.get('totDongTotCnt')}"
-                )
-            if _safe_float(matched.get("vlRat")):
-                extra_fields.append(
-                    f"FAR={matched.get('vlRat')}"
-                )
-            extra_str = (
-                f" [{', '.join(extra_fields)}]" if extra_fields else ""
+        if _safe_int(matched.get("totDongTotCnt")) > 0:
+            extra_fields.append(
+                f"dongs={matched.get('totDongTotCnt')}"
             )
-            print(
-                f"  OK   [{cx_name}] "
-                f"total_units={total_units}{pr_str}{bi_str}{extra_str} "
-                f"(matched: {matched_bld_nm})"
+        if _safe_float(matched.get("vlRat")):
+            extra_fields.append(
+                f"FAR={matched.get('vlRat')}"
             )
-            self.stats["updated"] += 1
+        extra_str = (
+            f" [{', '.join(extra_fields)}]" if extra_fields else ""
+        )
+        print(
+            f"  OK   [{plan['cx'].get('name', '')}] "
+            f"total_units={plan['total_units']}{pr_str}{bi_str}{extra_str} "
+            f"(matched: {matched.get('bldNm', '')})"
+        )
+        self.stats["updated"] += 1
+
+    def process_complex(
+        self,
+        cx: Dict,
+        sigungu_map: Dict[str, str],
+        bjdong_map: Dict[str, Dict[str, str]],
+    ) -> bool:
+        """
+        단일 단지에 대해 건축물대장 조회 + 매칭 + 업데이트를 수행합니다.
+
+        Returns:
+            True if updated successfully, False otherwise
+        """
+        plan = self.match_complex(cx, sigungu_map, bjdong_map)
+        if plan is None:
+            return False
+
+        # building_info 테이블에 UPSERT (전체 API 응답 저장)
+        building_info_id = self.insert_building_info(
+            self._building_info_row(plan)
+        )
+
+        # complexes 테이블 업데이트 (확장 필드 포함)
+        success = self.update_complex(
+            cx["id"], plan["total_units"], plan["parking_ratio"],
+            plan["matched"], building_info_id,
+        )
+
+        if success:
+            self._report_updated(plan, building_info_id)
             return True
         else:
             self.stats["api_error"] += 1
             return False
 
-    def run(self):
+    def bulk_update_complexes(
+        self,
+        plans: List[Dict[str, Any]],
+        building_info_ids: Dict[Tuple, Optional[str]],
+    ) -> Set[str]:
+        """
+        complexes 일괄 UPSERT (on_conflict=id).
+
+        - INSERT 제약(NOT NULL)을 위해 조회한 기존 name/address/sido/sigungu를 함께 전송
+        - 확장 필드 유무가 단지마다 다르므로 컬럼 구성이 같은 행끼리 묶어 전송
+          (누락 컬럼이 NULL/기본값으로 덮어써지지 않도록)
+        - 일괄 실패 시 단건 update_complex로 재시도 (확장 컬럼 미존재 fallback 포함)
+
+        Returns:
+            업데이트 성공한 complexes.id 집합
+        """
+        groups: Dict[Tuple[str, ...], List[Tuple[Dict, Dict]]] = {}
+        for plan in plans:
+            cx = plan["cx"]
+            bi_id = building_info_ids.get(
+                self._building_info_key(self._building_info_row(plan))
+            )
+            row = {
+                "id": cx["id"],
+                **{col: cx.get(col) for col in COMPLEX_REQUIRED_COLUMNS},
+                **self._complex_update_data(
+                    plan["total_units"], plan["parking_ratio"],
+                    plan["matched"], bi_id,
+                ),
+            }
+            groups.setdefault(tuple(sorted(row)), []).append((row, plan))
+
+        updated: Set[str] = set()
+        for members in groups.values():
+            for start in range(0, len(members), UPSERT_BATCH_SIZE):
+                batch = members[start:start + UPSERT_BATCH_SIZE]
+                try:
+                    self.client.table("complexes").upsert(
+                        [row for row, _ in batch], on_conflict="id"
+                    ).execute()
+                    updated.update(row["id"] for row, _ in batch)
+                except Exception as e:
+                    print(f"    complexes 일괄 UPSERT 오류, 단건 재시도: {e}")
+                    for row, plan in batch:
+                        if self.update_complex(
+                            row["id"], plan["total_units"],
+                            plan["parking_ratio"], plan["matched"],
+                            row.get("building_info_id"),
+                        ):
+                            updated.add(row["id"])
+        return updated
+
+    def process_concurrent(
+        self,
+        complexes: List[Dict],
+        sigungu_map: Dict[str, str],
+        bjdong_map: Dict[str, Dict[str, str]],
+        concurrency: int = CONCURRENCY,
+    ):
+        """
+        (시군구, 법정동) 그룹 단위 동시 수집 → 메모리 매칭 → 일괄 UPSERT.
+        매칭 규칙은 process_complex와 같고, 조회만 미리 동시에 캐시에 채웁니다.
+        """
+        start = time.time()
+
+        # 1) 코드 결정 + 그룹화
+        codes = {
+            cx["id"]: self.resolve_codes(cx, sigungu_map, bjdong_map)
+            for cx in complexes
+        }
+        keys = {c for c in codes.values() if c[0]}
+        print(f"  (시군구, 법정동) 그룹: {len(keys)}개")
+
+        # 2) 그룹별 대장 1회 조회 → 빈 그룹은 시군구 전체(00000)
+        fetched = asyncio.run(self.prefetch_building_items(keys, concurrency))
+        fallback = [
+            (sg, "00000") for sg, bj in keys
+            if bj != "00000" and not self._api_cache[(sg, bj)]
+        ]
+        fetched += asyncio.run(
+            self.prefetch_building_items(fallback, concurrency)
+        )
+
+        # 3) 행정동→법정동 대체 후보 (해당 시군구 단지만)
+        alternates = [
+            (codes[cx["id"]][0], alt)
+            for cx in complexes
+            if codes[cx["id"]][0] in ADMIN_TO_LEGAL_DONG
+            for alt in self._alternate_bjdong_codes(
+                cx, *codes[cx["id"]], bjdong_map
+            )
+        ]
+        fetched += asyncio.run(
+            self.prefetch_building_items(alternates, concurrency)
+        )
+        print(
+            f"  대장 조회 {fetched}개 조합 완료 "
+            f"({time.time() - start:.1f}초, 동시 {concurrency})"
+        )
+
+        # 4) 메모리 매칭 (캐시만 사용)
+        plans = []
+        for cx in complexes:
+            plan = self.match_complex(
+                cx, sigungu_map, bjdong_map, codes[cx["id"]]
+            )
+            if plan is not None:
+                plans.append(plan)
+
+        # 5) 일괄 UPSERT
+        bi_ids = self.bulk_upsert_building_info(
+            [self._building_info_row(plan) for plan in plans]
+        )
+        updated = self.bulk_update_complexes(plans, bi_ids)
+        for plan in plans:
+            if plan["cx"]["id"] in updated:
+                self._report_updated(
+                    plan,
+                    bi_ids.get(self._building_info_key(
+                        self._building_info_row(plan)
+                    )),
+                )
+            else:
+                self.stats["api_error"] += 1
+        print(f"  일괄 처리 완료 ({time.time() - start:.1f}초)")
+
+    def run(self, concurrency: int = CONCURRENCY, sequential: bool = False):
         """메인 실행"""
         print("=" * 70)
         print("건축물대장 건물 정보 수집 스크립트")
@@ -1214,35 +1447,20 @@ class BuildingInfoCollector:
         print("\n[1/5] regions 테이블에서 코드 매핑 구축...")
         sigungu_map, bjdong_map = build_code_mappings(self.client)
 
-        # fallback 코드 병합
-        merged_sigungu_count = 0
-        for name, code in FALLBACK_SIGUNGU_CODES.items():
-            if name not in sigungu_map:
-                sigungu_map[name] = code
-                merged_sigungu_count += 1
-        if merged_sigungu_count > 0:
-            print(
-                f"  fallback 시군구 코드 {merged_sigungu_count}건 추가 "
-                f"(총 {len(sigungu_map)}건)"
-            )
-
-        # 2) 법정동코드 JSON 보강
-        print("\n[2/5] 법정동코드 JSON 파일에서 보강...")
-        json_bjdong = load_bjdong_codes_json()
-        if json_bjdong:
-            merged_count = 0
-            for sg_cd, dong_map in json_bjdong.items():
-                if sg_cd not in bjdong_map:
-                    bjdong_map[sg_cd] = {}
-                for dong_name, bjdong_cd in dong_map.items():
-                    if dong_name not in bjdong_map[sg_cd]:
-                        bjdong_map[sg_cd][dong_name] = bjdong_cd
-                        merged_count += 1
-            print(
-                f"  법정동코드 {merged_count}건 보강 완료 "
-                f"(총 {sum(len(v) for v in bjdong_map.values())}건, "
-                f"{len(bjdong_map)}개 시군구)"
-            )
+        # 2) 지역 코드 사전의 법정동코드로 보강
+        print("\n[2/5] 지역 코드 사전에서 법정동코드 보강...")
+        merged_count = 0
+        for sg_cd, dong_map in region_gazetteer.bjdong_codes().items():
+            target = bjdong_map.setdefault(sg_cd, {})
+            for dong_name, bjdong_cd in dong_map.items():
+                if dong_name not in target:
+                    target[dong_name] = bjdong_cd
+                    merged_count += 1
+        print(
+            f"  법정동코드 {merged_count}건 보강 완료 "
+            f"(총 {sum(len(v) for v in bjdong_map.values())}건, "
+            f"{len(bjdong_map)}개 시군구)"
+        )
 
         # 3) NULL total_units 단지 조회
         print("\n[3/5] total_units가 NULL인 complexes 조회...")
@@ -1258,19 +1476,21 @@ class BuildingInfoCollector:
         print(f"\n[4/5] 건축물대장 API 조회 및 매칭 ({len(complexes)}건)...")
         print("-" * 70)
 
-        for idx, cx in enumerate(complexes, 1):
-            cx_name = cx.get("name", "")
-            sigungu = cx.get("sigungu", "")
-
-            # 진행률 표시
-            if idx % 50 == 0 or idx == 1:
-                pct = idx / len(complexes) * 100
-                print(
-                    f"\n--- 진행: {idx}/{len(complexes)} "
-                    f"({pct:.1f}%) ---"
-                )
+        if sequential:
+            for idx, cx in enumerate(complexes, 1):
+                # 진행률 표시
+                if idx % 50 == 0 or idx == 1:
+                    pct = idx / len(complexes) * 100
+                    print(
+                        f"\n--- 진행: {idx}/{len(complexes)} "
+                        f"({pct:.1f}%) ---"
+                    )
 
-            self.process_complex(cx, sigungu_map, bjdong_map)
+                self.process_complex(cx, sigungu_map, bjdong_map)
+        else:
+            self.process_concurrent(
+                complexes, sigungu_map, bjdong_map, concurrency
+            )
 
         # 5) 결과 요약
         print("\n" + "=" * 70)
@@ -1295,5 +1515,16 @@ class BuildingInfoCollector:
 # 엔트리 포인트
 # ------------------------------------------------------------------ #
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="건축물대장 건물 정보 수집")
+    parser.add_argument(
+        "--concurrency", type=int, default=CONCURRENCY,
+        help=f"동시 API 요청 수 (기본 {CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--sequential", action="store_true",
+        help="단지별 순차 처리 (기존 방식)",
+    )
+    args = parser.parse_args()
+
     collector = BuildingInfoCollector()
-    collector.run()
+    collector.run(concurrency=args.concurrency, sequential=args.sequential)
@@ -33,11 +33,13 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 import time
-import math
 
 import pandas as pd
 import numpy as np
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.geo import GeoIndex, haversine_m, optional_index
+
 # requests 확인
 try:
     import requests
@@ -88,18 +90,7 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         거리 (미터)
     """
-    R = 6371000  # 지구 반지름 (미터)
-    
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lon2 - lon1)
-    
-    a = math.sin(delta_phi / 2) ** 2 + \
-        math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    return R * c
+    return float(haversine_m(lat1, lon1, lat2, lon2))
 
 
 class FootfallDataCollector:
@@ -125,6 +116,8 @@ class FootfallDataCollector:
         # POI 데이터 캐시
         self._subway_stations_cache: Optional[pd.DataFrame] = None
         self._poi_cache: Dict[str, pd.DataFrame] = {}
+        # 좌표 색인 캐시 (시설 종류별 1회 구축, 데이터 없으면 None)
+        self._geo_index_cache: Dict[str, Optional[GeoIndex]] = {}
 
     def get_stores_by_region(
         self,
@@ -298,60 +291,11 @@ class FootfallDataCollector:
         Returns:
             교통 접근성 지표 딕셔너리
         """
-        if subway_df is None:
-            subway_df = self.load_subway_stations()
-        
-        if subway_df.empty:
-            return {
-                "distance_to_subway": None,
-                "subway_count_500m": 0,
-                "subway_count_1km": 0,
-                "transit_score": 0.0,
-            }
-        
-        # 각 지하철역까지의 거리 계산
-        distances = []
-        for _, station in subway_df.iterrows():
-            dist = haversine_distance(
-                center_lat, center_lon,
-                station["위도"], station["경도"]
-            )
-            distances.append(dist)
-        
-        if not distances:
-            return {
-                "distance_to_subway": None,
-                "subway_count_500m": 0,
-                "subway_count_1km": 0,
-                "transit_score": 0.0,
-            }
-        
-        # 가장 가까운 역까지 거리
-        min_distance = min(distances)
-        
-        # 반경 내 역 개수
-        count_500m = sum(1 for d in distances if d <= 500)
-        count_1km = sum(1 for d in distances if d <= 1000)
-        
-        # 교통 접근성 점수 (0-100)
-        # 500m 이내: 만점, 1km 이내: 절반, 그 이상: 거리 비례 감소
-        if min_distance <= 500:
-            transit_score = 100.0
-        elif min_distance <= 1000:
-            transit_score = 50.0 + (1000 - min_distance) / 10
-        else:
-            transit_score = max(0, 50.0 - (min_distance - 1000) / 50)
-        
-        # 반경 내 역 개수 보너스 (최대 20점)
-        count_bonus = min(20, count_500m * 5 + count_1km * 2)
-        transit_score = min(100, transit_score + count_bonus)
-        
-        return {
-            "distance_to_subway": round(min_distance, 1),
-            "subway_count_500m": count_500m,
-            "subway_count_1km": count_1km,
-            "transit_score": round(transit_score, 2),
-        }
+        features = self.calculate_geo_features(
+            [center_lat], [center_lon],
+            include_transit=True, include_poi=False, subway_df=subway_df
+        )
+        return self._feature_row(features)
 
     def load_poi_data(
         self,
@@ -456,63 +400,145 @@ class FootfallDataCollector:
         Returns:
             POI 밀도 지표 딕셔너리
         """
-        result = {
-            "school_count_500m": 0,
-            "school_count_1km": 0,
-            "hospital_count_500m": 0,
-            "hospital_count_1km": 0,
-            "park_count_500m": 0,
-            "park_count_1km": 0,
-            "poi_score": 0.0,
-        }
-        
-        # 각 POI 타입별로 계산
-        poi_types = ["school", "hospital", "park"]
+        features = self.calculate_geo_features(
+            [center_lat], [center_lon], include_transit=False, include_poi=True
+        )
+        return self._feature_row(features)
+
+    def _geo_index(self, kind: str) -> Optional[GeoIndex]:
+        """
+        시설 좌표 색인 (데이터셋당 1회 구축)
         
-        for poi_type in poi_types:
-            poi_df = self.load_poi_data(poi_type)
-            
-            if poi_df.empty:
-                continue
-            
-            # 각 시설까지의 거리 계산
-            distances = []
-            for _, poi in poi_df.iterrows():
-                try:
-                    dist = haversine_distance(
-                        center_lat, center_lon,
-                        poi["latitude"], poi["longitude"]
-                    )
-                    distances.append(dist)
-                except (KeyError, ValueError):
-                    continue
-            
-            if not distances:
-                continue
-            
-            # 반경 내 개수 집계
-            count_500m = sum(1 for d in distances if d <= 500)
-            count_1km = sum(1 for d in distances if d <= 1000)
-            
-            # 결과 저장
-            if poi_type == "school":
-                result["school_count_500m"] = count_500m
-                result["school_count_1km"] = count_1km
-            elif poi_type == "hospital":
-                result["hospital_count_500m"] = count_500m
-                result["hospital_count_1km"] = count_1km
-            elif poi_type == "park":
-                result["park_count_500m"] = count_500m
-                result["park_count_1km"] = count_1km
+        Args:
+            kind: 'subway', 'school', 'hospital', 'park'
+        """
+        if kind not in self._geo_index_cache:
+            if kind == "subway":
+                index = optional_index(self.load_subway_stations(), "위도", "경도")
+            else:
+                index = optional_index(self.load_poi_data(kind), "latitude", "longitude")
+            self._geo_index_cache[kind] = index
+        return self._geo_index_cache[kind]
+
+    def calculate_geo_features(
+        self,
+        lat,
+        lon,
+        include_transit: bool = True,
+        include_poi: bool = True,
+        subway_df: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """
+        여러 중심점의 교통 접근성 / POI 밀도 지표를 한 번에 계산
         
-        # POI 종합 점수 계산 (0-100)
-        # 학교: 최대 40점, 병원: 최대 30점, 공원: 최대 30점
-        school_score = min(40, result["school_count_1km"] * 4)
-        hospital_score = min(30, result["hospital_count_1km"] * 3)
-        park_score = min(30, result["park_count_500m"] * 6)  # 공원은 500m 기준
+        시설 데이터는 종류별 BallTree로 한 번만 색인하고,
+        모든 중심점의 최근접 거리와 500m/1km 개수를 배치 질의합니다.
         
-        result["poi_score"] = round(min(100, school_score + hospital_score + park_score), 2)
+        Args:
+            lat, lon: 중심 위도/경도 배열
+            include_transit: 교통 접근성 포함
+            include_poi: POI 밀도 포함
+            subway_df: 지하철역 데이터 (없으면 자동 로드)
         
+        Returns:
+            중심점당 1행 DataFrame
+            (distance_to_subway, subway_count_500m, subway_count_1km, transit_score,
+             {school,hospital,park}_count_{500m,1km}, poi_score)
+        """
+        lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+        lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+        features = pd.DataFrame(index=range(len(lat)))
+
+        if include_transit:
+            index = self._geo_index("subway") if subway_df is None \
+                else optional_index(subway_df, "위도", "경도")
+            if index is None or not len(index):
+                features["distance_to_subway"] = np.nan
+                features["subway_count_500m"] = 0
+                features["subway_count_1km"] = 0
+                features["transit_score"] = 0.0
+            else:
+                found = index.query(lat, lon)
+                distance = found["nearest"]
+                count_500m, count_1km = found["count_500m"], found["count_1km"]
+
+                # 교통 접근성 점수 (0-100)
+                # 500m 이내: 만점, 1km 이내: 절반, 그 이상: 거리 비례 감소
+                transit_score = np.where(
+                    distance <= 500, 100.0,
+                    np.where(distance <= 1000, 50.0 + (1000 - distance) / 10,
+                             np.maximum(0, 50.0 - (distance - 1000) / 50))
+                )
+                # 반경 내 역 개수 보너스 (최대 20점)
+                count_bonus = np.minimum(20, count_500m * 5 + count_1km * 2)
+
+                features["distance_to_subway"] = np.round(distance, 1)
+                features["subway_count_500m"] = count_500m
+                features["subway_count_1km"] = count_1km
+                features["transit_score"] = np.round(np.minimum(100, transit_score + count_bonus), 2)
+
+        if include_poi:
+            for poi_type in ["school", "hospital", "park"]:
+                index = self._geo_index(poi_type)
+                for radius, label in [(500, "500m"), (1000, "1km")]:
+                    features[f"{poi_type}_count_{label}"] = (
+                        index.count_within(lat, lon, radius) if index is not None else 0
+                    )
+
+            # POI 종합 점수 계산 (0-100)
+            # 학교: 최대 40점, 병원: 최대 30점, 공원: 최대 30점
+            school_score = np.minimum(40, features["school_count_1km"] * 4)
+            hospital_score = np.minimum(30, features["hospital_count_1km"] * 3)
+            park_score = np.minimum(30, features["park_count_500m"] * 6)  # 공원은 500m 기준
+            features["poi_score"] = np.round(
+                np.minimum(100, school_score + hospital_score + park_score), 2
+            ).astype(float)
+
+        return features
+
+    @staticmethod
+    def _feature_row(features: pd.DataFrame) -> Dict:
+        """배치 결과 1행 → 지표 딕셔너리 (NaN 거리는 None)"""
+        row = {}
+        for col, value in features.iloc[0].items():
+            if col.startswith("distance_"):
+                row[col] = None if pd.isna(value) else float(value)
+            elif "_count_" in col:
+                row[col] = int(value)
+            else:
+                row[col] = float(value)
+        return row
+
+    def add_geo_features(
+        self,
+        df: pd.DataFrame,
+        include_transit: bool = False,
+        include_poi: bool = False
+    ) -> pd.DataFrame:
+        """
+        지역 결과(avg_latitude/avg_longitude)에 교통/POI 지표를 배치로 추가하고
+        유동인구 점수를 다시 계산합니다.
+        """
+        if df.empty or not (include_transit or include_poi):
+            return df
+
+        has_center = df["avg_latitude"].notna() & df["avg_longitude"].notna()
+        features = self.calculate_geo_features(
+            df.loc[has_center, "avg_latitude"], df.loc[has_center, "avg_longitude"],
+            include_transit=include_transit, include_poi=include_poi
+        )
+        features.index = df.index[has_center]
+
+        result = df.copy()
+        for col in features.columns:
+            result[col] = features[col]
+            if "_count_" in col:
+                result[col] = result[col].fillna(0).astype(int)
+            elif col != "distance_to_subway":
+                result[col] = result[col].fillna(0.0)
+        result["footfall_score"] = [
+            self.estimate_footfall_score(row) for row in result.to_dict("records")
+        ]
         return result
 
     def calculate_footfall_indicators(
@@ -787,12 +813,11 @@ class FootfallDataCollector:
         for i, sigungu in enumerate(seoul_gu_list, 1):
             print(f"\n[{i}/{len(seoul_gu_list)}] {sigungu} 처리 중...")
             
+            # 교통/POI 지표는 전체 구 중심점을 모아 한 번에 계산 (아래 add_geo_features)
             result_df = self.collect_region_data(
                 sido="서울특별시",
                 sigungu=sigungu,
-                save_csv=False,
-                include_transit=include_transit,
-                include_poi=include_poi
+                save_csv=False
             )
 
             if not result_df.empty:
@@ -807,6 +832,9 @@ class FootfallDataCollector:
             return pd.DataFrame()
 
         combined_df = pd.concat(all_results, ignore_index=True)
+        combined_df = self.add_geo_features(
+            combined_df, include_transit=include_transit, include_poi=include_poi
+        )
 
         # CSV 저장
         if save_csv:
@@ -19,6 +19,9 @@ from supabase import create_client, Client
 
 load_dotenv()
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.region_gazetteer import region_gazetteer
+
 
 # ==========================================================================
 # 전국 시군구 좌표 (중심점)
@@ -224,7 +227,10 @@ def resolve_region_key(sido: Optional[str], sigungu: str) -> str:
     """sido + sigungu → poi_data region key 변환
 
     sido가 None이면 sigungu 그대로 반환 (서울 default)
+    sido는 약칭/코드도 허용 ("부산", "26" → "부산광역시")
     """
+    if sido:
+        sido = region_gazetteer.name(region_gazetteer.sido_code(sido), sido)
     if sido and sido in SIDO_SIGUNGU_TO_KEY:
         mapped = SIDO_SIGUNGU_TO_KEY[sido].get(sigungu)
         if mapped:
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+수집 Parquet 데이터셋 정리 스크립트
+
+data/collected (region_code/year_month 파티션)을 정리합니다.
+- 여러 파일로 나뉜 파티션 병합 + 유니크 키 기준 중복 제거
+- --import-csv: 구버전 data/latest_collected.csv를 데이터셋으로 이관
+
+사용법:
+    python -m scripts.compact_collected_data
+    python -m scripts.compact_collected_data --import-csv data/latest_collected.csv
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.collected_dataset import collected_dataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 Parquet 데이터셋 정리")
+    parser.add_argument("--import-csv", type=str, default=None, help="이관할 구버전 수집 CSV 경로")
+    parser.add_argument("--full", action="store_true", help="모든 파티션 중복 재검사")
+    args = parser.parse_args()
+
+    if args.import_csv:
+        csv_path = Path(args.import_csv)
+        if not csv_path.exists():
+            print(f"CSV 파일 없음: {csv_path}")
+            sys.exit(1)
+        added = collected_dataset.import_csv(csv_path)
+        print(f"CSV 이관 완료: 신규 {added:,}건 ({csv_path})")
+
+    stats = collected_dataset.compact(full=args.full)
+    print(f"파티션 {stats['partitions']}개 검사, {stats['compacted']}개 정리, "
+          f"중복 {stats['rows_removed']:,}건 제거")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ transactions 테이블에서 complexes 자동 생성 + 매핑
 
 1. 정상 transactions (apt_name IS NOT NULL)에서 유니크 아파트 추출
 2. 기존 complexes와 비교하여 신규만 생성
+   (표기만 다른 이름은 같은 시군구+동에서 정규화 후 완전 일치하면 기존 단지로 연결)
 3. transactions.complex_id 역매핑
 """
 
@@ -11,6 +12,7 @@ import os
 import sys
 import time
 from collections import defaultdict
+from pathlib import Path
 from typing import Dict, List, Tuple
 
 from dotenv import load_dotenv
@@ -18,6 +20,9 @@ load_dotenv()
 
 from supabase import create_client
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.name_matcher import NameIndex
+
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_KEY", "")
 
@@ -123,22 +128,56 @@ def extract_unique_apartments(txns: List[Dict]) -> Dict[Tuple[str, str], Dict]:
     return apt_map
 
 
-def create_new_complexes(sb, apt_map, existing_map) -> Dict[Tuple[str, str], str]:
-    """신규 complexes 생성, 기존 것은 ID만 수집"""
+def reconcile_with_existing(apt_map, existing_map) -> Dict[Tuple[str, str], str]:
+    """
+    (name, sigungu) 키가 없는 아파트를 기존 complexes와 이름 색인으로 대조.
+    같은 (시군구, 동) 블록에서 정규화 이름(strict, 접미사 제거 없음)이 같은 기존 단지가 1개면 연결합니다.
+    ("래미안 아파트" ↔ "래미안아파트" 등. "한양맨션" ↔ "한양아파트"는 다른 단지로 봄)
+
+    Returns:
+        {아파트 키: 기존 complexes.id}
+    """
+    existing = list(existing_map.values())
+    pending = [key for key in apt_map if key not in existing_map]
+    if not existing or not pending:
+        return {}
+
+    index = NameIndex(
+        [cx["name"] for cx in existing],
+        [(cx.get("sigungu") or "", cx.get("eupmyeondong") or "") for cx in existing],
+    )
+    results = index.match_many(
+        [name for name, _ in pending],
+        [(sigungu, apt_map[(name, sigungu)]["dong"] or "") for name, sigungu in pending],
+        tiers=("strict",),
+    )
+
+    aliases = {}
+    for key, matches in zip(pending, results):
+        ids = {existing[pos]["id"] for pos, _, _ in matches}
+        if len(ids) == 1:  # 후보가 여럿이면 모호 → 신규 생성
+            aliases[key] = ids.pop()
+    return aliases
+
+
+def create_new_complexes(sb, apt_map, existing_map, aliases=None) -> Dict[Tuple[str, str], str]:
+    """신규 complexes 생성, 기존 것은 ID만 수집 (aliases: 이름 색인으로 연결된 기존 단지)"""
     key_to_id = {}
+    aliases = aliases or {}
 
     # 기존 complexes ID 수집
     for key, cx in existing_map.items():
         key_to_id[key] = cx["id"]
+    key_to_id.update(aliases)
 
     # 신규 생성 대상 필터
     new_apts = []
     for key, info in apt_map.items():
-        if key in existing_map:
+        if key in existing_map or key in aliases:
             continue
         new_apts.append((key, info))
 
-    print(f"  기존 complexes 매칭: {len(key_to_id)}건")
+    print(f"  기존 complexes 매칭: {len(key_to_id)}건 (이름 색인 연결 {len(aliases)}건)")
     print(f"  신규 생성 대상: {len(new_apts)}건")
 
     # 배치 생성
@@ -256,7 +295,8 @@ def main():
     existing_map = fetch_existing_complexes(sb)
     print(f"  기존 complexes: {len(existing_map)}건")
 
-    key_to_id = create_new_complexes(sb, apt_map, existing_map)
+    aliases = reconcile_with_existing(apt_map, existing_map)
+    key_to_id = create_new_complexes(sb, apt_map, existing_map, aliases)
 
     # 4. Transactions 매핑
     print("\n[4/4] Transactions ↔ Complexes 매핑...")
@@ -0,0 +1,204 @@
+"""
+TimeSeriesSplit 병렬 교차 검증 (XGBoostTrainer / BusinessSuccessTrainer 공용)
+
+- 데이터는 1회만 float32 배열로 변환, bin 경계는 fold별 학습 구간으로만 계산
+  (검증 구간 값이 bin 경계에 섞이지 않도록, 검증 행렬은 학습 행렬의 경계를 참조)
+- fold는 스레드로 동시 학습 (xgboost 학습 중 GIL 해제), fold당 코어 예산 = CPU / 동시 fold 수
+- 큰 fold부터 시작 → 전체 시간 ≈ 가장 큰 fold 학습 시간
+- fold 완료 시마다 실행 파일(logs/cv_runs/<모델>.json)에 진행 상황 기록 (progress_path)
+  서빙 중인 모델의 메트릭 JSON은 학습이 끝난 뒤 write_json_atomic으로만 교체
+- fold 점수가 max_score(MAPE 예산)를 넘으면 대기 fold 취소 + 학습 중인 fold 중단
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+from sklearn.model_selection import TimeSeriesSplit
+
+DEFAULT_MAX_BIN = 256
+CV_RUNS_DIR = Path(__file__).parent.parent / "logs" / "cv_runs"
+
+
+@dataclass
+class FoldResult:
+    """fold별 결과"""
+    fold: int
+    train_size: int
+    val_size: int
+    status: str  # completed / aborted
+    score: Optional[float] = None
+    best_iteration: Optional[int] = None
+    seconds: float = 0.0
+
+
+def mape_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """MAPE (%)"""
+    mask = y_true != 0
+    return float(np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask])) * 100)
+
+
+def accuracy_score(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    """이진 분류 정확도 (y_pred는 양성 확률)"""
+    return float(np.mean((y_pred > 0.5).astype(y_true.dtype) == y_true))
+
+
+class _AbortCallback(xgb.callback.TrainingCallback):
+    """중단 이벤트 발생 시 부스팅 종료"""
+
+    def __init__(self, event: threading.Event):
+        super().__init__()
+        self.event = event
+
+    def after_iteration(self, model, epoch, evals_log) -> bool:
+        return self.event.is_set()
+
+
+def _native_params(estimator) -> tuple:
+    """sklearn 래퍼 파라미터 → (xgb.train 파라미터, 부스팅 라운드, early stopping 라운드)"""
+    params = {k: v for k, v in estimator.get_xgb_params().items() if v is not None}
+    params.pop("n_jobs", None)
+    if "random_state" in params:
+        params["seed"] = params.pop("random_state")
+    params.setdefault("tree_method", "hist")
+    params.setdefault("max_bin", DEFAULT_MAX_BIN)
+    return params, estimator.get_num_boosting_rounds(), estimator.early_stopping_rounds
+
+
+def cv_progress_path(model_name: str) -> Path:
+    """교차 검증 진행 상황 파일 (예: logs/cv_runs/apartment_model.json)"""
+    return CV_RUNS_DIR / f"{model_name}.json"
+
+
+def write_json_atomic(path: Path, data: dict):
+    """JSON 저장 (임시 파일 → replace, 중간에 실패해도 기존 파일 유지)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    tmp_path.replace(path)
+
+
+def run_time_series_cv(
+    estimator,
+    X: pd.DataFrame,
+    y: pd.Series,
+    n_splits: int = 5,
+    score_fn: Callable[[np.ndarray, np.ndarray], float] = mape_score,
+    score_name: str = "MAPE",
+    max_score: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+    progress_path: Optional[Path] = None,
+) -> dict:
+    """
+    TimeSeriesSplit 교차 검증 (fold 병렬)
+
+    Args:
+        estimator: 파라미터를 가져올 XGBRegressor / XGBClassifier (학습 여부 무관)
+        score_fn: (y_true, y_pred) → 점수 (y_pred는 회귀값 또는 양성 확률)
+        max_score: fold 점수가 이 값을 넘으면 나머지 fold 중단 (오차 지표용 예산)
+        n_jobs: 사용할 코어 수 (기본: 전체)
+        progress_path: fold 완료 시마다 진행 상황을 기록할 실행 파일 (cv_progress_path,
+            서빙 모델의 메트릭 JSON이 아닌 별도 파일)
+
+    Returns:
+        {"scores", "folds", "aborted", "seconds"} (scores는 완료된 fold만, fold 순서)
+    """
+    start = time.time()
+    params, num_boost_round, early_stopping_rounds = _native_params(estimator)
+
+    X_values = X.to_numpy(dtype=np.float32)
+    y_values = y.to_numpy(dtype=np.float64)
+    splits = list(TimeSeriesSplit(n_splits=n_splits).split(X_values))
+
+    cores = n_jobs if n_jobs and n_jobs > 0 else (os.cpu_count() or 1)
+    workers = max(1, min(len(splits), cores))
+    params["nthread"] = max(1, cores // workers)
+
+    abort = threading.Event()
+    results: List[FoldResult] = [
+        FoldResult(fold=i, train_size=len(tr), val_size=len(va), status="pending")
+        for i, (tr, va) in enumerate(splits, 1)
+    ]
+
+    def report():
+        if progress_path is None:
+            return
+        write_json_atomic(progress_path, {
+            "status": "aborted" if abort.is_set() else "running",
+            "score_name": score_name,
+            "folds": [asdict(r) for r in results],
+        })
+
+    def fit_fold(i: int) -> FoldResult:
+        train_idx, val_idx = splits[i]
+        result = results[i]
+        if abort.is_set():
+            result.status = "aborted"
+            return result
+
+        fold_start = time.time()
+        # bin 경계는 이 fold의 학습 구간으로만 계산
+        dtrain = xgb.QuantileDMatrix(
+            X_values[train_idx], y_values[train_idx], max_bin=params["max_bin"]
+        )
+        dval = xgb.QuantileDMatrix(X_values[val_idx], y_values[val_idx], ref=dtrain)
+        booster = xgb.train(
+            params, dtrain,
+            num_boost_round=num_boost_round,
+            evals=[(dval, "val")],
+            early_stopping_rounds=early_stopping_rounds,
+            callbacks=[_AbortCallback(abort)],
+            verbose_eval=False,
+        )
+        result.seconds = round(time.time() - fold_start, 2)
+        if abort.is_set():
+            result.status = "aborted"
+            return result
+
+        iteration_range = (0, booster.best_iteration + 1) if early_stopping_rounds else (0, 0)
+        y_pred = booster.inplace_predict(X_values[val_idx], iteration_range=iteration_range)
+        result.score = score_fn(y_values[val_idx], y_pred)
+        result.best_iteration = booster.best_iteration if early_stopping_rounds else None
+        result.status = "completed"
+
+        print(f"  Fold {result.fold}: {score_name} = {result.score:.4f} "
+              f"(train: {result.train_size}, val: {result.val_size}, {result.seconds}s)")
+        if max_score is not None and result.score > max_score:
+            print(f"  [!] Fold {result.fold} {score_name} {result.score:.2f} > 예산 {max_score} → 교차 검증 중단")
+            abort.set()
+        return result
+
+    print(f"  fold {len(splits)}개 / 동시 {workers}개 × {params['nthread']}스레드")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 큰 fold(마지막)부터 시작
+        futures = [pool.submit(fit_fold, i) for i in reversed(range(len(splits)))]
+        for future in as_completed(futures):
+            future.result()
+            report()
+
+    aborted = abort.is_set()
+    for result in results:
+        if result.status == "pending":
+            result.status = "aborted"
+    if progress_path is not None:
+        write_json_atomic(progress_path, {
+            "status": "aborted" if aborted else "completed",
+            "score_name": score_name,
+            "folds": [asdict(r) for r in results],
+        })
+
+    return {
+        "scores": [r.score for r in results if r.status == "completed"],
+        "folds": [asdict(r) for r in results],
+        "aborted": aborted,
+        "seconds": round(time.time() - start, 2),
+    }
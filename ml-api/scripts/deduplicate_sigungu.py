@@ -16,11 +16,15 @@
 import os
 import re
 import sys
+from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
 from supabase import create_client
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from app.core.name_matcher import NameIndex
+
 SUPABASE_URL = os.environ.get("SUPABASE_URL", "")
 SUPABASE_KEY = os.environ.get("SUPABASE_SERVICE_KEY", "")
 
@@ -70,24 +74,41 @@ def main():
     actions_merge = []   # (merged_complex, normal_complex) - 이관 후 삭제
     actions_rename = []  # (merged_complex, new_sigungu) - sigungu만 수정
 
-    for cx in merged_complexes:
-        normal_gu = extract_gu(cx["sigungu"])
-        if not normal_gu:
-            continue
-
-        # 같은 이름 + 같은 동 + 정상 sigungu인 complex 찾기
-        query = sb.table("complexes").select("id, name, sigungu, eupmyeondong, address") \
-            .eq("sigungu", normal_gu).eq("name", cx["name"])
-
+    # 정상 sigungu complexes를 한 번에 조회 → 시군구 블록 이름 색인
+    # (단지별 쿼리 대신. 병합 후 삭제하므로 이름은 strict: 공백/특수문자만 무시, 접미사 제거 없음
+    #  → "센트럴타워"와 "센트럴파크"처럼 브랜드만 같은 다른 단지는 병합하지 않음)
+    normal_gus = sorted({gu for gu in (extract_gu(cx["sigungu"]) for cx in merged_complexes) if gu})
+    normal_complexes = []
+    for i in range(0, len(normal_gus), 50):
+        offset = 0
+        while True:
+            r = sb.table("complexes").select("id, name, sigungu, eupmyeondong, address") \
+                .in_("sigungu", normal_gus[i:i + 50]) \
+                .range(offset, offset + 999).execute()
+            if not r.data:
+                break
+            normal_complexes.extend(r.data)
+            if len(r.data) < 1000:
+                break
+            offset += 1000
+    print(f"  Normal-format complexes loaded: {len(normal_complexes)}")
+
+    index = NameIndex([cx["name"] for cx in normal_complexes],
+                      [cx["sigungu"] for cx in normal_complexes])
+    candidates = [(cx, extract_gu(cx["sigungu"])) for cx in merged_complexes]
+    candidates = [(cx, gu) for cx, gu in candidates if gu]
+    results = index.match_many([cx["name"] for cx, _ in candidates],
+                               [gu for _, gu in candidates], tiers=("strict",))
+
+    for (cx, normal_gu), matches in zip(candidates, results):
+        duplicates = [normal_complexes[pos] for pos, _, _ in matches]
         # eupmyeondong이 있으면 동까지 매칭
         if cx.get("eupmyeondong"):
-            query = query.eq("eupmyeondong", cx["eupmyeondong"])
-
-        result = query.execute()
+            duplicates = [d for d in duplicates if d.get("eupmyeondong") == cx["eupmyeondong"]]
 
-        if result.data:
+        if duplicates:
             # Duplicate found → merge
-            actions_merge.append((cx, result.data[0]))
+            actions_merge.append((cx, duplicates[0]))
         else:
             # No duplicate → just rename sigungu
             actions_rename.append((cx, normal_gu))
@@ -16,6 +16,13 @@ XGBoost 모델 학습을 위한 Feature Engineering (v2 - 고도화)
 import os
 import json
 import pickle
+import shutil
+import hashlib
+import inspect
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 from pathlib import Path
 from datetime import datetime
 from typing import Tuple, Optional, Dict
@@ -23,7 +30,6 @@ from typing import Tuple, Optional, Dict
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.model_selection import KFold
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -32,32 +38,21 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.database import get_supabase_client
-from app.services.poi_service import POIService
-from app.services.market_service import MarketService
-from app.services.property_features_service import PropertyFeaturesService
-from app.services.footfall_service import FootfallService
+from app.core.feature_spec import (
+    ApartmentFeatureSpec, footfall_features, market_features, poi_features, property_features,
+)
+from app.core.collected_dataset import CollectedDataset
+from app.core.region_gazetteer import region_gazetteer
+
+# 피처 행렬 캐시 (train_model 단계 간 재사용, --reuse-features)
+FEATURE_CACHE_DIR = Path(__file__).parent.parent / "data" / "feature_cache"
+FEATURE_CACHE_KEEP = 3  # 보관할 최근 캐시 개수
+TARGET_COLUMN = "__target__"
 
 
 class FeatureEngineer:
     """XGBoost 학습용 피처 엔지니어링 (v2)"""
 
-    # 서울 주요 구 대표 좌표 (구청 위치 기준)
-    DISTRICT_COORDS = {
-        "강남구": (37.5172, 127.0473), "서초구": (37.4837, 127.0324),
-        "송파구": (37.5145, 127.1059), "용산구": (37.5326, 126.9908),
-        "마포구": (37.5663, 126.9014), "성동구": (37.5633, 127.0371),
-        "영등포구": (37.5264, 126.8963), "강동구": (37.5301, 127.1238),
-        "광진구": (37.5385, 127.0823), "동작구": (37.5124, 126.9393),
-        "양천구": (37.5169, 126.8666), "노원구": (37.6541, 127.0568),
-        "강서구": (37.5510, 126.8496), "은평구": (37.6027, 126.9291),
-        "종로구": (37.5735, 126.9790), "중구": (37.5636, 126.9976),
-        "동대문구": (37.5744, 127.0396), "중랑구": (37.6064, 127.0928),
-        "성북구": (37.5894, 127.0167), "강북구": (37.6396, 127.0257),
-        "도봉구": (37.6688, 127.0471), "서대문구": (37.5791, 126.9368),
-        "구로구": (37.4954, 126.8875), "금천구": (37.4569, 126.8955),
-        "관악구": (37.4784, 126.9516),
-    }
-
     # 브랜드 티어 (프리미엄 순)
     BRAND_TIERS = {
         "래미안": 5,
@@ -90,21 +85,77 @@ class FeatureEngineer:
         "building_structure_encoded": 0,    # 구조코드: unknown(0)
     }
 
-    def __init__(self):
+    # Temporal 피처 (월간 집계 키: 시군구/단지 + 면적구간)
+    _TEMPORAL_COLUMNS = [
+        "price_lag_1m", "price_lag_3m", "price_rolling_6m_mean",
+        "price_rolling_6m_std", "price_yoy_change", "volume_lag_1m",
+    ]
+    _SG_KEYS = ["sigungu", "area_segment"]
+    _APT_KEYS = ["apt_name", "area_segment"]
+
+    # 메모리 최적화 모드에서 원래 dtype을 유지할 컬럼 (타깃, 병합 키)
+    _KEEP_DTYPE_COLUMNS = {"price", "complex_id", "_complex_id", "transaction_date"}
+
+    def __init__(self, memory_optimized: bool = False):
         self.label_encoders = {}
         self.target_encoders: Dict[str, Dict] = {}  # target encoding 매핑
         self.fill_values: Dict[str, float] = {}  # 결측치 대체값
         self.scaler = StandardScaler()
         self.feature_names = []
         self.is_fitted = False
+        # True면 category/float32 dtype + 복사 최소화 (전국 다년치 데이터를 2~4GB에서 처리)
+        self.memory_optimized = memory_optimized
+
+    def load_training_data(
+        self,
+        csv_path: str = None,
+        region_codes: Optional[list] = None,
+        start_month: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        학습 데이터 로드
 
-    def load_training_data(self, csv_path: str = None) -> pd.DataFrame:
-        """학습 데이터 로드"""
+        csv_path가 디렉터리면 수집 Parquet 데이터셋(data/collected)으로 읽음.
+        region_codes / start_month(YYYYMM)는 데이터셋 파티션 필터로 푸시다운.
+        """
+        if csv_path and Path(csv_path).is_dir():
+            return self._load_from_dataset(csv_path, region_codes, start_month)
         if csv_path and Path(csv_path).exists():
             return self._load_from_csv(csv_path)
         else:
             return self._load_from_database()
 
+    def _load_from_dataset(
+        self,
+        dataset_dir: str,
+        region_codes: Optional[list] = None,
+        start_month: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """수집 Parquet 데이터셋에서 로드 (파티션 프루닝)"""
+        print(f"Parquet 데이터셋에서 로드: {dataset_dir}")
+        df = CollectedDataset(Path(dataset_dir)).read(
+            region_codes=region_codes, start_month=start_month
+        )
+        df = self._normalize_collected(df)
+        print(f"총 {len(df)}건 로드 완료 (Parquet)")
+        return df
+
+    @staticmethod
+    def _normalize_collected(df: pd.DataFrame) -> pd.DataFrame:
+        """수집 데이터셋 컬럼/단위 → 학습 데이터 형식"""
+        df = df.rename(columns={
+            "deal_date": "transaction_date",
+            "area": "area_exclusive",
+            "built_year": "prop_built_year",
+        })
+        df["price"] = df["price"] * 10000  # 만원 → 원 (Supabase와 동일 단위)
+        if "prop_sido" not in df.columns and "region_code" in df.columns:
+            # 수집 데이터엔 시도 컬럼이 없음 → 지역 코드로 시도명 (Supabase properties.sido와 같은 표기)
+            codes = df["region_code"].astype(str)
+            names = {code: region_gazetteer.sido_name(code) or None for code in codes.unique()}
+            df["prop_sido"] = codes.map(names)
+        return df
+
     def _load_from_csv(self, csv_path: str) -> pd.DataFrame:
         """CSV 파일에서 데이터 로드"""
         print(f"CSV 파일에서 로드: {csv_path}")
@@ -198,9 +249,36 @@ class FeatureEngineer:
         return pd.DataFrame(records)
 
     def create_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """피처 생성"""
-        df = df.copy()
+        """피처 생성 (memory_optimized면 입력 df를 직접 수정)"""
+        if not self.memory_optimized:
+            df = df.copy()
+
+        df = self._add_basic_features(df)
+        return self._add_service_features(df)
+
+    def _add_service_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """외부 서비스/테이블 조회 피처 (기본 피처 이후, df 직접 수정)"""
+        # 8. 주변환경 피처 (POI)
+        df = self._add_poi_features(df)
+
+        # 9. 시장 지표 피처
+        df = self._add_market_features(df)
+
+        # 10. 매물 추가 피처 (재건축, 학군, 향/뷰 등)
+        df = self._add_property_features(df)
+
+        # 11. 유동인구/상권 피처
+        df = self._add_footfall_features(df)
+
+        # 12. 건축물대장 피처 (building_info 테이블)
+        df = self._add_building_registry_features(df)
+
+        if self.memory_optimized:
+            df = self._optimize_dtypes(df)
+        return df
 
+    def _add_basic_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """거래/매물/단지/지역 기본 피처 (외부 서비스 조회 없음, df 직접 수정)"""
         # 1. 거래일 피처
         df["transaction_date"] = pd.to_datetime(df["transaction_date"])
         df["transaction_year"] = df["transaction_date"].dt.year
@@ -276,21 +354,8 @@ class FeatureEngineer:
             df["apt_name"] = df.get("complex_name", "unknown")
         df["apt_name"] = df["apt_name"].fillna("unknown")
 
-        # 8. 주변환경 피처 (POI)
-        df = self._add_poi_features(df)
-
-        # 9. 시장 지표 피처
-        df = self._add_market_features(df)
-
-        # 10. 매물 추가 피처 (재건축, 학군, 향/뷰 등)
-        df = self._add_property_features(df)
-
-        # 11. 유동인구/상권 피처
-        df = self._add_footfall_features(df)
-
-        # 12. 건축물대장 피처 (building_info 테이블)
-        df = self._add_building_registry_features(df)
-
+        if self.memory_optimized:
+            df = self._optimize_dtypes(df)
         return df
 
     # ─────────────────────────────────────────────
@@ -305,134 +370,167 @@ class FeatureEngineer:
         """
         if len(df) < 50:
             print("[temporal] 데이터 부족, temporal 피처 스킵")
-            for col in ["price_lag_1m", "price_lag_3m", "price_rolling_6m_mean",
-                        "price_rolling_6m_std", "price_yoy_change", "volume_lag_1m"]:
+            for col in self._TEMPORAL_COLUMNS:
                 df[col] = np.nan
             return df
 
         print("Temporal lag/rolling 피처 생성 중...")
 
-        df = df.copy()
-        df["_ym"] = df["transaction_date"].dt.to_period("M")
-
-        # --- 1. 시군구 + 면적구간별 월간 집계 (과거 데이터) ---
-        monthly_agg = (
-            df.groupby(["sigungu", "area_segment", "_ym"])["price"]
-            .agg(["mean", "std", "count"])
-            .reset_index()
-        )
-        monthly_agg.columns = ["sigungu", "area_segment", "_ym", "monthly_mean", "monthly_std", "monthly_count"]
+        if not self.memory_optimized:
+            df = df.copy()
 
-        # --- 2. 아파트 + 면적구간별 월간 집계 ---
-        apt_monthly = (
-            df.groupby(["apt_name", "area_segment", "_ym"])["price"]
-            .mean()
-            .reset_index()
-        )
-        apt_monthly.columns = ["apt_name", "area_segment", "_ym", "apt_monthly_mean"]
-
-        # --- 3. 각 행에 대해 lag/rolling 계산 ---
-        price_lag_1m = []
-        price_lag_3m = []
-        rolling_6m_mean = []
-        rolling_6m_std = []
-        yoy_change = []
-        vol_lag_1m = []
-
-        # 인덱스 빌드: (sigungu, area_segment) -> sorted list of (ym, mean, std, count)
-        sg_index = {}
-        for _, row in monthly_agg.iterrows():
-            key = (row["sigungu"], row["area_segment"])
-            if key not in sg_index:
-                sg_index[key] = []
-            sg_index[key].append((row["_ym"], row["monthly_mean"], row["monthly_std"], row["monthly_count"]))
-
-        # sort each list by ym
-        for key in sg_index:
-            sg_index[key].sort(key=lambda x: x[0])
-
-        # apt index
-        apt_index = {}
-        for _, row in apt_monthly.iterrows():
-            key = (row["apt_name"], row["area_segment"])
-            if key not in apt_index:
-                apt_index[key] = []
-            apt_index[key].append((row["_ym"], row["apt_monthly_mean"]))
-        for key in apt_index:
-            apt_index[key].sort(key=lambda x: x[0])
-
-        for _, row in df.iterrows():
-            cur_ym = row["_ym"]
-            sg_key = (row["sigungu"], row["area_segment"])
-            apt_key = (row["apt_name"], row["area_segment"])
-
-            # -- apt-level lag --
-            apt_hist = apt_index.get(apt_key, [])
-            past_apt = [(ym, val) for ym, val in apt_hist if ym < cur_ym]
-
-            if past_apt:
-                price_lag_1m.append(past_apt[-1][1])  # 가장 최근 월
-                if len(past_apt) >= 3:
-                    price_lag_3m.append(np.mean([v for _, v in past_apt[-3:]]))
-                else:
-                    price_lag_3m.append(np.mean([v for _, v in past_apt]))
-            else:
-                # apt 데이터 없으면 시군구 수준 fallback
-                sg_hist = sg_index.get(sg_key, [])
-                past_sg = [(ym, m, s, c) for ym, m, s, c in sg_hist if ym < cur_ym]
-                if past_sg:
-                    price_lag_1m.append(past_sg[-1][1])
-                    if len(past_sg) >= 3:
-                        price_lag_3m.append(np.mean([m for _, m, _, _ in past_sg[-3:]]))
-                    else:
-                        price_lag_3m.append(np.mean([m for _, m, _, _ in past_sg]))
-                else:
-                    price_lag_1m.append(np.nan)
-                    price_lag_3m.append(np.nan)
-
-            # -- sigungu-level rolling 6m --
-            sg_hist = sg_index.get(sg_key, [])
-            past_sg = [(ym, m, s, c) for ym, m, s, c in sg_hist if ym < cur_ym]
-
-            if len(past_sg) >= 2:
-                recent_6 = past_sg[-6:] if len(past_sg) >= 6 else past_sg
-                rolling_6m_mean.append(np.mean([m for _, m, _, _ in recent_6]))
-                rolling_6m_std.append(np.std([m for _, m, _, _ in recent_6]) if len(recent_6) > 1 else 0)
-            else:
-                rolling_6m_mean.append(np.nan)
-                rolling_6m_std.append(np.nan)
-
-            # -- YoY change --
-            target_ym_12m_ago = cur_ym - 12
-            past_yoy = [m for ym, m, _, _ in sg_hist if ym == target_ym_12m_ago]
-            past_cur = [m for ym, m, _, _ in sg_hist if ym == cur_ym - 1]
-            if past_yoy and past_cur and past_yoy[0] != 0:
-                yoy_change.append((past_cur[0] - past_yoy[0]) / past_yoy[0])
-            else:
-                yoy_change.append(np.nan)
-
-            # -- volume lag 1m --
-            vol_past = [(ym, c) for ym, _, _, c in sg_hist if ym == cur_ym - 1]
-            vol_lag_1m.append(vol_past[0][1] if vol_past else np.nan)
-
-        df["price_lag_1m"] = price_lag_1m
-        df["price_lag_3m"] = price_lag_3m
-        df["price_rolling_6m_mean"] = rolling_6m_mean
-        df["price_rolling_6m_std"] = rolling_6m_std
-        df["price_yoy_change"] = yoy_change
-        df["volume_lag_1m"] = vol_lag_1m
-
-        df.drop(columns=["_ym"], inplace=True, errors="ignore")
+        sg_monthly, apt_monthly = self._monthly_aggregates(df)
+        sg_history, apt_history = self._temporal_history(sg_monthly, apt_monthly)
+        self._apply_temporal_features(df, sg_history, apt_history)
 
         # 결측치 통계
-        for col in ["price_lag_1m", "price_lag_3m", "price_rolling_6m_mean",
-                     "price_rolling_6m_std", "price_yoy_change", "volume_lag_1m"]:
+        for col in self._TEMPORAL_COLUMNS:
             nan_pct = df[col].isna().mean() * 100
             print(f"  {col}: NaN {nan_pct:.1f}%")
 
+        if self.memory_optimized:
+            df = self._optimize_dtypes(df)
         print("Temporal 피처 6개 추가 완료")
         return df
 
+    @staticmethod
+    def _month_index(dates: pd.Series) -> np.ndarray:
+        """거래일 → 월 번호 (year * 12 + month - 1, 1 차이 = 1개월)"""
+        return (dates.dt.year * 12 + dates.dt.month - 1).to_numpy(dtype=np.int64)
+
+    def _monthly_aggregates(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        (시군구, 면적구간, 월) / (단지, 면적구간, 월)별 가격 합계·건수
+
+        합계/건수라서 파티션별 결과를 _combine_monthly로 합칠 수 있음 (청크 처리의 스트리밍 상태)
+        """
+        frame = pd.DataFrame({
+            "sigungu": df["sigungu"].to_numpy(),
+            "apt_name": df["apt_name"].to_numpy(),
+            "area_segment": df["area_segment"].to_numpy(),
+            "_ym": self._month_index(df["transaction_date"]),
+            "price_sum": df["price"].to_numpy(dtype=np.float64),
+            "count": np.ones(len(df), dtype=np.int64),
+        })
+        tables = []
+        for keys in (self._SG_KEYS, self._APT_KEYS):
+            tables.append(
+                frame.groupby(keys + ["_ym"], sort=False)[["price_sum", "count"]]
+                .sum()
+                .reset_index()
+            )
+        return tables[0], tables[1]
+
+    @staticmethod
+    def _combine_monthly(tables: list) -> pd.DataFrame:
+        """파티션별 월간 집계 합치기 (같은 키·월은 합계/건수 합산)"""
+        combined = pd.concat(tables, ignore_index=True)
+        keys = [c for c in combined.columns if c not in ("price_sum", "count")]
+        return combined.groupby(keys, sort=False)[["price_sum", "count"]].sum().reset_index()
+
+    @staticmethod
+    def _monthly_history(monthly: pd.DataFrame, keys: list, window: int) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        키별 월 시계열 → 각 (키, 월) 행 기준 직전 월평균 window개
+
+        Returns:
+            (키·월 정렬된 집계 + mean 컬럼, prev[i, k] = k+1번째 이전 월평균 (없으면 NaN))
+        """
+        monthly = monthly.sort_values(keys + ["_ym"], kind="stable").reset_index(drop=True)
+        monthly["mean"] = monthly["price_sum"] / monthly["count"]
+        n = len(monthly)
+
+        group = monthly.groupby(keys, sort=False).ngroup().to_numpy()
+        starts = np.r_[0, np.flatnonzero(np.diff(group)) + 1]
+        sizes = np.diff(np.r_[starts, n])
+        n_prev = np.arange(n) - np.repeat(starts, sizes)
+        monthly["n_prev"] = n_prev
+        monthly["_group"] = group
+
+        mean = monthly["mean"].to_numpy()
+        prev = np.full((n, window), np.nan)
+        for k in range(1, window + 1):
+            prev[k:, k - 1] = mean[:-k]
+            prev[n_prev < k, k - 1] = np.nan
+        return monthly, prev
+
+    @staticmethod
+    def _window_mean_std(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """행별 NaN 제외 평균 / 표준편차 (ddof=0, 값이 없으면 NaN)"""
+        present = ~np.isnan(values)
+        count = present.sum(axis=1)
+        filled = np.where(present, values, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = filled.sum(axis=1) / count
+            dev = np.where(present, values - mean[:, None], 0.0)
+            std = np.sqrt((dev ** 2).sum(axis=1) / count)
+        return mean, std
+
+    def _temporal_history(self, sg_monthly: pd.DataFrame,
+                          apt_monthly: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        월간 집계 → (키, 월)별 temporal 피처 조회 테이블
+
+        - 단지 lag: 직전 월평균 / 최근 3개월 평균 (이전 이력 없으면 시군구 lag로 대체)
+        - 시군구 rolling: 이전 2개월 이상일 때 최근 6개월 평균/표준편차
+        - YoY: (전월 평균 - 12개월 전 평균) / 12개월 전 평균, 거래량: 전월 건수
+        """
+        sg, prev = self._monthly_history(sg_monthly, self._SG_KEYS, window=6)
+        sg["lag_1m"] = prev[:, 0]
+        sg["lag_3m"] = self._window_mean_std(prev[:, :3])[0]
+        rolling_mean, rolling_std = self._window_mean_std(prev)
+        has_rolling = sg["n_prev"].to_numpy() >= 2
+        sg["rolling_6m_mean"] = np.where(has_rolling, rolling_mean, np.nan)
+        sg["rolling_6m_std"] = np.where(has_rolling, rolling_std, np.nan)
+
+        # 같은 키의 정확히 1개월 / 12개월 전 월 (직전 이력이 아니라 달력 기준)
+        # (그룹, 월) → 정수 키: 그룹마다 월 범위 + 12개월 여유를 두어 다른 그룹과 겹치지 않음
+        ym = sg["_ym"].to_numpy()
+        base = ym.min() - 12 if len(sg) else 0
+        span = int(ym.max() - base) + 1 if len(sg) else 1
+        slot = sg["_group"].to_numpy() * span + (ym - base)
+        position = pd.Index(slot)
+        one_ago = position.get_indexer(slot - 1)
+        year_ago = position.get_indexer(slot - 12)
+        means = np.r_[sg["mean"].to_numpy(), np.nan]
+        counts = np.r_[sg["count"].to_numpy(dtype=np.float64), np.nan]
+        cur, past = means[one_ago], means[year_ago]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sg["yoy_change"] = np.where(past != 0, (cur - past) / past, np.nan)
+        sg["volume_lag_1m"] = counts[one_ago]
+
+        apt, apt_prev = self._monthly_history(apt_monthly, self._APT_KEYS, window=3)
+        apt["lag_1m"] = apt_prev[:, 0]
+        apt["lag_3m"] = self._window_mean_std(apt_prev)[0]
+
+        sg_history = sg.set_index(self._SG_KEYS + ["_ym"])[
+            ["lag_1m", "lag_3m", "rolling_6m_mean", "rolling_6m_std", "yoy_change", "volume_lag_1m"]
+        ]
+        apt_history = apt[apt["n_prev"] > 0].set_index(self._APT_KEYS + ["_ym"])[["lag_1m", "lag_3m"]]
+        return sg_history, apt_history
+
+    def _apply_temporal_features(self, df: pd.DataFrame, sg_history: pd.DataFrame,
+                                 apt_history: pd.DataFrame):
+        """행의 (키, 월)로 조회 테이블을 찾아 temporal 피처 컬럼 추가 (in-place)"""
+        ym = self._month_index(df["transaction_date"])
+
+        def lookup(history: pd.DataFrame, keys: list) -> pd.DataFrame:
+            rows = pd.MultiIndex.from_arrays([df[k].to_numpy() for k in keys] + [ym])
+            position = history.index.get_indexer(rows)
+            values = np.vstack([history.to_numpy(dtype=np.float64), np.full(history.shape[1], np.nan)])
+            return pd.DataFrame(values[position], columns=history.columns)
+
+        sg = lookup(sg_history, self._SG_KEYS)
+        apt = lookup(apt_history, self._APT_KEYS)
+        has_apt = apt["lag_1m"].notna().to_numpy()
+
+        df["price_lag_1m"] = np.where(has_apt, apt["lag_1m"], sg["lag_1m"])
+        df["price_lag_3m"] = np.where(has_apt, apt["lag_3m"], sg["lag_3m"])
+        df["price_rolling_6m_mean"] = sg["rolling_6m_mean"].to_numpy()
+        df["price_rolling_6m_std"] = sg["rolling_6m_std"].to_numpy()
+        df["price_yoy_change"] = sg["yoy_change"].to_numpy()
+        df["volume_lag_1m"] = sg["volume_lag_1m"].to_numpy()
+
     # ─────────────────────────────────────────────
     # Target Encoding (Phase C)
     # ─────────────────────────────────────────────
@@ -443,39 +541,73 @@ class FeatureEngineer:
         정규화된 Target Encoding (학습 시 K-fold, 추론 시 저장된 매핑 사용)
         """
         if fit:
+            n_folds = 5
             global_mean = target.mean()
-            agg = pd.DataFrame({"target": target, "col": df[col]}).groupby("col")["target"].agg(["mean", "count"])
-            smooth = (agg["count"] * agg["mean"] + smoothing * global_mean) / (agg["count"] + smoothing)
+
+            # 범주 → 정수 코드 (결측 -1), 폴드별 합계/건수는 bincount 한 번으로
+            codes, uniques = pd.factorize(df[col])
+            n_cats = len(uniques)
+            y = target.to_numpy(dtype=np.float64)
+            valid = (codes >= 0) & ~np.isnan(y)
+
+            sums = np.bincount(codes[valid], weights=y[valid], minlength=n_cats)
+            counts = np.bincount(codes[valid], minlength=n_cats).astype(np.float64)
+            smooth = self._smooth_means(sums, counts, global_mean, smoothing)
             self.target_encoders[col] = {
-                "mapping": smooth.to_dict(),
+                "mapping": dict(zip(uniques, smooth.tolist())),
                 "global_mean": global_mean,
             }
 
             # K-fold encoding to prevent leakage
-            encoded = pd.Series(np.nan, index=df.index)
-            kf = KFold(n_splits=5, shuffle=True, random_state=42)
-            for train_idx, val_idx in kf.split(df):
-                train_target = target.iloc[train_idx]
-                train_col = df[col].iloc[train_idx]
-                fold_global = train_target.mean()
-                fold_agg = pd.DataFrame({"t": train_target, "c": train_col}).groupby("c")["t"].agg(["mean", "count"])
-                fold_smooth = (fold_agg["count"] * fold_agg["mean"] + smoothing * fold_global) / (fold_agg["count"] + smoothing)
-                fold_map = fold_smooth.to_dict()
-                encoded.iloc[val_idx] = df[col].iloc[val_idx].map(fold_map).fillna(fold_global)
-
-            return encoded
+            # (KFold(shuffle=True, random_state=42)와 같은 폴드: 셔플 순서를 앞에서부터 폴드 크기로 분할)
+            n = len(df)
+            fold_of = np.empty(n, dtype=np.int64)
+            perm = np.random.RandomState(42).permutation(n)
+            fold_sizes = np.full(n_folds, n // n_folds)
+            fold_sizes[: n % n_folds] += 1
+            start = 0
+            for k, size in enumerate(fold_sizes):
+                fold_of[perm[start:start + size]] = k
+                start += size
+            fold_keys = fold_of[valid] * n_cats + codes[valid]
+            fold_sums = np.bincount(fold_keys, weights=y[valid], minlength=n_folds * n_cats).reshape(n_folds, n_cats)
+            fold_counts = np.bincount(fold_keys, minlength=n_folds * n_cats).reshape(n_folds, n_cats)
+
+            # 학습 폴드 통계 = 전체 - 검증 폴드
+            train_sums = sums - fold_sums
+            train_counts = (counts - fold_counts).astype(np.float64)
+            fold_globals = np.array([np.nanmean(y[fold_of != k]) for k in range(n_folds)])
+
+            table = np.empty((n_folds, n_cats + 1), dtype=np.float64)
+            for k in range(n_folds):
+                table[k, :n_cats] = self._smooth_means(
+                    train_sums[k], train_counts[k], fold_globals[k], smoothing
+                )
+                table[k, n_cats] = fold_globals[k]  # 결측/미등장 범주 → 폴드 평균
+
+            lookup = np.where(codes >= 0, codes, n_cats)
+            return pd.Series(table[fold_of, lookup], index=df.index)
         else:
             enc_data = self.target_encoders.get(col, {})
             mapping = enc_data.get("mapping", {})
             global_mean = enc_data.get("global_mean", 0)
             return df[col].map(mapping).fillna(global_mean)
 
+    @staticmethod
+    def _smooth_means(sums: np.ndarray, counts: np.ndarray, prior: float,
+                      smoothing: int) -> np.ndarray:
+        """(count * mean + smoothing * prior) / (count + smoothing), 건수 0이면 prior"""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+            smooth = (counts * means + smoothing * prior) / (counts + smoothing)
+        return np.where(counts > 0, smooth, prior)
+
     # ─────────────────────────────────────────────
-    # 기존 피처 생성 메서드 (POI, Market, Property, Footfall)
+    # POI / 시장 / 매물 / 유동인구 피처 (app.core.feature_spec 공용 함수 → 추론과 같은 값)
     # ─────────────────────────────────────────────
 
     def _add_poi_features(self, df: pd.DataFrame) -> pd.DataFrame:
-        """POI 기반 주변환경 피처 추가"""
+        """POI 기반 주변환경 피처 추가 (시군구 등급별 추정)"""
         poi_columns = [
             "distance_to_subway", "subway_count_1km",
             "distance_to_school", "school_count_1km",
@@ -490,26 +622,9 @@ class FeatureEngineer:
             return df
 
         print("POI 피처 생성 중...")
-        poi_service = POIService()
-        poi_cache: dict = {}
-
-        sido_col = df["sido"].fillna("서울시")
-        sigungu_col = df["sigungu"].fillna("강남구")
-
-        for sido, sigungu in set(zip(sido_col, sigungu_col)):
-            key = (sido, sigungu)
-            if key not in poi_cache:
-                coords = self.DISTRICT_COORDS.get(sigungu, (37.5665, 126.9780))
-                features = poi_service.get_poi_features(lat=coords[0], lng=coords[1])
-                features["poi_score"] = poi_service.get_poi_score(features)
-                poi_cache[key] = features
-
-        poi_rows = [poi_cache[(s, g)] for s, g in zip(sido_col, sigungu_col)]
-        poi_df = pd.DataFrame(poi_rows, index=df.index)
-        for col in poi_df.columns:
-            df[col] = poi_df[col]
-
-        print(f"POI 피처 {len(poi_df.columns)}개 추가 완료")
+        added = self._assign_features(df, poi_features(df["sigungu"]))
+
+        print(f"POI 피처 {len(added)}개 추가 완료")
         return df
 
     def _add_market_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -524,23 +639,11 @@ class FeatureEngineer:
             return df
 
         print("시장 지표 피처 생성 중...")
-        market_cache: dict = {}
-        years = df.get("transaction_year", pd.Series([2026] * len(df))).fillna(2026).astype(int)
-        months = df.get("transaction_month", pd.Series([1] * len(df))).fillna(1).astype(int)
-        sigungus = df["sigungu"].fillna("강남구")
-
-        market_service = MarketService()
-        for y, m, s in set(zip(years, months, sigungus)):
-            key = (int(y), int(m), s)
-            if key not in market_cache:
-                market_cache[key] = market_service.get_market_features(*key)
-
-        market_rows = [market_cache[(int(y), int(m), s)] for y, m, s in zip(years, months, sigungus)]
-        market_df = pd.DataFrame(market_rows, index=df.index)
-        for col in market_df.columns:
-            df[col] = market_df[col]
-
-        print(f"시장 지표 피처 {len(market_df.columns)}개 추가 완료")
+        added = self._assign_features(df, market_features(
+            df["transaction_year"].fillna(2026), df["transaction_month"].fillna(1), df["sigungu"],
+        ))
+
+        print(f"시장 지표 피처 {len(added)}개 추가 완료")
         return df
 
     def _add_property_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -557,22 +660,9 @@ class FeatureEngineer:
             return df
 
         print("매물 추가 피처 생성 중...")
-        prop_cache: dict = {}
-        built_years = df["built_year"].fillna(2010).astype(int)
-        sigungus = df["sigungu"].fillna("강남구")
-
-        prop_service = PropertyFeaturesService()
-        for by, s in set(zip(built_years, sigungus)):
-            key = (int(by), s)
-            if key not in prop_cache:
-                prop_cache[key] = prop_service.get_all_features(built_year=key[0], sigungu=key[1])
-
-        prop_rows = [prop_cache[(int(by), s)] for by, s in zip(built_years, sigungus)]
-        property_df = pd.DataFrame(prop_rows, index=df.index)
-        for col in property_df.columns:
-            df[col] = property_df[col]
-
-        print(f"매물 추가 피처 {len(property_df.columns)}개 추가 완료")
+        added = self._assign_features(df, property_features(df["building_age"], df["sigungu"]))
+
+        print(f"매물 추가 피처 {len(added)}개 추가 완료")
         return df
 
     def _add_footfall_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -584,23 +674,64 @@ class FeatureEngineer:
             return df
 
         print("유동인구/상권 피처 생성 중...")
-        footfall_cache: dict = {}
-        sigungus = df["sigungu"].fillna("강남구")
+        self._assign_features(df, footfall_features(df.index))
+
+        print(f"유동인구/상권 피처 {len(footfall_columns)}개 추가 완료")
+        return df
 
-        footfall_service = FootfallService()
-        for s in sigungus.unique():
-            if s not in footfall_cache:
-                footfall_cache[s] = footfall_service.get_footfall_features(sigungu=s)
+    # ─────────────────────────────────────────────
+    # 피처 컬럼 추가 / dtype 최적화
+    # ─────────────────────────────────────────────
 
-        footfall_rows = [footfall_cache[s] for s in sigungus]
-        footfall_df = pd.DataFrame(footfall_rows, index=df.index)
-        for col in footfall_columns:
-            if col in footfall_df.columns:
-                df[col] = footfall_df[col]
+    def _assign_features(self, df: pd.DataFrame, features: Dict[str, pd.Series]) -> list:
+        """공용 피처 함수 결과를 df에 컬럼으로 추가 (in-place, dtype 축소는 _add_service_features 끝에서)"""
+        for col, values in features.items():
+            df[col] = values.to_numpy()
+        return list(features)
 
-        print(f"유동인구/상권 피처 {len(footfall_columns)}개 추가 완료")
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        메모리 최적화 dtype 변환 (in-place)
+
+        - 문자열 컬럼 → category (고유값 비율 50% 미만, 전부 결측인 컬럼 제외)
+        - float64 → float32 (XGBoost 내부 정밀도와 동일)
+        - int64 → 가능한 가장 작은 정수형 (int8/int16/int32)
+        """
+        for col in df.columns:
+            if col in self._KEEP_DTYPE_COLUMNS:
+                continue
+            series = df[col]
+            dtype = series.dtype
+            if dtype == object:
+                if pd.api.types.infer_dtype(series, skipna=True) != "string":
+                    continue  # 전부 결측이거나 숫자/dict 등이 섞인 컬럼
+                if series.nunique(dropna=True) < 0.5 * len(series):
+                    df[col] = series.astype("category")
+            elif dtype == np.float64:
+                df[col] = series.astype(np.float32)
+            elif dtype == np.int64:
+                df[col] = pd.to_numeric(series, downcast="integer")
         return df
 
+    @staticmethod
+    def _fill_category(series: pd.Series, value: str) -> pd.Series:
+        """fillna (category면 대체값을 범주에 먼저 추가)"""
+        if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+            series = series.cat.add_categories([value])
+        return series.fillna(value)
+
+    def _report_memory(self, stage: str, df: Optional[pd.DataFrame] = None):
+        """단계별 최대 RSS / 프레임 메모리 출력 (memory_optimized 모드)"""
+        if not self.memory_optimized:
+            return
+        parts = []
+        if resource is not None:
+            # Linux: KB 단위
+            parts.append(f"최대 RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f}MB")
+        if df is not None:
+            parts.append(f"프레임 {df.memory_usage(deep=True).sum() / 1024 ** 2:.0f}MB")
+        print(f"[메모리] {stage}: {', '.join(parts)}")
+
     # ─────────────────────────────────────────────
     # 건축물대장(Building Registry) 피처 (Phase 6)
     # ─────────────────────────────────────────────
@@ -820,8 +951,16 @@ class FeatureEngineer:
 
         # 기존 df에 left join (complex_id 중복 시 1:1 보장을 위해 drop_duplicates)
         bi_merge = bi_merge.drop_duplicates(subset=["complex_id"], keep="first")
+        if self.memory_optimized:
+            # merge 대신 컬럼별 map (전체 프레임 복사 없음)
+            keyed = bi_merge.set_index("complex_id")
+            for col in keyed.columns:
+                df[col] = df[merge_key].map(keyed[col])
+            bi_merge = None
+
         orig_len = len(df)
-        df = df.merge(bi_merge, left_on=merge_key, right_on="complex_id", how="left", suffixes=("", "_bi"))
+        if bi_merge is not None:
+            df = df.merge(bi_merge, left_on=merge_key, right_on="complex_id", how="left", suffixes=("", "_bi"))
 
         # merge 후 행 수가 변하지 않았는지 검증
         if len(df) != orig_len:
@@ -853,13 +992,14 @@ class FeatureEngineer:
     def encode_categoricals(self, df: pd.DataFrame, target: pd.Series = None,
                             fit: bool = True) -> pd.DataFrame:
         """범주형 변수 인코딩 (Label + Target Encoding)"""
-        df = df.copy()
+        if not self.memory_optimized:
+            df = df.copy()
 
         # Label Encoding (sido만 - 저 cardinality)
         for col in ["sido", "prop_type"]:
             if col not in df.columns:
                 continue
-            df[col] = df[col].fillna("unknown")
+            df[col] = self._fill_category(df[col], "unknown")
             if fit:
                 if col not in self.label_encoders:
                     self.label_encoders[col] = LabelEncoder()
@@ -873,7 +1013,7 @@ class FeatureEngineer:
 
         # sigungu는 여전히 LabelEncoder도 유지 (하위 호환)
         if "sigungu" in df.columns:
-            df["sigungu"] = df["sigungu"].fillna("unknown")
+            df["sigungu"] = self._fill_category(df["sigungu"], "unknown")
             if fit:
                 if "sigungu" not in self.label_encoders:
                     self.label_encoders["sigungu"] = LabelEncoder()
@@ -995,71 +1135,104 @@ class FeatureEngineer:
 
     def _smart_fill_missing(self, X: pd.DataFrame, fit: bool = True) -> pd.DataFrame:
         """피처 유형별 결측치 전략 적용"""
-        X = X.copy()
+        if not self.memory_optimized:
+            X = X.copy()
 
         if fit:
             self.fill_values = {}
 
         for col in X.columns:
-            if col.startswith("distance_"):
-                # 거리 피처: median (0은 의미 없음)
+            default = self._median_fill_default(col)
+            if default is not None:
+                # 거리 / target encoding / lag·rolling / 건축물대장: median (전부 결측이면 기본값)
                 if fit:
-                    self.fill_values[col] = X[col].median() if X[col].notna().any() else 500.0
-                X[col] = X[col].fillna(self.fill_values.get(col, 500.0))
+                    self.fill_values[col] = X[col].median() if X[col].notna().any() else default
+                X[col] = X[col].fillna(self.fill_values.get(col, default))
 
             elif "_count_" in col or col.endswith("_count"):
                 # 카운트 피처: 0이 적절
                 X[col] = X[col].fillna(0)
 
-            elif col.endswith("_target_enc"):
-                # Target encoding: global mean
-                if fit:
-                    self.fill_values[col] = X[col].median() if X[col].notna().any() else 0
-                X[col] = X[col].fillna(self.fill_values.get(col, 0))
-
-            elif col.startswith("price_lag") or col.startswith("price_rolling") or col.startswith("price_yoy") or col.startswith("volume_lag"):
-                # Lag/Rolling 피처: median
-                if fit:
-                    self.fill_values[col] = X[col].median() if X[col].notna().any() else 0
-                X[col] = X[col].fillna(self.fill_values.get(col, 0))
-
-            elif col in self._BUILDING_REGISTRY_FILL_VALUES:
-                # 건축물대장 피처: 카테고리별 기본값 (median 또는 도메인 기본값)
-                if fit:
-                    median_val = X[col].median() if X[col].notna().any() else None
-                    self.fill_values[col] = (
-                        median_val if median_val is not None
-                        else self._BUILDING_REGISTRY_FILL_VALUES[col]
-                    )
-                X[col] = X[col].fillna(
-                    self.fill_values.get(col, self._BUILDING_REGISTRY_FILL_VALUES[col])
-                )
-
             else:
                 # 기타: -1 sentinel (XGBoost가 학습 가능)
                 X[col] = X[col].fillna(-1)
 
         return X
 
+    def _median_fill_default(self, col: str):
+        """
+        median으로 결측치를 채우는 컬럼이면 전부 결측일 때의 기본값, 아니면 None
+
+        - 거리 피처: 500m (0은 의미 없음)
+        - 카운트 피처: 대상 아님 (0으로 채움)
+        - target encoding / lag·rolling: 0
+        - 건축물대장 피처: 도메인 기본값
+        """
+        if col.startswith("distance_"):
+            return 500.0
+        if "_count_" in col or col.endswith("_count"):
+            return None
+        if col.endswith("_target_enc") or col.startswith(
+            ("price_lag", "price_rolling", "price_yoy", "volume_lag")
+        ):
+            return 0
+        return self._BUILDING_REGISTRY_FILL_VALUES.get(col)
+
     # ─────────────────────────────────────────────
     # 데이터 준비 메인 메서드
     # ─────────────────────────────────────────────
 
-    def prepare_training_data(self, csv_path: str = None) -> Tuple[pd.DataFrame, pd.Series]:
-        """학습용 X, y 데이터 준비 (v2 - 시간 순서 정렬 + 고도화)"""
+    def prepare_training_data(
+        self,
+        csv_path: str = None,
+        cache_dir: Optional[Path] = None,
+        reuse_features: bool = False,
+    ) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        학습용 X, y 데이터 준비 (v2 - 시간 순서 정렬 + 고도화)
+
+        cache_dir 지정 시 (원본 데이터 스냅샷 해시, 피처 설정 해시)로 피처 행렬을 캐시.
+        reuse_features=True면 데이터 로드 없이 같은 설정의 최신 캐시를 사용.
+        POI/시장/건축물대장 등 보조 테이블 변경은 키에 포함되지 않음.
+        """
+        if cache_dir and reuse_features:
+            entry = self._latest_cache_entry(Path(cache_dir))
+            if entry is not None:
+                print(f"피처 캐시 재사용 (데이터 로드 생략): {entry.name}")
+                return self._load_cached_features(entry)
+            print("재사용할 피처 캐시 없음 → 피처 생성")
+
         df = self.load_training_data(csv_path)
         if df.empty:
             raise ValueError("학습 데이터가 없습니다")
 
+        entry = None
+        if cache_dir:
+            entry = Path(cache_dir) / f"{self.config_hash()}_{self.snapshot_hash(df)}"
+            if (entry / "features.parquet").exists():
+                print(f"피처 캐시 적중: {entry.name}")
+                return self._load_cached_features(entry)
+
+        X, y = self._build_training_data(df)
+        if entry is not None:
+            self._save_cached_features(entry, X, y)
+        return X, y
+
+    def _build_training_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+        """원본 데이터 → 피처 행렬 (인코더/결측치 대체값 fit)"""
         print(f"원본 데이터: {len(df)}건")
+        self._report_memory("원본 로드", df)
 
         # 피처 생성
         df = self.create_features(df)
+        self._report_memory("피처 생성", df)
 
-        # 결측치/이상치 제거
-        df = df.dropna(subset=["price", "area_exclusive"])
-        df = df[df["price"] > 0]
-        df = df[df["area_exclusive"] > 0]
+        # 결측치/이상치 제거 (한 번의 마스크로 필터)
+        valid = (
+            df["price"].notna() & df["area_exclusive"].notna()
+            & (df["price"] > 0) & (df["area_exclusive"] > 0)
+        )
+        df = df[valid]
 
         # 이상치 제거 (IQR 1%-99%)
         Q1 = df["price"].quantile(0.01)
@@ -1071,6 +1244,7 @@ class FeatureEngineer:
 
         # ★ Temporal lag/rolling 피처 추가 (정렬 후!)
         df = self._add_temporal_features(df)
+        self._report_memory("temporal 피처", df)
 
         # ★ Target encoding (price를 target으로)
         y_for_encoding = df["price"].copy()
@@ -1087,17 +1261,94 @@ class FeatureEngineer:
             if col not in df.columns:
                 df[col] = np.nan
 
-        X = df[feature_cols].copy()
+        X = df[feature_cols]
         y = df["price"].copy()
+        del df  # 원본 프레임 해제 (memory_optimized에서는 X가 유일한 사본)
+        if not self.memory_optimized:
+            X = X.copy()
 
         # ★ 스마트 결측치 처리 (유형별 전략)
         X = self._smart_fill_missing(X, fit=True)
+        if self.memory_optimized:
+            X = self._optimize_dtypes(X)
+        self._report_memory("피처 행렬", X)
 
         self.is_fitted = True
         return X, y
 
+    # ─────────────────────────────────────────────
+    # 피처 행렬 캐시
+    # ─────────────────────────────────────────────
+
+    def config_hash(self) -> str:
+        """피처 설정 해시 (클래스 소스 + dtype 모드 → 피처 로직/상수 변경 시 캐시 무효화)"""
+        payload = inspect.getsource(type(self)) + f"|memory_optimized={self.memory_optimized}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def snapshot_hash(df: pd.DataFrame) -> str:
+        """원본 데이터 스냅샷 해시 (컬럼 순서 무관)"""
+        columns = sorted(df.columns)
+        digest = hashlib.sha256(",".join(columns).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(df[columns], index=False).values.tobytes())
+        return digest.hexdigest()[:16]
+
+    def _latest_cache_entry(self, cache_dir: Path) -> Optional[Path]:
+        """현재 피처 설정으로 만든 가장 최근 캐시"""
+        if not cache_dir.exists():
+            return None
+        entries = [
+            p for p in cache_dir.glob(f"{self.config_hash()}_*")
+            if (p / "features.parquet").exists()
+        ]
+        return max(entries, key=lambda p: p.stat().st_mtime, default=None)
+
+    def _save_cached_features(self, entry: Path, X: pd.DataFrame, y: pd.Series):
+        """피처 행렬 + fit된 인코더 저장 (임시 디렉터리 → rename)"""
+        tmp = entry.with_name(entry.name + ".tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        X.assign(**{TARGET_COLUMN: y.values}).to_parquet(tmp / "features.parquet", index=False)
+        self.save(str(tmp / "artifacts.pkl"))
+        with open(tmp / "meta.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "created_at": datetime.now().isoformat(),
+                "rows": len(X),
+                "features": len(X.columns),
+                "target_name": y.name,
+            }, f, ensure_ascii=False)
+
+        shutil.rmtree(entry, ignore_errors=True)
+        tmp.rename(entry)
+        print(f"피처 캐시 저장: {entry}")
+
+        # 오래된 캐시 정리
+        entries = sorted(
+            (p for p in entry.parent.iterdir() if p.is_dir() and not p.name.endswith(".tmp")),
+            key=lambda p: p.stat().st_mtime,
+            reverse=True,
+        )
+        for old in entries[FEATURE_CACHE_KEEP:]:
+            shutil.rmtree(old, ignore_errors=True)
+
+    def _load_cached_features(self, entry: Path) -> Tuple[pd.DataFrame, pd.Series]:
+        """캐시된 피처 행렬 + 인코더 로드"""
+        with open(entry / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+        X = pd.read_parquet(entry / "features.parquet")
+        y = X.pop(TARGET_COLUMN).rename(meta.get("target_name"))
+        self.load(str(entry / "artifacts.pkl"))
+        os.utime(entry)  # 최근 사용 캐시 유지
+        print(f"캐시 피처 행렬: {X.shape}")
+        return X, y
+
     def prepare_inference_features(self, property_data: dict) -> pd.DataFrame:
-        """추론용 단일 매물 피처 준비"""
+        """
+        추론용 단일 매물 피처 준비 (학습과 같은 create_features 경로)
+
+        서빙/배치 분석은 compile_spec()의 ApartmentFeatureSpec을 사용합니다.
+        """
         if not self.is_fitted:
             raise ValueError("먼저 prepare_training_data()를 호출하세요")
 
@@ -1118,14 +1369,25 @@ class FeatureEngineer:
     # 저장 / 로드
     # ─────────────────────────────────────────────
 
+    def compile_spec(self) -> ApartmentFeatureSpec:
+        """학습된 인코더/대체값 → 서빙/배치 추론 피처 스펙 (POI·시장 등 파생 피처 함수는 create_features와 공용)"""
+        return ApartmentFeatureSpec.from_artifacts({
+            "label_encoders": self.label_encoders,
+            "target_encoders": self.target_encoders,
+            "fill_values": self.fill_values,
+            "feature_names": self.feature_names,
+            "brand_tiers": self.BRAND_TIERS,
+        })
+
     def save(self, path: str):
-        """인코더 및 설정 저장 (v2 - target encoding + fill values 포함)"""
+        """인코더 및 설정 저장 (v2 - target encoding + fill values + 컴파일된 피처 스펙)"""
         artifacts = {
             "label_encoders": self.label_encoders,
             "target_encoders": self.target_encoders,
             "fill_values": self.fill_values,
             "feature_names": self.feature_names,
             "brand_tiers": self.BRAND_TIERS,
+            "feature_spec": self.compile_spec(),
         }
         with open(path, "wb") as f:
             pickle.dump(artifacts, f)
@@ -1149,7 +1411,7 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Feature Engineering v2")
-    parser.add_argument("--csv", type=str, help="CSV 파일 경로")
+    parser.add_argument("--csv", type=str, help="CSV 파일 또는 수집 Parquet 데이터셋 디렉터리 (data/collected)")
     args = parser.parse_args()
 
     fe = FeatureEngineer()
@@ -20,6 +20,10 @@ import pandas as pd
 import numpy as np
 from supabase import create_client, Client
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.collected_dataset import collected_dataset
+
 
 # ============================================================================
 # 상수 정의
@@ -63,11 +67,19 @@ class TrainingDataPreparer:
             print("경고: Supabase 설정이 없습니다.")
             self.supabase = None
 
-    def fetch_transactions(self, limit: int = 100000, csv_path: str = None) -> pd.DataFrame:
+    def fetch_transactions(
+        self,
+        limit: int = 100000,
+        csv_path: str = None,
+        region_codes: Optional[list] = None,
+        start_month: Optional[str] = None,
+    ) -> pd.DataFrame:
         """
         실거래가 데이터 조회
 
-        우선순위: Supabase (전체 컬럼) → csv_path → data/latest_collected.csv
+        우선순위: Supabase (전체 컬럼) → csv_path → data/collected (Parquet 데이터셋)
+        → data/latest_collected.csv (구버전)
+        region_codes / start_month(YYYYMM)는 Parquet 데이터셋 읽기 시 파티션 필터로 적용
         """
         # 1. Supabase에서 읽기 (주 데이터소스 - 영구 저장소)
         if self.supabase:
@@ -110,7 +122,15 @@ class TrainingDataPreparer:
             print(f"  {len(df)}건 로드됨 (CSV)")
             return df
 
-        # 3. 수집기 CSV 자동 탐색 (fallback)
+        # 3. 수집 Parquet 데이터셋 (fallback, 필터 푸시다운)
+        if collected_dataset.exists():
+            print(f"수집 데이터셋 자동 감지: {collected_dataset.root}")
+            df = collected_dataset.read(region_codes=region_codes, start_month=start_month)
+            df = self._normalize_csv_columns(df)
+            print(f"  {len(df)}건 로드됨 (Parquet)")
+            return df
+
+        # 4. 구버전 수집기 CSV 자동 탐색 (fallback)
         auto_csv = Path(__file__).parent.parent / "data" / "latest_collected.csv"
         if auto_csv.exists():
             print(f"수집 CSV 자동 감지: {auto_csv}")
@@ -6,8 +6,8 @@ XGBoost 창업 성공 예측 모델 학습
     python -m scripts.train_business_model --tune  # 하이퍼파라미터 튜닝
 """
 import argparse
-import json
 import pickle
+import sys
 import time
 from pathlib import Path
 from datetime import datetime
@@ -21,7 +21,6 @@ from sklearn.model_selection import (
     train_test_split,
     cross_val_score,
     StratifiedKFold,
-    TimeSeriesSplit,
     GridSearchCV
 )
 from sklearn.calibration import CalibratedClassifierCV
@@ -37,6 +36,10 @@ from sklearn.metrics import (
     log_loss as sklearn_log_loss,
 )
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.cv_runner import cv_progress_path, run_time_series_cv, write_json_atomic, accuracy_score as cv_accuracy
+
 
 class BusinessSuccessTrainer:
     """창업 성공 예측 모델 학습 파이프라인"""
@@ -357,7 +360,8 @@ class BusinessSuccessTrainer:
         self,
         X: pd.DataFrame,
         y: pd.Series,
-        cv: int = 5
+        cv: int = 5,
+        progress_path: Optional[Path] = None,
     ) -> dict:
         """
         교차 검증
@@ -366,22 +370,29 @@ class BusinessSuccessTrainer:
             X: 전체 데이터
             y: 전체 타겟
             cv: Fold 수
+            progress_path: fold별 진행 상황을 기록할 실행 파일 (cv_progress_path)
 
         Returns:
             교차 검증 결과
         """
-        if self.model is None:
-            self.model = xgb.XGBClassifier(**self.DEFAULT_PARAMS)
+        # 학습된 모델의 파라미터 사용 (캘리브레이션 모델이면 base 모델)
+        base_model = getattr(self.model, "estimator", self.model)
+        if not isinstance(base_model, xgb.XGBClassifier):
+            base_model = xgb.XGBClassifier(**self.DEFAULT_PARAMS)
 
         print(f"\n{'='*60}")
         print(f"{cv}-Fold 교차 검증")
         print(f"{'='*60}")
 
-        # TimeSeriesSplit (시간 순서 보존)
-        tscv = TimeSeriesSplit(n_splits=cv)
-
-        # Accuracy
-        scores = cross_val_score(self.model, X, y, cv=tscv, scoring="accuracy")
+        # TimeSeriesSplit (시간 순서 보존, fold 병렬)
+        result = run_time_series_cv(
+            base_model, X, y,
+            n_splits=cv,
+            score_fn=cv_accuracy,
+            score_name="Accuracy",
+            progress_path=progress_path,
+        )
+        scores = np.array(result["scores"])
 
         print(f"\nAccuracy: {scores.mean():.4f} (+/- {scores.std() * 2:.4f})")
         print(f"Fold별 점수: {scores}")
@@ -390,6 +401,7 @@ class BusinessSuccessTrainer:
             "mean": scores.mean(),
             "std": scores.std(),
             "scores": scores,
+            "folds": result["folds"],
         }
 
     def tune_hyperparameters(
@@ -586,15 +598,19 @@ def main():
     # 모델 평가 (캘리브레이션된 모델로)
     metrics = trainer.evaluate(X_test, y_test)
 
-    # 교차 검증
-    cv_result = trainer.cross_validate(pd.concat([X_train, X_test]), pd.concat([y_train, y_test]))
+    # 교차 검증 (fold별 진행 상황은 logs/cv_runs/에 기록, 메트릭 JSON은 완료 후 교체)
+    output_dir = Path(__file__).parent.parent / Path(args.output).parent
+    metrics_path = output_dir / "business_model_metrics.json"
+    cv_result = trainer.cross_validate(
+        pd.concat([X_train, X_test]), pd.concat([y_train, y_test]),
+        progress_path=cv_progress_path("business_model"),
+    )
     print(f"\n{'='*60}")
     print("피처 중요도")
     print(f"{'='*60}")
     print(importance.to_string(index=False))
 
     # 모델 저장
-    output_dir = Path(__file__).parent.parent / Path(args.output).parent
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = Path(__file__).parent.parent / args.output
     trainer.save_model(str(output_path))
@@ -624,14 +640,13 @@ def main():
             "mean": float(cv_result["mean"]),
             "std": float(cv_result["std"]),
             "scores": [float(s) for s in cv_result["scores"]],
+            "folds": cv_result["folds"],
         },
         "feature_importance_top20": importance.head(20).to_dict("records"),
         "hyperparameters": {k: v for k, v in (params or trainer.DEFAULT_PARAMS).items() if not callable(v)},
         "training_duration_seconds": round(time.time() - start_time, 1),
     }
-    metrics_path = output_dir / "business_model_metrics.json"
-    with open(metrics_path, "w", encoding="utf-8") as f:
-        json.dump(metrics_json, f, indent=2, ensure_ascii=False)
+    write_json_atomic(metrics_path, metrics_json)
     print(f"메트릭 저장: {metrics_path}")
 
     print(f"\n{'='*60}")
@@ -14,12 +14,18 @@ XGBoost 가격 예측 모델 학습 (v2 - 고도화)
     python -m scripts.train_model
     python -m scripts.train_model --tune          # 하이퍼파라미터 튜닝 (200 trials)
     python -m scripts.train_model --tune --trials 50  # 빠른 튜닝
+    python -m scripts.train_model --tune --tune-workers 4  # trial 병렬 (프로세스 4개)
     python -m scripts.train_model --ensemble      # LightGBM 앙상블
+    python -m scripts.train_model --reuse-features  # 캐시된 피처 행렬로 재학습 (데이터 로드 생략)
+    python -m scripts.train_model --low-memory    # category/float32 피처 (2~4GB 컨테이너)
+    python -m scripts.train_model --chunked --csv data/collected  # (시도, 연도) 파티션 + 외부 메모리 학습
 """
 import argparse
-import json
+import multiprocessing
+import os
 import pickle
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -33,7 +39,101 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.feature_engineering import FeatureEngineer
+from scripts.feature_engineering import FeatureEngineer, FEATURE_CACHE_DIR
+from scripts.cv_runner import cv_progress_path, run_time_series_cv, write_json_atomic, _native_params
+from scripts.chunked_features import ChunkedFeatureBuilder, ChunkedFeatureSet, CHUNKED_FEATURE_DIR
+from app.core.collected_dataset import COLLECTED_DATASET_DIR
+from app.core.compiled_trees import CompiledPriceModel
+
+# 하이퍼파라미터 튜닝 설정
+TUNE_STORAGE_DIR = Path(__file__).parent.parent / "data" / "optuna"
+TUNE_CV_SPLITS = 5
+TUNE_MAX_BIN = 256          # QuantileDMatrix bin 수 (fold 학습/검증 공유)
+TUNE_NUM_BOOST_ROUND = 1000
+TUNE_EARLY_STOPPING = 50
+
+
+def _journal_storage(path: str):
+    """프로세스 간 공유 Optuna 저장소 (저널 파일)"""
+    import optuna
+    try:
+        from optuna.storages.journal import JournalFileBackend
+    except ImportError:  # optuna < 4.0
+        from optuna.storages import JournalFileStorage as JournalFileBackend
+    return optuna.storages.JournalStorage(JournalFileBackend(path))
+
+
+def _tune_pruner():
+    from optuna.pruners import MedianPruner
+    return MedianPruner(n_startup_trials=10, n_warmup_steps=2)
+
+
+def _build_fold_matrices(X: np.ndarray, y: np.ndarray, n_splits: int = TUNE_CV_SPLITS) -> list:
+    """TimeSeriesSplit fold별 QuantileDMatrix (검증셋은 학습셋 bin 공유, 1회 생성)"""
+    folds = []
+    for train_idx, val_idx in TimeSeriesSplit(n_splits=n_splits).split(X):
+        dtrain = xgb.QuantileDMatrix(X[train_idx], y[train_idx], max_bin=TUNE_MAX_BIN)
+        dval = xgb.QuantileDMatrix(X[val_idx], y[val_idx], ref=dtrain)
+        folds.append((dtrain, dval, X[val_idx], y[val_idx]))
+    return folds
+
+
+def _tune_objective(trial, folds: list, n_threads: int) -> float:
+    """trial 1회: fold별 xgb.train + Early Stopping → 평균 MAPE"""
+    import optuna
+
+    params = {
+        "objective": "reg:squarederror",
+        "tree_method": "hist",
+        "max_bin": TUNE_MAX_BIN,
+        "max_depth": trial.suggest_int("max_depth", 3, 10),
+        "eta": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
+        "subsample": trial.suggest_float("subsample", 0.6, 1.0),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 1.0),
+        "min_child_weight": trial.suggest_int("min_child_weight", 1, 15),
+        "alpha": trial.suggest_float("reg_alpha", 1e-8, 10.0, log=True),
+        "lambda": trial.suggest_float("reg_lambda", 1e-8, 10.0, log=True),
+        "gamma": trial.suggest_float("gamma", 0.0, 5.0),
+        "seed": 42,
+        "nthread": n_threads,
+    }
+
+    mape_scores = []
+    for fold, (dtrain, dval, X_v, y_v) in enumerate(folds):
+        booster = xgb.train(
+            params, dtrain,
+            num_boost_round=TUNE_NUM_BOOST_ROUND,
+            evals=[(dval, "val")],
+            early_stopping_rounds=TUNE_EARLY_STOPPING,
+            verbose_eval=False,
+        )
+        y_pred = booster.inplace_predict(X_v, iteration_range=(0, booster.best_iteration + 1))
+        mask = y_v != 0
+        mape = np.mean(np.abs((y_v[mask] - y_pred[mask]) / y_v[mask])) * 100
+        mape_scores.append(mape)
+
+        # Pruning: 앞 fold에서 이미 나쁘면 조기 종료
+        trial.report(np.mean(mape_scores), fold)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
+
+    return float(np.mean(mape_scores))
+
+
+def _tune_worker(storage_path: str, study_name: str, X: np.ndarray, y: np.ndarray,
+                 n_trials: int, n_threads: int) -> int:
+    """튜닝 워커 프로세스: fold 행렬 1회 생성 후 공유 study에 trial 추가"""
+    import optuna
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=_journal_storage(storage_path),
+        pruner=_tune_pruner(),
+    )
+    folds = _build_fold_matrices(X, y)
+    study.optimize(lambda trial: _tune_objective(trial, folds, n_threads), n_trials=n_trials)
+    return n_trials
 
 
 class XGBoostTrainer:
@@ -55,16 +155,26 @@ class XGBoostTrainer:
         "n_jobs": -1,
     }
 
-    def __init__(self, feature_engineer: FeatureEngineer, csv_path: str = None):
+    def __init__(self, feature_engineer: FeatureEngineer, csv_path: str = None,
+                 cache_dir: Path = FEATURE_CACHE_DIR, reuse_features: bool = False):
         self.fe = feature_engineer
         self.csv_path = csv_path
+        self.cache_dir = cache_dir
+        self.reuse_features = reuse_features
+        self.X = None  # 전체 피처 행렬 (교차 검증 등에서 재사용)
+        self.y = None
         self.model = None
         self.shap_explainer = None
         self.residual_info = {}  # 잔차 기반 신뢰구간 정보
 
     def prepare_data(self) -> tuple:
         """학습 데이터 준비 (시간 기반 70/15/15 분할)"""
-        X, y = self.fe.prepare_training_data(csv_path=self.csv_path)
+        X, y = self.fe.prepare_training_data(
+            csv_path=self.csv_path,
+            cache_dir=self.cache_dir,
+            reuse_features=self.reuse_features,
+        )
+        self.X, self.y = X, y
 
         # ★ 시간 순서 분할 (데이터는 이미 정렬됨)
         n = len(X)
@@ -121,7 +231,10 @@ class XGBoostTrainer:
             raise ValueError("모델이 학습되지 않았습니다")
 
         y_pred = self.model.predict(X_test)
+        return self._score_predictions(y_test, y_pred)
 
+    def _score_predictions(self, y_test: pd.Series, y_pred: np.ndarray) -> dict:
+        """예측값 평가 지표 + 잔차 기반 신뢰구간 정보"""
         mae = mean_absolute_error(y_test, y_pred)
         rmse = np.sqrt(mean_squared_error(y_test, y_pred))
         r2 = r2_score(y_test, y_pred)
@@ -162,41 +275,70 @@ class XGBoostTrainer:
 
         return metrics
 
-    def cross_validate(self, X, y, cv: int = 5) -> dict:
-        """TimeSeriesSplit 교차 검증"""
-        print(f"\n{cv}-Fold TimeSeriesSplit 교차 검증 중...")
-
-        tscv = TimeSeriesSplit(n_splits=cv)
-        mape_scores = []
+    def train_external_memory(self, features: ChunkedFeatureSet, params: dict = None) -> dict:
+        """
+        청크 피처 파티션으로 학습 (XGBoost 외부 메모리 DataIter)
 
-        for fold, (train_idx, val_idx) in enumerate(tscv.split(X), 1):
-            X_train_cv = X.iloc[train_idx]
-            X_val_cv = X.iloc[val_idx]
-            y_train_cv = y.iloc[train_idx]
-            y_val_cv = y.iloc[val_idx]
+        train/val은 ExtMemQuantileDMatrix로 파티션을 디스크 캐시에 스트리밍하고,
+        test는 파티션별로 예측해 지표만 모음 (전체 행렬을 메모리에 올리지 않음)
+        """
+        if params is None:
+            params = self.DEFAULT_PARAMS.copy()
+        native_params, num_boost_round, early_stopping_rounds = _native_params(xgb.XGBRegressor(**params))
 
-            model_cv = xgb.XGBRegressor(**self.DEFAULT_PARAMS)
-            model_cv.fit(
-                X_train_cv, y_train_cv,
-                eval_set=[(X_val_cv, y_val_cv)],
-                verbose=False,
-            )
+        print(f"\n외부 메모리 학습 시작 (파티션 {len(features.partitions)}개, {features.rows}건)")
+        dtrain = xgb.ExtMemQuantileDMatrix(
+            features.iterator(self.fe, "train"), max_bin=native_params["max_bin"]
+        )
+        dval = xgb.ExtMemQuantileDMatrix(features.iterator(self.fe, "val"), ref=dtrain)
+        print(f"Train set: {dtrain.num_row()}건 (< {features.split_dates['val_start']})")
+        print(f"Val set:   {dval.num_row()}건 (< {features.split_dates['test_start']})")
+
+        booster = xgb.train(
+            native_params, dtrain,
+            num_boost_round=num_boost_round,
+            evals=[(dtrain, "train"), (dval, "val")],
+            early_stopping_rounds=early_stopping_rounds,
+            verbose_eval=100,
+        )
+        print(f"학습 완료! (best iteration: {booster.best_iteration})")
 
-            y_pred = model_cv.predict(X_val_cv)
-            mask = y_val_cv != 0
-            mape = np.mean(np.abs((y_val_cv[mask] - y_pred[mask]) / y_val_cv[mask])) * 100
-            mape_scores.append(mape)
+        # sklearn 래퍼로 감싸 기존 저장/SHAP/중요도 경로 재사용
+        self.model = xgb.XGBRegressor(**params)
+        self.model.load_model(bytearray(booster.save_raw("json")))
+
+        y_true, y_pred = [], []
+        for X_batch, y_batch in features.iterator(self.fe, "test").batches():
+            y_pred.append(self.model.predict(X_batch))
+            y_true.append(y_batch)
+        y_test = pd.concat(y_true, ignore_index=True)
+        print(f"Test set:  {len(y_test)}건 (newest)")
+        return self._score_predictions(y_test, np.concatenate(y_pred))
+
+    def cross_validate(self, X, y, cv: int = 5, mape_budget: float = None,
+                       progress_path: Path = None) -> dict:
+        """TimeSeriesSplit 교차 검증 (fold 병렬, MAPE 예산 초과 시 중단)"""
+        print(f"\n{cv}-Fold TimeSeriesSplit 교차 검증 중...")
 
-            print(f"  Fold {fold}: MAPE = {mape:.2f}% (train: {len(train_idx)}, val: {len(val_idx)})")
+        result = run_time_series_cv(
+            xgb.XGBRegressor(**self.DEFAULT_PARAMS), X, y,
+            n_splits=cv,
+            max_score=mape_budget,
+            progress_path=progress_path,
+        )
+        mape_scores = result["scores"]
 
         mean_mape = np.mean(mape_scores)
         std_mape = np.std(mape_scores)
-        print(f"\n교차 검증 결과: MAPE = {mean_mape:.2f}% ± {std_mape:.2f}%")
+        status = " (중단됨)" if result["aborted"] else ""
+        print(f"\n교차 검증 결과{status}: MAPE = {mean_mape:.2f}% ± {std_mape:.2f}% ({result['seconds']}s)")
 
         return {
             "cv_mape_mean": mean_mape,
             "cv_mape_std": std_mape,
             "cv_mape_scores": mape_scores,
+            "folds": result["folds"],
+            "aborted": result["aborted"],
         }
 
     def select_features(self, X, y, importance_threshold=0.005,
@@ -283,63 +425,60 @@ class XGBoostTrainer:
 
         return importance
 
-    def tune_hyperparameters(self, X, y, n_trials: int = 200):
-        """Optuna + MedianPruner + TimeSeriesSplit 하이퍼파라미터 튜닝"""
+    def tune_hyperparameters(self, X, y, n_trials: int = 200, n_workers: int = None):
+        """
+        Optuna + MedianPruner + TimeSeriesSplit 하이퍼파라미터 튜닝
+
+        - fold별 QuantileDMatrix를 워커당 1회만 생성 (trial마다 재생성하지 않음)
+        - 네이티브 xgb.train + Early Stopping
+        - trial을 프로세스 n_workers개에 분산, 저널 파일 저장소로 study 공유
+        """
         try:
             import optuna
-            from optuna.pruners import MedianPruner
         except ImportError:
             print("optuna 패키지가 필요합니다: pip install optuna")
             return self.DEFAULT_PARAMS
 
-        print(f"\n하이퍼파라미터 튜닝 시작 (trials: {n_trials}, TimeSeriesSplit)")
-
-        def objective(trial):
-            params = {
-                "n_estimators": 1000,
-                "max_depth": trial.suggest_int("max_depth", 3, 10),
-                "learning_rate": trial.suggest_float("learning_rate", 0.01, 0.3, log=True),
-                "subsample": trial.suggest_float("subsample", 0.6, 1.0),
-                "colsample_bytree": trial.suggest_float("colsample_bytree", 0.5, 1.0),
-                "min_child_weight": trial.suggest_int("min_child_weight", 1, 15),
-                "reg_alpha": trial.suggest_float("reg_alpha", 1e-8, 10.0, log=True),
-                "reg_lambda": trial.suggest_float("reg_lambda", 1e-8, 10.0, log=True),
-                "gamma": trial.suggest_float("gamma", 0.0, 5.0),
-                "random_state": 42,
-                "n_jobs": -1,
-            }
-
-            tscv = TimeSeriesSplit(n_splits=5)
-            mape_scores = []
-
-            for fold, (train_idx, val_idx) in enumerate(tscv.split(X)):
-                X_t, X_v = X.iloc[train_idx], X.iloc[val_idx]
-                y_t, y_v = y.iloc[train_idx], y.iloc[val_idx]
-
-                model = xgb.XGBRegressor(**params)
-                model.fit(
-                    X_t, y_t,
-                    eval_set=[(X_v, y_v)],
-                    verbose=False,
-                )
-
-                y_pred = model.predict(X_v)
-                mask = y_v != 0
-                mape = np.mean(np.abs((y_v[mask] - y_pred[mask]) / y_v[mask])) * 100
-                mape_scores.append(mape)
-
-                # Pruning: 앞 fold에서 이미 나쁘면 조기 종료
-                trial.report(np.mean(mape_scores), fold)
-                if trial.should_prune():
-                    raise optuna.TrialPruned()
+        cpu_count = os.cpu_count() or 1
+        if n_workers is None:
+            n_workers = max(1, cpu_count // 2)
+        n_workers = max(1, min(n_workers, n_trials))
+        n_threads = max(1, cpu_count // n_workers)
 
-            return np.mean(mape_scores)
+        print(f"\n하이퍼파라미터 튜닝 시작 (trials: {n_trials}, TimeSeriesSplit, "
+              f"워커 {n_workers}개 × {n_threads}스레드)")
 
+        TUNE_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+        study_name = f"xgb_tune_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        storage_path = str(TUNE_STORAGE_DIR / f"{study_name}.log")
         study = optuna.create_study(
+            study_name=study_name,
+            storage=_journal_storage(storage_path),
             direction="minimize",
-            pruner=MedianPruner(n_startup_trials=10, n_warmup_steps=2),
+            pruner=_tune_pruner(),
         )
-        study.optimize(objective, n_trials=n_trials, show_progress_bar=True)
+
+        X_values = X.to_numpy(dtype=np.float32)
+        y_values = y.to_numpy(dtype=np.float64)
+
+        if n_workers == 1:
+            folds = _build_fold_matrices(X_values, y_values)
+            study.optimize(
+                lambda trial: _tune_objective(trial, folds, n_threads),
+                n_trials=n_trials, show_progress_bar=True,
+            )
+        else:
+            shares = [n_trials // n_workers + (i < n_trials % n_workers) for i in range(n_workers)]
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as pool:
+                futures = [
+                    pool.submit(_tune_worker, storage_path, study_name,
+                                X_values, y_values, share, n_threads)
+                    for share in shares
+                ]
+                for future in futures:
+                    future.result()
+            print(f"완료된 trials: {len(study.trials)}")
 
         print(f"\n최적 파라미터:")
         for key, value in study.best_params.items():
@@ -370,13 +509,90 @@ class XGBoostTrainer:
             print(f"SHAP Explainer 저장: {shap_path}")
 
 
+def export_compiled_model(model, feature_names, models_dir: Path, lgbm_model=None):
+    """서빙용 컴파일 트리 앙상블 저장 (export 불가 모델이면 이전 파일 삭제 → XGBoost fallback)"""
+    compiled_path = models_dir / "compiled_model.pkl"
+    try:
+        compiled = CompiledPriceModel.export(model, feature_names, lgbm_model)
+    except ValueError as e:
+        print(f"컴파일 모델 export 생략: {e}")
+        compiled_path.unlink(missing_ok=True)
+        return None
+
+    with open(compiled_path, "wb") as f:
+        pickle.dump(compiled, f)
+    print(f"컴파일 모델 저장: {compiled_path}")
+    return compiled_path
+
+
+def run_chunked_training(trainer: XGBoostTrainer, dataset_dir: Path, models_dir: Path,
+                         reuse_features: bool = False):
+    """
+    --chunked: 파티션 피처 생성 → 외부 메모리 학습 → 저장
+
+    교차 검증/튜닝/피처 선택/앙상블은 전체 행렬이 필요하므로 생략
+    """
+    # ExtMemQuantileDMatrix는 xgboost 3.0부터 (피처 생성 전에 확인)
+    if not hasattr(xgb, "ExtMemQuantileDMatrix"):
+        raise RuntimeError(
+            f"--chunked는 xgboost>=3.0이 필요합니다 (현재 {xgb.__version__}). "
+            "pip install -U 'xgboost>=3.0'"
+        )
+
+    start_time = time.time()
+    fe = trainer.fe
+
+    if reuse_features and (CHUNKED_FEATURE_DIR / "manifest.json").exists():
+        print(f"청크 피처 재사용: {CHUNKED_FEATURE_DIR}")
+        features = ChunkedFeatureSet.load(CHUNKED_FEATURE_DIR)
+        fe.load(str(CHUNKED_FEATURE_DIR / "artifacts.pkl"))
+    else:
+        features = ChunkedFeatureBuilder(fe, dataset_dir).build()
+
+    metrics = trainer.train_external_memory(features)
+    trainer.get_feature_importance()
+    X_sample, _ = next(features.iterator(fe, "test").batches())
+    trainer.create_shap_explainer(X_sample.head(100))
+
+    trainer.save_model(str(models_dir / "xgboost_model.pkl"), str(models_dir / "shap_explainer.pkl"))
+    fe.save(str(models_dir / "feature_artifacts.pkl"))
+    with open(models_dir / "residual_info.pkl", "wb") as f:
+        pickle.dump(trainer.residual_info, f)
+    export_compiled_model(trainer.model, fe.feature_names, models_dir)
+
+    metrics_path = models_dir / "apartment_model_metrics.json"
+    write_json_atomic(metrics_path, {
+        "model_type": "apartment_price_regressor",
+        "timestamp": datetime.now().isoformat(),
+        "training_mode": "chunked_external_memory",
+        "data_summary": {
+            "rows": features.rows,
+            "partitions": len(features.partitions),
+            "split_dates": features.split_dates,
+            "features": len(fe.feature_names),
+            "feature_names": fe.feature_names,
+        },
+        "metrics": {k.lower(): float(v) for k, v in metrics.items()},
+        "residual_info": trainer.residual_info,
+        "hyperparameters": {k: v for k, v in trainer.DEFAULT_PARAMS.items() if not callable(v)},
+        "training_duration_seconds": round(time.time() - start_time, 1),
+    })
+    print(f"메트릭 저장: {metrics_path}")
+    print(f"\n=== 학습 완료 (chunked) === MAPE: {metrics['MAPE']:.2f}%")
+
+
 def main():
     parser = argparse.ArgumentParser(description="XGBoost 가격 예측 모델 학습 v2")
     parser.add_argument("--tune", action="store_true", help="하이퍼파라미터 튜닝")
     parser.add_argument("--trials", type=int, default=200, help="튜닝 trials 수")
-    parser.add_argument("--csv", type=str, help="CSV 파일 경로")
+    parser.add_argument("--tune-workers", type=int, help="튜닝 병렬 프로세스 수 (기본: CPU 코어 수 / 2)")
+    parser.add_argument("--csv", type=str, help="CSV 파일 또는 수집 Parquet 데이터셋 디렉터리 (data/collected)")
     parser.add_argument("--ensemble", action="store_true", help="LightGBM 앙상블")
     parser.add_argument("--select-features", action="store_true", help="피처 선택 적용")
+    parser.add_argument("--cv-mape-budget", type=float, help="교차 검증 fold MAPE 상한 (초과 시 중단, %%)")
+    parser.add_argument("--low-memory", action="store_true", help="메모리 최적화 피처 생성 (category/float32, 최대 RSS 출력)")
+    parser.add_argument("--chunked", action="store_true", help="파티션 단위 피처 생성 + 외부 메모리 학습 (--csv: 수집 데이터셋 디렉터리)")
+    parser.add_argument("--reuse-features", action="store_true", help="캐시된 피처 행렬 재사용 (데이터 로드/피처 생성 생략)")
     args = parser.parse_args()
 
     # 경로 설정
@@ -386,14 +602,20 @@ def main():
     model_path = models_dir / "xgboost_model.pkl"
     shap_path = models_dir / "shap_explainer.pkl"
     fe_path = models_dir / "feature_artifacts.pkl"
+    metrics_path = models_dir / "apartment_model_metrics.json"
 
     # Feature Engineering
-    fe = FeatureEngineer()
-    trainer = XGBoostTrainer(fe, csv_path=args.csv)
+    fe = FeatureEngineer(memory_optimized=args.low_memory)
+    trainer = XGBoostTrainer(fe, csv_path=args.csv, reuse_features=args.reuse_features)
 
     try:
         start_time = time.time()
 
+        if args.chunked:
+            dataset_dir = Path(args.csv) if args.csv else COLLECTED_DATASET_DIR
+            run_chunked_training(trainer, dataset_dir, models_dir, reuse_features=args.reuse_features)
+            return
+
         # 1. 데이터 준비 (시간 기반 분할)
         X_train, X_val, X_test, y_train, y_val, y_test = trainer.prepare_data()
 
@@ -401,7 +623,9 @@ def main():
         if args.tune:
             X_tune = pd.concat([X_train, X_val])
             y_tune = pd.concat([y_train, y_val])
-            best_params = trainer.tune_hyperparameters(X_tune, y_tune, n_trials=args.trials)
+            best_params = trainer.tune_hyperparameters(
+                X_tune, y_tune, n_trials=args.trials, n_workers=args.tune_workers
+            )
             trainer.DEFAULT_PARAMS.update(best_params)
 
         # 3. 모델 학습 (Early Stopping on validation set)
@@ -422,9 +646,12 @@ def main():
                 trainer.train(X_train_s, y_train, X_val_s, y_val)
                 metrics = trainer.evaluate(X_test_s, y_test)
 
-        # 6. 교차 검증
-        X_full, y_full = fe.prepare_training_data(csv_path=args.csv)
-        cv_result = trainer.cross_validate(X_full, y_full)
+        # 6. 교차 검증 (1단계 피처 행렬 재사용, fold별 진행 상황은 logs/cv_runs/에 기록)
+        cv_result = trainer.cross_validate(
+            trainer.X, trainer.y,
+            mape_budget=args.cv_mape_budget,
+            progress_path=cv_progress_path("apartment_model"),
+        )
 
         # 7. Feature Importance
         importance_df = trainer.get_feature_importance()
@@ -515,6 +742,9 @@ def main():
                 pickle.dump(lgbm_model, f)
             print(f"LightGBM 모델 저장: {lgbm_path}")
 
+        # 컴파일된 트리 앙상블 (서빙 선택 백엔드, PRICE_MODEL_BACKEND)
+        export_compiled_model(trainer.model, fe.feature_names, models_dir, lgbm_model)
+
         # 메트릭 JSON 영구 저장
         metrics_json = {
             "model_type": "apartment_price_regressor",
@@ -537,6 +767,8 @@ def main():
                 "cv_mape_mean": float(cv_result["cv_mape_mean"]),
                 "cv_mape_std": float(cv_result["cv_mape_std"]),
                 "cv_mape_scores": [float(s) for s in cv_result["cv_mape_scores"]],
+                "folds": cv_result["folds"],
+                "aborted": cv_result["aborted"],
             },
             "feature_importance_top20": [
                 {"feature": name, "importance": float(imp)}
@@ -548,9 +780,7 @@ def main():
             "hyperparameters": {k: v for k, v in trainer.DEFAULT_PARAMS.items() if not callable(v)},
             "training_duration_seconds": round(time.time() - start_time, 1),
         }
-        metrics_path = models_dir / "apartment_model_metrics.json"
-        with open(metrics_path, "w", encoding="utf-8") as f:
-            json.dump(metrics_json, f, indent=2, ensure_ascii=False)
+        write_json_atomic(metrics_path, metrics_json)
         print(f"메트릭 저장: {metrics_path}")
 
         print(f"\n=== 학습 완료 (v2) ===")
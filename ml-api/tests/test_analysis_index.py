@@ -0,0 +1,134 @@
+"""
+분석 결과 검색 인덱스 테스트 (전수 필터와 일치 / 커서 페이지 / 저장소 동기화)
+"""
+import asyncio
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.result_store import JobResultStore
+from app.services.analyzer_service import AnalyzerService, PriceAnalysis, RESULTS_NAME
+
+NAMES = ["래미안대치팰리스", "래미안퍼스티지", "자이", "개포자이", "힐스테이트", "현대", "현대아이파크"]
+REGIONS = ["11680", "11650", "41273"]
+
+
+def _analysis(apt_name, region_code, price):
+    return PriceAnalysis(
+        apt_name=apt_name, region_code=region_code, area=84.0,
+        base_price=price, estimated_price=price, min_price=int(price * 0.95),
+        max_price=int(price * 1.05), confidence=0.8,
+        price_factors={"floor": 0.0}, recent_trades=3,
+        avg_trade_price=price, market_trend="보합", analyzed_at="2025-01-01T00:00:00",
+    )
+
+
+@pytest.fixture
+def service(tmp_path):
+    store = JobResultStore(tmp_path / "results")
+    rng = np.random.default_rng(3)
+    for j in range(3):
+        analyses = [
+            _analysis(
+                NAMES[rng.integers(len(NAMES))],
+                REGIONS[rng.integers(len(REGIONS))],
+                int(rng.integers(50, 80)) * 1000,  # 동일 가격 다수 → 커서 경계 검증
+            )
+            for _ in range(200)
+        ]
+        store.put(f"analyze_{j}", RESULTS_NAME, [asdict(a) for a in analyses])
+    return AnalyzerService(results=store)
+
+
+def _brute_force(service, apt_name=None, region_code=None, min_price=None, max_price=None):
+    rows = [r for job_id in service.result_job_ids() for r in service.get_results(job_id)]
+    order = sorted(range(len(rows)), key=lambda i: (rows[i].estimated_price, i))
+    return [
+        rows[i] for i in order
+        if (not apt_name or apt_name in rows[i].apt_name)
+        and (not region_code or rows[i].region_code == region_code)
+        and (not min_price or rows[i].estimated_price >= min_price)
+        and (not max_price or rows[i].estimated_price <= max_price)
+    ]
+
+
+def _all_pages(service, limit, **filters):
+    items, cursor = [], None
+    while True:
+        page, cursor = service.search_analysis(limit=limit, cursor=cursor, **filters)
+        assert len(page) <= limit
+        items.extend(page)
+        if cursor is None:
+            return items
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"region_code": "11680"},
+    {"min_price": 60000, "max_price": 70000},
+    {"region_code": "41273", "min_price": 65000},
+    {"apt_name": "래미안"},
+    {"apt_name": "자이", "region_code": "11650", "max_price": 72000},
+    {"apt_name": "현"},
+    {"apt_name": "없는단지"},
+    {"region_code": "99999"},
+])
+def test_search_matches_brute_force(service, filters):
+    assert _all_pages(service, 37, **filters) == _brute_force(service, **filters)
+
+
+def test_first_page_and_cursor(service):
+    page, cursor = service.search_analysis(region_code="11680", limit=5)
+    assert len(page) == 5 and cursor is not None
+    assert page == _brute_force(service, region_code="11680")[:5]
+
+    everything, cursor = service.search_analysis(limit=10_000)
+    assert len(everything) == 600 and cursor is None
+
+
+def test_index_follows_result_store(service):
+    total = len(_brute_force(service))
+    service.results.delete("analyze_0")
+    service._sync_index(force=True)
+    assert len(service.index) == total - 200
+
+    trades = [{
+        "region_code": "11680", "apt_name": "신규단지", "area": 84.0, "floor": 5,
+        "price": 150000, "deal_date": "2025-01-10", "built_year": 2020,
+    }]
+    job = service.create_job(["11680"])
+    asyncio.run(service.analyze_all_regions(["11680"], trades, job.job_id))
+    page, _ = service.search_analysis(apt_name="신규")
+    assert [r.apt_name for r in page] == ["신규단지"]
+
+
+def test_cursor_survives_rebuild(service):
+    tagged = [
+        (r.estimated_price, j, i, r)
+        for j, job_id in enumerate(service.result_job_ids())
+        for i, r in enumerate(service.get_results(job_id))
+    ]
+    ordered = sorted(tagged, key=lambda t: t[:3])
+    # 마지막 작업의 행에서 끊고 같은 가격이 뒤에 이어지는 지점 (재구성 전후 위치가 달라지는 경계)
+    cut = next(
+        k for k in range(1, len(ordered))
+        if ordered[k - 1][1] == 2 and ordered[k][0] == ordered[k - 1][0]
+    )
+
+    first, cursor = service.search_analysis(limit=cut)
+    assert first == [t[3] for t in ordered[:cut]]
+
+    # 앞쪽 작업이 만료되어 재구성 → 남은 결과의 정렬 키는 그대로
+    service.results.delete("analyze_0")
+    service._sync_index(force=True)
+    rest = []
+    while cursor is not None:
+        page, cursor = service.search_analysis(limit=40, cursor=cursor)
+        rest.extend(page)
+
+    assert rest == [t[3] for t in ordered[cut:] if t[1] != 0]
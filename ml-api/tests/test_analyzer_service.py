@@ -0,0 +1,152 @@
+"""
+가격 분석 서비스 테스트 (벡터화 지역 분석 = 반복 참조 구현, 단일 아파트 분석과 같은 규칙)
+"""
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.result_store import JobResultStore
+from app.services.analyzer_service import AnalyzerService, PriceAnalysis
+
+
+@pytest.fixture
+def service(tmp_path):
+    return AnalyzerService(results=JobResultStore(tmp_path / "results"))
+
+
+@pytest.fixture
+def trades():
+    """거래일 오름차순 (목록 순서 = 시간 순서) 샘플 거래"""
+    rng = np.random.default_rng(7)
+    apts = ["래미안", "자이", "힐스테이트", "현대"]
+    areas = [59.9, 84.97, 84.5, 114.8, 134.2]
+    start = date(2023, 1, 1)
+    rows = []
+    for i in range(400):
+        apt = apts[rng.integers(len(apts))]
+        area = areas[rng.integers(len(areas))]
+        rows.append({
+            "region_code": "11680",
+            "apt_name": apt,
+            "area": area,
+            "floor": int(rng.integers(1, 26)),
+            "price": int(rng.integers(80000, 300000)) if i % 37 else 0,
+            "deal_date": (start + timedelta(days=i)).isoformat(),
+            "built_year": 1990 + apts.index(apt) * 8,
+        })
+    return rows
+
+
+def _trend(trades):
+    """시간순 전반부 vs 후반부 평균 (±3%)"""
+    if len(trades) < 3:
+        return "보합"
+    ordered = sorted(trades, key=lambda t: t["deal_date"])
+    mid = len(ordered) // 2
+    early = [t["price"] for t in ordered[:mid] if t["price"]]
+    late = [t["price"] for t in ordered[mid:] if t["price"]]
+    if not early or not late:
+        return "보합"
+    change = (np.mean(late) - np.mean(early)) / np.mean(early)
+    return "상승" if change > 0.03 else "하락" if change < -0.03 else "보합"
+
+
+def _reference(service, trades, region_code):
+    """단지·면적별 반복 분석 (같은 지역·단지, 면적 ±10%, 거래일 기준 최근 10건)"""
+    results = []
+    apts = {}
+    for t in trades:
+        if t["region_code"] == region_code:
+            apts.setdefault(t["apt_name"], []).append(t)
+    for apt_name, apt_trades in apts.items():
+        for area in {t["area"] for t in apt_trades if t["area"] > 0}:
+            latest = max((t for t in apt_trades if abs(t["area"] - area) < 5), key=lambda x: x["deal_date"])
+            similar = sorted(
+                (t for t in apt_trades if area * 0.9 <= t["area"] <= area * 1.1),
+                key=lambda x: x["deal_date"],
+            )[-10:]
+            prices = [t["price"] for t in similar if t["price"]]
+            base = int(np.mean(prices)) if prices else 0
+            factors = service.calculate_price_adjustment(latest["floor"], 20, latest["built_year"])
+            estimated = int(base * (1 + sum(factors.values())))
+            confidence = min(0.9, 0.5 + len(similar) * 0.05)
+            margin = 0.05 if confidence > 0.7 else 0.10
+            results.append(PriceAnalysis(
+                apt_name=apt_name, region_code=region_code, area=area,
+                base_price=base, estimated_price=estimated,
+                min_price=int(estimated * (1 - margin)), max_price=int(estimated * (1 + margin)),
+                confidence=confidence, price_factors=factors, recent_trades=len(similar),
+                avg_trade_price=base, market_trend=_trend(similar), analyzed_at="",
+            ))
+    return results
+
+
+def _key(analysis):
+    row = analysis.__dict__.copy()
+    row.pop("analyzed_at")
+    return row
+
+
+def test_vectorized_region_matches_per_apartment_analysis(service, trades):
+    got = asyncio.run(service.analyze_region("11680", trades, "job"))
+    expected = _reference(service, trades, "11680")
+
+    assert len(got) == len(expected)
+    by_target = {(a.apt_name, a.area): _key(a) for a in got}
+    for exp in expected:
+        assert by_target[(exp.apt_name, exp.area)] == _key(exp)
+
+
+def test_region_scoping_and_empty_regions(service, trades):
+    other = [dict(t, region_code="41273", price=t["price"] * 2) for t in trades[:50]]
+    got = asyncio.run(service.analyze_region("41273", trades + other, "job"))
+    assert {a.region_code for a in got} == {"41273"}
+    assert all(a.recent_trades <= 10 for a in got)
+    assert asyncio.run(service.analyze_region("99999", trades, "job")) == []
+
+
+def test_analyze_all_regions_stores_results(service, trades):
+    job = service.create_job(["11680", "41273"])
+    result = asyncio.run(service.analyze_all_regions(["11680", "41273"], trades, job.job_id))
+    assert result["total_analyzed"] == len(service.get_results(job.job_id)) > 0
+    assert service.get_job(job.job_id).status.value == "completed"
+
+
+def test_single_apartment_uses_region_rules(service, trades):
+    other = [dict(t, region_code="41273", price=t["price"] * 2) for t in trades]
+    shuffled = list(reversed(trades)) + other  # 목록 순서가 아닌 거래일 기준
+    region = {(a.apt_name, a.area): a for a in asyncio.run(service.analyze_region("11680", trades, "job"))}
+
+    for (apt_name, area), expected in list(region.items())[:5]:
+        latest = max(
+            (t for t in trades if t["apt_name"] == apt_name and abs(t["area"] - area) < 5),
+            key=lambda x: x["deal_date"],
+        )
+        got = service.analyze_apartment(
+            apt_name=apt_name, region_code="11680", area=area,
+            floor=latest["floor"], built_year=latest["built_year"], trade_data=shuffled,
+        )
+        assert _key(got) == _key(expected)
+
+
+def test_single_apartment_extra_factors_and_fallback(service, trades):
+    got = service.analyze_apartment(
+        apt_name="래미안", region_code="11680", area=84.97, floor=20, built_year=2020,
+        trade_data=trades, near_subway=True, is_branded=True,
+    )
+    assert got.price_factors["subway"] == 0.03 and got.price_factors["brand"] == 0.02
+    assert got.estimated_price == int(got.base_price * (1 + sum(got.price_factors.values())))
+
+    # 유사 거래 없음 → 지역 평균 기반 기준가
+    missing = service.analyze_apartment(
+        apt_name="없는단지", region_code="11680", area=84.97, floor=5, built_year=2000, trade_data=trades,
+    )
+    assert missing.recent_trades == 0
+    assert missing.base_price == service._estimate_from_region("11680", 84.97, trades) > 0
+    assert missing.confidence == 0.5
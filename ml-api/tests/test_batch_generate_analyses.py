@@ -0,0 +1,119 @@
+"""
+배치 분석 생성 테스트 (지역 재스코어링: 새 분석 저장 후 이전 분석 삭제)
+"""
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import batch_generate_analyses as batch
+
+
+class FakeQuery:
+    """sb.table(...) 체인 중 사용하는 부분만 흉내낸 메모리 테이블 쿼리"""
+
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.op = "select"
+        self.rows = None
+        self.filters = []
+        self.window = None
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end + 1)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append((column, set(values)))
+        return self
+
+    def insert(self, rows):
+        self.op, self.rows = "insert", rows
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    def _matches(self, row):
+        return all(row.get(column) in values for column, values in self.filters)
+
+    def execute(self):
+        rows = self.db.tables.setdefault(self.table, [])
+        if self.op == "insert":
+            if self.table == "chamgab_analyses" and self.rows["property_id"] in self.db.fail_insert:
+                raise RuntimeError("insert 실패")
+            new = [self.rows] if isinstance(self.rows, dict) else list(self.rows)
+            for row in new:
+                row.setdefault("id", f"{self.table}-{next(self.db.ids)}")
+            rows.extend(new)
+            return type("Result", (), {"data": new})()
+        if self.op == "delete":
+            self.db.tables[self.table] = [row for row in rows if not self._matches(row)]
+            return type("Result", (), {"data": []})()
+        data = [row for row in rows if self._matches(row)]
+        if self.window:
+            data = data[self.window[0]:self.window[1]]
+        return type("Result", (), {"data": data})()
+
+
+class FakeSupabase:
+    def __init__(self, tables):
+        self.tables = tables
+        self.ids = itertools.count(1)
+        self.fail_insert = set()
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+class StubSpec:
+    feature_names = ["area_exclusive"]
+
+    def transform(self, records):
+        return np.array([[r["area_exclusive"]] for r in records], dtype=np.float32)
+
+
+class StubModel:
+    def predict(self, features):
+        return features[:, 0] * 1e7
+
+
+def test_region_rescore_keeps_old_analysis_when_scoring_fails(monkeypatch):
+    monkeypatch.setattr(batch.ApartmentFeatureSpec, "from_bundle", classmethod(lambda cls, a: StubSpec()))
+    monkeypatch.setattr(batch.time, "sleep", lambda s: None)
+
+    properties = [
+        {"id": "p1", "sido": "서울특별시", "sigungu": "강남구", "area_exclusive": 84},
+        {"id": "p2", "sido": "서울특별시", "sigungu": "강남구", "area_exclusive": 59},
+        {"id": "p3", "sido": "부산광역시", "sigungu": "해운대구", "area_exclusive": 84},
+    ]
+    sb = FakeSupabase({
+        "properties": properties,
+        "chamgab_analyses": [
+            {"id": "old1", "property_id": "p1"},
+            {"id": "old2", "property_id": "p2"},
+            {"id": "old3", "property_id": "p3"},
+        ],
+        "price_factors": [{"id": "f1", "analysis_id": "old1"}, {"id": "f2", "analysis_id": "old2"}],
+    })
+    sb.fail_insert = {"p2"}
+
+    created, _ = batch.generate_analyses(
+        sb, StubModel(), artifacts={}, shap_explainer=None, residual_info=None,
+        skip_existing=False, region_codes=["11680"],
+    )
+
+    analyses = {row["id"]: row["property_id"] for row in sb.tables["chamgab_analyses"]}
+    assert created == 1
+    # p1: 새 분석으로 교체 / p2: 스코어링 실패 → 이전 분석 유지 / p3: 대상 지역 아님
+    assert "old1" not in analyses and list(analyses.values()).count("p1") == 1
+    assert analyses["old2"] == "p2" and analyses["old3"] == "p3"
+    assert [f["id"] for f in sb.tables["price_factors"]] == ["f2"]
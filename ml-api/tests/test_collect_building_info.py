@@ -0,0 +1,124 @@
+"""
+건축물대장 동시 수집 테스트 (그룹별 1회 조회, 메모리 매칭, 일괄 UPSERT)
+"""
+import sys
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import collect_building_info as cbi
+
+
+class FakeTable:
+    def __init__(self, client, name):
+        self.client, self.name = client, name
+
+    def upsert(self, rows, on_conflict=""):
+        self.client.upserts.append((self.name, rows, on_conflict))
+        saved = [{**row, "id": row.get("id") or f"bi-{row['mgm_bld_rgst_pk']}"} for row in rows]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=saved))
+
+
+class FakeClient:
+    def __init__(self):
+        self.upserts = []
+
+    def table(self, name):
+        return FakeTable(self, name)
+
+
+def building(pk, name, units, **extra):
+    return {"mgmBldrgstPk": pk, "bldNm": name, "hhldCnt": str(units), "bun": "0001",
+            "ji": "0000", "mainPurpsCdNm": "아파트", **extra}
+
+
+# (시군구, 법정동) → 대장 항목 (150건 조합은 2페이지)
+REGISTRY = {
+    ("11680", "10300"): [building("A", "래미안개포", 1200, grndFlrCnt="35", mainBldCnt="12"),
+                         building("B", "개포자이", 900)]
+                        + [building(f"X{i}", f"근린생활시설{i}", 0) for i in range(148)],
+    ("11680", "00000"): [building("C", "도곡렉슬", 3000)],
+}
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    calls = Counter()
+
+    async def fake_fetch(session, sigungu_cd, bjdong_cd, page_no=1, num_of_rows=100):
+        calls[(sigungu_cd, bjdong_cd, page_no)] += 1
+        items = REGISTRY.get((sigungu_cd, bjdong_cd), [])
+        page = items[(page_no - 1) * num_of_rows:page_no * num_of_rows]
+        if not page:
+            return None
+        return {"response": {"header": {"resultCode": "00"},
+                             "body": {"items": {"item": page}, "totalCount": len(items)}}}
+
+    monkeypatch.setattr(cbi, "SUPABASE_URL", "http://test")
+    monkeypatch.setattr(cbi, "SUPABASE_KEY", "key")
+    monkeypatch.setattr(cbi, "API_KEY", "key")
+    monkeypatch.setattr(cbi, "REQUEST_DELAY", 0)
+    monkeypatch.setattr(cbi, "create_client", lambda *args: FakeClient())
+    monkeypatch.setattr(cbi, "fetch_building_info_async", fake_fetch)
+    instance = cbi.BuildingInfoCollector()
+    instance.calls = calls
+    return instance
+
+
+def complex_row(cx_id, name, emd):
+    return {"id": cx_id, "name": name, "address": f"서울특별시 강남구 {emd}", "sido": "서울특별시",
+            "sigungu": "강남구", "eupmyeondong": emd}
+
+
+def test_concurrent_groups_fetch_once_and_bulk_upsert(collector):
+    sigungu_map = {"강남구": "11680"}
+    bjdong_map = {"11680": {"개포동": "10300", "도곡동": "11800"}}
+    complexes = [
+        complex_row("c1", "래미안개포아파트", "개포동"),
+        complex_row("c2", "개포자이", "개포동"),
+        complex_row("c3", "없는단지", "개포동"),
+        complex_row("c4", "도곡렉슬", "도곡동"),  # 법정동 응답 없음 → 시군구 전체
+        {**complex_row("c5", "미상", "어딘가동"), "sigungu": "없는구"},
+    ]
+
+    collector.process_concurrent(complexes, sigungu_map, bjdong_map, concurrency=4)
+
+    # 조합·페이지별 1회 조회
+    assert all(count == 1 for count in collector.calls.values())
+    assert set(collector.calls) == {("11680", "10300", 1), ("11680", "10300", 2),
+                                    ("11680", "11800", 1), ("11680", "00000", 1)}
+
+    tables = [name for name, _, _ in collector.client.upserts]
+    assert tables[0] == "building_info" and set(tables[1:]) == {"complexes"}
+    _, bi_rows, conflict = collector.client.upserts[0]
+    assert conflict == cbi.BUILDING_INFO_CONFLICT
+    assert {row["complex_id"] for row in bi_rows} == {"c1", "c2", "c4"}
+
+    by_id = {row["id"]: row for _, rows, _ in collector.client.upserts[1:] for row in rows}
+    assert by_id["c1"]["total_units"] == 1200 and by_id["c1"]["total_floors"] == 35
+    assert by_id["c1"]["building_info_id"] == "bi-A"
+    assert by_id["c4"]["total_units"] == 3000 and by_id["c4"]["name"] == "도곡렉슬"
+    assert collector.stats == {**collector.stats, "updated": 3, "not_found": 1, "no_code": 1}
+
+
+def test_complex_rows_grouped_by_columns(collector):
+    """확장 필드 구성이 다른 행은 별도 UPSERT (누락 컬럼 NULL 덮어쓰기 방지)"""
+    items = REGISTRY[("11680", "10300")]
+    plans = [
+        {"cx": complex_row("c1", "래미안개포", "개포동"), "sigungu_cd": "11680", "bjdong_cd": "10300",
+         "matched": items[0], "total_units": 1200, "parking_ratio": 1.2},
+        {"cx": complex_row("c2", "개포자이", "개포동"), "sigungu_cd": "11680", "bjdong_cd": "10300",
+         "matched": items[1], "total_units": 900, "parking_ratio": None},
+    ]
+
+    updated = collector.bulk_update_complexes(plans, {})
+
+    assert updated == {"c1", "c2"}
+    batches = [rows for name, rows, _ in collector.client.upserts]
+    assert len(batches) == 2
+    for rows in batches:
+        assert len({tuple(sorted(row)) for row in rows}) == 1
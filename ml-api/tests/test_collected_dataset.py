@@ -0,0 +1,84 @@
+"""
+수집 Parquet 데이터셋 테스트 (upsert / 필터 읽기 / compaction)
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.collected_dataset import CollectedDataset
+
+
+def _trade(region_code="11680", deal_date="2025-01-15", price=150000, floor=10, collected_at="2025-02-01T00:00:00"):
+    return {
+        "source": "molit",
+        "region_code": region_code,
+        "apt_name": "래미안",
+        "area": 84.97,
+        "floor": floor,
+        "price": price,
+        "deal_date": deal_date,
+        "built_year": 2015,
+        "dong": "대치동",
+        "jibun": "1",
+        "collected_at": collected_at,
+    }
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    return CollectedDataset(tmp_path / "collected")
+
+
+def test_upsert_dedupes_on_unique_key(dataset):
+    assert dataset.upsert([_trade(), _trade(floor=11)]) == 2
+    # 같은 키 재수집 → 추가 없음, 최신 collected_at 유지
+    assert dataset.upsert([_trade(collected_at="2025-03-01T00:00:00")]) == 0
+
+    df = dataset.read()
+    assert len(df) == 2
+    assert sorted(df["collected_at"]) == ["2025-02-01T00:00:00", "2025-03-01T00:00:00"]
+    assert (dataset.root / "region_code=11680" / "year_month=202501" / "part-0.parquet").exists()
+
+
+def test_read_filters_prune_partitions(dataset):
+    dataset.upsert([
+        _trade(),
+        _trade(region_code="41273", deal_date="2025-02-03"),
+        _trade(region_code="41273", deal_date="2025-03-03"),
+    ])
+
+    assert len(dataset.read(region_codes=["41273"])) == 2
+    assert len(dataset.read(start_month="202502")) == 2
+    only = dataset.read(region_codes=["41273"], end_month="202502", columns=["price", "year_month"])
+    assert list(only.columns) == ["price", "year_month"]
+    assert only["year_month"].tolist() == ["202502"]
+    # 파티션 컬럼은 문자열 유지 (선행 0 보존)
+    assert dataset.read()["region_code"].dtype == object
+
+
+def test_compact_merges_split_partition(dataset):
+    dataset.upsert([_trade()])
+    part_dir = dataset.root / "region_code=11680" / "year_month=202501"
+    table = pq.read_table(part_dir / "part-0.parquet")
+    pq.write_table(table, part_dir / "part-extra.parquet")
+
+    assert len(dataset.read()) == 2
+    stats = dataset.compact()
+    assert stats == {"partitions": 1, "compacted": 1, "rows_removed": 1}
+    assert [p.name for p in part_dir.glob("*.parquet")] == ["part-0.parquet"]
+    assert len(dataset.read()) == 1
+
+
+def test_import_legacy_csv(dataset, tmp_path):
+    csv_path = tmp_path / "latest_collected.csv"
+    rows = [_trade(), _trade(), _trade(region_code="26350", deal_date="2024-12-01")]
+    pd.DataFrame(rows).drop(columns=["source"]).to_csv(csv_path, index=False)
+
+    assert dataset.import_csv(csv_path) == 2
+    df = dataset.read(region_codes=["26350"])
+    assert df["price"].tolist() == [150000]
@@ -0,0 +1,128 @@
+"""
+수집 작업 저장소 / 체크포인트 재개 테스트
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.job_store import CollectionJobStore, is_month_settled
+from app.core.result_store import JobResultStore
+from app.services.collector_service import CollectorService, CollectionStatus
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CollectionJobStore(tmp_path / "jobs.db")
+
+
+@pytest.fixture
+def results(tmp_path):
+    return JobResultStore(tmp_path / "results")
+
+
+@pytest.fixture
+def service(store, results, monkeypatch):
+    svc = CollectorService(job_store=store, results=results)
+    svc.RONE_STATS = {}
+    calls = []
+
+    async def fake_fetch(session, region_code, year_month, raise_errors=False):
+        calls.append((region_code, year_month))
+        if region_code == "FAIL":
+            raise RuntimeError("HTTP 500")
+        return [{"region_code": region_code, "deal_date": f"{year_month[:4]}-{year_month[4:]}-01",
+                 "apt_name": "테스트", "area": 84.0, "floor": 5, "price": 100000}]
+
+    async def fake_persist(rows):
+        failed = [i for i, row in enumerate(rows) if row["region_code"] in svc.supabase_down]
+        return len(rows) - len(failed), failed
+
+    monkeypatch.setattr(svc, "fetch_molit_trade", fake_fetch)
+    monkeypatch.setattr(svc, "_persist_to_supabase", fake_persist)
+    monkeypatch.setattr(svc, "_save_to_dataset", lambda rows: len(rows))
+    svc.fetch_calls = calls
+    svc.supabase_down = set()  # Supabase 저장이 실패하는 지역
+    return svc
+
+
+def test_month_settled_after_reporting_window():
+    assert is_month_settled("202501", "2025-03-05T00:00:00")
+    assert not is_month_settled("202501", "2025-02-10T00:00:00")
+    assert is_month_settled("202412", "2025-02-01T00:00:00")
+
+
+def test_job_persisted_across_service_instances(store, results, service):
+    job = service.create_job(["11680"], 2025, [1])
+    asyncio.run(service.collect_regions(["11680"], 2025, [1], job.job_id))
+
+    restarted = CollectorService(job_store=store, results=results)
+    loaded = restarted.get_job(job.job_id)
+    assert loaded is not None
+    assert loaded.status == CollectionStatus.COMPLETED
+    assert loaded.molit_count == 1
+    assert loaded.cells_completed == loaded.cells_total == 1
+
+    cell = store.get_cell("11680", "202501", "molit")
+    assert cell["row_count"] == 1
+    assert len(cell["checksum"]) == 16
+
+    # 수집 결과는 결과 저장소에서 재시작 후에도 조회
+    assert restarted.get_collected_page(job.job_id, "molit", 0, 10)[1] == 1
+
+
+def test_failed_cells_resume_without_refetching(store, service):
+    job = service.create_job(["11680", "FAIL"], 2025, [1, 2])
+    asyncio.run(service.collect_regions(["11680", "FAIL"], 2025, [1, 2], job.job_id))
+
+    assert service.get_job(job.job_id).status == CollectionStatus.FAILED
+    assert service.get_job(job.job_id).cells_completed == 2
+
+    service.fetch_calls.clear()
+    asyncio.run(service.collect_regions(["11680", "FAIL"], 2025, [1, 2], job.job_id))
+    assert sorted(service.fetch_calls) == [("FAIL", "202501"), ("FAIL", "202502")]
+    assert service.get_job(job.job_id).cells_skipped == 2
+
+
+def test_supabase_failure_is_not_checkpointed(store, service):
+    service.supabase_down = {"11650"}
+    job = service.create_job(["11680", "11650"], 2025, [1])
+    asyncio.run(service.collect_regions(["11680", "11650"], 2025, [1], job.job_id))
+
+    assert store.get_cell("11680", "202501", "molit") is not None
+    assert store.get_cell("11650", "202501", "molit") is None
+    assert service.get_job(job.job_id).cells_completed == 1
+
+    # 재개 시 Supabase 저장에 실패한 셀만 다시 수집
+    service.supabase_down = set()
+    service.fetch_calls.clear()
+    asyncio.run(service.collect_regions(["11680", "11650"], 2025, [1], job.job_id))
+    assert service.fetch_calls == [("11650", "202501")]
+    assert store.get_cell("11650", "202501", "molit") is not None
+
+
+def test_resume_interrupted_jobs(store, results, service):
+    job = service.create_job(["11680"], 2025, [3])
+    job.status = CollectionStatus.RUNNING
+    store.save_job(job.__dict__)
+
+    restarted = CollectorService(job_store=store, results=results)
+    restarted.RONE_STATS = {}
+    restarted.fetch_molit_trade = service.fetch_molit_trade
+    restarted._persist_to_supabase = service._persist_to_supabase
+    restarted._save_to_dataset = service._save_to_dataset
+
+    resumed = asyncio.run(restarted.resume_interrupted_jobs())
+    assert resumed == [job.job_id]
+    assert restarted.get_job(job.job_id).status == CollectionStatus.COMPLETED
+
+
+def test_pending_months(store):
+    store.mark_cells([(("11680", "202401", "molit"), 10, "abc")], "old_job")
+    # 신고 기한이 지난 뒤 수집된 셀은 확정
+    assert store.pending_months(["11680"], ["202401"]) == []
+    # 수집 기록이 없는 지역이 있으면 해당 월은 미완료
+    assert store.pending_months(["11680", "11650"], ["202401"]) == ["202401"]
@@ -0,0 +1,126 @@
+"""
+컴파일된 트리 앙상블 테스트 (XGBoost / LightGBM 예측 일치, 서빙 선택)
+"""
+import pickle
+import sys
+from pathlib import Path
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import compiled_trees
+from app.core.compiled_trees import CompiledPriceModel, CompiledTrees
+from app.services.model_service import ModelService
+from scripts.train_model import export_compiled_model
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(4)
+    n = 1500
+    X = pd.DataFrame(rng.normal(size=(n, 10)), columns=[f"f{i}" for i in range(10)])
+    X.loc[::5, "f3"] = np.nan  # 결측 분기
+    X.loc[::3, "f4"] = 0.0     # zero_as_missing 분기
+    X["f5"] = rng.integers(0, 5, n)
+    y = 5e8 + 1e8 * X["f1"] - 3e7 * X["f2"] ** 2 + 2e7 * X["f3"].fillna(1) + 1e7 * X["f4"] + 1e7 * X["f5"]
+    return X, y
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "numpy"])
+def kernel(request, monkeypatch):
+    if request.param and not compiled_trees.HAS_NUMBA:
+        pytest.skip("numba 미설치")
+    monkeypatch.setattr(compiled_trees, "HAS_NUMBA", request.param)
+
+
+def test_xgboost_matches_booster(data, kernel):
+    X, y = data
+    model = xgb.XGBRegressor(n_estimators=150, max_depth=6, n_jobs=1).fit(X, y)
+    compiled = CompiledTrees.from_xgboost(model, list(X.columns))
+
+    X_test = X.copy()
+    X_test.loc[::4, "f7"] = np.nan
+    # XGBoost는 리프 합을 float32로 누적 → 상대오차 ~1e-6
+    np.testing.assert_allclose(compiled.predict(X_test.to_numpy()), model.predict(X_test), rtol=1e-5)
+
+
+def test_xgboost_early_stopping_truncates(data):
+    X, y = data
+    model = xgb.XGBRegressor(n_estimators=500, learning_rate=0.3, early_stopping_rounds=5, n_jobs=1)
+    model.fit(X.iloc[:1000], y.iloc[:1000], eval_set=[(X.iloc[1000:], y.iloc[1000:])], verbose=False)
+    compiled = CompiledTrees.from_xgboost(model, list(X.columns))
+
+    assert len(compiled.roots) == model.best_iteration + 1
+    np.testing.assert_allclose(compiled.predict(X.to_numpy()), model.predict(X), rtol=1e-5)
+
+
+@pytest.mark.parametrize("zero_as_missing", [False, True])
+def test_lightgbm_matches_booster(data, kernel, zero_as_missing):
+    X, y = data
+    model = lgb.LGBMRegressor(n_estimators=120, zero_as_missing=zero_as_missing, verbose=-1).fit(X, y)
+    compiled = CompiledTrees.from_lightgbm(model, list(X.columns))
+
+    np.testing.assert_allclose(compiled.predict(X.to_numpy()), model.predict(X), rtol=1e-12)
+
+
+def test_ensemble_bundle_in_model_service(data, tmp_path):
+    X, y = data
+    model = xgb.XGBRegressor(n_estimators=80, n_jobs=1).fit(X, y)
+    lgbm = lgb.LGBMRegressor(n_estimators=80, verbose=-1).fit(X, y)
+    feature_names = list(X.columns)
+
+    assert export_compiled_model(model, feature_names, tmp_path, lgbm) == tmp_path / "compiled_model.pkl"
+    with open(tmp_path / "compiled_model.pkl", "rb") as f:
+        compiled = pickle.load(f)
+
+    service = ModelService(model, {"feature_names": feature_names}, {"ensemble": True}, lgbm, compiled)
+    reference = ModelService(model, {"feature_names": feature_names}, {"ensemble": True}, lgbm)
+    assert service.compiled_model is compiled
+    for i in range(10):
+        features = X.iloc[[i]]
+        assert service._predict_value(features) == pytest.approx(reference._predict_value(features), rel=1e-5)
+
+    # 피처 순서가 다른 번들은 사용하지 않음 (Booster 경로로 fallback)
+    stale = CompiledPriceModel.export(model, feature_names[::-1])
+    mismatched = ModelService(model, {"feature_names": feature_names}, None, None, stale)
+    assert mismatched.compiled_model is None
+
+
+def test_unsupported_model_removes_stale_export(data, tmp_path):
+    X, y = data
+    stale = tmp_path / "compiled_model.pkl"
+    stale.write_bytes(b"old")
+    model = xgb.XGBRegressor(n_estimators=5, booster="gblinear", n_jobs=1).fit(X, y)
+
+    assert export_compiled_model(model, list(X.columns), tmp_path) is None
+    assert not stale.exists()  # 이전 모델의 컴파일 파일로 서빙하지 않도록 삭제
+
+
+def test_feature_count_mismatch_falls_back(data, tmp_path):
+    X, y = data
+    selected = list(X.columns[:6])  # --select-features: XGBoost만 선택 피처로 재학습
+    model = xgb.XGBRegressor(n_estimators=5, max_depth=3, n_jobs=1).fit(X[selected], y)
+    lgbm = lgb.LGBMRegressor(n_estimators=5, num_leaves=7, n_jobs=1, verbose=-1).fit(X, y)
+
+    with pytest.raises(ValueError):
+        CompiledTrees.from_lightgbm(lgbm, selected)
+    with pytest.raises(ValueError):
+        CompiledTrees.from_xgboost(model, list(X.columns))
+    stale = tmp_path / "compiled_model.pkl"
+    stale.write_bytes(b"old")
+    assert export_compiled_model(model, selected, tmp_path, lgbm_model=lgbm) is None
+    assert not stale.exists()
+
+
+def test_warm_up_warns_without_numba(monkeypatch, capsys):
+    monkeypatch.setattr(compiled_trees, "HAS_NUMBA", False)
+    model = CompiledPriceModel.__new__(CompiledPriceModel)
+    model.feature_names = ["a"]
+    monkeypatch.setattr(model, "predict", lambda X: np.zeros(len(X)), raising=False)
+    model.warm_up()
+    assert "numba not installed" in capsys.readouterr().out
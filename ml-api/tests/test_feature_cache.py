@@ -0,0 +1,83 @@
+"""
+피처 행렬 캐시 테스트 (스냅샷 해시 적중 / --reuse-features / 데이터 변경 시 재생성)
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.feature_engineering import FeatureEngineer
+
+
+def _raw(n=50, shift=0):
+    return pd.DataFrame({
+        "transaction_date": pd.date_range("2024-01-01", periods=n).astype(str),
+        "area_exclusive": np.linspace(59, 135, n),
+        "price": np.arange(n) * 1_000_000 + 500_000_000 + shift,
+    })
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """데이터 로드/피처 생성 호출 기록 (외부 서비스 없이)"""
+    calls = {"load": 0, "build": 0, "raw": _raw()}
+
+    def load(self, csv_path=None, region_codes=None, start_month=None):
+        calls["load"] += 1
+        return calls["raw"].copy()
+
+    def build(self, df):
+        calls["build"] += 1
+        self.feature_names = ["area_exclusive", "month"]
+        self.fill_values = {"area_exclusive": float(df["area_exclusive"].median())}
+        self.is_fitted = True
+        X = pd.DataFrame({
+            "area_exclusive": df["area_exclusive"].astype(np.float64),
+            "month": pd.to_datetime(df["transaction_date"]).dt.month.astype(np.int64),
+        })
+        return X, df["price"].rename("price")
+
+    monkeypatch.setattr(FeatureEngineer, "load_training_data", load)
+    monkeypatch.setattr(FeatureEngineer, "_build_training_data", build)
+    return calls
+
+
+def test_cache_hit_restores_matrix_and_encoders(calls, tmp_path):
+    X1, y1 = FeatureEngineer().prepare_training_data(cache_dir=tmp_path)
+    fe = FeatureEngineer()
+    X2, y2 = fe.prepare_training_data(cache_dir=tmp_path)
+
+    assert calls["build"] == 1
+    pd.testing.assert_frame_equal(X1, X2)
+    pd.testing.assert_series_equal(y1, y2)
+    assert fe.feature_names == ["area_exclusive", "month"]
+    assert fe.fill_values == {"area_exclusive": 97.0}
+    assert fe.is_fitted
+
+
+def test_snapshot_change_invalidates(calls, tmp_path):
+    FeatureEngineer().prepare_training_data(cache_dir=tmp_path)
+    calls["raw"] = _raw(shift=1)
+    FeatureEngineer().prepare_training_data(cache_dir=tmp_path)
+    assert calls["build"] == 2
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_reuse_features_skips_data_load(calls, tmp_path):
+    # 캐시 없음 → 평소대로 생성
+    FeatureEngineer().prepare_training_data(cache_dir=tmp_path, reuse_features=True)
+    assert (calls["load"], calls["build"]) == (1, 1)
+
+    X, y = FeatureEngineer().prepare_training_data(cache_dir=tmp_path, reuse_features=True)
+    assert (calls["load"], calls["build"]) == (1, 1)
+    assert len(X) == len(y) == 50
+
+
+def test_without_cache_dir_always_builds(calls, tmp_path):
+    FeatureEngineer().prepare_training_data()
+    FeatureEngineer().prepare_training_data()
+    assert calls["build"] == 2
@@ -0,0 +1,229 @@
+"""
+가격 모델 피처 엔지니어링 테스트 (벡터화 K-fold target encoding / 메모리 최적화 모드 / 청크 처리)
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import KFold
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import feature_spec
+from app.core.collected_dataset import CollectedDataset
+from scripts.chunked_features import ChunkedFeatureBuilder, ChunkedFeatureSet
+from scripts.feature_engineering import FeatureEngineer
+
+
+def _reference_target_encode(df, col, target, smoothing=20):
+    """기존 폴드별 groupby 구현"""
+    global_mean = target.mean()
+    agg = pd.DataFrame({"target": target, "col": df[col]}).groupby("col")["target"].agg(["mean", "count"])
+    smooth = (agg["count"] * agg["mean"] + smoothing * global_mean) / (agg["count"] + smoothing)
+
+    encoded = pd.Series(np.nan, index=df.index)
+    kf = KFold(n_splits=5, shuffle=True, random_state=42)
+    for train_idx, val_idx in kf.split(df):
+        train_target = target.iloc[train_idx]
+        train_col = df[col].iloc[train_idx]
+        fold_global = train_target.mean()
+        fold_agg = pd.DataFrame({"t": train_target, "c": train_col}).groupby("c")["t"].agg(["mean", "count"])
+        fold_smooth = (fold_agg["count"] * fold_agg["mean"] + smoothing * fold_global) / (fold_agg["count"] + smoothing)
+        encoded.iloc[val_idx] = df[col].iloc[val_idx].map(fold_smooth.to_dict()).fillna(fold_global)
+    return encoded, smooth.to_dict(), global_mean
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(11)
+    n = 5000
+    dongs = np.array([f"동{i}" for i in range(300)], dtype=object)
+    dong = dongs[rng.zipf(1.3, n) % 300]
+    dong[rng.random(n) < 0.02] = None  # 결측 동
+    df = pd.DataFrame({"dong": dong}, index=np.arange(n) * 3)  # 비연속 인덱스
+    # 원 단위 정수 가격 (만원 * 10000)
+    price = pd.Series(rng.integers(10_000, 300_000, n) * 10_000, index=df.index, dtype=np.float64)
+    return df, price
+
+
+def test_matches_reference_bit_for_bit(frame):
+    df, price = frame
+    fe = FeatureEngineer()
+    got = fe._target_encode(df, "dong", price, fit=True)
+    expected, mapping, global_mean = _reference_target_encode(df, "dong", price)
+
+    assert got.index.equals(df.index)
+    assert np.array_equal(got.to_numpy(), expected.to_numpy())
+    assert fe.target_encoders["dong"]["global_mean"] == global_mean
+    assert fe.target_encoders["dong"]["mapping"] == mapping
+
+
+def test_matches_reference_on_float_targets(frame):
+    df, _ = frame
+    target = pd.Series(np.random.default_rng(5).lognormal(20, 0.5, len(df)), index=df.index)
+    got = FeatureEngineer()._target_encode(df, "dong", target, fit=True)
+    expected, _, _ = _reference_target_encode(df, "dong", target)
+    np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_inference_uses_saved_mapping(frame):
+    df, price = frame
+    fe = FeatureEngineer()
+    fe._target_encode(df, "dong", price, fit=True)
+
+    new = pd.DataFrame({"dong": ["동0", "없는동", None]})
+    encoded = fe._target_encode(new, "dong", None, fit=False)
+    enc = fe.target_encoders["dong"]
+    assert encoded.tolist() == [enc["mapping"]["동0"], enc["global_mean"], enc["global_mean"]]
+
+
+@pytest.fixture
+def raw_transactions(monkeypatch):
+    monkeypatch.setattr(FeatureEngineer, "_load_building_info", lambda self: pd.DataFrame())
+
+    rng = np.random.default_rng(2)
+    n = 400
+    sigungus = np.array(["강남구", "서초구", "송파구", "마포구"], dtype=object)
+    return pd.DataFrame({
+        "transaction_date": pd.date_range("2022-01-01", periods=n, freq="3D").astype(str),
+        "price": rng.integers(30_000, 250_000, n) * 10_000.0,
+        "area_exclusive": rng.choice([59.9, 84.97, 114.5, 134.0], n),
+        "floor": rng.integers(1, 30, n).astype(float),
+        "prop_built_year": rng.integers(1985, 2022, n).astype(float),
+        "prop_sido": "서울시",
+        "prop_sigungu": sigungus[rng.integers(0, 4, n)],
+        "dong": np.array([f"동{i}" for i in range(12)], dtype=object)[rng.integers(0, 12, n)],
+        "apt_name": np.array([f"단지{i}" for i in range(20)], dtype=object)[rng.integers(0, 20, n)],
+    })
+
+
+def test_memory_optimized_matches_default(raw_transactions):
+    X_ref, y_ref = FeatureEngineer()._build_training_data(raw_transactions.copy())
+    fe = FeatureEngineer(memory_optimized=True)
+    X, y = fe._build_training_data(raw_transactions.copy())
+
+    assert list(X.columns) == list(X_ref.columns)
+    pd.testing.assert_series_equal(y, y_ref)
+    np.testing.assert_allclose(X.to_numpy(np.float64), X_ref.to_numpy(np.float64), rtol=1e-6)
+    assert X.memory_usage(deep=True).sum() < 0.6 * X_ref.memory_usage(deep=True).sum()
+    assert not (X.dtypes == np.float64).any()
+    assert set(fe.target_encoders["dong"]["mapping"]) == {f"동{i}" for i in range(12)}
+
+
+def test_service_features_use_shared_spec_functions(raw_transactions):
+    df = FeatureEngineer(memory_optimized=True).create_features(raw_transactions)
+
+    assert df["sigungu"].dtype == "category"
+    sigungu = df["sigungu"].astype(object)
+    expected = {
+        **feature_spec.poi_features(sigungu),
+        **feature_spec.market_features(df["transaction_year"], df["transaction_month"], sigungu),
+        **feature_spec.property_features(df["building_age"], sigungu),
+        **feature_spec.footfall_features(df.index),
+    }
+    for col, values in expected.items():
+        np.testing.assert_allclose(df[col].to_numpy(np.float64), values.to_numpy(np.float64), rtol=1e-6)
+    assert df["distance_to_subway"].dtype == np.float32
+
+
+def test_temporal_history_uses_only_past_months():
+    fe = FeatureEngineer()
+    df = pd.DataFrame({
+        "transaction_date": pd.to_datetime(
+            ["2023-01-10", "2023-02-10", "2023-02-20", "2023-04-05", "2024-03-01", "2023-03-15"]
+        ),
+        "sigungu": ["강남구"] * 5 + ["서초구"],
+        "apt_name": ["A", "A", "A", "A", "A", "B"],
+        "area_segment": ["m"] * 6,
+        "price": [100.0, 200.0, 400.0, 600.0, 900.0, 50.0],
+    })
+    fe._apply_temporal_features(df, *fe._temporal_history(*fe._monthly_aggregates(df)))
+
+    # 2023-04: 이전 월평균 1월 100, 2월 300
+    april = df.iloc[3]
+    assert april["price_lag_1m"] == 300.0
+    assert april["price_lag_3m"] == 200.0
+    assert april["price_rolling_6m_mean"] == 200.0
+    assert april["price_rolling_6m_std"] == 100.0
+    assert np.isnan(april["volume_lag_1m"])  # 3월 거래 없음
+    assert df.iloc[2]["volume_lag_1m"] == 1  # 2월 행 → 1월 1건
+    assert np.isnan(df.iloc[0]["price_lag_1m"]) and np.isnan(df.iloc[5]["price_lag_1m"])
+    # 2024-03: 전월(2024-02) 거래 없음 → YoY 없음, 최근 3개월 = 2·4월
+    assert np.isnan(df.iloc[4]["price_yoy_change"])
+    assert df.iloc[4]["price_lag_3m"] == pytest.approx((100 + 300 + 600) / 3)
+
+
+@pytest.fixture
+def collected(raw_transactions, tmp_path):
+    """raw_transactions와 같은 행을 (시도, 연도) 여러 파티션의 수집 데이터셋으로"""
+    region_codes = {"강남구": "11680", "서초구": "11650", "송파구": "11710", "마포구": "26440"}
+    raw = raw_transactions
+    rows = pd.DataFrame({
+        "region_code": raw["prop_sigungu"].map(region_codes),
+        "sigungu": raw["prop_sigungu"],
+        "apt_name": raw["apt_name"],
+        "area": raw["area_exclusive"],
+        "floor": raw["floor"].astype(int),
+        "price": (raw["price"] // 10_000).astype(int),
+        "deal_date": raw["transaction_date"],
+        "built_year": raw["prop_built_year"].astype(int),
+        "dong": raw["dong"],
+    })
+    dataset = CollectedDataset(tmp_path / "collected")
+    dataset.upsert(rows.to_dict("records"))
+    return dataset
+
+
+def test_collected_sido_from_region_code(collected):
+    df = FeatureEngineer._normalize_collected(collected.read())
+    sido = df.groupby(df["region_code"].astype(str))["prop_sido"].unique()
+    assert list(sido["11680"]) == ["서울특별시"]
+    assert list(sido["26440"]) == ["부산광역시"]
+
+
+@pytest.mark.parametrize("memory_optimized", [False, True])
+def test_chunked_matches_in_memory(collected, tmp_path, memory_optimized):
+    ref = FeatureEngineer(memory_optimized=memory_optimized)
+    X_ref, y_ref = ref._build_training_data(ref._normalize_collected(collected.read()))
+
+    fe = FeatureEngineer(memory_optimized=memory_optimized)
+    builder = ChunkedFeatureBuilder(fe, collected.root, tmp_path / "chunked")
+    features = builder.build()
+    assert len(features.partitions) == len(builder.partitions()) > 2
+    X = pd.concat([pd.read_parquet(p.path) for p in features.partitions], ignore_index=True)
+    assert features.rows == len(X) == len(X_ref)
+
+    # target encoding은 폴드 배정 방식이 다름 (행 키 해시) → 나머지 피처를 행 집합으로 비교
+    X = fe._smart_fill_missing(X[fe.feature_names].copy(), fit=False)
+    cols = [c for c in X_ref.columns if not c.endswith("_target_enc")]
+    got = X[cols].astype(np.float64).sort_values(cols).reset_index(drop=True)
+    expected = X_ref[cols].astype(np.float64).sort_values(cols).reset_index(drop=True)
+    np.testing.assert_allclose(got.to_numpy(), expected.to_numpy(), rtol=1e-6)
+
+    assert fe.target_encoders["dong"]["mapping"] == pytest.approx(ref.target_encoders["dong"]["mapping"])
+    assert {k: v for k, v in fe.fill_values.items() if not k.endswith("_target_enc")} == pytest.approx(
+        {k: v for k, v in ref.fill_values.items() if not k.endswith("_target_enc")}
+    )
+
+
+def test_partition_iterator_feeds_external_memory(collected, tmp_path):
+    import xgboost as xgb
+
+    fe = FeatureEngineer()
+    features = ChunkedFeatureBuilder(fe, collected.root, tmp_path / "chunked").build()
+    features = ChunkedFeatureSet.load(tmp_path / "chunked")
+
+    sizes = {
+        split: sum(len(y) for _, y in features.iterator(fe, split).batches())
+        for split in ("train", "val", "test")
+    }
+    assert sum(sizes.values()) == features.rows
+    assert sizes["train"] > sizes["val"] > 0 and sizes["test"] > 0
+
+    dtrain = xgb.ExtMemQuantileDMatrix(features.iterator(fe, "train"), max_bin=32)
+    assert (dtrain.num_row(), dtrain.num_col()) == (sizes["train"], len(fe.feature_names))
+    booster = xgb.train({"max_depth": 3, "max_bin": 32, "nthread": 1}, dtrain, num_boost_round=5)
+    X_test, _ = next(features.iterator(fe, "test").batches())
+    assert booster.inplace_predict(X_test.to_numpy(np.float32)).shape == (len(X_test),)
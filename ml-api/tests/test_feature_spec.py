@@ -0,0 +1,209 @@
+"""
+공유 피처 스펙 테스트 (학습 아티팩트 → 서빙/배치 공용 피처 계산)
+"""
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import LabelEncoder
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.feature_spec import COMPOUND_CITIES, ApartmentFeatureSpec, SigunguKeyResolver, sido_prefix
+from app.services.model_service import ModelService
+from scripts.feature_engineering import FeatureEngineer
+
+# 기존 광역시 약칭 표 (지역 코드 사전 기반 sido_prefix와 같아야 함)
+METRO_SHORT = {
+    "부산광역시": "부산", "대구광역시": "대구",
+    "인천광역시": "인천", "광주광역시": "광주",
+    "대전광역시": "대전", "울산광역시": "울산",
+    "세종특별자치시": "세종",
+}
+SIGUNGU_KEYS = ["강남구", "중구", "부산중구", "부산해운대구", "안산시단원구", "성남시분당구"]
+TEMPORAL = {
+    "price_lag_1m": 1.1e9, "price_lag_3m": 1.0e9, "price_rolling_6m_mean": 9e8,
+    "price_rolling_6m_std": 1e7, "price_yoy_change": 0.05, "volume_lag_1m": 3.0,
+}
+
+
+@pytest.fixture
+def artifacts():
+    return {
+        "label_encoders": {
+            "sido": LabelEncoder().fit(["서울시", "부산광역시", "경기도"]),
+            "sigungu": LabelEncoder().fit(SIGUNGU_KEYS),
+        },
+        "target_encoders": {
+            "sigungu": {"mapping": {k: 1e8 * (i + 1) for i, k in enumerate(SIGUNGU_KEYS)}, "global_mean": 3.3e8},
+            "dong": {"mapping": {"역삼동": 9e8}, "global_mean": 4e8},
+        },
+        "fill_values": {"sigungu_target_enc": 6e8, "volume_lag_1m": 12, "unknown_feature": 7.5},
+        "feature_names": FeatureEngineer().get_feature_columns() + ["unknown_feature"],
+        "brand_tiers": {"래미안": 3, "힐스테이트": 2},
+    }
+
+
+@pytest.fixture
+def records():
+    rng = np.random.default_rng(5)
+    n = 200
+    return pd.DataFrame({
+        "area_exclusive": rng.choice([59.9, 84.97, 0.0, np.nan], n),
+        "floor": rng.choice([1.0, 12.0, np.nan], n),
+        "transaction_year": rng.choice([2024, 2025, 2026], n),
+        "transaction_month": rng.integers(1, 13, n),
+        "prop_sido": rng.choice(["서울시", "부산광역시", "경기도", None], n),
+        "prop_sigungu": rng.choice(["강남구", "중구", "해운대구", "단원구", "분당구", None], n),
+        "prop_eupmyeondong": rng.choice(["역삼동", "대치동", None], n),
+        "prop_built_year": rng.choice([1985.0, 2012.0, np.nan], n),
+        "prop_floors": rng.choice([0.0, 25.0, np.nan], n),
+        "complex_built_year": rng.choice([1992.0, np.nan], n),
+        "complex_brand": rng.choice(["래미안", "무명", "", None], n),
+    })
+
+
+def _scan_sigungu_key(sido, sigungu, mapping):
+    """기존 구현 (suffix 매칭 시 매핑 전체 스캔)"""
+    if sido in ("서울특별시", "서울시"):
+        return sigungu
+    sido_short = METRO_SHORT.get(sido, "")
+    if sido_short and sido_short + sigungu in mapping:
+        return sido_short + sigungu
+    if sigungu in COMPOUND_CITIES and COMPOUND_CITIES[sigungu] + sigungu in mapping:
+        return COMPOUND_CITIES[sigungu] + sigungu
+    matches = [k for k in mapping if k.endswith(sigungu)]
+    if len(matches) == 1:
+        return matches[0]
+    return sido_short + sigungu if sido_short else sigungu
+
+
+def test_sido_prefix_uses_gazetteer():
+    for sido, short in METRO_SHORT.items():
+        assert sido_prefix(sido) == short
+    for sido in ("서울특별시", "서울시", "경기도", "제주특별자치도", "", None, "없는도"):
+        assert sido_prefix(sido) == ""
+    assert sido_prefix("부산시") == "부산"  # 통칭도 사전으로 해석
+
+
+def test_sigungu_key_resolution(capsys):
+    resolver = SigunguKeyResolver(dict.fromkeys(SIGUNGU_KEYS, 1.0))
+
+    assert resolver.resolve("서울시", "중구") == "중구"
+    assert resolver.resolve("부산광역시", "중구") == "부산중구"
+    assert resolver.resolve("경기도", "단원구") == "안산시단원구"
+    assert resolver.resolve("경기도", "분당구") == "성남시분당구"
+    assert resolver.resolve("부산광역시", "해운대구") == "부산해운대구"
+    # 매핑에 없는 광역시 구 → 서울 '중구'와 충돌하지 않는 키 (global_mean fallback)
+    assert resolver.resolve("대구광역시", "중구") == "대구중구"
+    assert resolver.ambiguous == ["중구"]
+    assert capsys.readouterr().out.count("suffix 중복") == 1  # 빌드 시 1회만 로그
+
+
+def test_resolver_matches_scan():
+    mapping = dict.fromkeys(
+        SIGUNGU_KEYS + ["대구중구", "인천서구", "대전서구", "수원시영통구", "고양시일산서구", "청주시흥덕구", "춘천시"], 1.0
+    )
+    resolver = pickle.loads(pickle.dumps(SigunguKeyResolver(mapping)))
+    sidos = ["서울시", "경기도", "충청북도", "강원특별자치도", *METRO_SHORT]
+    sigungus = ["중구", "서구", "일산서구", "영통구", "흥덕구", "춘천시", "단원구", "해운대구", "수성구", "구"]
+
+    for sido in sidos:
+        for sigungu in sigungus:
+            assert resolver.resolve(sido, sigungu) == _scan_sigungu_key(sido, sigungu, mapping), (sido, sigungu)
+
+
+def test_bulk_matches_single_record(artifacts, records):
+    spec = ApartmentFeatureSpec.from_artifacts(artifacts)
+    bulk = spec.transform(records)
+
+    assert list(bulk.columns) == artifacts["feature_names"]
+    single = pd.concat(
+        [spec.transform([row]) for row in records.to_dict("records")], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(bulk.astype(np.float64), single.astype(np.float64))
+    assert (bulk["unknown_feature"] == 7.5).all()
+    assert (bulk["price_lag_1m"] == 6e8).all()  # temporal 미조회 → 가격수준 fallback
+
+
+def test_encodings_and_provided_features(artifacts):
+    spec = ApartmentFeatureSpec.from_artifacts(artifacts)
+    X = spec.transform([
+        {"prop_sido": "부산광역시", "prop_sigungu": "중구", "prop_eupmyeondong": "역삼동",
+         "complex_brand": "래미안", "distance_to_subway": 120.0, **TEMPORAL},
+        {"prop_sido": "대구광역시", "prop_sigungu": "중구", "distance_to_subway": None},
+    ])
+
+    classes = list(artifacts["label_encoders"]["sigungu"].classes_)
+    assert X["sigungu_encoded"].tolist() == [classes.index("부산중구"), 0]  # 미등장 키 → 0
+    assert X["sigungu_target_enc"].tolist() == [3e8, 3.3e8]
+    assert X["dong_target_enc"].tolist() == [9e8, 4e8]
+    assert X["brand_tier"].tolist() == [3, 1]
+    assert X["distance_to_subway"].tolist() == [120.0, 700.0]  # 입력값 우선, 결측 → 등급 추정
+    assert X.loc[0, "price_lag_1m"] == TEMPORAL["price_lag_1m"]
+
+
+def test_model_service_uses_bundled_spec(artifacts, tmp_path, monkeypatch):
+    fe = FeatureEngineer()
+    fe.label_encoders = artifacts["label_encoders"]
+    fe.target_encoders = artifacts["target_encoders"]
+    fe.fill_values = artifacts["fill_values"]
+    fe.feature_names = artifacts["feature_names"]
+    fe.save(str(tmp_path / "feature_artifacts.pkl"))
+    with open(tmp_path / "feature_artifacts.pkl", "rb") as f:
+        bundle = pickle.load(f)
+
+    assert isinstance(bundle["feature_spec"], ApartmentFeatureSpec)
+    monkeypatch.setattr(ApartmentFeatureSpec, "from_artifacts", None)  # 번들 스펙 재사용 (재컴파일 없음)
+    monkeypatch.setattr(ModelService, "_get_temporal_features", lambda self, *args: dict(TEMPORAL))
+    service = ModelService(None, bundle)
+
+    property_data = {"prop_sido": "경기도", "prop_sigungu": "단원구", "area_exclusive": 84.97,
+                     "complex_built_year": 1995, "complex_brand": "힐스테이트"}
+    expected = bundle["feature_spec"].transform([{**property_data, **TEMPORAL}])
+    pd.testing.assert_frame_equal(service._prepare_features(property_data), expected)
+    assert service._prepare_features(property_data).loc[0, "sigungu_target_enc"] == 5e8  # 안산시단원구
+
+
+def test_training_featurization_matches_transform(monkeypatch):
+    monkeypatch.setattr(FeatureEngineer, "_load_building_info", lambda self: pd.DataFrame())
+    rng = np.random.default_rng(8)
+    n = 240
+    raw = pd.DataFrame({
+        "transaction_date": pd.date_range("2023-01-01", periods=n, freq="2D").astype(str),
+        "price": rng.integers(30_000, 250_000, n) * 10_000.0,
+        "area_exclusive": rng.choice([59.9, 84.97, 114.5], n),
+        "floor": rng.integers(1, 30, n).astype(float),
+        "prop_built_year": rng.choice([1985.0, 1996.0, 2012.0], n),
+        "prop_floors": rng.choice([15.0, 25.0], n),
+        "prop_sido": "서울시",
+        "prop_sigungu": rng.choice(["강남구", "마포구", "영등포구", "노원구"], n),
+        "dong": rng.choice(["역삼동", "합정동", "상계동"], n),
+        "apt_name": rng.choice(["A", "B", "C"], n),
+        "complex_brand": rng.choice(["래미안", "자이", None], n),
+    })
+    fe = FeatureEngineer()
+    X_train, _ = fe._build_training_data(raw.copy())
+    spec = fe.compile_spec()
+
+    # 학습 행렬과 같은 행 (가격 1~99% 구간, 거래일 순)
+    kept = raw[raw["price"].between(raw["price"].quantile(0.01), raw["price"].quantile(0.99))]
+    served = spec.transform(kept)
+    # lag/rolling은 학습 시 거래 이력, target encoding은 K-fold → 그 외 피처는 같은 값
+    cols = [c for c in spec.feature_names
+            if not c.endswith("_target_enc") and c not in TEMPORAL]
+    np.testing.assert_allclose(
+        served[cols].to_numpy(np.float64), X_train[cols].to_numpy(np.float64), rtol=1e-9
+    )
+
+    # 학습 피처 경로 (create_features → 저장된 인코더) == transform, 전체 피처
+    rows = kept.head(20)
+    expected = pd.concat(
+        [fe.prepare_inference_features(row) for row in rows.to_dict("records")], ignore_index=True
+    )
+    pd.testing.assert_frame_equal(
+        spec.transform(rows).astype(np.float64), expected[spec.feature_names].astype(np.float64)
+    )
@@ -0,0 +1,106 @@
+"""
+좌표 색인 / 유동인구 접근성 지표 테스트 (배치 계산 = 지점별 Haversine 루프)
+"""
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.geo import GeoIndex, haversine_m, radius_label
+from scripts.collect_footfall_data import FootfallDataCollector, haversine_distance
+
+
+def scalar_haversine(lat1, lon1, lat2, lon2):
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin(math.radians(lat2 - lat1) / 2) ** 2 + \
+        math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    return 6371000 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def random_points(rng, n):
+    """서울 범위 좌표"""
+    return rng.uniform(37.45, 37.70, n), rng.uniform(126.80, 127.15, n)
+
+
+@pytest.fixture
+def collector():
+    rng = np.random.default_rng(5)
+    instance = FootfallDataCollector(api_key="test")
+    lat, lon = random_points(rng, 300)
+    instance._subway_stations_cache = pd.DataFrame({"역명": range(300), "위도": lat, "경도": lon})
+    for poi_type, n in [("school", 1200), ("hospital", 2500), ("park", 400)]:
+        lat, lon = random_points(rng, n)
+        instance._poi_cache[f"{poi_type}_cache"] = pd.DataFrame(
+            {"name": range(n), "latitude": lat, "longitude": lon})
+    return instance
+
+
+def test_haversine_matches_scalar():
+    rng = np.random.default_rng(1)
+    lat1, lon1 = random_points(rng, 50)
+    lat2, lon2 = random_points(rng, 50)
+
+    expected = [scalar_haversine(*args) for args in zip(lat1, lon1, lat2, lon2)]
+    np.testing.assert_allclose(haversine_m(lat1, lon1, lat2, lon2), expected, rtol=1e-12)
+    assert haversine_distance(lat1[0], lon1[0], lat2[0], lon2[0]) == pytest.approx(expected[0], rel=1e-12)
+
+
+def test_geo_index_matches_brute_force():
+    rng = np.random.default_rng(2)
+    lat, lon = random_points(rng, 2000)
+    centers = random_points(rng, 100)
+    index = GeoIndex(np.append(lat, np.nan), np.append(lon, 127.0))  # 결측 좌표 제외
+    assert len(index) == 2000
+
+    distances = haversine_m(centers[0][:, None], centers[1][:, None], lat[None, :], lon[None, :])
+    found = index.query(*centers)
+    np.testing.assert_allclose(found["nearest"], distances.min(axis=1), rtol=1e-9)
+    np.testing.assert_array_equal(found["count_500m"], (distances <= 500).sum(axis=1))
+    np.testing.assert_array_equal(found["count_1km"], (distances <= 1000).sum(axis=1))
+
+    empty = GeoIndex([], [])
+    assert np.isnan(empty.nearest(37.5, 127.0)).all() and empty.count_within(37.5, 127.0, 500)[0] == 0
+    assert radius_label(500) == "500m" and radius_label(1000) == "1km" and radius_label(1500) == "1.5km"
+
+
+def test_batch_features_match_single_point(collector):
+    rng = np.random.default_rng(3)
+    lat, lon = random_points(rng, 40)
+    batch = collector.calculate_geo_features(lat, lon)
+
+    subway = collector._subway_stations_cache
+    for i in range(40):
+        row = batch.iloc[i]
+        distances = [scalar_haversine(lat[i], lon[i], a, b) for a, b in zip(subway["위도"], subway["경도"])]
+        assert row["distance_to_subway"] == round(min(distances), 1)
+        assert row["subway_count_1km"] == sum(d <= 1000 for d in distances)
+
+        single = {**collector.calculate_transit_accessibility(lat[i], lon[i]),
+                  **collector.calculate_poi_density(lat[i], lon[i])}
+        assert single == pytest.approx(row.to_dict())
+        assert isinstance(single["school_count_500m"], int)
+
+
+def test_missing_data_and_region_scores(collector):
+    collector._subway_stations_cache = pd.DataFrame()
+    collector._geo_index_cache.clear()
+    transit = collector.calculate_transit_accessibility(37.5, 127.0)
+    assert transit == {"distance_to_subway": None, "subway_count_500m": 0,
+                       "subway_count_1km": 0, "transit_score": 0.0}
+
+    regions = pd.DataFrame({
+        "sigungu": ["강남구", "중구", "미상"], "total_stores": [800, 500, 10],
+        "category_diversity": [10.0, 8.0, 1.0], "franchise_ratio": [5.0, 3.0, 0.0],
+        "footfall_score": [0.0, 0.0, 0.0],
+        "avg_latitude": [37.50, 37.56, None], "avg_longitude": [127.03, 126.99, None],
+    })
+    result = collector.add_geo_features(regions, include_transit=True, include_poi=True)
+
+    assert result["school_count_1km"].dtype.kind == "i" and result.loc[2, "poi_score"] == 0.0
+    for row in result.to_dict("records"):
+        assert row["footfall_score"] == collector.estimate_footfall_score(row)
@@ -0,0 +1,114 @@
+"""
+원시 Booster 단건 추론 엔진 테스트 (sklearn 래퍼와 예측 일치)
+"""
+import pickle
+import sys
+import threading
+from pathlib import Path
+
+import lightgbm as lgb
+import numpy as np
+import pandas as pd
+import pytest
+import xgboost as xgb
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.inference_engine import BoosterInferenceEngine
+from app.services.business_model_service import FEATURE_COLUMNS, BusinessModelService
+from app.services.model_service import ModelService
+
+
+@pytest.fixture
+def regression_data():
+    rng = np.random.default_rng(3)
+    X = pd.DataFrame(rng.normal(size=(600, 12)), columns=[f"f{i}" for i in range(12)])
+    X["f0"] = rng.integers(1, 30, len(X))  # 정수 컬럼 섞기
+    y = 5e8 + 1e8 * X["f1"] - 3e7 * X["f2"] ** 2 + 1e6 * X["f0"]
+    return X, y
+
+
+def test_regressor_matches_wrapper(regression_data):
+    X, y = regression_data
+    model = xgb.XGBRegressor(n_estimators=120, max_depth=5, n_jobs=1).fit(X, y)
+    engine = BoosterInferenceEngine.for_model(model, list(X.columns))
+
+    expected = model.predict(X.iloc[:50])
+    actual = [engine.predict(engine.load(X.iloc[[i]]))[0] for i in range(50)]
+    np.testing.assert_array_equal(actual, expected)
+    assert BoosterInferenceEngine.for_model(model, list(X.columns)) is engine  # 모델별 캐시
+
+
+def test_early_stopping_uses_best_iteration(regression_data):
+    X, y = regression_data
+    model = xgb.XGBRegressor(n_estimators=400, learning_rate=0.3, early_stopping_rounds=5, n_jobs=1)
+    model.fit(X.iloc[:400], y.iloc[:400], eval_set=[(X.iloc[400:], y.iloc[400:])], verbose=False)
+    engine = BoosterInferenceEngine.for_model(model, list(X.columns))
+
+    assert engine.iteration_range == (0, model.best_iteration + 1)
+    row = engine.load(X.iloc[[450]])
+    assert engine.predict(row)[0] == model.predict(X.iloc[[450]])[0]
+
+
+def test_model_service_ensemble_matches_wrapper(regression_data):
+    X, y = regression_data
+    model = xgb.XGBRegressor(n_estimators=80, n_jobs=1).fit(X, y)
+    lgbm = lgb.LGBMRegressor(n_estimators=80, verbose=-1).fit(X, y)
+    artifacts = {"feature_names": list(X.columns)}
+    service = ModelService(model, artifacts, {"ensemble": True}, lgbm)
+    assert service.engine is not None and service.engine.lgbm_booster is lgbm.booster_
+
+    for i in range(20):
+        features = X.iloc[[i]]
+        expected = 0.5 * model.predict(features)[0] + 0.5 * lgbm.predict(features)[0]
+        assert service._predict_value(features) == pytest.approx(expected, rel=1e-12)
+
+
+def test_feature_order_checked_once(regression_data):
+    X, y = regression_data
+    model = xgb.XGBRegressor(n_estimators=5, n_jobs=1).fit(X, y)
+
+    with pytest.raises(ValueError):
+        BoosterInferenceEngine(model.get_booster(), list(reversed(X.columns)))
+    assert BoosterInferenceEngine.for_model(object(), list(X.columns)) is None  # 래퍼 fallback
+
+
+def test_row_buffer_per_thread(regression_data):
+    X, y = regression_data
+    model = xgb.XGBRegressor(n_estimators=5, n_jobs=1).fit(X, y)
+    engine = BoosterInferenceEngine.for_model(model, list(X.columns))
+    buffers = []
+    thread = threading.Thread(target=lambda: buffers.append(engine.row_buffer()))
+    thread.start()
+    thread.join()
+
+    assert engine.row_buffer() is engine.row_buffer()
+    assert buffers[0] is not engine.row_buffer()
+    assert engine.row_buffer().dtype == np.float32 and engine.row_buffer().flags.c_contiguous
+
+
+def test_business_service_matches_predict_proba(tmp_path):
+    rng = np.random.default_rng(8)
+    X = pd.DataFrame(rng.random((500, len(FEATURE_COLUMNS))) * 100, columns=FEATURE_COLUMNS)
+    y = (X["survival_rate"] + rng.normal(0, 10, len(X)) > 50).astype(int)
+    model = xgb.XGBClassifier(n_estimators=60, max_depth=4, n_jobs=1).fit(X, y)
+    path = tmp_path / "business_model.pkl"
+    with open(path, "wb") as f:
+        pickle.dump({"model": model, "feature_names": FEATURE_COLUMNS}, f)
+
+    service = BusinessModelService()
+    assert service.load(str(path))
+    assert service.engine is not None
+
+    kwargs = dict(survival_rate=68.0, monthly_avg_sales=3.2e7, store_count=80, foot_traffic_score=71.0)
+    result = service.predict(**kwargs)
+    service.engine = None  # sklearn 래퍼 경로
+    assert service.predict(**kwargs) == result
+
+    features = service._prepare_features(
+        survival_rate=68.0, monthly_avg_sales=3.2e7, sales_growth_rate=3.0, store_count=80,
+        franchise_ratio=0.3, competition_ratio=1.2, foot_traffic_score=71.0, peak_hour_ratio=0.3,
+        weekend_ratio=35.0,
+    )
+    assert list(features.columns) == FEATURE_COLUMNS
+    assert result["success_probability"] == round(float(model.predict_proba(features)[0][1]) * 100, 1)
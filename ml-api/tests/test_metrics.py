@@ -0,0 +1,156 @@
+"""
+메트릭 테스트 (Prometheus 텍스트 출력, 라우트 템플릿 레이블, Supabase 쿼리 타이밍, 캐시 적중)
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.metrics import (
+    SUPABASE_QUERY_SECONDS, MetricsRegistry, TimedSupabaseClient, metrics_middleware,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    hist = registry.histogram("demo_seconds", "demo", ["route"], buckets=(0.1, 1.0))
+    hist.observe(0.05, route="/a")
+    hist.observe(0.5, route="/a")
+    hist.observe(3.0, route="/a")
+
+    text = registry.render()
+    assert "# TYPE demo_seconds histogram" in text
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{route="/a"} 3' in text
+    assert 'demo_seconds_sum{route="/a"} 3.55' in text
+
+
+def test_counter_and_label_validation():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "demo", ["cache", "result"])
+    counter.inc(cache='a"b', result="hit")
+    counter.inc(cache='a"b', result="hit")
+    assert counter.value(cache='a"b', result="hit") == 2
+    assert 'demo_total{cache="a\\"b",result="hit"} 2' in registry.render()
+
+    with pytest.raises(ValueError):
+        counter.inc(cache="a")
+    with pytest.raises(ValueError):
+        registry.counter("demo_total", "dup")
+
+
+class FakeQuery:
+    def __init__(self, calls, fail=False):
+        self.calls = calls
+        self.fail = fail
+
+    def select(self, *args):
+        self.calls.append("select")
+        return self
+
+    def eq(self, *args):
+        self.calls.append("eq")
+        return self
+
+    @property
+    def not_(self):
+        return self
+
+    def is_(self, *args):
+        return self
+
+    def execute(self):
+        if self.fail:
+            raise RuntimeError("timeout")
+        return {"data": self.calls}
+
+
+class FakeClient:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+        self.auth = "auth-api"
+
+    def table(self, name):
+        return FakeQuery(self.calls, self.fail)
+
+
+def test_supabase_queries_are_timed_per_table_and_operation():
+    client = TimedSupabaseClient(FakeClient())
+    before = SUPABASE_QUERY_SECONDS.count(table="regions", operation="select", status="ok")
+
+    result = client.table("regions").select("id").not_.is_("x", "null").eq("id", 1).execute()
+
+    assert result == {"data": ["select", "eq"]}
+    assert client.auth == "auth-api"  # 그 외 속성은 그대로 위임
+    assert SUPABASE_QUERY_SECONDS.count(table="regions", operation="select", status="ok") == before + 1
+
+    failing = TimedSupabaseClient(FakeClient(fail=True))
+    with pytest.raises(RuntimeError):
+        failing.table("regions").select("id").execute()
+    assert SUPABASE_QUERY_SECONDS.count(table="regions", operation="select", status="error") >= 1
+
+
+def test_middleware_labels_by_route_template():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api import metrics as metrics_api
+
+    app = FastAPI()
+    app.middleware("http")(metrics_middleware)
+    app.include_router(metrics_api.router)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    for item_id in (1, 2, 3):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    assert client.get("/nowhere").status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'chamgab_http_request_duration_seconds_count{method="GET",route="/items/{item_id}",status="200"} 3' in body
+    assert 'route="unmatched",status="404"' in body
+    assert "/items/1" not in body
+
+
+def test_middleware_label_includes_router_prefix():
+    from fastapi.testclient import TestClient
+
+    from app.core.metrics import HTTP_REQUEST_SECONDS
+    from app.main import app
+
+    labels = dict(method="GET", route="/api/analyze/results/{job_id}", status="404")
+    before = HTTP_REQUEST_SECONDS.count(**labels)
+
+    client = TestClient(app)
+    assert client.get("/api/analyze/results/no-such-job").status_code == 404
+
+    assert HTTP_REQUEST_SECONDS.count(**labels) == before + 1
+    assert 'route="/analyze/results/{job_id}"' not in client.get("/metrics").text
+
+
+def test_chamgab_cache_hits_are_counted():
+    from app.api.chamgab import SimpleCache
+    from app.core.metrics import CACHE_REQUESTS
+
+    cache = SimpleCache(ttl_seconds=60)
+    label = "chamgab:investment_score"
+    hits = CACHE_REQUESTS.value(cache=label, result="hit")
+    misses = CACHE_REQUESTS.value(cache=label, result="miss")
+
+    assert cache.get("investment_score:p1") is None
+    cache.set("investment_score:p1", {"score": 1})
+    assert cache.get("investment_score:p1") == {"score": 1}
+
+    assert CACHE_REQUESTS.value(cache=label, result="miss") == misses + 1
+    assert CACHE_REQUESTS.value(cache=label, result="hit") == hits + 1
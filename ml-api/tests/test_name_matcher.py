@@ -0,0 +1,96 @@
+"""
+단지명 매칭 엔진 테스트 (색인 결과 = names_match 전수 비교)
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.name_matcher import NameIndex, names_match
+from scripts.collect_building_info import find_matching_building
+
+BRANDS = ["래미안", "자이", "힐스테이트", "푸르지오", "e편한세상", "아이파크", "롯데캐슬", "더샵", "SK뷰", "주공"]
+PLACES = ["", "강남", "역삼", "개포", "대치", "잠실", "반포", "목동", "상계", "분당"]
+SUFFIXES = ["", "아파트", "1단지", "2단지", "2차", "퍼스트", "파크", "(101동)", " 타워"]
+
+
+def random_name(rng):
+    name = rng.choice(BRANDS) + rng.choice(PLACES) + rng.choice(SUFFIXES)
+    if rng.random() < 0.3 and len(name) > 3:  # 오탈자
+        pos = rng.randrange(len(name))
+        name = name[:pos] + name[pos + 1:]
+    return name
+
+
+def brute_force(names, blocks, query, block):
+    matches = {}
+    for i, (name, name_block) in enumerate(zip(names, blocks)):
+        if name_block == block:
+            matched, match_type = names_match(name, query)
+            if matched:
+                matches[i] = match_type
+    return matches
+
+
+def test_index_matches_names_match():
+    rng = random.Random(7)
+    names = [random_name(rng) for _ in range(2000)]
+    blocks = [rng.choice("ABCDEFGH") for _ in names]
+    queries = [random_name(rng) for _ in range(300)]
+    query_blocks = [rng.choice("ABCDEFGH") for _ in queries]
+
+    index = NameIndex(names, blocks)
+    results = index.match_many(queries, query_blocks)
+
+    for query, block, matches in zip(queries, query_blocks, results):
+        assert {pos: t for pos, t, _ in matches} == brute_force(names, blocks, query, block)
+
+
+def test_tiers_order_and_blocking():
+    index = NameIndex(["래미안강남아파트", "래미안강남퍼스트하임", "래미안 강남", "래미안강남"],
+                      blocks=["역삼동", "역삼동", "역삼동", "대치동"])
+
+    matches = index.match("래미안강남", "역삼동")
+    assert [(pos, t) for pos, t, _ in matches] == [(2, "exact"), (0, "contains"), (1, "contains")]
+    assert all(0 < score <= 1 for _, _, score in matches)
+    assert [pos for pos, _, _ in index.match("래미안강남", "역삼동", tiers=("exact",))] == [2]
+    assert index.match("래미안강남", "반포동") == []
+
+
+def test_fuzzy_and_short_names():
+    index = NameIndex(["은마", "롯데캐슬골드", "A"])
+
+    assert [t for _, t, _ in index.match("롯데캐슬골드아파트")] == ["partial"]  # names_match 순서 (norm 포함 우선)
+    assert [t for _, t, _ in index.match("롯데캐쓸골드")] == ["fuzzy"]
+    assert [pos for pos, _, _ in index.match("a")] == [2]  # gram 없는 1글자 이름
+    assert index.match("") == []
+
+
+def test_find_matching_building_prefers_units_within_tier():
+    items = [
+        {"bldNm": "개포자이 상가", "hhldCnt": "0", "mainPurpsCdNm": "근린생활시설"},
+        {"bldNm": "개포자이", "hhldCnt": "120"},
+        {"bldNm": "개포자이(2단지)", "hhldCnt": "900"},
+        {"bldNm": "개포주공", "hhldCnt": "1500", "mainPurpsCdNm": "아파트"},
+    ]
+    index = NameIndex([item["bldNm"] for item in items])
+
+    assert find_matching_building(items, "개포자이아파트", index) is items[2]
+    assert find_matching_building(items, "개포자이아파트") is items[2]
+    # 이름 매칭 실패 → 법정동 내 유일한 아파트
+    assert find_matching_building(items, "없는단지", index) is items[3]
+
+
+def test_strict_tier_keeps_same_brand_complexes_apart():
+    # 접미사 제거 후에만 같은 이름은 exact이지만 strict(병합/삭제용)에서는 다른 단지
+    assert names_match("센트럴타워", "센트럴파크") == (True, "exact")
+
+    index = NameIndex(["센트럴파크", "래미안빌라", "한양아파트", "래미안 아파트"],
+                      blocks=["역삼동"] * 4)
+    results = index.match_many(["센트럴타워", "래미안빌딩", "한양맨션", "래미안아파트"],
+                               ["역삼동"] * 4, tiers=("strict",))
+
+    assert results[:3] == [[], [], []]
+    assert [(pos, t) for pos, t, _ in results[3]] == [(3, "strict")]  # 공백 차이만 무시
+    assert [pos for pos, _, _ in index.match("센트럴타워", "역삼동", tiers=("exact",))] == [0]
@@ -0,0 +1,200 @@
+"""
+증분 파이프라인 실행기 테스트 (입력 해시 기반 건너뛰기, 병렬 실행, 부분 재계산, 실패 전파)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.pipeline import FileHasher, PipelineRunner, Stage
+
+
+class Recorder:
+    """단계 실행 기록 + 출력 파일 쓰기"""
+
+    def __init__(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+        self.fail = set()
+
+    def stage(self, name, output=None, content=lambda: "x"):
+        async def run(changed):
+            self.calls.append((name, None if changed is None else sorted(changed)))
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await asyncio.sleep(0.05)
+            self.running -= 1
+            if output is not None:
+                (self.tmp_path / output).write_text(content(), encoding="utf-8")
+            return name not in self.fail
+        return run
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    regions = tmp_path / "regions"
+    regions.mkdir()
+    (regions / "11680.txt").write_text("a", encoding="utf-8")
+    (regions / "41273.txt").write_text("b", encoding="utf-8")
+    return regions
+
+
+def build(tmp_path, data_dir, recorder, model_content=lambda: "model"):
+    pipeline = PipelineRunner(tmp_path / "state.json")
+
+    def region_inputs():
+        return {
+            f"region:{p.stem}": pipeline.hasher.hash_files([p])
+            for p in sorted(data_dir.glob("*.txt"))
+        }
+
+    pipeline.add(Stage(
+        "train", recorder.stage("train", "model.bin", model_content),
+        inputs=region_inputs, outputs=[tmp_path / "model.bin"],
+    ))
+    pipeline.add(Stage(
+        "features", recorder.stage("features", "features.csv"),
+        outputs=[tmp_path / "features.csv"],
+    ))
+    pipeline.add(Stage(
+        "other_model", recorder.stage("other_model", "other.bin"),
+        inputs=lambda: {}, outputs=[tmp_path / "other.bin"], deps=["features"],
+    ))
+    pipeline.add(Stage("score", recorder.stage("score"), inputs=region_inputs, deps=["train"]))
+    return pipeline
+
+
+def test_first_run_executes_everything_in_parallel(tmp_path, data_dir):
+    recorder = Recorder(tmp_path)
+    results = asyncio.run(build(tmp_path, data_dir, recorder).run())
+
+    assert {name: r.status for name, r in results.items()} == {
+        "train": "ran", "features": "ran", "other_model": "ran", "score": "ran",
+    }
+    assert all(changed is None for _, changed in recorder.calls)
+    assert recorder.max_running == 2  # train ∥ features
+    assert [name for name, _ in recorder.calls].index("score") > [name for name, _ in recorder.calls].index("train")
+
+
+def test_unchanged_inputs_are_skipped_across_restarts(tmp_path, data_dir):
+    asyncio.run(build(tmp_path, data_dir, Recorder(tmp_path)).run())
+
+    recorder = Recorder(tmp_path)
+    results = asyncio.run(build(tmp_path, data_dir, recorder).run())
+
+    assert results["train"].status == "skipped"
+    assert results["score"].status == "skipped"
+    # 해시 불가 단계는 항상 실행되지만 출력이 같으면 하위 단계는 건너뜀
+    assert results["features"].status == "ran"
+    assert not results["features"].output_changed
+    assert results["other_model"].status == "skipped"
+    assert [name for name, _ in recorder.calls] == ["features"]
+
+
+def test_changed_region_propagates_as_partial_rescore(tmp_path, data_dir):
+    asyncio.run(build(tmp_path, data_dir, Recorder(tmp_path)).run())
+    (data_dir / "41273.txt").write_text("b2", encoding="utf-8")
+
+    # 재학습 결과 모델이 그대로면 스코어링은 바뀐 지역만
+    recorder = Recorder(tmp_path)
+    results = asyncio.run(build(tmp_path, data_dir, recorder).run(["score"]))
+    assert set(results) == {"train", "score"}
+    assert ("train", ["region:41273"]) in recorder.calls
+    assert ("score", ["region:41273"]) in recorder.calls
+
+    # 모델이 바뀌면 하위 단계는 의존 키 변경을 받음
+    (data_dir / "11680.txt").write_text("a2", encoding="utf-8")
+    recorder = Recorder(tmp_path)
+    asyncio.run(build(tmp_path, data_dir, recorder, model_content=lambda: "model-v2").run(["score"]))
+    assert ("score", ["@train", "region:11680"]) in recorder.calls
+
+
+def test_failure_blocks_downstream_and_is_retried(tmp_path, data_dir):
+    recorder = Recorder(tmp_path)
+    recorder.fail.add("train")
+    results = asyncio.run(build(tmp_path, data_dir, recorder).run())
+    assert results["train"].status == "failed"
+    assert results["score"].status == "blocked"
+    assert results["other_model"].status == "ran"
+
+    recorder = Recorder(tmp_path)
+    results = asyncio.run(build(tmp_path, data_dir, recorder).run(["score"]))
+    assert results["train"].status == "ran"
+    assert results["score"].status == "ran"
+
+
+def test_force_and_missing_outputs_rerun(tmp_path, data_dir):
+    asyncio.run(build(tmp_path, data_dir, Recorder(tmp_path)).run())
+
+    (tmp_path / "model.bin").unlink()
+    recorder = Recorder(tmp_path)
+    results = asyncio.run(build(tmp_path, data_dir, recorder).run(["train"]))
+    assert results["train"].status == "ran"
+
+    recorder = Recorder(tmp_path)
+    asyncio.run(build(tmp_path, data_dir, recorder).run(force=True))
+    assert len(recorder.calls) == 4
+
+
+def test_register_rejects_unknown_dependency(tmp_path):
+    pipeline = PipelineRunner(tmp_path / "state.json")
+    with pytest.raises(ValueError):
+        pipeline.add(Stage("score", Recorder(tmp_path).stage("score"), deps=["train"]))
+
+
+def test_file_hasher_reuses_hash_for_unchanged_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abc")
+    hasher = FileHasher()
+    first = hasher.hash_file(path)
+    assert hasher.cache[str(path)][2] == first
+    assert hasher.hash_file(path) == first
+    assert hasher.hash_file(tmp_path / "missing.bin") is None
+    assert hasher.hash_files([path], root=tmp_path) != hasher.hash_files([tmp_path / "missing.bin"], root=tmp_path)
+
+
+def test_transactions_fingerprint_tracks_supabase_table():
+    from app.core.scheduler import transactions_fingerprint
+
+    class Query:
+        def __init__(self, rows):
+            self.rows = rows
+            self.head = False
+
+        def select(self, *args, count=None, head=False):
+            self.head = head
+            return self
+
+        def order(self, *args, **kwargs):
+            return self
+
+        def limit(self, n):
+            return self
+
+        def execute(self):
+            latest = sorted(self.rows, key=lambda r: r["created_at"], reverse=True)[:1]
+            return type("Result", (), {"count": len(self.rows), "data": [] if self.head else latest})()
+
+    class Client:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def table(self, name):
+            return Query(self.rows)
+
+    rows = [{"created_at": "2026-01-01T00:00:00"}]
+    before = transactions_fingerprint(Client(rows))
+    rows.append({"created_at": "2026-02-01T00:00:00"})
+    assert transactions_fingerprint(Client(rows)) != before
+    assert transactions_fingerprint(Client(rows)) == "2:2026-02-01T00:00:00"
+
+    class Broken:
+        def table(self, name):
+            raise RuntimeError("연결 실패")
+
+    assert transactions_fingerprint(Broken()) is None
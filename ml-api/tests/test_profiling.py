@@ -0,0 +1,173 @@
+"""
+핫패스 프로파일링 테스트 (스팬 타이밍, folded 스택, 요청 선택, 관리자 토큰, 미들웨어)
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.core.profiling import (
+    SPAN_SECONDS, ProfileController, SamplingProfiler, is_admin_token,
+    profile_controller, profiling_middleware, server_timing, span,
+)
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    return "secret"
+
+
+@pytest.fixture
+def controller(monkeypatch, tmp_path):
+    monkeypatch.setattr(profile_controller, "output_dir", tmp_path)
+    monkeypatch.setattr(profile_controller, "remaining", 0)
+    monkeypatch.setattr(profile_controller, "path_prefix", "")
+    return profile_controller
+
+
+def test_span_records_histogram():
+    before = SPAN_SECONDS.count(span="test.block")
+    with pytest.raises(RuntimeError):
+        with span("test.block"):
+            raise RuntimeError("실패해도 기록")
+    assert SPAN_SECONDS.count(span="test.block") == before + 1
+
+
+def test_server_timing_sums_repeated_spans():
+    header = server_timing([("a", 0.001), ("b", 0.002), ("a", 0.003)])
+    assert header == "a;dur=4.00, b;dur=2.00"
+
+
+def busy_hot_function(stop):
+    while not stop.is_set():
+        sum(range(200))
+
+
+def test_sampling_profiler_writes_folded_stacks():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_hot_function, args=(stop,))
+    worker.start()
+    try:
+        profiler = SamplingProfiler(worker.ident, interval=0.001)
+        profiler.start()
+        time.sleep(0.1)
+        profiler.stop()
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profiler.samples > 0
+    lines = profiler.folded().splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("busy_hot_function (tests/test_profiling.py" in line for line in lines)
+
+
+def test_controller_arms_for_matching_paths(tmp_path):
+    controller = ProfileController(output_dir=tmp_path)
+    assert not controller.should_profile("/api/predict", {})
+
+    controller.arm(2, path_prefix="/api/predict")
+    assert not controller.should_profile("/health", {})
+    assert controller.should_profile("/api/predict", {})
+    assert controller.should_profile("/api/predict/x", {})
+    assert not controller.should_profile("/api/predict", {})
+
+    controller.arm(5)
+    controller.disarm()
+    assert controller.status()["remaining"] == 0
+
+
+def test_controller_keeps_latest_profiles(tmp_path):
+    controller = ProfileController(output_dir=tmp_path, keep=2)
+    profiler = SamplingProfiler(threading.get_ident())
+    ids = [controller.save(profiler, {"path": f"/{i}"}) for i in range(3)]
+
+    assert len(controller.list_profiles()) == 2
+    assert controller.folded_path(ids[-1]) is not None
+    assert controller.folded_path("../../etc/passwd") is None
+
+
+def test_admin_token_required(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    assert not is_admin_token("")  # 미설정이면 항상 거부
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    assert not is_admin_token(None)
+    assert not is_admin_token("wrong")
+    assert is_admin_token("secret")
+
+
+def make_app():
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api import admin
+
+    app = FastAPI()
+    app.middleware("http")(profiling_middleware)
+    app.include_router(admin.router, prefix="/api")
+
+    @app.get("/api/predict/{item_id}")
+    async def predict(item_id: int):
+        with span("predict.fetch"):
+            time.sleep(0.01)
+        with span("predict.predict"):
+            pass
+        return {"id": item_id}
+
+    return TestClient(app)
+
+
+def test_middleware_profiles_opt_in_requests(admin_token, controller):
+    client = make_app()
+
+    plain = client.get("/api/predict/1")
+    assert "X-Profile-Id" not in plain.headers
+
+    # 토큰 없는 X-Profile은 무시
+    assert "X-Profile-Id" not in client.get("/api/predict/1", headers={"X-Profile": "1"}).headers
+
+    response = client.get(
+        "/api/predict/1", headers={"X-Profile": "1", "X-Admin-Token": admin_token}
+    )
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+    assert "predict.fetch;dur=" in response.headers["Server-Timing"]
+
+    meta = controller.list_profiles()[0]
+    assert meta["id"] == profile_id
+    assert meta["route"] == "/api/predict/{item_id}"
+    assert [s["name"] for s in meta["spans"]] == ["predict.fetch", "predict.predict"]
+
+
+def test_admin_profile_endpoints(admin_token, controller):
+    client = make_app()
+    headers = {"X-Admin-Token": admin_token}
+
+    assert client.post("/api/admin/profile", json={"requests": 1}).status_code == 403
+    assert client.get("/api/admin/profile", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    armed = client.post(
+        "/api/admin/profile", json={"requests": 1, "path_prefix": "/api/predict"}, headers=headers
+    )
+    assert armed.status_code == 200
+    assert armed.json()["remaining"] == 1
+
+    profile_id = client.get("/api/predict/7").headers["X-Profile-Id"]
+    assert "X-Profile-Id" not in client.get("/api/predict/7").headers  # 1개만
+
+    status = client.get("/api/admin/profile", headers=headers).json()
+    assert status["remaining"] == 0
+    assert status["profiles"][0]["id"] == profile_id
+
+    folded = client.get(f"/api/admin/profile/{profile_id}", headers=headers)
+    assert folded.status_code == 200
+    assert folded.headers["content-type"].startswith("text/plain")
+    assert client.get("/api/admin/profile/missing", headers=headers).status_code == 404
+
+    assert client.delete("/api/admin/profile", headers=headers).status_code == 200
@@ -0,0 +1,113 @@
+"""
+지역 코드 사전 테스트 (표기 변형 / 동명 시군구 / 코드 정규화 / 스냅샷 생성)
+"""
+import json
+import re
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.region_gazetteer import RegionGazetteer, region_gazetteer
+from app.services.collector_service import CollectorService
+from scripts import collect_building_info as cbi
+from scripts.build_region_gazetteer import merge_bjdong_json, snapshot_from_code_table, write_snapshot
+
+BJDONG_JSON = Path(__file__).parent.parent / "scripts" / "bjdong_codes.json"
+
+
+@pytest.mark.parametrize("name, sido, code", [
+    ("단원구", None, "41273"),
+    ("안산시단원구", None, "41273"),
+    ("안산시 단원구", None, "41273"),
+    ("경기 안산시 단원구", None, "41273"),
+    ("안산시", None, "41270"),
+    ("강남구", "서울특별시", "11680"),
+    ("중구", "부산광역시", "26110"),
+    ("중구", "부산", "26110"),
+    ("부산중구", None, "26110"),
+    ("서울 강서구", None, "11500"),
+    ("강서구", "서울시", "11500"),
+    ("고성군", "경남", "48820"),
+    ("세종시", None, "36110"),
+    ("인천 남구", None, "28177"),  # 옛 이름
+])
+def test_sigungu_code_aliases(name, sido, code):
+    assert region_gazetteer.sigungu_code(name, sido) == code
+
+
+def test_ambiguous_names_need_sido():
+    assert region_gazetteer.sigungu_code("중구") is None
+    assert len(region_gazetteer.sigungu_candidates("중구")) == 6
+    assert region_gazetteer.sigungu_code("중구", "경기도") is None
+    assert region_gazetteer.sigungu_code("없는구") is None
+
+
+def test_codes_parents_and_legacy_codes():
+    g = region_gazetteer
+    assert g.name("41273") == "안산시 단원구" and g.sido_name("41273") == "경기도"
+    assert g.parent("41273").code == "41270" and g.parent("41270").code == "41"
+    assert g.children("41270") == ["41271", "41273"]
+    assert g.full_name("4127310100") == "경기도 안산시 단원구 고잔동"
+    assert g.get("4127300000").code == "41273" and g.get("4100000000").name == "경기도"
+
+    # 28170(인천 남구) → 28177, 51(강원특별자치도 신코드) → 42
+    assert g.get("2817010200") == g.get("2817710200") and g.get("2817710200").name == "용현동"
+    assert g.bjdong_code("28170", "용현동") == "10200"
+    assert g.name("51110") == "춘천시" and g.sido_code("강원도") == "42" and g.sido_code("51") == "42"
+    assert g.get("99999") is None and g.name("99999", "99999") == "99999"
+
+
+def test_snapshot_covers_existing_code_tables():
+    with open(BJDONG_JSON, encoding="utf-8") as f:
+        bjdong = json.load(f)
+    for sigungu_code, dongs in bjdong.items():
+        assert region_gazetteer.get(sigungu_code) is not None
+        for name, code in dongs.items():
+            assert region_gazetteer.bjdong_code(sigungu_code, name) == code
+
+    for name, code in CollectorService.REGION_CODES.items():
+        assert code in region_gazetteer.sigungu_candidates(name)  # 서울 "중구" 등은 시도 접두 없음
+        assert CollectorService().get_region_name(code) == name
+    assert CollectorService().get_region_name("48121") == "창원시 의창구"
+
+
+def test_resolve_codes_uses_gazetteer():
+    collector = object.__new__(cbi.BuildingInfoCollector)
+    row = {"sido": "경기도", "sigungu": "수지구", "eupmyeondong": "풍덕천동"}
+    assert collector.resolve_codes(row, {}, region_gazetteer.bjdong_codes()) == ("41465", "10100")
+    row = {"sido": "부산광역시", "sigungu": "중구", "eupmyeondong": ""}
+    assert collector.resolve_codes(row, {"중구": "11140"}, {}) == ("26110", "00000")
+
+
+def test_build_snapshot_from_code_table(tmp_path):
+    df = pd.DataFrame([
+        ("4100000000", "경기도", None, None, None, None),
+        ("4127000000", "경기도", "안산시", None, None, None),
+        ("4127300000", "경기도", "안산시 단원구", None, None, None),
+        ("4127310100", "경기도", "안산시 단원구", "고잔동", None, None),
+        ("4127310200", "경기도", "안산시 단원구", "와동", None, "2001-01-01"),  # 말소
+        ("3600000000", "세종특별자치시", None, None, None, None),
+        ("3611000000", "세종특별자치시", None, None, None, None),
+        ("3611025021", "세종특별자치시", None, "조치원읍", "원리", None),
+    ], columns=["법정동코드", "시도명", "시군구명", "읍면동명", "동리명", "말소일자"])
+    snapshot = snapshot_from_code_table(df)
+
+    assert snapshot["sigungu"] == {"41270": "안산시", "41273": "안산시 단원구", "36110": "세종특별자치시"}
+    assert snapshot["bjdong"] == {"41273": {"고잔동": "10100"}, "36110": {"원리": "25021"}}
+
+    snapshot["code_aliases"] = {"41275": "41273"}
+    source = tmp_path / "bjdong.json"
+    source.write_text(json.dumps({"41275": {"와동": "10200", "고잔동": "99999"}}, ensure_ascii=False))
+    assert merge_bjdong_json(snapshot, source) == 1
+
+    path = tmp_path / "gazetteer.json"
+    write_snapshot(snapshot, path)
+    assert not re.search(r": |, ", path.read_text(encoding="utf-8"))
+    gazetteer = RegionGazetteer.load(path)
+    assert gazetteer.sigungu_code("단원구") == "41273"
+    assert gazetteer.bjdong_code("41273", "와동") == "10200" and gazetteer.bjdong_code("41273", "고잔동") == "10100"
+    assert gazetteer.parent("41273").name == "안산시" and gazetteer.sido_name("3611025021") == "세종특별자치시"
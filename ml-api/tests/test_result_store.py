@@ -0,0 +1,88 @@
+"""
+작업 결과 저장소 테스트 (Arrow 파일 / LRU / TTL / 페이지 조회)
+"""
+import asyncio
+import os
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.result_store import JobResultStore
+from app.services.analyzer_service import AnalyzerService, PriceAnalysis, RESULTS_NAME
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobResultStore(tmp_path / "results", max_memory_jobs=2, ttl_hours=1)
+
+
+def _analysis(apt_name, region_code, price):
+    return PriceAnalysis(
+        apt_name=apt_name, region_code=region_code, area=84.0,
+        base_price=price, estimated_price=price, min_price=int(price * 0.95),
+        max_price=int(price * 1.05), confidence=0.8,
+        price_factors={"floor": 0.0, "age": 0.02}, recent_trades=3,
+        avg_trade_price=price, market_trend="보합", analyzed_at="2025-01-01T00:00:00",
+    )
+
+
+def test_put_and_slice(store):
+    rows = [{"apt_name": f"apt{i}", "price": i} for i in range(250)]
+    assert store.put("collect_1", "molit", rows) == 250
+
+    page, total = store.slice("collect_1", "molit", 100, 20)
+    assert total == 250
+    assert [r["price"] for r in page] == list(range(100, 120))
+    assert store.names("collect_1") == ["molit"]
+    assert store.slice("missing", "molit", 0, 10) == ([], 0)
+
+
+def test_mixed_type_columns_are_stringified(store):
+    store.put("collect_1", "rone", [{"value": 1.5}, {"value": "-"}, {"value": None}])
+    page, _ = store.slice("collect_1", "rone", 0, 10)
+    assert [r["value"] for r in page] == ["1.5", "-", None]
+
+
+def test_lru_keeps_only_recent_jobs(store):
+    for i in range(3):
+        store.put(f"job{i}", "molit", [{"x": i}])
+        store.get_table(f"job{i}", "molit")
+    assert list(store._cache) == ["job1", "job2"]
+    # 캐시에서 밀려난 작업도 파일에서 다시 조회
+    assert store.slice("job0", "molit", 0, 1) == ([{"x": 0}], 1)
+
+
+def test_ttl_cleanup(store):
+    store.put("old_job", "molit", [{"x": 1}])
+    store.put("new_job", "molit", [{"x": 2}])
+    expired = time.time() - 2 * 3600
+    os.utime(store.root / "old_job", (expired, expired))
+
+    assert store.cleanup_expired(force=True) == 1
+    assert not store.has("old_job")
+    assert store.has("new_job")
+
+
+def test_analysis_results_page_from_store(store, monkeypatch):
+    from app.api import analyze
+
+    service = AnalyzerService(results=store)
+    analyses = [_analysis(f"단지{i}", "11680" if i % 2 else "11650", 100000 + i * 1000) for i in range(10)]
+    store.put("analyze_1", RESULTS_NAME, [asdict(a) for a in analyses])
+    monkeypatch.setattr(analyze, "analyzer_service", service)
+
+    result = asyncio.run(analyze.get_analysis_results(
+        "analyze_1", region_code="11680", min_price=None, max_price=None,
+        sort_by="estimated_price", sort_order="desc", limit=2, offset=1,
+    ))
+    assert result["total"] == 5
+    assert [i["apt_name"] for i in result["items"]] == ["단지7", "단지5"]
+    assert result["items"][0]["price_factors"] == {"floor": 0.0, "age": 0.02}
+
+    assert service.get_results("analyze_1")[0] == analyses[0]
+    assert service.result_job_ids() == ["analyze_1"]
@@ -0,0 +1,119 @@
+"""
+스케줄러 리더 선출 테스트 (파일 락, 리더/팔로워 작업 예약, 모델 번들 게시/리로드)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core import scheduler as scheduler_module
+from app.core.leader import (
+    FileLeaderLock, LeaderLock, advisory_lock_id, create_leader_lock,
+)
+from app.core.scheduler import DataScheduler, LEADERSHIP_JOB_ID, MODEL_WATCH_JOB_ID
+
+pytestmark = pytest.mark.skipif(
+    not isinstance(create_leader_lock("file", "k", Path("unused")), FileLeaderLock),
+    reason="fcntl 미지원 플랫폼",
+)
+
+
+def test_file_lock_single_holder(tmp_path):
+    path = tmp_path / "scheduler.lock"
+    a, b = FileLeaderLock(path), FileLeaderLock(path)
+
+    assert a.acquire()
+    assert a.acquire()  # 재진입
+    assert not b.acquire()
+    assert b.holder() == a.token
+
+    a.release()
+    assert not a.renew()
+    assert b.acquire()
+    assert b.renew()
+    b.release()
+
+
+def test_create_leader_lock_fallbacks(tmp_path):
+    lock = create_leader_lock("auto", "k", tmp_path / "x.lock", database_url="sqlite:///x.db")
+    assert lock.backend == "file"
+    assert create_leader_lock("redis", "k", tmp_path / "x.lock").backend == "file"  # REDIS_URL 없음
+    assert create_leader_lock("none", "k", tmp_path / "x.lock").backend == "none"
+
+
+def test_advisory_lock_id_is_stable_signed_int64():
+    lock_id = advisory_lock_id("chamgab:scheduler-leader")
+    assert lock_id == advisory_lock_id("chamgab:scheduler-leader")
+    assert -2 ** 63 <= lock_id < 2 ** 63
+
+
+def _make_scheduler(tmp_path, lock_path):
+    sched = DataScheduler()
+    sched.leader = FileLeaderLock(lock_path)
+    sched.bundle_manifest_path = tmp_path / "bundle_manifest.json"
+    reloads = []
+
+    async def fake_reload():
+        reloads.append(sched.bundle_version)
+
+    sched._reload_models = fake_reload
+    return sched, reloads
+
+
+def test_leader_schedules_jobs_follower_only_watches(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "MODELS_DIR", tmp_path)
+    (tmp_path / "model.pkl").write_bytes(b"v1")
+    lock_path = tmp_path / "scheduler.lock"
+
+    async def scenario():
+        leader, _ = _make_scheduler(tmp_path, lock_path)
+        follower, reloads = _make_scheduler(tmp_path, lock_path)
+        leader.start()
+        follower.start()
+        try:
+            assert leader.role == "leader"
+            assert follower.role == "follower"
+
+            leader_jobs = {job["id"] for job in leader.get_jobs()}
+            follower_jobs = {job["id"] for job in follower.get_jobs()}
+            assert {"daily_collection", "monthly_full_training", "startup_catchup"} <= leader_jobs
+            assert MODEL_WATCH_JOB_ID not in leader_jobs
+            assert follower_jobs == {LEADERSHIP_JOB_ID, MODEL_WATCH_JOB_ID}
+
+            # 리더가 게시한 번들 → 팔로워가 한 번만 리로드
+            leader._publish_model_bundle()
+            assert await follower.watch_model_bundle()
+            assert not await follower.watch_model_bundle()
+            assert reloads == [leader.bundle_version]
+
+            # 리더가 내려가면 팔로워가 인수
+            leader.stop()
+            await follower.check_leadership()
+            assert follower.role == "leader"
+            assert "daily_collection" in {job["id"] for job in follower.get_jobs()}
+        finally:
+            leader.stop()
+            follower.stop()
+
+    asyncio.run(scenario())
+
+
+def test_leader_steps_down_when_lock_lost(tmp_path):
+    async def scenario():
+        sched, _ = _make_scheduler(tmp_path, tmp_path / "scheduler.lock")
+        sched.leader = LeaderLock("k")
+        sched.start()
+        try:
+            assert sched.role == "leader"
+            sched.leader.held = False  # 락 상실 (Redis TTL 만료 등)
+            sched.leader.acquire = lambda: False
+            await sched.check_leadership()
+            assert sched.role == "follower"
+            assert {job["id"] for job in sched.get_jobs()} == {LEADERSHIP_JOB_ID, MODEL_WATCH_JOB_ID}
+        finally:
+            sched.stop()
+
+    asyncio.run(scenario())
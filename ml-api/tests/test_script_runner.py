@@ -0,0 +1,151 @@
+"""
+스케줄러 스크립트 실행기 테스트 (비차단 실행, 로그 스트리밍, 진행률/ETA, 타임아웃/취소, CPU 예산)
+"""
+import asyncio
+import os
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.scheduler import DataScheduler
+from app.core.script_runner import ScriptRunner, parse_progress
+
+JOBS = {
+    "job_ok": """
+        import os, sys, time
+        print("OMP", os.environ.get("OMP_NUM_THREADS"))
+        for step in range(1, 5):
+            print(f"[{step}/4] 단계 {step}")
+            time.sleep(0.15)
+        print("경고", file=sys.stderr)
+        print("MAPE: 4.5%")
+        print("NICE", os.nice(0) if hasattr(os, "nice") else 0)
+    """,
+    "job_fail": """
+        import sys
+        print("학습 실패", file=sys.stderr)
+        sys.exit(3)
+    """,
+    "job_slow": """
+        import time
+        print("시작")
+        time.sleep(30)
+    """,
+}
+
+
+@pytest.fixture
+def runner(tmp_path):
+    for name, body in JOBS.items():
+        (tmp_path / f"{name}.py").write_text(textwrap.dedent(body), encoding="utf-8")
+    return ScriptRunner(cwd=tmp_path, nice=5, cpu_threads=2, history_path=tmp_path / "history.json")
+
+
+def test_parse_progress():
+    assert parse_progress("[3/5] 모델 학습") == 0.6
+    assert parse_progress(" 45%|████▌     | 45/100") == 0.45
+    assert parse_progress("MAPE: 4.52%") is None
+    assert parse_progress("[0/0]") is None
+
+
+def test_run_streams_log_without_blocking_loop(runner):
+    async def scenario():
+        ticks = 0
+        task = asyncio.create_task(runner.run("job_ok"))
+        seen_progress = []
+        while not task.done():
+            await asyncio.sleep(0.05)
+            ticks += 1
+            for run in runner.active.values():
+                seen_progress.append(run.progress)
+        return await task, ticks, seen_progress
+
+    run, ticks, seen_progress = asyncio.run(scenario())
+
+    assert run.succeeded and run.returncode == 0 and run.progress == 1.0
+    assert ticks >= 5  # 실행 중에도 이벤트 루프가 계속 돌아감
+    assert any(p is not None and 0 < p < 1 for p in seen_progress)  # 실행 중 진행률 갱신
+    assert run.log[0] == "OMP 2"  # 학습 라이브러리 스레드 상한
+    assert "! 경고" in run.log and "MAPE: 4.5%" in run.log
+    if hasattr(os, "nice"):
+        assert "NICE 5" in run.log  # nice 값 적용
+
+    # 직전 성공 소요 시간 → 다음 실행 ETA 기준 (파일로 유지)
+    reloaded = ScriptRunner(cwd=runner.cwd, history_path=runner.history_path)
+    assert reloaded._durations["job_ok"] == pytest.approx(run.elapsed, abs=0.1)
+    status = runner.status()
+    assert status["active"] == [] and status["recent"][0]["status"] == "succeeded"
+    assert status["recent"][0]["eta_seconds"] == 0.0
+
+
+def test_failure_timeout_and_missing_module(runner):
+    failed = asyncio.run(runner.run("job_fail"))
+    assert failed.status == "failed" and failed.returncode == 3 and failed.tail(1) == ["! 학습 실패"]
+
+    timed_out = asyncio.run(runner.run("job_slow", timeout=1))
+    assert timed_out.status == "timeout" and timed_out.elapsed < 10
+    assert runner.get(timed_out.run_id) is timed_out
+    assert "job_fail" not in runner._durations and "job_slow" not in runner._durations
+
+    missing = asyncio.run(runner.run("no_such_module"))
+    assert missing.status == "failed"
+
+
+def test_scheduler_cancel_skips_remaining_steps(runner):
+    scheduler = DataScheduler()
+    scheduler.script_runner = runner
+
+    async def job():
+        with scheduler._job("train_all_1"):
+            first = await scheduler._run_script("job_slow", timeout=60)
+            second = await scheduler._run_script("job_ok")
+        return first, second
+
+    async def scenario():
+        task = asyncio.create_task(job())
+        while not runner.active or not next(iter(runner.active.values())).log:
+            await asyncio.sleep(0.05)
+        active = next(iter(runner.active.values()))
+        assert active.eta_seconds() is None  # 진행률도 이력도 없음
+        cancelled = await scheduler.cancel_scripts()
+        return cancelled, await task
+
+    cancelled, (first, second) = asyncio.run(scenario())
+
+    assert len(cancelled) == 1 and first is False and second is False
+    assert [run.module for run in runner.recent] == ["job_slow"]
+    assert runner.recent[-1].status == "cancelled"
+    assert runner.recent[-1].job_id == "train_all_1"
+    assert asyncio.run(scheduler.cancel_scripts()) == []
+
+
+def test_scheduler_cancel_is_scoped_to_job(runner):
+    scheduler = DataScheduler()
+    scheduler.script_runner = runner
+
+    async def job(job_id, modules):
+        with scheduler._job(job_id):
+            return [await scheduler._run_script(module, timeout=60) for module in modules]
+
+    async def scenario():
+        cancelled_job = asyncio.create_task(job("commercial_1", ["job_slow", "job_ok"]))
+        while not runner.active:
+            await asyncio.sleep(0.05)
+        cancelling = asyncio.create_task(scheduler.cancel_scripts("commercial_1"))
+        # 취소 대기 중 다른 작업이 시작돼도 commercial_1의 취소 요청은 유지되고, 새 작업은 취소되지 않음
+        other_job = asyncio.create_task(job("train_biz_1", ["job_ok"]))
+        cancelled = await cancelling
+        return cancelled, await cancelled_job, await other_job
+
+    cancelled, first, second = asyncio.run(scenario())
+
+    assert len(cancelled) == 1
+    assert first == [False, False]
+    assert second == [True]
+    assert sorted((run.job_id, run.module, run.status) for run in runner.recent) == [
+        ("commercial_1", "job_slow", "cancelled"), ("train_biz_1", "job_ok", "succeeded"),
+    ]
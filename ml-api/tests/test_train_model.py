@@ -0,0 +1,108 @@
+"""
+가격 예측 모델 학습 테스트 (fold QuantileDMatrix 튜닝 / 병렬 trial / 병렬 교차 검증)
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("optuna")
+
+from scripts import train_model
+from scripts.train_model import XGBoostTrainer, _build_fold_matrices
+
+
+@pytest.fixture
+def price_data():
+    rng = np.random.default_rng(0)
+    n = 600
+    X = pd.DataFrame(rng.normal(size=(n, 6)), columns=[f"f{i}" for i in range(6)])
+    y = pd.Series(5e8 + 1e8 * X["f0"] + 5e7 * X["f1"] ** 2 + rng.normal(0, 1e7, n))
+    return X, y
+
+
+@pytest.fixture
+def trainer(tmp_path, monkeypatch):
+    monkeypatch.setattr(train_model, "TUNE_STORAGE_DIR", tmp_path / "optuna")
+    monkeypatch.setattr(train_model, "TUNE_NUM_BOOST_ROUND", 30)
+    return XGBoostTrainer(feature_engineer=None)
+
+
+def test_fold_matrices_share_training_bins(price_data):
+    X, y = price_data
+    folds = _build_fold_matrices(X.to_numpy(np.float32), y.to_numpy())
+    assert len(folds) == 5
+    for dtrain, dval, X_v, y_v in folds:
+        assert dval.num_row() == len(X_v) == len(y_v)
+        assert dtrain.num_col() == dval.num_col() == 6
+
+
+def test_tune_returns_sklearn_params(trainer, price_data, tmp_path):
+    X, y = price_data
+    params = trainer.tune_hyperparameters(X, y, n_trials=3, n_workers=1)
+
+    assert {"max_depth", "learning_rate", "reg_alpha", "reg_lambda"} <= set(params)
+    assert params["n_estimators"] == 1000
+    assert len(list((tmp_path / "optuna").glob("xgb_tune_*.log"))) == 1
+
+
+def test_parallel_workers_share_study(trainer, price_data, tmp_path):
+    import optuna
+
+    X, y = price_data
+    trainer.tune_hyperparameters(X, y, n_trials=4, n_workers=2)
+
+    log_path = next((tmp_path / "optuna").glob("xgb_tune_*.log"))
+    study = optuna.load_study(
+        study_name=log_path.stem, storage=train_model._journal_storage(str(log_path))
+    )
+    assert len(study.trials) == 4
+
+
+def test_cross_validate_streams_folds_to_run_file(price_data, tmp_path):
+    X, y = price_data
+    metrics_path = tmp_path / "apartment_model_metrics.json"
+    metrics_path.write_text(json.dumps({"model_type": "apartment_price_regressor"}))
+    progress_path = tmp_path / "cv_runs" / "apartment_model.json"
+
+    result = XGBoostTrainer(feature_engineer=None).cross_validate(X, y, progress_path=progress_path)
+
+    assert len(result["cv_mape_scores"]) == 5 and not result["aborted"]
+    assert [f["train_size"] for f in result["folds"]] == [100, 200, 300, 400, 500]
+    # 서빙 모델 메트릭은 교차 검증 중 건드리지 않음 (완료 후 write_json_atomic으로 교체)
+    assert json.loads(metrics_path.read_text()) == {"model_type": "apartment_price_regressor"}
+    progress = json.loads(progress_path.read_text())
+    assert progress["status"] == "completed"
+    assert [f["status"] for f in progress["folds"]] == ["completed"] * 5
+
+
+def test_cross_validate_aborts_over_mape_budget(price_data):
+    X, y = price_data
+    result = XGBoostTrainer(feature_engineer=None).cross_validate(X, y, mape_budget=0.0)
+
+    assert result["aborted"]
+    assert len(result["cv_mape_scores"]) < 5
+    assert "aborted" in {f["status"] for f in result["folds"]}
+
+
+def test_cross_validate_bins_from_training_fold_only(price_data, monkeypatch):
+    from scripts import cv_runner
+
+    built = []
+    original = cv_runner.xgb.QuantileDMatrix
+
+    def recording(data, *args, ref=None, **kwargs):
+        built.append((len(data), ref is None))
+        return original(data, *args, ref=ref, **kwargs)
+
+    monkeypatch.setattr(cv_runner.xgb, "QuantileDMatrix", recording)
+    X, y = price_data
+    XGBoostTrainer(feature_engineer=None).cross_validate(X, y)
+
+    # bin 경계를 새로 계산하는 행렬(ref 없음)은 fold 학습 구간뿐 (검증 구간 포함 전체 데이터 X)
+    assert sorted(n for n, own_bins in built if own_bins) == [100, 200, 300, 400, 500]
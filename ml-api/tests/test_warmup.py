@@ -0,0 +1,90 @@
+"""
+백그라운드 모델 워밍업 테스트 (warming 상태, 대기 시간 초과 폴백, 실패 후 서빙 계속, 지연 import)
+"""
+import asyncio
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.warmup import ModelWarmup, init_model_state
+
+
+def test_background_warmup_reports_warming_then_ready():
+    release = threading.Event()
+    started = []
+
+    async def scenario():
+        warmup = ModelWarmup()
+        assert await warmup.wait(0)  # 워밍업 미사용이면 기다리지 않음
+
+        warmup.start(lambda: release.wait(5), on_ready=lambda: started.append(warmup.status))
+        await asyncio.sleep(0.05)
+        assert warmup.status == "warming"
+        assert warmup.describe()["status"] == "warming"
+        assert not await warmup.wait(0.05)  # 시간 초과 → 폴백
+
+        waiter = asyncio.create_task(warmup.wait(5))
+        release.set()
+        assert await waiter
+        assert warmup.status == "ready"
+        assert started == ["ready"]
+        assert warmup.describe()["elapsed_seconds"] is not None
+
+    asyncio.run(scenario())
+
+
+def test_failed_warmup_still_unblocks_requests():
+    def broken():
+        raise RuntimeError("모델 파일 손상")
+
+    async def scenario():
+        warmup = ModelWarmup()
+        on_ready = []
+        await warmup.run(broken, on_ready=lambda: on_ready.append(True))
+        assert warmup.status == "failed"
+        assert "손상" in warmup.error
+        assert await warmup.wait(0)
+        assert on_ready == [True]
+
+    asyncio.run(scenario())
+
+
+def test_cancel_pending_warmup():
+    release = threading.Event()
+
+    async def scenario():
+        warmup = ModelWarmup()
+        on_ready = []
+        warmup.start(lambda: release.wait(5), on_ready=lambda: on_ready.append(True))
+        await asyncio.sleep(0.05)
+        await warmup.cancel()
+        release.set()
+        assert on_ready == []
+
+    asyncio.run(scenario())
+
+
+def test_init_model_state_sets_fallback_attributes():
+    state = SimpleNamespace()
+    init_model_state(state)
+    assert state.model is None
+    assert state.feature_artifacts is None
+    assert state.compiled_model is None
+
+
+def test_app_import_defers_model_libraries():
+    # 새 인터프리터에서 확인 (다른 테스트가 이미 import한 모듈 영향 없이)
+    code = (
+        "import sys; import app.main; "
+        "print(sorted(m for m in ('xgboost', 'shap', 'numba') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+        capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"